@@ -11,7 +11,32 @@ class ValidationLevel(Enum):
     VALIDATE_ALL = "validate_all"
 
 
+class CompressionProfile(Enum):
+    """
+    Deflate profiles used when writing a DAT file.
+
+    Every profile produces a standard raw deflate stream, so the game reads
+    all of them; they only trade file size for save time.
+    """
+    FAST = "fast"
+    BALANCED = "balanced"
+    MAX = "max"
+
+    @property
+    def level(self) -> int:
+        """zlib compression level for this profile."""
+        return _COMPRESSION_LEVELS[self]
+
+
+_COMPRESSION_LEVELS = {
+    CompressionProfile.FAST: 1,
+    CompressionProfile.BALANCED: 6,
+    CompressionProfile.MAX: 9,
+}
+
+
 class Config:
     """Global configuration for aoe2_genie_tooling."""
     DEFAULT_VERSION = DE_LATEST
     DEFAULT_VALIDATION = ValidationLevel.VALIDATE_NEW
+    DEFAULT_COMPRESSION = CompressionProfile.MAX
@@ -0,0 +1,207 @@
+"""
+EditBatch - Transactional batch of handle writes (``workspace.batch()``).
+
+Responsibilities:
+- Hold the workspace change notifications while the batch is open and
+  deliver each changed object once on exit, instead of once per write
+- Record the old values of the fields written through handles, once per
+  object and field, so the batch can be rolled back
+- Roll back automatically when the ``with`` block raises
+
+Writes still go to the DAT immediately, so reads, collection edits and manager
+operations inside the batch see them. What a write no longer pays for is the
+fan-out to every change subscriber (name indexes, handle cache, ID index,
+fingerprint), which happens once per object when the batch closes.
+
+Rollback covers what handles write: unit attributes (flattened or through
+wrappers and collections) and graphic, sound, tech and effect handle writes.
+Field writes are recorded as (kind, ID, object, field, old value) tuples. Objects that
+are edited in ways a single field cannot describe (a wrapper or collection of
+a unit, list edits on a tech) are copied once, on their first write in the
+batch. Structural manager operations (create, clone_into, move, delete,
+renumber) and direct edits of ``workspace.dat`` are not rolled back.
+
+Lookups that depend on change notifications (find_by_name, handle reuse)
+see the batch's writes only after it closes or after flush(). With the
+journal enabled (``workspace.enable_journal()``), the batch is one undo step.
+
+Usage:
+    with workspace.batch():
+        for unit_id in range(100, 200):
+            unit = workspace.unit_manager.get(unit_id)
+            unit.hit_points += 10
+            unit.reload_time *= 0.9
+
+    with workspace.batch() as batch:
+        ...
+        if not ok:
+            batch.rollback()     # undo the writes so far, keep the batch open
+"""
+from __future__ import annotations
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, Type
+
+from aoe2_genie_tooling.Base.core.struct_cloner import copy_struct_into, deep_clone
+
+if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.core.journal import ChangeJournal
+    from aoe2_genie_tooling.Base.workspace import GenieWorkspace
+
+__all__ = ["EditBatch"]
+
+_SCALARS = (int, float, str, bytes, type(None))
+
+
+class EditBatch:
+    """
+    Open batch of writes on one workspace.
+
+    Attributes:
+        rollback_enabled: Old values are recorded (rollback() is available)
+    """
+
+    def __init__(self, workspace: GenieWorkspace, rollback: bool = True) -> None:
+        """
+        Initialize a closed batch.
+
+        Args:
+            workspace: Workspace whose writes are batched
+            rollback: Record old values so the batch can be rolled back.
+                      False skips the recording and only coalesces
+                      notifications.
+        """
+        self.workspace = workspace
+        self.rollback_enabled = rollback
+        self._depth = 0
+        # (kind, ID, object, field, old value); field None = old value is a
+        # copy of the object
+        self._records: List[Tuple[str, int, Any, Optional[str], Any]] = []
+        self._fields: Set[Tuple[int, str]] = set()
+        self._saved: Set[int] = set()
+        self._type_changed: Set[int] = set()
+        self._journal: Optional[ChangeJournal] = None
+
+    # -------------------------
+    # Context
+    # -------------------------
+
+    def __enter__(self) -> EditBatch:
+        if self._depth == 0:
+            workspace = self.workspace
+            if workspace._batch is not None:
+                raise RuntimeError("Another batch is already open on this workspace")
+            workspace._batch = self
+            self._type_changed = set(workspace._type_changed_units)
+            # The whole batch is one undo step
+            self._journal = workspace._journal
+            if self._journal is not None:
+                self._journal.begin()
+            workspace.changes.hold()
+        self._depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                if exc_type is not None and self.rollback_enabled:
+                    self.rollback()
+            finally:
+                self.workspace._batch = None
+                self._clear()
+                self.workspace.changes.release()
+                if self._journal is not None:
+                    self._journal.end()
+                    self._journal = None
+        return False
+
+    @property
+    def active(self) -> bool:
+        """True while the batch is open."""
+        return self._depth > 0
+
+    def __len__(self) -> int:
+        """Number of recorded old values (0 if rollback is disabled)."""
+        return len(self._records)
+
+    # -------------------------
+    # Recording (called by handles before they write)
+    # -------------------------
+
+    def record(self, kind: str, obj_id: int, obj: Any, field: str) -> None:
+        """
+        Remember obj.field before its first write in this batch.
+
+        Values that are not plain scalars (lists, nested structs) make the
+        whole object be saved instead.
+
+        Args:
+            kind: Change tracker kind of the written object ("units", ...)
+            obj_id: Its ID, reported again if the batch is rolled back
+            obj: Struct about to be written (a unit, a unit's combat_info, ...)
+            field: Field about to be written
+        """
+        if not self.rollback_enabled or id(obj) in self._saved:
+            return
+        key = (id(obj), field)
+        if key in self._fields:
+            return
+        try:
+            value = getattr(obj, field)
+        except AttributeError:
+            # Not a raw field (e.g. a computed handle property)
+            self.save(kind, obj_id, obj)
+            return
+        if not isinstance(value, _SCALARS):
+            self.save(kind, obj_id, obj)
+            return
+        self._fields.add(key)
+        self._records.append((kind, obj_id, obj, field, value))
+
+    def save(self, kind: str, obj_id: int, obj: Any) -> None:
+        """Remember a copy of obj (a struct) before its first write in this batch."""
+        if not self.rollback_enabled or obj is None or id(obj) in self._saved:
+            return
+        self._saved.add(id(obj))
+        self._records.append((kind, obj_id, obj, None, deep_clone(obj)))
+
+    # -------------------------
+    # Control
+    # -------------------------
+
+    def rollback(self) -> None:
+        """
+        Restore every recorded value, newest first, and keep the batch open.
+
+        Raises:
+            RuntimeError: If the batch was opened with rollback=False
+        """
+        if not self.rollback_enabled:
+            raise RuntimeError("Batch was opened with rollback=False")
+        restored = {}
+        for kind, obj_id, obj, field, old in reversed(self._records):
+            if field is None:
+                copy_struct_into(old, obj)
+            else:
+                setattr(obj, field, old)
+            restored[(kind, obj_id)] = None
+        self.workspace._type_changed_units.intersection_update(self._type_changed)
+        self._clear()
+        # Reported again in case flush() delivered the original writes
+        for kind, obj_id in restored:
+            self.workspace.changes.mark(kind, obj_id)
+
+    def flush(self) -> None:
+        """Deliver the change notifications collected so far."""
+        self.workspace.changes.flush()
+
+    def _clear(self) -> None:
+        self._records.clear()
+        self._fields.clear()
+        self._saved.clear()
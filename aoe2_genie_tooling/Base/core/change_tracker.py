@@ -0,0 +1,178 @@
+"""
+ChangeTracker - Write notifications from handles and managers.
+
+Responsibilities:
+- Receive a notification whenever a handle or manager writes to the DAT
+- Forward it to subscribers (e.g. the fingerprint cache)
+- Count the changes per top-level DAT section (used by the fingerprint cache)
+
+Notifications name the kind of object and its ID. An ID of None means the
+whole collection may have changed (objects added, removed or replaced).
+
+Kinds:
+- "units": unit ID (the same ID in every civilization)
+- "sprites", "sounds", "techs", "tech_effects": index in the top-level list
+- "civilizations": civ ID, for civilization fields other than units
+
+Edits made directly on ``workspace.dat`` bypass the handles; report them with
+``workspace.changes.mark(kind, obj_id)``, or with
+``workspace.changes.touch(section)`` for sections without a kind (terrain,
+map, tech tree, ...).
+
+While held (see hold(), used by ``workspace.batch()``), notifications are
+collected and coalesced per object, and delivered once by release().
+
+Usage:
+    workspace.changes.subscribe(lambda kind, obj_id: print(kind, obj_id))
+    workspace.unit_manager.get(4).hit_points = 40   # prints: units 4
+"""
+from __future__ import annotations
+
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+__all__ = ["ChangeTracker", "CHANGE_KINDS", "KIND_SECTIONS", "notifies"]
+
+CHANGE_KINDS = ("units", "sprites", "sounds", "techs", "tech_effects", "civilizations")
+
+# Change kind -> top-level DatFile section holding the objects
+KIND_SECTIONS = {
+    "units": "civilizations",
+    "sprites": "sprites",
+    "sounds": "sounds",
+    "techs": "techs",
+    "tech_effects": "tech_effects",
+    "civilizations": "civilizations",
+}
+
+Listener = Callable[[str, Optional[int]], None]
+
+
+class ChangeTracker:
+    """
+    Fan-out point for write notifications.
+
+    With no subscribers a notification only bumps a per-section counter, so
+    handles can report every write without measurable cost.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without subscribers."""
+        self._listeners: List[Listener] = []
+        # Top-level section -> number of changes reported since load
+        self._section_versions: Dict[str, int] = {}
+        # While held: kind -> IDs to deliver (None = whole collection)
+        self._held: Optional[Dict[str, Optional[Dict[int, None]]]] = None
+
+    def subscribe(self, listener: Listener) -> None:
+        """
+        Register a callback for write notifications.
+
+        Args:
+            listener: Called as listener(kind, obj_id)
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        """Remove a callback registered with subscribe()."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def mark(self, kind: str, obj_id: Optional[int] = None) -> None:
+        """
+        Report a write.
+
+        Args:
+            kind: One of CHANGE_KINDS
+            obj_id: ID of the changed object, or None for the whole collection
+        """
+        section = KIND_SECTIONS.get(kind)
+        if section is not None:
+            self._section_versions[section] = self._section_versions.get(section, 0) + 1
+        held = self._held
+        if held is not None:
+            if obj_id is None:
+                held[kind] = None
+            elif kind not in held:
+                held[kind] = {obj_id: None}
+            elif held[kind] is not None:
+                held[kind][obj_id] = None
+            return
+        for listener in self._listeners:
+            listener(kind, obj_id)
+
+    def touch(self, *sections: str) -> None:
+        """
+        Report direct edits of whole top-level sections.
+
+        Subscribers are not notified; only the section versions change.
+
+        Args:
+            sections: DatFile section names ("tech_tree", "terrain_data", ...)
+        """
+        for section in sections:
+            self._section_versions[section] = self._section_versions.get(section, 0) + 1
+
+    def section_version(self, section: str) -> int:
+        """
+        Number of changes reported for a top-level section since load.
+
+        Args:
+            section: DatFile section name
+
+        Returns:
+            0 while the section is unchanged; grows with every mark() or touch()
+        """
+        return self._section_versions.get(section, 0)
+
+    # -------------------------
+    # Holding
+    # -------------------------
+
+    @property
+    def held(self) -> bool:
+        """True while notifications are collected instead of delivered."""
+        return self._held is not None
+
+    def hold(self) -> None:
+        """Collect notifications from now on, until release()."""
+        if self._held is None:
+            self._held = {}
+
+    def flush(self) -> None:
+        """Deliver the notifications collected so far and keep holding."""
+        if self._held:
+            self.release()
+            self.hold()
+
+    def release(self) -> None:
+        """Stop holding and deliver each collected notification once."""
+        held, self._held = self._held, None
+        if not held:
+            return
+        for kind, ids in held.items():
+            for obj_id in (None,) if ids is None else ids:
+                for listener in self._listeners:
+                    listener(kind, obj_id)
+
+
+def notifies(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator for mutating methods of objects with ``_before_change`` and
+    ``_on_change`` callbacks.
+
+    ``_before_change`` (if set) runs before the method. ``_on_change`` (if
+    set) runs after it, also when it raises, since part of the data may
+    already have been written.
+    """
+    @wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        if self._before_change is not None:
+            self._before_change()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if self._on_change is not None:
+                self._on_change()
+    return wrapper
@@ -7,7 +7,9 @@ Exception hierarchy:
     ├── InvalidIdError (ID out of valid range)
     ├── UnitIdConflictError (ID already exists)
     ├── GapNotAllowedError (gaps in ID sequence)
-    └── TemplateNotFoundError (base template not found)
+    ├── TemplateNotFoundError (base template not found)
+    ├── IdRangeExhaustedError (reserved ID range has no free IDs)
+    └── PatchError (patch cannot be created or applied)
 """
 from __future__ import annotations
 
@@ -21,6 +23,8 @@ __all__ = [
     "UnitIdConflictError",
     "GapNotAllowedError",
     "TemplateNotFoundError",
+    "IdRangeExhaustedError",
+    "PatchError",
 ]
 
 
@@ -183,3 +187,25 @@ class TemplateNotFoundError(GenieToolsError):
     - create(base_unit_id=999999) when unit 999999 doesn't exist
     """
     pass
+
+
+class IdRangeExhaustedError(GenieToolsError):
+    """
+    Raised when a reserved ID range has no free IDs left.
+
+    Examples:
+    - create() with the "reserved" allocation policy after all IDs of the
+      mod's range are in use
+    """
+    pass
+
+
+class PatchError(GenieToolsError):
+    """
+    Raised when a DAT patch cannot be created or applied.
+
+    Examples:
+    - apply_patch() on a workspace of a different DAT version
+    - create_patch() between files with different civilization counts
+    """
+    pass
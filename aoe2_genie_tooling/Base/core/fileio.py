@@ -3,13 +3,27 @@ FileIO - Handles reading and writing DAT files.
 
 Responsibilities:
 - Load DAT files from disk using GenieDatParser backend
+- Optionally load through a memory map with streaming inflation
 - Save modified DAT files to disk
 - Handle backend method variations (parse/from_file, save/write)
+- Apply the requested compression profile when writing
+- Reuse compressed bytes of sections whose bytes did not change since the last save
+- Compress and write in the background with an atomic replace of the target
+- Read and write raw (uncompressed) DAT files and convert between both forms
 """
 from __future__ import annotations
 
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
@@ -17,8 +31,46 @@ if TYPE_CHECKING:
 # Import DatFile from vendored GenieDatParser
 import aoe2_genie_tooling._vendor  # Initialize vendored path
 from sections.datfile_sections import DatFile
+from zlib_ng import zlib_ng as zlib
+from aoe2_genie_tooling.Base.config import CompressionProfile, Config
+from aoe2_genie_tooling.Base.core.lazy_dat import LazyDatFile
+from aoe2_genie_tooling.Base.core.section_cache import SectionCache
 
 PathLike = Union[str, Path]
+CompressionLike = Union[CompressionProfile, str, None]
+
+# Compressed input is fed to the inflater, and output taken from it, in slices of this size
+_INFLATE_CHUNK = 4 * 1024 * 1024
+
+# First binary-file-parser release whose BaseStruct.from_bytes() reads a bytearray
+# as-is; None while every release takes bytes only (checked up to 0.3.0a24)
+_BUFFER_FROM_BYTES_SINCE: Optional[Tuple[int, int, int, float]] = None
+
+
+def _bfp_release() -> Optional[Tuple[int, int, int, float]]:
+    """Installed binary-file-parser release as (major, minor, patch, alpha), or None if unknown."""
+    try:
+        match = re.match(r"(\d+)\.(\d+)\.(\d+)(?:a(\d+))?", version("binary-file-parser"))
+    except PackageNotFoundError:
+        return None
+    if match is None:
+        return None
+    major, minor, patch, alpha = match.groups()
+    # A final release sorts after its alphas
+    return int(major), int(minor), int(patch), float(alpha) if alpha else float("inf")
+
+
+def _from_bytes_takes_buffer() -> bool:
+    """Whether DatFile.from_bytes() accepts a bytearray, decided from the installed bfp_rs release."""
+    release = _bfp_release()
+    return _BUFFER_FROM_BYTES_SINCE is not None and release is not None and release >= _BUFFER_FROM_BYTES_SINCE
+
+
+# Decided once; memory-mapped loads copy the inflated payload to bytes otherwise
+_FROM_BYTES_TAKES_BUFFER = _from_bytes_takes_buffer()
+
+# DatFile._compression_level is class-wide, so concurrent saves must not interleave
+_compression_lock = threading.Lock()
 
 __all__ = ["FileIO"]
 
@@ -38,6 +90,9 @@ class FileIO:
             workspace: The GenieWorkspace instance owning this FileIO
         """
         self.workspace = workspace
+        self.section_cache = SectionCache()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
     
     @staticmethod
     def load_dat_file(path: PathLike) -> DatFile:
@@ -69,16 +124,308 @@ class FileIO:
         
         return loader(str(p))
     
-    def save(self, path: PathLike) -> None:
+    @staticmethod
+    def load_dat_file_mapped(path: PathLike, size_hint: Optional[int] = None) -> DatFile:
+        """
+        Load a DatFile through a memory map of the compressed file.
+
+        The compressed input is never copied into a bytes object: the inflater
+        reads slices of the map and its output is copied, at most
+        _INFLATE_CHUNK bytes at a time, into one preallocated buffer that is
+        handed to the parser. This keeps peak memory close to the size of the
+        inflated DAT, which matters when several DATs are loaded side by side.
+
+        If the installed bfp_rs release only accepts immutable bytes (every
+        release so far), the buffer is copied once before parsing.
+
+        Args:
+            path: Path to the .dat file (compressed or raw)
+            size_hint: Expected inflated size in bytes, to preallocate the buffer
+
+        Returns:
+            Loaded DatFile instance
+        """
+        with open(Path(path), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            payload = FileIO._inflate_into_buffer(mapped, size_hint)
+
+        if _FROM_BYTES_TAKES_BUFFER:
+            return DatFile.from_bytes(payload)
+        return DatFile.from_bytes(bytes(payload))
+
+    @staticmethod
+    def _inflate_into_buffer(source: mmap.mmap, size_hint: Optional[int] = None) -> bytearray:
+        """
+        Inflate a raw deflate stream (or copy a raw payload) into a single bytearray.
+
+        The buffer is allocated once from size_hint (or a guess) and doubled in
+        place when it is too small. The inflater never returns more than the
+        free space (and at most _INFLATE_CHUNK bytes); input it could not
+        consume yet is fed again from its unconsumed_tail.
+        """
+        view = memoryview(source)
+        try:
+            if bytes(view[:4]) == b"VER ":
+                return bytearray(view)
+
+            out = bytearray(size_hint or len(source) * 4)
+            pos = 0
+            inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+            for start in range(0, len(view), _INFLATE_CHUNK):
+                data = view[start:start + _INFLATE_CHUNK]
+                while data and not inflater.eof:
+                    if pos == len(out):
+                        # Grows in place; the duplicated bytes are overwritten or cut off below
+                        out *= 2
+                    chunk = inflater.decompress(data, min(len(out) - pos, _INFLATE_CHUNK))
+                    out[pos:pos + len(chunk)] = chunk
+                    pos += len(chunk)
+                    data = inflater.unconsumed_tail
+
+            tail = inflater.flush()
+            while pos + len(tail) > len(out):
+                out *= 2
+            out[pos:pos + len(tail)] = tail
+            del out[pos + len(tail):]
+            return out
+        finally:
+            view.release()
+
+    @staticmethod
+    def resolve_compression(compression: CompressionLike = None) -> CompressionProfile:
+        """
+        Normalize a compression argument to a CompressionProfile.
+
+        Args:
+            compression: Profile, profile name ("fast", "balanced", "max") or None
+                         for Config.DEFAULT_COMPRESSION
+
+        Returns:
+            The matching CompressionProfile
+
+        Raises:
+            ValueError: If the name is not a known profile
+        """
+        if compression is None:
+            return Config.DEFAULT_COMPRESSION
+        if isinstance(compression, CompressionProfile):
+            return compression
+        try:
+            return CompressionProfile(str(compression).lower())
+        except ValueError:
+            valid = ", ".join(p.value for p in CompressionProfile)
+            raise ValueError(f"Unknown compression profile {compression!r}. Expected one of: {valid}") from None
+
+    def save(self, path: PathLike, compression: CompressionLike = None, compressed: bool = True) -> None:
         """
         Save the workspace's DAT file to disk.
         
-        Uses DatFile.to_file() method from GenieDatParser.
+        Uses DatFile.to_file() method from GenieDatParser. The deflate level is
+        taken from the compression profile; every profile writes a standard raw
+        deflate stream that the game can read.
         
+        A lazily loaded DAT that was never accessed is copied from its source
+        file unchanged, since there is nothing to re-serialize. Otherwise every
+        section is serialized, and only those whose bytes differ from the
+        previous save are compressed again; the others reuse the compressed
+        bytes cached by that save. Sections of a section-indexed lazy DAT
+        that were never parsed are taken from the bytes they were loaded from.
+
+        With compressed=False the inflated payload is written as is. Raw files
+        load like compressed ones and can be compared with binary diff tools.
+
         Args:
             path: Output path for the .dat file
+            compression: Compression profile (default: Config.DEFAULT_COMPRESSION)
+            compressed: Write a deflate-compressed DAT (False = raw payload)
         """
         p = Path(path)
-        
-        # Use to_file method from GenieDatParser
-        self.workspace.dat.to_file(str(p))
+        dat = self.workspace.dat
+        level = self.resolve_compression(compression).level if compressed else None
+        self.wait()
+
+        if isinstance(dat, LazyDatFile) and not dat.parsed_sections:
+            self.convert(dat.source_path, p, compressed=compressed, compression=compression)
+            return
+
+        if SectionCache.supports(dat):
+            try:
+                if level is None:
+                    data = self.section_cache.payload(dat)
+                else:
+                    data = self.section_cache.build(dat, level)
+            except Exception as e:
+                self.section_cache.invalidate()
+                self.workspace.logger.warning(f"Incremental save failed ({e}), writing full file")
+            else:
+                p.write_bytes(data)
+                return
+
+        with _compression_lock:
+            previous = DatFile._compression_level
+            DatFile._compression_level = level
+            try:
+                # Use to_file method from GenieDatParser
+                dat.to_file(str(p))
+            finally:
+                DatFile._compression_level = previous
+
+    def save_async(self, path: PathLike, compression: CompressionLike = None, compressed: bool = True) -> Future:
+        """
+        Save the workspace's DAT file in the background.
+
+        The sections are serialized before this returns, so later edits do not
+        leak into the file. Compression and writing run on a worker
+        thread; the output goes to a temporary file that atomically replaces
+        the target, so readers never see a partially written DAT. Saves run
+        one at a time in the order they were requested.
+
+        SWGB files cannot be snapshotted section by section: they are
+        serialized in full before this returns, and only the atomic write runs
+        in the background.
+
+        Args:
+            path: Output path for the .dat file
+            compression: Compression profile (default: Config.DEFAULT_COMPRESSION)
+            compressed: Write a deflate-compressed DAT (False = raw payload)
+
+        Returns:
+            Future that resolves to the output Path when the file is written
+        """
+        p = Path(path)
+        dat = self.workspace.dat
+        level = self.resolve_compression(compression).level if compressed else None
+
+        job: Optional[Callable[[], Path]] = None
+        if isinstance(dat, LazyDatFile) and not dat.parsed_sections:
+            source = dat.source_path
+            job = partial(self.convert, source, p, compressed=compressed, compression=compression)
+        elif SectionCache.supports(dat):
+            try:
+                if level is None:
+                    payload = self.section_cache.payload(dat)
+                    job = partial(self._write_atomic, p, payload)
+                else:
+                    snapshot = self.section_cache.snapshot(dat, level)
+
+                    def write_compressed() -> Path:
+                        return self._write_atomic(p, self.section_cache.compress(snapshot))
+
+                    job = write_compressed
+            except Exception as e:
+                self.section_cache.invalidate()
+                self.workspace.logger.warning(f"Incremental save failed ({e}), writing full file")
+
+        if job is None:
+            data = self._full_bytes(dat, level)
+            job = partial(self._write_atomic, p, data)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="genie-save")
+        self._pending = self._executor.submit(job)
+        return self._pending
+
+    @staticmethod
+    def _full_bytes(dat: DatFile, level: Optional[int]) -> bytes:
+        """Serialize the whole DAT with DatFile.to_bytes() at a compression level."""
+        with _compression_lock:
+            previous = DatFile._compression_level
+            DatFile._compression_level = level
+            try:
+                return dat.to_bytes()
+            finally:
+                DatFile._compression_level = previous
+
+    @staticmethod
+    def is_raw_file(path: PathLike) -> bool:
+        """
+        Check whether a DAT file holds an uncompressed payload.
+
+        Raw payloads start with the "VER " version string; a deflate stream
+        can never start with those bytes.
+
+        Args:
+            path: Path to the .dat file
+
+        Returns:
+            True for a raw DAT, False for a compressed one
+        """
+        with open(Path(path), "rb") as f:
+            return f.read(4) == b"VER "
+
+    @staticmethod
+    def convert(
+        source: PathLike,
+        target: PathLike,
+        compressed: bool = True,
+        compression: CompressionLike = None,
+    ) -> Path:
+        """
+        Convert a DAT file between compressed and raw form without parsing it.
+
+        If the source already has the requested form it is copied unchanged.
+        Source and target may be the same path.
+
+        Args:
+            source: DAT file to read
+            target: Output path
+            compressed: Produce a compressed DAT (False = raw payload)
+            compression: Compression profile when compressing
+
+        Returns:
+            The target Path
+        """
+        src, dst = Path(source), Path(target)
+        if FileIO.is_raw_file(src) != compressed:
+            if src.resolve() != dst.resolve():
+                shutil.copyfile(src, dst)
+            return dst
+
+        data = src.read_bytes()
+        if compressed:
+            level = FileIO.resolve_compression(compression).level
+            deflate_obj = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            data = deflate_obj.compress(data) + deflate_obj.flush()
+        else:
+            data = DatFile._decompress(data)
+        return FileIO._write_atomic(dst, data)
+
+    def wait(self) -> None:
+        """Block until the last background save has finished."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def close(self) -> None:
+        """
+        Finish the pending background save and stop the save thread.
+
+        A later save_async() starts a new thread, so closing is safe at any time.
+
+        Raises:
+            Exception: Whatever the pending save raised
+        """
+        try:
+            self.wait()
+        finally:
+            executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def __enter__(self) -> FileIO:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> Path:
+        """Write data next to path, then replace path in one step."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
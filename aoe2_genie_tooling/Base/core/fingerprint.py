@@ -0,0 +1,311 @@
+"""
+Fingerprint - Content hashes of a DAT, per section and per object.
+
+Responsibilities:
+- Hash every unit (per civilization), sprite, sound, tech, effect and civ
+- Combine object hashes into section hashes and one hash for the whole file
+- Keep the hashes between calls and recompute only what handles wrote to
+
+Object hashes are invalidated by the workspace ChangeTracker, so a repeated
+fingerprint() after a few edits re-serializes only the edited objects. Top-level
+sections without handles (terrain, map, tech tree, ...) are hashed once and
+again only after they were reported with ``workspace.changes.touch()``.
+
+Hashes are blake2b digests of the serialized bytes: equal content gives equal
+hashes across sessions and machines.
+
+Usage:
+    before = workspace.fingerprint()
+    workspace.unit_manager.get(4).hit_points = 40
+    after = workspace.fingerprint()
+    after.diff(before)  # {"units": [(0, 4), (1, 4), ...]}
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from sections.datfile_sections import DatFile
+
+from aoe2_genie_tooling.Base.core.lazy_dat import DAT_SECTIONS
+from aoe2_genie_tooling.Base.core.struct_schema import is_list, is_struct, retriever_fields
+
+if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.workspace import GenieWorkspace
+
+__all__ = ["DatFingerprint", "Fingerprinter"]
+
+_DIGEST_SIZE = 16
+
+# Top-level lists hashed element by element (change kind = section name)
+_COLLECTIONS = ("sprites", "sounds", "techs", "tech_effects")
+
+# Sections hashed from object hashes; all others are hashed whole
+_OBJECT_SECTIONS = frozenset(_COLLECTIONS) | {"civilizations"}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def _struct_digest(value: Any) -> str:
+    return _digest(value.to_bytes())
+
+
+def _combine(parts: Iterable[str]) -> str:
+    """Hash an ordered sequence of digests (or "-" for empty slots)."""
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for part in parts:
+        h.update(part.encode("ascii"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _value_bytes(value: Any) -> bytes:
+    """Serialize a field value for hashing."""
+    if is_struct(value):
+        return value.to_bytes()
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    if is_list(value):
+        return b"[" + b",".join(_value_bytes(v) for v in value) + b"]"
+    return repr(value).encode("utf-8")
+
+
+def _civ_digest(civ: Any) -> str:
+    """Hash a civilization without its units (those are hashed one by one)."""
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for name in retriever_fields(type(civ), civ.ver):
+        if name != "units":
+            h.update(_value_bytes(getattr(civ, name)))
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class DatFingerprint:
+    """
+    Content hashes of a DAT at one point in time.
+
+    Empty (None) slots are left out of the per-object maps.
+
+    Attributes:
+        digest: Hash of the whole file
+        sections: Top-level section name -> hash
+        units: (civ ID, unit ID) -> hash
+        sprites: Sprite ID -> hash
+        sounds: Sound ID -> hash
+        techs: Tech ID -> hash
+        effects: Effect ID -> hash
+        civilizations: Civ ID -> hash of the civ fields other than units
+    """
+    digest: str
+    sections: Dict[str, str] = field(default_factory=dict)
+    units: Dict[Tuple[int, int], str] = field(default_factory=dict)
+    sprites: Dict[int, str] = field(default_factory=dict)
+    sounds: Dict[int, str] = field(default_factory=dict)
+    techs: Dict[int, str] = field(default_factory=dict)
+    effects: Dict[int, str] = field(default_factory=dict)
+    civilizations: Dict[int, str] = field(default_factory=dict)
+
+    def diff(self, other: DatFingerprint) -> Dict[str, List[Hashable]]:
+        """
+        List what differs from another fingerprint.
+
+        Args:
+            other: Fingerprint to compare against
+
+        Returns:
+            Category ("sections", "units", "sprites", ...) -> sorted keys that were
+            added, removed or changed. Categories without differences are left out.
+        """
+        result: Dict[str, List[Hashable]] = {}
+        if self.digest == other.digest:
+            return result
+        for name in ("sections", "units", "sprites", "sounds", "techs", "effects", "civilizations"):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            keys = [k for k in mine.keys() | theirs.keys() if mine.get(k) != theirs.get(k)]
+            if keys:
+                result[name] = sorted(keys)
+        return result
+
+
+class Fingerprinter:
+    """
+    Incremental fingerprint cache bound to a workspace.
+
+    Subscribes to ``workspace.changes`` on creation. Objects reported as changed
+    are hashed again on the next compute(); everything else is served from the
+    cache. List growth and shrinkage are picked up without a notification.
+    """
+
+    def __init__(self, workspace: GenieWorkspace) -> None:
+        """
+        Initialize an empty cache and start listening for changes.
+
+        Args:
+            workspace: The GenieWorkspace to fingerprint
+        """
+        self.workspace = workspace
+        # kind -> {id: digest}, None marks an empty slot
+        self._objects: Dict[str, Dict[int, Optional[str]]] = {
+            kind: {} for kind in (*_COLLECTIONS, "civilizations")
+        }
+        # civ ID -> {unit ID: digest}
+        self._units: Dict[int, Dict[int, Optional[str]]] = {}
+        # kind -> IDs to hash again, None = everything
+        self._stale: Dict[str, Optional[Set[int]]] = {kind: None for kind in (*self._objects, "units")}
+        # section name -> (ChangeTracker section version, digest)
+        self._sections: Dict[str, Tuple[int, str]] = {}
+        self.last_rehashed = 0
+        workspace.changes.subscribe(self._on_change)
+
+    def _on_change(self, kind: str, obj_id: Optional[int]) -> None:
+        if kind not in self._stale:
+            return
+        if obj_id is None:
+            self._stale[kind] = None
+            if kind == "civilizations":
+                # Whole civs were added or replaced, their units with them
+                self._stale["units"] = None
+            return
+        stale = self._stale[kind]
+        if stale is not None:
+            stale.add(obj_id)
+
+    def invalidate(self) -> None:
+        """Drop all cached hashes."""
+        for kind in self._stale:
+            self._stale[kind] = None
+        self._sections.clear()
+
+    def compute(self) -> DatFingerprint:
+        """
+        Bring the cache up to date and return the current fingerprint.
+
+        Returns:
+            The DatFingerprint
+        """
+        dat = self.workspace.dat
+        self.last_rehashed = 0
+
+        for kind in _COLLECTIONS:
+            self._refresh_list(kind, getattr(dat, kind), _struct_digest)
+        civs = dat.civilizations
+        self._refresh_list("civilizations", civs, _civ_digest)
+        self._refresh_units(civs)
+
+        changes = self.workspace.changes
+        available = retriever_fields(DatFile, dat.ver)
+        sections: Dict[str, str] = {}
+        for name in DAT_SECTIONS:
+            if name not in available:
+                continue
+            if name in _OBJECT_SECTIONS:
+                sections[name] = self._object_section_digest(name, civs)
+                continue
+            version = changes.section_version(name)
+            cached = self._sections.get(name)
+            if cached is None or cached[0] != version:
+                cached = self._sections[name] = (version, _digest(_value_bytes(getattr(dat, name))))
+                self.last_rehashed += 1
+            sections[name] = cached[1]
+
+        objects = {kind: {k: d for k, d in digests.items() if d is not None} for kind, digests in self._objects.items()}
+        units = {
+            (civ_id, unit_id): d
+            for civ_id, digests in self._units.items()
+            for unit_id, d in digests.items() if d is not None
+        }
+        return DatFingerprint(
+            digest=_combine(f"{name}={digest}" for name, digest in sections.items()),
+            sections=sections,
+            units=units,
+            sprites=objects["sprites"],
+            sounds=objects["sounds"],
+            techs=objects["techs"],
+            effects=objects["tech_effects"],
+            civilizations=objects["civilizations"],
+        )
+
+    def unit_digests(self) -> Dict[int, Dict[int, Optional[str]]]:
+        """
+        Bring the unit hashes up to date and return them.
+
+        Returns:
+            Civ ID -> unit ID -> hash (None for empty slots). The cache itself,
+            valid until the next change; do not modify.
+        """
+        self._refresh_units(self.workspace.dat.civilizations)
+        return self._units
+
+    def _refresh_list(self, kind: str, items: List[Any], digest_fn: Callable[[Any], str]) -> None:
+        """Hash stale and new entries of a top-level list."""
+        cache = self._objects[kind]
+        stale = self._stale[kind]
+        count = len(items)
+
+        if stale is None:
+            cache.clear()
+            ids: Iterable[int] = range(count)
+        else:
+            for key in [k for k in cache if k >= count]:
+                del cache[key]
+            ids = {i for i in stale if i < count} | set(range(len(cache), count))
+
+        for i in ids:
+            item = items[i]
+            cache[i] = None if item is None else digest_fn(item)
+            self.last_rehashed += 1
+        self._stale[kind] = set()
+
+    def _refresh_units(self, civs: List[Any]) -> None:
+        """Hash stale and new units in every civilization."""
+        stale = self._stale["units"]
+        if stale is None:
+            self._units.clear()
+
+        for civ_id in [c for c in self._units if c >= len(civs) or civs[c] is None]:
+            del self._units[civ_id]
+
+        # A unit shared between civs is serialized once. The unit is kept
+        # with its digest so its id() cannot be reused by another object.
+        shared: Dict[int, Tuple[Any, str]] = {}
+
+        for civ_id, civ in enumerate(civs):
+            if civ is None:
+                continue
+            units = civ.units
+            count = len(units)
+            cache = self._units.setdefault(civ_id, {})
+            for unit_id in [u for u in cache if u >= count]:
+                del cache[unit_id]
+            ids = set(range(len(cache), count))
+            if stale:
+                ids.update(i for i in stale if i < count)
+            for unit_id in ids:
+                unit = units[unit_id]
+                if unit is None:
+                    cache[unit_id] = None
+                    continue
+                entry = shared.get(id(unit))
+                if entry is None:
+                    entry = shared[id(unit)] = (unit, _struct_digest(unit))
+                    self.last_rehashed += 1
+                cache[unit_id] = entry[1]
+        self._stale["units"] = set()
+
+    def _object_section_digest(self, name: str, civs: List[Any]) -> str:
+        """Combine the object hashes of a list section in file order."""
+        if name != "civilizations":
+            cache = self._objects[name]
+            return _combine(cache[i] or "-" for i in range(len(cache)))
+
+        civ_digests = self._objects["civilizations"]
+        parts: List[str] = []
+        for civ_id in range(len(civs)):
+            parts.append(civ_digests.get(civ_id) or "-")
+            units = self._units.get(civ_id, {})
+            parts.extend(units[i] or "-" for i in range(len(units)))
+        return _combine(parts)
@@ -0,0 +1,117 @@
+"""
+HandleCache - Weak-value cache of the handles a manager hands out.
+
+Responsibilities:
+- Return the same handle for repeated get() calls while someone holds it, so
+  its wrapper and unit caches stay warm
+- Drop or refresh the handles of the IDs the change tracker reports
+
+Entries disappear as soon as the last reference to a handle is dropped; the
+cache never keeps handles alive on its own.
+
+A change reported for an ID drops its cached handle, so the next get()
+builds a new one; with a refresh callback the handle is kept and refreshed
+on its next get() instead. A whole-collection change does this for every
+handle. Nothing is checked on get() itself.
+
+Usage:
+    self._handles = HandleCache("techs", lambda tech_id: TechHandle(self.workspace, tech_id))
+    workspace.changes.subscribe(self._handles.on_change)
+    handle = self._handles.get(tech_id)
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Generic, Hashable, Iterator, Optional, Sequence, Set, TypeVar
+from weakref import WeakValueDictionary
+
+__all__ = ["HandleCache"]
+
+H = TypeVar("H")
+
+
+class HandleCache(Generic[H]):
+    """
+    Weak-value handle cache keyed by ID (or any hashable key).
+
+    Attributes:
+        kind: Change tracker kind of the collection
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        make: Callable[[Hashable], H],
+        key_id: Optional[Callable[[Hashable], int]] = None,
+        refresh: Optional[Callable[[H], None]] = None,
+        reset_kinds: Sequence[str] = (),
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            kind: Change tracker kind of the collection
+            make: Builds the handle for a key
+            key_id: Object ID of a key, for keys that are not the ID itself
+            refresh: Brings a handle of a changed ID up to date; without it,
+                     such handles are dropped
+            reset_kinds: Other kinds whose whole-collection notifications
+                         also reset the cache (e.g. "civilizations" for units)
+        """
+        self.kind = kind
+        self._make = make
+        self._key_id = key_id
+        self._refresh = refresh
+        self._reset_kinds = frozenset(reset_kinds)
+        self._handles: WeakValueDictionary = WeakValueDictionary()
+        # ID -> keys handed out for it (only with key_id)
+        self._keys: Dict[int, Set[Hashable]] = {}
+        # Keys whose handle is refreshed before its next reuse
+        self._stale: Set[Hashable] = set()
+
+    def get(self, key: Hashable) -> H:
+        """Return the cached handle for key, or a new one."""
+        handle = self._handles.get(key)
+        if handle is None:
+            self._stale.discard(key)
+            handle = self._make(key)
+            self._handles[key] = handle
+            if self._key_id is not None:
+                self._keys.setdefault(self._key_id(key), set()).add(key)
+        elif key in self._stale:
+            self._stale.discard(key)
+            self._refresh(handle)
+        return handle
+
+    def on_change(self, kind: str, obj_id: Optional[int]) -> None:
+        """Change tracker listener (see ChangeTracker.subscribe)."""
+        if kind == self.kind and obj_id is not None:
+            keys = self._keys.get(obj_id, ()) if self._key_id is not None else (obj_id,)
+            if self._refresh is not None:
+                self._stale.update(keys)
+                return
+            for key in keys:
+                self._handles.pop(key, None)
+            self._keys.pop(obj_id, None)
+        elif obj_id is None and (kind == self.kind or kind in self._reset_kinds):
+            if self._refresh is not None:
+                # Handles held elsewhere stay in use
+                for handle in self.handles():
+                    self._refresh(handle)
+            self.clear()
+
+    def discard(self, key: Hashable) -> None:
+        """Forget the handle for key (holders keep their reference)."""
+        self._handles.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all handles."""
+        self._handles.clear()
+        self._keys.clear()
+        self._stale.clear()
+
+    def handles(self) -> Iterator[H]:
+        """Live cached handles."""
+        return iter(list(self._handles.values()))
+
+    def __len__(self) -> int:
+        return len(self._handles)
@@ -0,0 +1,327 @@
+"""
+IdAllocator - Slot occupancy index and ID allocation policies.
+
+Responsibilities:
+- Keep one state byte per slot of an ID space (empty, placeholder, in use)
+- Hand out free IDs by policy: append, lowest free slot, or a reserved range
+- Stay in sync with writes through the workspace change tracker
+
+The index is built on first use with one pass over the data. After that,
+lookups and allocations are O(1) (a lowest-free search is a memchr over the
+state bytes), instead of a scan over every civilization per query.
+
+Managers report the slots they fill or free with mark_used()/mark_free()/
+grow(). Any other write reported to the change tracker marks that slot dirty;
+it is checked again on the next query. Writes that bypass the change tracker
+need invalidate().
+
+Usage:
+    ids = workspace.unit_manager.ids
+    ids.reserve("my_mod", 5000, 6000)
+    ids.set_policy("reserved", "my_mod")   # new units now get IDs 5000-5999
+    handle = workspace.unit_manager.create("Hero", base_unit_id=4)
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Set, Tuple
+
+from aoe2_genie_tooling.Base.core.exceptions import IdRangeExhaustedError, InvalidIdError
+
+__all__ = ["IdAllocator", "EMPTY", "PLACEHOLDER", "USED"]
+
+# Slot states
+EMPTY = 0        # no object in any civ/list
+PLACEHOLDER = 1  # capacity filler, free to allocate
+USED = 2         # a real object
+
+AllocationPolicy = Literal["append", "lowest", "reserved"]
+_POLICIES = ("append", "lowest", "reserved")
+
+
+class IdAllocator:
+    """
+    Occupancy index for one ID space (e.g. unit IDs across all civs).
+
+    Attributes:
+        kind: Change tracker kind whose notifications keep the index in sync
+        policy: Default allocation policy ("append", "lowest" or "reserved")
+        id_range: Reserved range used by the "reserved" policy
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        scan: Callable[[], Iterable[int]],
+        check: Callable[[int], int],
+    ) -> None:
+        """
+        Initialize an unbuilt index.
+
+        Args:
+            kind: Change tracker kind of this ID space
+            scan: Returns the state of every slot, in order (builds the index)
+            check: Returns the current state of one slot
+        """
+        self.kind = kind
+        self.policy: AllocationPolicy = "append"
+        self.id_range: Optional[str] = None
+        self._scan = scan
+        self._check = check
+        self._states: Optional[bytearray] = None
+        self._dirty: Set[int] = set()
+        # No free slot below this index
+        self._lowest_free = 0
+        self._ranges: Dict[str, Tuple[int, int]] = {}
+
+    # -------------------------
+    # Index maintenance
+    # -------------------------
+
+    def _index(self) -> bytearray:
+        """Return the state bytes, building or refreshing them as needed."""
+        if self._states is None:
+            self._states = bytearray(self._scan())
+            self._dirty.clear()
+            self._lowest_free = 0
+        elif self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            for index in dirty:
+                self._set(index, self._check(index))
+        return self._states
+
+    def _set(self, index: int, state: int) -> None:
+        states = self._states
+        if index >= len(states):
+            if state == EMPTY:
+                return
+            states.extend(bytes(index + 1 - len(states)))
+        states[index] = state
+        if state != USED and index < self._lowest_free:
+            self._lowest_free = index
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt on the next query."""
+        self._states = None
+        self._dirty.clear()
+
+    def on_change(self, kind: str, obj_id: Optional[int]) -> None:
+        """Change tracker listener (see ChangeTracker.subscribe)."""
+        if self._states is None:
+            return
+        if kind == self.kind:
+            if obj_id is None:
+                self.invalidate()
+            else:
+                self._dirty.add(obj_id)
+        elif kind == "civilizations" and obj_id is None and self.kind == "units":
+            # Civilizations added or replaced bring their own unit tables
+            self.invalidate()
+
+    def mark_used(self, index: int) -> None:
+        """Record that a slot now holds a real object."""
+        if self._states is not None:
+            self._dirty.discard(index)
+            self._set(index, USED)
+
+    def mark_free(self, index: int, state: int = PLACEHOLDER) -> None:
+        """Record that a slot was freed (placeholder by default)."""
+        if self._states is not None:
+            self._dirty.discard(index)
+            self._set(index, state)
+
+    def grow(self, size: int) -> None:
+        """Record that the ID space was extended to size slots with placeholders."""
+        if self._states is not None and size > len(self._states):
+            start = len(self._states)
+            self._states.extend(bytes([PLACEHOLDER]) * (size - start))
+            self._lowest_free = min(self._lowest_free, start)
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    @property
+    def size(self) -> int:
+        """Number of slots (the first ID past the end)."""
+        return len(self._index())
+
+    def state(self, index: int) -> int:
+        """State of a slot (EMPTY past the end)."""
+        states = self._index()
+        return states[index] if 0 <= index < len(states) else EMPTY
+
+    def is_used(self, index: int) -> bool:
+        """True if the slot holds a real object."""
+        return self.state(index) == USED
+
+    def highest_used(self) -> int:
+        """Highest ID in use, or -1 if none."""
+        return self._index().rfind(USED)
+
+    def used_count(self) -> int:
+        """Number of slots holding a real object."""
+        return self._index().count(USED)
+
+    # -------------------------
+    # Reserved ranges
+    # -------------------------
+
+    def reserve(self, name: str, start: int, stop: int) -> None:
+        """
+        Reserve the IDs start..stop-1 for one mod.
+
+        Reserved IDs are skipped by the "append" and "lowest" policies and
+        handed out only by the "reserved" policy for that range.
+
+        Raises:
+            InvalidIdError: If the range is empty, negative or overlaps another
+        """
+        if start < 0 or stop <= start:
+            raise InvalidIdError(f"Invalid ID range {start}-{stop} for '{name}'.")
+        for other, (o_start, o_stop) in self._ranges.items():
+            if other != name and start < o_stop and o_start < stop:
+                raise InvalidIdError(
+                    f"ID range {start}-{stop} for '{name}' overlaps '{other}' ({o_start}-{o_stop})."
+                )
+        self._ranges[name] = (start, stop)
+
+    def release(self, name: str) -> None:
+        """Remove a reserved range (IDs already allocated stay in use)."""
+        self._ranges.pop(name, None)
+        self._lowest_free = 0
+        if self.id_range == name:
+            self.policy, self.id_range = "append", None
+
+    @property
+    def ranges(self) -> Dict[str, Tuple[int, int]]:
+        """Reserved ranges by name, as (start, stop)."""
+        return dict(self._ranges)
+
+    def set_policy(self, policy: AllocationPolicy, id_range: Optional[str] = None) -> None:
+        """
+        Set the policy used when no ID is given.
+
+        Args:
+            policy: "append" (after the last slot), "lowest" (lowest free
+                    slot, reusing placeholders) or "reserved" (lowest free ID
+                    in a reserved range)
+            id_range: Range name for the "reserved" policy
+        """
+        self._check_policy(policy, id_range)
+        self.policy = policy
+        self.id_range = id_range if policy == "reserved" else None
+
+    def _check_policy(self, policy: str, id_range: Optional[str]) -> None:
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown allocation policy '{policy}'. Use one of {', '.join(_POLICIES)}.")
+        if policy == "reserved" and id_range not in self._ranges:
+            raise InvalidIdError(f"No reserved ID range named '{id_range}'.")
+
+    # -------------------------
+    # Allocation
+    # -------------------------
+
+    def allocate(self, policy: Optional[AllocationPolicy] = None, id_range: Optional[str] = None) -> int:
+        """
+        Pick a free ID. The ID is not marked used; the caller does that once
+        the slot is filled.
+
+        Args:
+            policy: Policy for this call (default: self.policy)
+            id_range: Range for the "reserved" policy (default: self.id_range)
+
+        Raises:
+            IdRangeExhaustedError: If the reserved range has no free ID
+        """
+        return self.allocate_many(1, policy, id_range)[0]
+
+    def allocate_many(
+        self,
+        count: int,
+        policy: Optional[AllocationPolicy] = None,
+        id_range: Optional[str] = None,
+        exclude: Iterable[int] = (),
+    ) -> List[int]:
+        """
+        Pick count distinct free IDs in ascending order.
+
+        Args:
+            count: Number of IDs
+            policy: Policy for this call (default: self.policy)
+            id_range: Range for the "reserved" policy (default: self.id_range)
+            exclude: IDs not to hand out (e.g. explicitly requested elsewhere)
+
+        Raises:
+            IdRangeExhaustedError: If the reserved range has fewer free IDs
+        """
+        policy = policy or self.policy
+        if policy == "reserved":
+            id_range = id_range or self.id_range
+        self._check_policy(policy, id_range)
+
+        excluded = set(exclude)
+        result: List[int] = []
+        for candidate in self._candidates(policy, id_range):
+            if len(result) == count:
+                break
+            if candidate not in excluded:
+                result.append(candidate)
+        if len(result) < count:
+            start, stop = self._ranges[id_range]
+            raise IdRangeExhaustedError(
+                f"Reserved ID range '{id_range}' ({start}-{stop}) has only {len(result)} free IDs, {count} needed."
+            )
+        return result
+
+    def _candidates(self, policy: str, id_range: Optional[str]) -> Iterator[int]:
+        """Free IDs in ascending order for a policy."""
+        states = self._index()
+        if policy == "reserved":
+            start, stop = self._ranges[id_range]
+            yield from self._free_between(states, start, stop, skip_reserved=False)
+            return
+
+        position = len(states) if policy == "append" else self._lowest_free
+        if policy == "lowest":
+            first = True
+            for index in self._free_between(states, position, len(states), skip_reserved=True):
+                if first:
+                    self._lowest_free = index
+                    first = False
+                yield index
+            if first:
+                self._lowest_free = len(states)
+            position = len(states)
+
+        # Past the end every ID is free, except reserved ranges
+        while True:
+            skip = self._reserved_stop(position)
+            if skip is None:
+                yield position
+                position += 1
+            else:
+                position = skip
+
+    def _free_between(self, states: bytearray, start: int, stop: int, skip_reserved: bool) -> Iterator[int]:
+        """Free IDs in [start, stop), optionally skipping reserved ranges."""
+        position = start
+        end = min(stop, len(states))
+        while position < end:
+            found = [i for i in (states.find(EMPTY, position, end), states.find(PLACEHOLDER, position, end)) if i >= 0]
+            if not found:
+                break
+            index = min(found)
+            skip = self._reserved_stop(index) if skip_reserved else None
+            if skip is not None:
+                position = skip
+                continue
+            yield index
+            position = index + 1
+        yield from range(max(position, len(states)), stop)
+
+    def _reserved_stop(self, index: int) -> Optional[int]:
+        """End of the reserved range containing index, or None."""
+        for start, stop in self._ranges.values():
+            if start <= index < stop:
+                return stop
+        return None
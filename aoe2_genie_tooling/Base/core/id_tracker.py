@@ -5,12 +5,17 @@ Responsibilities:
 - Validate IDs are unique before assignment
 - Track ID movements (e.g., unit 400 → 399)
 - Update references when IDs change
+
+ID spaces with an IdAllocator (unit IDs, attached by UnitManager) answer
+is_id_used() from the allocator's occupancy index, so both agree on which
+IDs are taken.
 """
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, Optional, Set
 
 if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.core.id_allocator import IdAllocator
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
 
 __all__ = ["IDTracker"]
@@ -45,6 +50,23 @@ class IDTracker:
             "techs": {},
             "effects": {},
         }
+
+        # Occupancy indexes that replace _used_ids for their type
+        self._allocators: Dict[str, IdAllocator] = {}
+
+    def attach(self, obj_type: str, allocator: IdAllocator) -> None:
+        """
+        Use an IdAllocator as the source of truth for an object type.
+
+        Args:
+            obj_type: Type of object ("units", ...)
+            allocator: Occupancy index of that ID space
+        """
+        self._allocators[obj_type] = allocator
+
+    def allocator(self, obj_type: str) -> Optional[IdAllocator]:
+        """Get the IdAllocator attached for an object type, if any."""
+        return self._allocators.get(obj_type)
     
     # -------------------------
     # ID Registration
@@ -58,7 +80,9 @@ class IDTracker:
             obj_type: Type of object ("units", "graphics", etc.)
             obj_id: ID to register
         """
-        if obj_type in self._used_ids:
+        if obj_type in self._allocators:
+            self._allocators[obj_type].mark_used(obj_id)
+        elif obj_type in self._used_ids:
             self._used_ids[obj_type].add(obj_id)
     
     def unregister_id(self, obj_type: str, obj_id: int) -> None:
@@ -69,7 +93,9 @@ class IDTracker:
             obj_type: Type of object
             obj_id: ID to unregister
         """
-        if obj_type in self._used_ids:
+        if obj_type in self._allocators:
+            self._allocators[obj_type].mark_free(obj_id)
+        elif obj_type in self._used_ids:
             self._used_ids[obj_type].discard(obj_id)
     
     def is_id_used(self, obj_type: str, obj_id: int) -> bool:
@@ -83,6 +109,8 @@ class IDTracker:
         Returns:
             True if ID is in use
         """
+        if obj_type in self._allocators:
+            return self._allocators[obj_type].is_used(obj_id)
         return obj_id in self._used_ids.get(obj_type, set())
     
     # -------------------------
@@ -105,6 +133,27 @@ class IDTracker:
             self.unregister_id(obj_type, old_id)
             self.register_id(obj_type, new_id)
     
+    def track_moves(self, obj_type: str, mapping: Dict[int, int]) -> None:
+        """
+        Track many moves that happened at once (a bulk renumber).
+
+        Unlike calling track_move() per pair, this is correct for swaps and
+        chains (e.g. 1 -> 2 and 2 -> 3 together).
+
+        Args:
+            obj_type: Type of object
+            mapping: Old ID -> new ID
+        """
+        if obj_type not in self._id_moves:
+            return
+        self._id_moves[obj_type].update(mapping)
+
+        if obj_type not in self._allocators:
+            used = self._used_ids[obj_type]
+            moved = {old for old in mapping if old in used}
+            used.difference_update(moved)
+            used.update(mapping[old] for old in moved)
+
     def get_new_id(self, obj_type: str, old_id: int) -> Optional[int]:
         """
         Get the new ID for an object that moved.
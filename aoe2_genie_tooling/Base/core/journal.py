@@ -0,0 +1,394 @@
+"""
+ChangeJournal - Undo/redo history of workspace edits (``workspace.undo()``).
+
+Responsibilities:
+- Capture each object a handle or manager is about to write
+- Turn every finished edit into compact field-level change records
+- Replay those records backwards (undo) or forwards (redo)
+
+The journal is off until ``workspace.enable_journal()``. While on, handles and
+managers report the objects they are about to write (touch()); the journal
+keeps their serialized bytes only until the edit is over. Then each object is
+compared with its bytes and only the differences are kept, as tuples:
+
+- ``(kind, civs, index, ((path, old, new), ...))`` - fields of one element;
+  an empty path replaces the whole element (created, deleted, moved units)
+- ``(kind, civs, None, (old_length, new_length))`` - a list grew or shrank
+
+``civs`` lists the civilizations a unit change applies to (identical changes
+in several civs are stored once) and is None for the other kinds. Structs in
+old/new values are stored as (class, bytes). Undo and redo apply the records
+of one step and report the changed objects to ``workspace.changes``, so
+their cost grows with the size of the edit, not of the DAT.
+
+An edit ends with its change notification, so one handle write is one undo
+step; ``workspace.batch()``, manager operations (create, clone_into, move,
+delete, renumber, ...) and ``with journal.step():`` are one step each.
+
+Not journaled: direct edits of ``workspace.dat``, civilization handle writes,
+the registry and ID tracker history, and unit sharing (restored units get
+their own copy per civ).
+
+Usage:
+    journal = workspace.enable_journal(limit=200)
+    unit = workspace.unit_manager.get(4)
+    unit.hit_points = 1
+    unit.attacks.add(4, 6)
+    workspace.undo()      # attack removed
+    workspace.undo()      # hit points back
+    workspace.redo()
+
+    with journal.step():  # one undo step for several edits
+        ...
+"""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aoe2_genie_tooling.Base.core.struct_schema import diff_structs, is_list, is_struct, struct_from_bytes
+
+if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.workspace import GenieWorkspace
+
+__all__ = ["ChangeJournal", "journal_touch", "journaled"]
+
+Path = Tuple[Any, ...]
+Entry = Tuple[str, Optional[Tuple[int, ...]], Optional[int], Tuple[Any, ...]]
+
+
+def _pack(value: Any) -> Any:
+    """Detach a field value from the DAT: structs become (class, bytes)."""
+    if is_struct(value):
+        return type(value), value.to_bytes()
+    if is_list(value):
+        return [_pack(v) for v in value]
+    return value
+
+
+def _unpack(value: Any, ver: Any) -> Any:
+    """Rebuild a value produced by _pack()."""
+    if isinstance(value, tuple):
+        cls, data = value
+        return struct_from_bytes(cls, data, ver)
+    if isinstance(value, list):
+        return [_unpack(v, ver) for v in value]
+    return value
+
+
+def _assign(obj: Any, path: Path, value: Any) -> None:
+    """Set a field addressed by field names and list indices."""
+    for part in path[:-1]:
+        obj = obj[part] if isinstance(part, int) else getattr(obj, part)
+    last = path[-1]
+    if isinstance(last, int):
+        obj[last] = value
+    else:
+        setattr(obj, last, value)
+
+
+class ChangeJournal:
+    """
+    Undo and redo history of one workspace.
+
+    Attributes:
+        limit: Maximum number of undo steps kept (None = unlimited)
+    """
+
+    def __init__(self, workspace: GenieWorkspace, limit: Optional[int] = None) -> None:
+        """
+        Initialize an empty history.
+
+        Args:
+            workspace: Workspace whose edits are journaled
+            limit: Maximum number of undo steps; the oldest are dropped
+        """
+        self.workspace = workspace
+        self.limit = limit
+        self._undo: Deque[Tuple[Entry, ...]] = deque(maxlen=limit)
+        self._redo: List[Tuple[Entry, ...]] = []
+        # Open step: (kind, civ, index) -> packed element before the edit
+        self._pending: Dict[Tuple[str, Optional[int], int], Any] = {}
+        # Open step: (kind, civ) -> list length before the edit
+        self._lengths: Dict[Tuple[str, Optional[int]], int] = {}
+        # Open step: id(element) -> (element, packed), for shared units
+        self._packed: Dict[int, Tuple[Any, Any]] = {}
+        self._depth = 0
+        # A change notification ended the edit; the step closes on the next touch
+        self._closing = False
+
+    # -------------------------
+    # Recording (called by handles and managers before they write)
+    # -------------------------
+
+    def touch(self, kind: str, index: int, civ_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Remember an element before it is written.
+
+        Args:
+            kind: Change tracker kind ("units", "sprites", "sounds", "techs",
+                  "tech_effects")
+            index: Element ID
+            civ_ids: Civs of a unit (None = all civs); ignored for other kinds
+        """
+        if self._closing:
+            self.commit()
+        if kind == "units":
+            civs = self.workspace.dat.civilizations
+            for civ_id in range(len(civs)) if civ_ids is None else civ_ids:
+                if 0 <= civ_id < len(civs):
+                    self._capture(kind, civ_id, civs[civ_id].units, index)
+        else:
+            self._capture(kind, None, getattr(self.workspace.dat, kind), index)
+
+    def touch_all(self, kind: str) -> None:
+        """Remember every element of a kind (for edits that may write any of them)."""
+        if self._closing:
+            self.commit()
+        if kind == "units":
+            for civ_id, civ in enumerate(self.workspace.dat.civilizations):
+                for index in range(len(civ.units)):
+                    self._capture(kind, civ_id, civ.units, index)
+        else:
+            items = getattr(self.workspace.dat, kind)
+            for index in range(len(items)):
+                self._capture(kind, None, items, index)
+
+    def _capture(self, kind: str, civ_id: Optional[int], items: Any, index: int) -> None:
+        self._lengths.setdefault((kind, civ_id), len(items))
+        key = (kind, civ_id, index)
+        if key in self._pending or not 0 <= index < len(items):
+            # Slots past the end are recorded when the list grows
+            return
+        self._pending[key] = self._pack_element(items[index])
+
+    def _pack_element(self, element: Any) -> Any:
+        if element is None:
+            return None
+        cached = self._packed.get(id(element))
+        if cached is None:
+            cached = self._packed[id(element)] = (element, (type(element), element.to_bytes()))
+        return cached[1]
+
+    # -------------------------
+    # Steps
+    # -------------------------
+
+    @contextmanager
+    def step(self) -> Iterator[ChangeJournal]:
+        """Context manager: edits made in the block form one undo step."""
+        self.begin()
+        try:
+            yield self
+        finally:
+            self.end()
+
+    def begin(self) -> None:
+        """Open a step (nested steps join the outer one)."""
+        if self._closing:
+            self.commit()
+        self._depth += 1
+
+    def end(self) -> None:
+        """Close a step opened with begin()."""
+        self._depth -= 1
+        if self._depth == 0:
+            self.commit()
+
+    def _on_change(self, kind: str, obj_id: Optional[int]) -> None:
+        """Change tracker listener: the edit that touched the pending objects is over."""
+        if self._pending or self._lengths:
+            self._closing = True
+
+    def commit(self) -> None:
+        """Turn the open step into records (called before undo/redo and new edits)."""
+        if self._depth:
+            return
+        pending, lengths = self._pending, self._lengths
+        self._pending, self._lengths, self._packed = {}, {}, {}
+        self._closing = False
+        if not pending and not lengths:
+            return
+
+        resizes: Dict[Tuple[str, int, int], List[Optional[int]]] = {}
+        for (kind, civ_id), old_length in lengths.items():
+            items = self._items(kind, civ_id)
+            if len(items) != old_length:
+                resizes.setdefault((kind, old_length, len(items)), []).append(civ_id)
+                for index in range(old_length, len(items)):
+                    pending[(kind, civ_id, index)] = None
+
+        # Identical changes in several civs are diffed and stored once
+        groups: Dict[Tuple[str, int, Any, Any], List[Optional[int]]] = {}
+        current: Dict[Tuple[str, int, Any, Any], Any] = {}
+        for (kind, civ_id, index), old in pending.items():
+            items = self._items(kind, civ_id)
+            element = items[index] if index < len(items) else None
+            new = self._pack_element(element)
+            if old == new:
+                continue
+            key = (kind, index, old, new)
+            groups.setdefault(key, []).append(civ_id)
+            current[key] = element
+        self._packed = {}
+
+        entries: List[Entry] = []
+        for (kind, old_length, new_length), civ_ids in resizes.items():
+            entries.append((kind, self._civs(kind, civ_ids), None, (old_length, new_length)))
+        ver = self.workspace.dat.ver
+        for key in sorted(groups, key=lambda k: (k[0], k[1])):
+            kind, index, old, new = key
+            changes: List[Tuple[Path, Any, Any]] = []
+            if old is not None and new is not None and old[0] is new[0]:
+                before = _unpack(old, ver)
+                changes.extend((path, _pack(va), _pack(vb)) for path, va, vb in diff_structs(before, current[key]))
+            else:
+                changes.append(((), old, new))
+            if changes:
+                entries.append((kind, self._civs(kind, groups[key]), index, tuple(changes)))
+
+        if entries:
+            self._undo.append(tuple(entries))
+            self._redo.clear()
+
+    @staticmethod
+    def _civs(kind: str, civ_ids: List[Optional[int]]) -> Optional[Tuple[int, ...]]:
+        return tuple(sorted(civ_ids)) if kind == "units" else None
+
+    def _items(self, kind: str, civ_id: Optional[int]) -> Any:
+        dat = self.workspace.dat
+        return dat.civilizations[civ_id].units if kind == "units" else getattr(dat, kind)
+
+    # -------------------------
+    # Undo / redo
+    # -------------------------
+
+    @property
+    def undo_count(self) -> int:
+        """Number of steps undo() can revert."""
+        self.commit()
+        return len(self._undo)
+
+    @property
+    def redo_count(self) -> int:
+        """Number of steps redo() can reapply."""
+        return len(self._redo)
+
+    def undo(self) -> bool:
+        """
+        Revert the newest step.
+
+        Returns:
+            True if a step was reverted, False if there was none
+        """
+        if self._depth:
+            raise RuntimeError("Cannot undo inside a journal step or batch")
+        self.commit()
+        if not self._undo:
+            return False
+        entries = self._undo.pop()
+        self._apply(entries, forward=False)
+        self._redo.append(entries)
+        return True
+
+    def redo(self) -> bool:
+        """
+        Reapply the newest undone step.
+
+        Returns:
+            True if a step was reapplied, False if there was none
+        """
+        if self._depth:
+            raise RuntimeError("Cannot redo inside a journal step or batch")
+        self.commit()
+        if not self._redo:
+            return False
+        entries = self._redo.pop()
+        self._apply(entries, forward=True)
+        self._undo.append(entries)
+        return True
+
+    def clear(self) -> None:
+        """Forget the whole history."""
+        self.commit()
+        self._undo.clear()
+        self._redo.clear()
+
+    def _apply(self, entries: Tuple[Entry, ...], forward: bool) -> None:
+        """Write the new (forward) or old values of a step back into the DAT."""
+        workspace = self.workspace
+        sharing = workspace.unit_manager.sharing
+        ver = workspace.dat.ver
+        replaced = set()
+        ordered = entries if forward else tuple(reversed(entries))
+        # Lists grow before the elements are written and shrink after
+        resizes = [entry for entry in ordered if entry[2] is None]
+        for kind, civ_ids, _, (old_length, new_length) in resizes:
+            length = new_length if forward else old_length
+            for civ_id in civ_ids or (None,):
+                items = self._items(kind, civ_id)
+                while len(items) < length:
+                    items.append(None)
+
+        for kind, civ_ids, index, changes in ordered:
+            if index is None:
+                continue
+            targets: Iterable[Optional[int]] = (None,)
+            if kind == "units":
+                if changes[0][0]:
+                    # Written like a handle would: shared objects once
+                    targets = sharing.unique_civs(index, list(civ_ids))
+                else:
+                    sharing.detach(index, civ_ids)
+                    replaced.add(index)
+                    targets = civ_ids
+            for civ_id in targets:
+                items = self._items(kind, civ_id)
+                # Fields are written in declaration order in both directions
+                for path, old, new in changes:
+                    value = _unpack(new if forward else old, ver)
+                    if path:
+                        _assign(items[index], path, value)
+                    else:
+                        items[index] = value
+            workspace.changes.mark(kind, index)
+        for kind, civ_ids, _, (old_length, new_length) in resizes:
+            length = new_length if forward else old_length
+            for civ_id in civ_ids or (None,):
+                items = self._items(kind, civ_id)
+                if kind == "units":
+                    for i in range(length, len(items)):
+                        sharing.detach(i, [civ_id])
+                while len(items) > length:
+                    items.pop()
+            workspace.changes.mark(kind, None)
+        if replaced:
+            workspace.unit_manager._invalidate_handles(replaced)
+        # The replay's own notifications do not start a new step
+        self._closing = False
+
+
+def journaled(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator for manager operations: run the method as one journal step.
+
+    The manager must have a ``workspace``; without an enabled journal the
+    method runs unchanged.
+    """
+    @wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        journal = self.workspace._journal
+        if journal is None:
+            return method(self, *args, **kwargs)
+        with journal.step():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def journal_touch(workspace: GenieWorkspace, kind: str, index: int, civ_ids: Optional[Iterable[int]] = None) -> None:
+    """Let the workspace journal, if enabled, remember an element before a manager writes it."""
+    journal = workspace._journal
+    if journal is not None:
+        journal.touch(kind, index, civ_ids)
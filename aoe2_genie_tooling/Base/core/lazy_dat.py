@@ -0,0 +1,265 @@
+"""
+LazyDatFile - Deferred DatFile parsing.
+
+Responsibilities:
+- Stand in for a DatFile until the data is first accessed
+- Parse single top-level sections on demand when their offsets are known
+- Hand out the loaded bytes of unparsed sections for verbatim saves
+- Let FileIO write a never accessed file back verbatim
+
+There are two modes:
+
+- Section-indexed (``LazyDatFile.indexed()``, used by ``load(cache_dir=...)``):
+  the proxy holds the inflated payload and the offset of every top-level
+  section. Accessing a section parses only that section. The offsets come
+  from the snapshot cache, which records them the first time a file is
+  loaded through it.
+- Whole-file (``LazyDatFile(path)``, used by ``load(lazy=True)``): without
+  offsets a section can only be found by parsing everything before it, so
+  nothing is parsed until some section is accessed, and then the whole file is.
+
+Usage:
+    dat = cache.load_lazy("empires2_x2_p1.dat")
+    dat.parsed_sections        # frozenset(), nothing parsed yet
+    dat.sprites                # parses the sprites section only
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Union
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from bfp_rs import ByteStream, Version
+from sections.datfile_sections import DatFile
+
+PathLike = Union[str, Path]
+
+__all__ = ["LazyDatFile", "DAT_SECTIONS"]
+
+# Top-level DatFile sections, in file order
+DAT_SECTIONS = (
+    "file_version",
+    "swgb_data",
+    "terrain_table_data",
+    "color_data",
+    "sounds",
+    "sprites",
+    "terrain_data",
+    "map_data",
+    "tech_effects",
+    "unit_data",
+    "civilizations",
+    "unknown_swgb1",
+    "techs",
+    "unknown_swgb2",
+    "tech_tree",
+)
+_SECTION_NAMES = frozenset(DAT_SECTIONS)
+
+
+class LazyDatFile:
+    """
+    Proxy for a DatFile that parses its source on first use.
+
+    Only workspaces loaded with ``lazy=True`` or ``cache_dir`` hold one; every
+    other workspace holds the DatFile itself.
+
+    In whole-file mode, attribute reads and writes are forwarded to the real
+    DatFile, which is created by the loader the first time any attribute is
+    accessed. In section-indexed mode the proxy holds the sections itself and
+    offers the DatFile attributes the toolkit uses: the sections, ``ver``,
+    ``to_bytes()`` and ``to_file()``.
+
+    Attributes:
+        source_path: File the DatFile will be parsed from
+    """
+
+    __slots__ = ("source_path", "_loader", "_dat", "_payload", "_ver", "_offsets", "_sections")
+
+    def __init__(self, path: PathLike, loader: Optional[Callable[[Path], DatFile]] = None) -> None:
+        """
+        Initialize a whole-file proxy without reading the file.
+
+        Args:
+            path: Path to the .dat file
+            loader: Callable that parses the path (default: FileIO.load_dat_file)
+        """
+        if loader is None:
+            from aoe2_genie_tooling.Base.core.fileio import FileIO
+            loader = FileIO.load_dat_file
+
+        object.__setattr__(self, "source_path", Path(path))
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_dat", None)
+        object.__setattr__(self, "_payload", None)
+        object.__setattr__(self, "_ver", None)
+        object.__setattr__(self, "_offsets", {})
+        object.__setattr__(self, "_sections", {})
+
+    @classmethod
+    def indexed(
+        cls,
+        path: PathLike,
+        payload: bytes,
+        offsets: Dict[str, Tuple[int, int]],
+        parsed: Optional[DatFile] = None,
+    ) -> LazyDatFile:
+        """
+        Create a section-indexed proxy over an inflated payload.
+
+        Args:
+            path: File the payload was loaded from
+            payload: Inflated DAT bytes
+            offsets: Section name -> (start, end) in payload, for every section
+                     of SECTION_LAYOUT
+            parsed: DatFile already parsed from payload, whose sections are
+                    used instead of parsing them again (optional)
+
+        Returns:
+            A LazyDatFile that parses sections on demand
+        """
+        proxy = cls(path, loader=_no_loader)
+        object.__setattr__(proxy, "_payload", payload)
+        object.__setattr__(proxy, "_offsets", dict(offsets))
+        if parsed is not None:
+            object.__setattr__(proxy, "_ver", parsed.ver)
+            for name in offsets:
+                proxy._sections[name] = getattr(parsed, name)
+        else:
+            object.__setattr__(proxy, "_ver", DatFile._get_version(ByteStream.from_bytes(payload[:16])))
+        return proxy
+
+    @property
+    def is_indexed(self) -> bool:
+        """True if sections are parsed one by one."""
+        return self._payload is not None
+
+    @property
+    def ver(self) -> Version:
+        """Struct version of the DAT (parses the file in whole-file mode)."""
+        if self._payload is not None:
+            return self._ver
+        return self.materialize().ver
+
+    @property
+    def parsed_sections(self) -> FrozenSet[str]:
+        """Top-level sections parsed so far."""
+        if self._payload is not None:
+            return frozenset(self._sections)
+        return _SECTION_NAMES if self._dat is not None else frozenset()
+
+    @property
+    def is_materialized(self) -> bool:
+        """True once every section has been parsed."""
+        if self._payload is not None:
+            return len(self._sections) == len(self._offsets)
+        return self._dat is not None
+
+    def section(self, name: str) -> Any:
+        """
+        Read a top-level section, parsing it if needed.
+
+        Args:
+            name: Section name (see DAT_SECTIONS)
+
+        Returns:
+            The section value
+        """
+        if self._payload is None:
+            return getattr(self.materialize(), name)
+        value = self._sections.get(name)
+        if value is None:
+            if name not in self._offsets:
+                raise AttributeError(f"DAT version {self._ver} has no section {name!r}")
+            from aoe2_genie_tooling.Base.core.section_cache import parse_section
+
+            start, end = self._offsets[name]
+            value = self._sections[name] = parse_section(name, self._payload[start:end], self._ver)
+        return value
+
+    def raw_section(self, name: str) -> Optional[bytes]:
+        """
+        The bytes a section was loaded from.
+
+        Args:
+            name: Section name
+
+        Returns:
+            The uncompressed section bytes, or None in whole-file mode
+        """
+        if self._payload is None:
+            return None
+        start, end = self._offsets[name]
+        return self._payload[start:end]
+
+    def materialize(self) -> Union[DatFile, LazyDatFile]:
+        """
+        Parse everything that is still deferred.
+
+        Returns:
+            The parsed DatFile in whole-file mode, the proxy itself in
+            section-indexed mode
+        """
+        if self._payload is not None:
+            for name in self._offsets:
+                self.section(name)
+            return self
+        if self._dat is None:
+            object.__setattr__(self, "_dat", self._loader(self.source_path))
+        return self._dat
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the DAT like DatFile.to_bytes().
+
+        Unparsed sections are copied from the loaded payload.
+
+        Returns:
+            The file contents, compressed per DatFile._compression_level
+        """
+        if self._payload is None:
+            return self.materialize().to_bytes()
+        from aoe2_genie_tooling.Base.core.section_cache import SECTION_LAYOUT, serialize_section
+
+        parts = []
+        for name, encoding in SECTION_LAYOUT:
+            value = self._sections.get(name)
+            parts.append(self.raw_section(name) if value is None else serialize_section(value, encoding))
+        return DatFile._compress(b"".join(parts))
+
+    def to_file(self, path: PathLike) -> None:
+        """Write the DAT like DatFile.to_file()."""
+        if self._payload is None:
+            self.materialize().to_file(str(path))
+            return
+        Path(path).write_bytes(self.to_bytes())
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not slots or properties, i.e. DatFile attributes
+        if self._payload is None:
+            return getattr(self.materialize(), name)
+        if name in _SECTION_NAMES:
+            return self.section(name)
+        raise AttributeError(f"{name!r} is not available on a section-indexed LazyDatFile")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyDatFile.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        if self._payload is None:
+            setattr(self.materialize(), name, value)
+            return
+        if name not in self._offsets:
+            raise AttributeError(f"{name!r} is not a section of this DAT")
+        self._sections[name] = value
+
+    def __repr__(self) -> str:
+        if self._payload is not None:
+            state = f"{len(self._sections)}/{len(self._offsets)} sections parsed"
+        else:
+            state = "materialized" if self._dat is not None else "deferred"
+        return f"LazyDatFile({self.source_path.name!r}, {state})"
+
+
+def _no_loader(path: Path) -> DatFile:
+    raise RuntimeError(f"Section-indexed LazyDatFile for {path} has no whole-file loader")
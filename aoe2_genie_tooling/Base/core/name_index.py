@@ -0,0 +1,174 @@
+"""
+NameIndex - Lazily built name lookup for one DAT collection.
+
+Responsibilities:
+- Map names to object indexes for exact, case-insensitive and prefix lookups
+- Build on first use with one pass over the collection
+- Stay in sync with writes through the workspace change tracker
+
+Objects written through handles or managers are reported to the change
+tracker; the index re-reads just those objects on the next lookup. Edits made
+directly on ``workspace.dat`` need ``workspace.changes.mark(kind, index)`` or
+invalidate().
+
+Lookups return the lowest matching index first, the same result as a scan
+from the start of the collection.
+
+Usage:
+    index = NameIndex("techs", lambda: len(dat.techs), lambda i: [dat.techs[i].name])
+    index.find("Loom")              # exact
+    index.find_all("loom", case_sensitive=False)
+    index.find_prefix("Elite ")
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+__all__ = ["NameIndex"]
+
+
+class NameIndex:
+    """
+    Name -> index lookup over one collection.
+
+    Attributes:
+        kind: Change tracker kind of the collection
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        size: Callable[[], int],
+        read: Callable[[int], Iterable[str]],
+        reset_kinds: Sequence[str] = (),
+    ) -> None:
+        """
+        Initialize an unbuilt index.
+
+        Args:
+            kind: Change tracker kind of the collection
+            size: Returns the number of objects in the collection
+            read: Returns the names of one object (empty if it has none)
+            reset_kinds: Other kinds whose whole-collection notifications
+                         (ID None) also reset this index
+        """
+        self.kind = kind
+        self._size = size
+        self._read = read
+        self._reset_kinds = tuple(reset_kinds)
+        self._built = False
+        self._dirty: Set[int] = set()
+        # index -> names it is filed under
+        self._names: Dict[int, Tuple[str, ...]] = {}
+        # name -> sorted indexes, and the same by casefolded name
+        self._exact: Dict[str, List[int]] = {}
+        self._folded: Dict[str, List[int]] = {}
+        # Sorted casefolded names for prefix search, rebuilt when names change
+        self._sorted: Optional[List[str]] = None
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt on the next lookup."""
+        self._built = False
+        self._dirty.clear()
+        self._names.clear()
+        self._exact.clear()
+        self._folded.clear()
+        self._sorted = None
+
+    def on_change(self, kind: str, obj_id: Optional[int]) -> None:
+        """Change tracker listener (see ChangeTracker.subscribe)."""
+        if not self._built:
+            return
+        if kind == self.kind:
+            if obj_id is None:
+                self.invalidate()
+            else:
+                self._dirty.add(obj_id)
+        elif obj_id is None and kind in self._reset_kinds:
+            self.invalidate()
+
+    def _refresh(self) -> None:
+        if not self._built:
+            for index in range(self._size()):
+                self._file(index, self._names_of(index))
+            self._built = True
+        elif self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            for index in dirty:
+                self._unfile(index)
+                self._file(index, self._names_of(index))
+
+    def _names_of(self, index: int) -> Tuple[str, ...]:
+        if index >= self._size():
+            return ()
+        try:
+            return tuple(dict.fromkeys(name for name in self._read(index) if isinstance(name, str)))
+        except Exception:
+            return ()
+
+    def _file(self, index: int, names: Tuple[str, ...]) -> None:
+        if not names:
+            return
+        self._names[index] = names
+        for name in names:
+            insort(self._exact.setdefault(name, []), index)
+            folded = name.casefold()
+            bucket = self._folded.get(folded)
+            if bucket is None:
+                self._folded[folded] = [index]
+                self._sorted = None
+            elif index not in bucket:
+                insort(bucket, index)
+
+    def _unfile(self, index: int) -> None:
+        for name in self._names.pop(index, ()):
+            for table, key in ((self._exact, name), (self._folded, name.casefold())):
+                bucket = table.get(key)
+                if bucket is None or index not in bucket:
+                    continue
+                bucket.remove(index)
+                if not bucket:
+                    del table[key]
+                    if table is self._folded:
+                        self._sorted = None
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+
+    def find(self, name: str, case_sensitive: bool = True) -> Optional[int]:
+        """Lowest index with the name, or None."""
+        matches = self.find_all(name, case_sensitive)
+        return matches[0] if matches else None
+
+    def find_all(self, name: str, case_sensitive: bool = True) -> List[int]:
+        """All indexes with the name, ascending."""
+        self._refresh()
+        if case_sensitive:
+            return list(self._exact.get(name, ()))
+        return list(self._folded.get(name.casefold(), ()))
+
+    def find_prefix(self, prefix: str, case_sensitive: bool = False) -> List[int]:
+        """All indexes with a name starting with prefix, ascending."""
+        self._refresh()
+        if self._sorted is None:
+            self._sorted = sorted(self._folded)
+        folded = prefix.casefold()
+        result: Set[int] = set()
+        position = bisect_left(self._sorted, folded)
+        while position < len(self._sorted) and self._sorted[position].startswith(folded):
+            result.update(self._folded[self._sorted[position]])
+            position += 1
+        if case_sensitive:
+            result = {i for i in result if any(n.startswith(prefix) for n in self._names.get(i, ()))}
+        return sorted(result)
+
+    def names(self, index: int) -> Tuple[str, ...]:
+        """Names the object at index is filed under."""
+        self._refresh()
+        return self._names.get(index, ())
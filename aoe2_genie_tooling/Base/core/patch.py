@@ -0,0 +1,373 @@
+"""
+Patch - Structural diffs between two DAT files.
+
+Responsibilities:
+- Compare two workspaces and record only what differs
+- Store the result as a small compressed patch file
+- Apply a patch to a workspace without a full load/save of a replacement DAT
+
+Units (per civilization), sprites, sounds, techs and effects are compared
+element by element. Unchanged elements are skipped by comparing their
+serialized bytes; changed ones are recorded field by field. Elements whose
+layout changed (added, removed, a nested struct switched on or off, a list
+changed length) are stored whole. Other sections are compared the same way,
+so applying a patch to its source reproduces the target byte for byte.
+
+Usage:
+    patch = create_patch(vanilla_ws, balanced_ws)
+    patch.save("balance.genpatch")
+
+    workspace = GenieWorkspace.load("empires2_x2_p1.dat")
+    apply_patch(workspace, DatPatch.load("balance.genpatch"))
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import importlib
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from sections.datfile_sections import DatFile
+
+from aoe2_genie_tooling.Base.core.exceptions import PatchError
+from aoe2_genie_tooling.Base.core.struct_schema import (
+    diff_structs,
+    is_list,
+    is_struct,
+    retriever_fields,
+    struct_from_bytes,
+    values_equal,
+)
+
+if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.workspace import GenieWorkspace
+
+PathLike = Union[str, Path]
+
+__all__ = ["DatPatch", "create_patch", "apply_patch"]
+
+# Top-level lists compared element by element
+_COLLECTIONS = ("sounds", "sprites", "tech_effects", "techs")
+
+# Remaining top-level sections, compared as a whole and diffed field by field
+_SECTIONS = (
+    "file_version", "swgb_data", "terrain_table_data", "color_data", "terrain_data",
+    "map_data", "unit_data", "unknown_swgb1", "unknown_swgb2", "tech_tree",
+)
+
+_UNITS_PREFIX = "units/"
+
+
+class _Replace(Exception):
+    """Internal: the layout of a struct changed, store it whole."""
+
+
+@dataclass
+class DatPatch:
+    """
+    A list of changes that turns one DAT into another.
+
+    Operations are compact lists:
+    - ``["resize", key, length]`` - grow (with empty slots) or shrink a list
+    - ``["put", key, index, value]`` - replace a whole element (None removes it)
+    - ``["set", key, index, path, value]`` - set one field inside an element
+
+    ``key`` is a collection name (``"sprites"``, ``"units/3"`` for civ 3, ...)
+    or ``"dat"`` for fields addressed from the root of the file.
+
+    Attributes:
+        version: Struct version of the DAT the patch was made from
+        ops: Patch operations in apply order
+    """
+    FORMAT = 1
+
+    version: str
+    ops: List[list] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def summary(self) -> Dict[str, int]:
+        """Count operations per collection key."""
+        counts: Dict[str, int] = {}
+        for op in self.ops:
+            counts[op[1]] = counts.get(op[1], 0) + 1
+        return counts
+
+    def save(self, path: PathLike) -> None:
+        """
+        Write the patch as gzip-compressed JSON.
+
+        Args:
+            path: Output path
+        """
+        data = {"format": self.FORMAT, "version": self.version, "ops": self.ops}
+        with gzip.open(Path(path), "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: PathLike) -> DatPatch:
+        """
+        Read a patch written by save().
+
+        Args:
+            path: Patch file path
+
+        Returns:
+            The loaded DatPatch
+
+        Raises:
+            PatchError: If the file has an unsupported format
+        """
+        with gzip.open(Path(path), "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != cls.FORMAT:
+            raise PatchError(f"Unsupported patch format: {data.get('format')!r}")
+        return cls(version=data["version"], ops=data["ops"])
+
+
+# -------------------------
+# Value encoding
+# -------------------------
+
+def _encode(value: Any) -> Any:
+    """Encode a field value as JSON-compatible data."""
+    if is_struct(value):
+        cls = type(value)
+        return {
+            "$s": base64.b64encode(value.to_bytes()).decode("ascii"),
+            "c": f"{cls.__module__}:{cls.__qualname__}",
+        }
+    if isinstance(value, (bytes, bytearray)):
+        return {"$b": base64.b64encode(bytes(value)).decode("ascii")}
+    if is_list(value):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value: Any, ver: Any) -> Any:
+    """Decode a value produced by _encode()."""
+    if isinstance(value, dict):
+        if "$b" in value:
+            return base64.b64decode(value["$b"])
+        module_name, _, qualname = value["c"].partition(":")
+        cls = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            cls = getattr(cls, part)
+        return struct_from_bytes(cls, base64.b64decode(value["$s"]), ver)
+    if isinstance(value, list):
+        return [_decode(v, ver) for v in value]
+    return value
+
+
+# -------------------------
+# Diff
+# -------------------------
+
+def _diff_struct(a: Any, b: Any, path: Tuple, out: List[Tuple[Tuple, Any]], skip: Tuple[str, ...] = ()) -> None:
+    """
+    Record field-level differences between two structs of the same type.
+
+    Raises:
+        _Replace: If the layout differs and the struct must be stored whole
+    """
+    for field_path, va, vb in diff_structs(a, b, skip):
+        # Only fields keeping their shape can be set in place
+        if isinstance(field_path[-1], int):
+            raise _Replace
+        if is_list(va) and is_list(vb):
+            if len(va) != len(vb):
+                raise _Replace
+        elif va is None or vb is None or is_list(va) or is_list(vb) or is_struct(va) or is_struct(vb):
+            raise _Replace
+        out.append((path + field_path, _encode(vb)))
+
+
+def _diff_collection(key: str, src: List[Any], dst: List[Any], ops: List[list]) -> None:
+    """Append the operations that turn list src into list dst."""
+    if len(src) != len(dst):
+        ops.append(["resize", key, len(dst)])
+
+    for i, b in enumerate(dst):
+        a = src[i] if i < len(src) else None
+        if a is None and b is None:
+            continue
+        if a is None or b is None or type(a) is not type(b):
+            ops.append(["put", key, i, _encode(b)])
+            continue
+        if a.to_bytes() == b.to_bytes():
+            continue
+
+        changes: List[Tuple[Tuple, Any]] = []
+        try:
+            _diff_struct(a, b, (), changes)
+        except _Replace:
+            ops.append(["put", key, i, _encode(b)])
+            continue
+        ops.extend(["set", key, i, list(path), value] for path, value in changes)
+
+
+def create_patch(source: GenieWorkspace, target: GenieWorkspace) -> DatPatch:
+    """
+    Compute the patch that turns source into target.
+
+    Args:
+        source: Workspace the patch will be applied to
+        target: Workspace with the desired result
+
+    Returns:
+        The DatPatch
+
+    Raises:
+        PatchError: If the files have different versions or civilization counts
+    """
+    src, dst = source.dat, target.dat
+    if str(src.ver) != str(dst.ver):
+        raise PatchError(f"Cannot diff DAT version {src.ver} against {dst.ver}")
+
+    ops: List[list] = []
+    available = retriever_fields(DatFile, dst.ver)
+
+    # Whole sections first, then the element-wise collections
+    for name in _SECTIONS:
+        if name not in available:
+            continue
+        va, vb = getattr(src, name), getattr(dst, name)
+        if values_equal(va, vb):
+            continue
+        if not is_struct(vb):
+            ops.append(["set", "dat", None, [name], _encode(vb)])
+            continue
+        changes: List[Tuple[Tuple, Any]] = []
+        try:
+            _diff_struct(va, vb, (name,), changes)
+        except _Replace:
+            changes = [((name,), _encode(vb))]
+        ops.extend(["set", "dat", None, list(path), value] for path, value in changes)
+
+    for name in _COLLECTIONS:
+        _diff_collection(name, getattr(src, name), getattr(dst, name), ops)
+
+    src_civs, dst_civs = src.civilizations, dst.civilizations
+    if len(src_civs) != len(dst_civs):
+        raise PatchError(f"Civilization count differs ({len(src_civs)} vs {len(dst_civs)})")
+
+    for civ_id, (civ_a, civ_b) in enumerate(zip(src_civs, dst_civs)):
+        if civ_a.to_bytes() == civ_b.to_bytes():
+            continue
+        changes = []
+        try:
+            _diff_struct(civ_a, civ_b, ("civilizations", civ_id), changes, skip=("units",))
+        except _Replace:
+            raise PatchError(f"Civilization {civ_id} changed layout outside its units") from None
+        ops.extend(["set", "dat", None, list(path), value] for path, value in changes)
+        _diff_collection(f"{_UNITS_PREFIX}{civ_id}", civ_a.units, civ_b.units, ops)
+
+    return DatPatch(version=str(dst.ver), ops=ops)
+
+
+# -------------------------
+# Apply
+# -------------------------
+
+def _get_collection(dat: Any, key: str) -> List[Any]:
+    if key.startswith(_UNITS_PREFIX):
+        return dat.civilizations[int(key[len(_UNITS_PREFIX):])].units
+    return getattr(dat, key)
+
+
+def _set_collection(dat: Any, key: str, items: List[Any]) -> None:
+    if key.startswith(_UNITS_PREFIX):
+        dat.civilizations[int(key[len(_UNITS_PREFIX):])].units = items
+    else:
+        setattr(dat, key, items)
+
+
+def _report_change(workspace: GenieWorkspace, key: str, index: Optional[int], path: Optional[list] = None) -> None:
+    """Tell the workspace change tracker which object an operation wrote to."""
+    if key.startswith(_UNITS_PREFIX):
+        workspace.changes.mark("units", index)
+    elif key != "dat":
+        workspace.changes.mark(key, index)
+    elif path and path[0] == "civilizations":
+        workspace.changes.mark("civilizations", path[1] if len(path) > 2 else None)
+
+
+def _set_path(obj: Any, path: List[Union[str, int]], value: Any) -> None:
+    """Set a field addressed by a path of field names and list indices."""
+    for part in path[:-1]:
+        obj = obj[part] if isinstance(part, int) else getattr(obj, part)
+    setattr(obj, path[-1], value)
+
+
+def apply_patch(workspace: GenieWorkspace, patch: DatPatch) -> None:
+    """
+    Apply a patch to a workspace in place.
+
+    Handles obtained before applying may point at replaced elements; get
+    fresh handles afterwards.
+
+    Args:
+        workspace: Workspace loaded from the patch's source DAT
+        patch: Patch from create_patch() or DatPatch.load()
+
+    Raises:
+        PatchError: If the workspace version does not match the patch
+    """
+    start = time.perf_counter()
+    dat = workspace.dat
+    ver = dat.ver
+    if str(ver) != patch.version:
+        raise PatchError(f"Patch is for DAT version {patch.version}, workspace is {ver}")
+
+    # Structural changes are collected per list and assigned back once
+    lists: Dict[str, List[Any]] = {}
+    field_ops: List[list] = []
+    for op in patch.ops:
+        kind, key = op[0], op[1]
+        if kind == "set":
+            field_ops.append(op)
+            continue
+
+        items = lists.get(key)
+        if items is None:
+            items = lists[key] = list(_get_collection(dat, key))
+        if kind == "resize":
+            length = op[2]
+            if length < len(items):
+                del items[length:]
+            else:
+                items.extend([None] * (length - len(items)))
+        elif kind == "put":
+            if key.startswith(_UNITS_PREFIX):
+                workspace.unit_manager.sharing.detach(op[2], [int(key[len(_UNITS_PREFIX):])])
+            items[op[2]] = _decode(op[3], ver)
+            _report_change(workspace, key, op[2])
+        else:
+            raise PatchError(f"Unknown patch operation: {kind!r}")
+
+    for key, items in lists.items():
+        _set_collection(dat, key, items)
+
+    collections: Dict[str, List[Any]] = {}
+    for _, key, index, path, value in field_ops:
+        if key == "dat":
+            target = dat
+        else:
+            if key.startswith(_UNITS_PREFIX):
+                # A shared unit gets its own copy before a per-civ edit
+                workspace.unit_manager.sharing.materialize(index, [int(key[len(_UNITS_PREFIX):])])
+            items = collections.get(key)
+            if items is None:
+                items = collections[key] = _get_collection(dat, key)
+            target = items[index]
+        _set_path(target, path, _decode(value, ver))
+        _report_change(workspace, key, index, path)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    workspace.logger.info(f"Applied patch: {len(patch.ops)} operations in {elapsed:.1f}ms")
@@ -0,0 +1,301 @@
+"""
+ReferenceRewriter - Rewrite unit ID references after units are renumbered.
+
+Responsibilities:
+- Translate the unit reference fields of field_discovery.json into raw struct
+  paths (the JSON names fields the way handles expose them)
+- Rewrite every such field in all units of all civs and in all techs, plus the
+  unit parameters of effect commands, in one pass over the DAT
+
+Each reference is looked up in the old -> new mapping (a dict), so the pass is
+linear in the size of the DAT whatever the size of the mapping. Fields a
+struct's version lacks are skipped. The pass only collects the writes; they
+are made together afterwards, so a failing read leaves the DAT untouched.
+
+Not rewritten: the tech tree and unit line sections, and attribute modifier
+values other than the projectile unit (attribute 16).
+
+Usage:
+    stats = rewrite_unit_references(workspace.dat, {100: 1500, 101: 1501})
+
+    rewrite = plan_unit_references(workspace.dat, mapping)
+    ...  # move the units
+    stats = rewrite.apply()
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from aoe2_genie_tooling.Base.core.field_metadata import FIELD_METADATA
+from aoe2_genie_tooling.Base.core.struct_schema import _ver_key, has_field
+
+__all__ = [
+    "RewriteStats",
+    "ReferenceRewrite",
+    "plan_unit_references",
+    "rewrite_unit_references",
+    "unit_reference_paths",
+]
+
+Path = Tuple[str, ...]
+
+# (struct, attribute, new value)
+_Write = Tuple[Any, str, Any]
+
+# Handle component prefixes used in field_discovery.json -> raw info structs
+_COMPONENT_STRUCTS = {
+    "type_50": "combat_info",
+    "creatable": "creation_info",
+    "building": "building_info",
+    "dead_fish": "movement_info",
+    "projectile": "projectile_info",
+}
+
+# JSON names whose raw field is named differently or is a list; "[]" marks a
+# list that is iterated (or rewritten item by item if it is the last step)
+_RAW_PATHS: Dict[str, Tuple[str, ...]] = {
+    "dead_fish.tracking_unit_id": ("movement_info.trailing_unit_id",),
+    "creatable.charge_projectile_unit_id": ("creation_info.charge_projectile_unit",),
+    "building.pile_unit_id": ("building_info.salvage_unit_id",),
+    "drop_sites.unit_id": ("task_info.drop_site_unit_ids[]",),
+    "train_locations.unit_id": (
+        "creation_info.train_locations_new[].location_unit_id",
+        "creation_info.train_locations_old[].location_unit_id",
+    ),
+    "annexes.unit_id": ("building_info.building_annex[].unit_id",),
+    "research_location.location": ("research_locations[].location_unit_id", "location_unit_id"),
+}
+
+# Unit identity fields that follow the unit to its new ID
+_UNIT_IDENTITY_PATHS = ("copy_id", "base_id")
+
+# Effect command types (base type, before the team/enemy/neutral/gaia offsets
+# of 10/20/30/40) and the parameters that hold unit IDs
+_COMMAND_UNIT_PARAMS = {
+    0: ("a",),       # attribute modifier (set)
+    2: ("a",),       # enable/disable unit
+    3: ("a", "b"),   # upgrade unit
+    4: ("a",),       # attribute modifier (+/-)
+    5: ("a",),       # attribute modifier (multiply)
+    7: ("a", "b"),   # spawn unit (unit, spawning building)
+}
+_PROJECTILE_UNIT_ATTRIBUTE = 16
+
+
+@dataclass
+class RewriteStats:
+    """
+    What a reference rewrite changed.
+
+    Attributes:
+        references: Number of reference fields rewritten
+        units: IDs of units with a rewritten reference
+        techs: Indexes of techs with a rewritten reference
+        tech_effects: Indexes of tech effects with a rewritten command
+    """
+    references: int = 0
+    units: Set[int] = field(default_factory=set)
+    techs: Set[int] = field(default_factory=set)
+    tech_effects: Set[int] = field(default_factory=set)
+
+
+def _raw_paths(name: str) -> Tuple[str, ...]:
+    if name in _RAW_PATHS:
+        return _RAW_PATHS[name]
+    head, _, rest = name.partition(".")
+    if rest and head in _COMPONENT_STRUCTS:
+        return (f"{_COMPONENT_STRUCTS[head]}.{rest}",)
+    return (name,)
+
+
+def unit_reference_paths(obj_type: str) -> List[Path]:
+    """
+    Raw paths of the fields of an object type that hold unit IDs.
+
+    Args:
+        obj_type: "units" or "techs" (a field_discovery.json section)
+
+    Returns:
+        Paths as tuples of attribute names ("name[]" for lists)
+    """
+    paths: List[Path] = []
+    for fields in FIELD_METADATA.get(obj_type, {}).values():
+        for name, ref in fields.items():
+            if ref.target_type == "UnitHandle":
+                paths.extend(tuple(p.split(".")) for p in _raw_paths(name))
+    if obj_type == "units":
+        paths.extend((name,) for name in _UNIT_IDENTITY_PATHS)
+    return list(dict.fromkeys(paths))
+
+
+def _read(obj: Any, name: str) -> Any:
+    """Value of a field, or None if the struct's version lacks it."""
+    if not has_field(type(obj), obj.ver, name):
+        return None
+    return getattr(obj, name)
+
+
+def _rewrite_path(obj: Any, steps: Path, mapping: Dict[int, int], writes: List[_Write]) -> int:
+    """Collect the writes for one path below obj; returns the number of values changed."""
+    for i, step in enumerate(steps[:-1]):
+        if step.endswith("[]"):
+            rest = steps[i + 1:]
+            items = _read(obj, step[:-2]) or ()
+            return sum(_rewrite_path(item, rest, mapping, writes) for item in items if item is not None)
+        obj = _read(obj, step)
+        if obj is None:
+            return 0
+
+    last = steps[-1]
+    if last.endswith("[]"):
+        name = last[:-2]
+        values = _read(obj, name) or ()
+        changed = sum(1 for value in values if value in mapping)
+        if changed:
+            writes.append((obj, name, [mapping.get(value, value) for value in values]))
+        return changed
+
+    new = mapping.get(_read(obj, last))
+    if new is None:
+        return 0
+    writes.append((obj, last, new))
+    return 1
+
+
+class _PathRewriter:
+    """Collect the writes of a list of paths, skipping paths a struct version lacks."""
+
+    def __init__(self, paths: List[Path], mapping: Dict[int, int]) -> None:
+        self._paths = paths
+        self._mapping = mapping
+        self._usable: Dict[Tuple[type, Hashable], List[Path]] = {}
+
+    def _paths_for(self, obj: Any) -> List[Path]:
+        """Paths whose first field exists in obj's class and version."""
+        key = (type(obj), _ver_key(obj.ver))
+        paths = self._usable.get(key)
+        if paths is None:
+            cls, ver = type(obj), obj.ver
+            paths = self._usable[key] = [p for p in self._paths if has_field(cls, ver, p[0].removesuffix("[]"))]
+        return paths
+
+    def __call__(self, obj: Any, writes: List[_Write]) -> int:
+        return sum(_rewrite_path(obj, path, self._mapping, writes) for path in self._paths_for(obj))
+
+
+def _rewrite_commands(commands: List[Any], mapping: Dict[int, int], writes: List[_Write]) -> int:
+    changed = 0
+    for command in commands:
+        kind = command.type
+        params = _COMMAND_UNIT_PARAMS.get(kind % 10) if 0 <= kind < 50 else None
+        if not params:
+            continue
+        for name in params:
+            new = mapping.get(getattr(command, name))
+            if new is not None:
+                writes.append((command, name, new))
+                changed += 1
+        # Setting the projectile unit attribute stores a unit ID as the value
+        if kind % 10 == 0 and command.c == _PROJECTILE_UNIT_ATTRIBUTE:
+            new = mapping.get(int(command.d))
+            if new is not None and command.d == int(command.d):
+                writes.append((command, "d", float(new)))
+                changed += 1
+    return changed
+
+
+@dataclass
+class ReferenceRewrite:
+    """
+    The writes of a reference rewrite, collected before any is made.
+
+    Attributes:
+        stats: What apply() changes
+    """
+    stats: RewriteStats
+    _writes: List[_Write] = field(default_factory=list, repr=False)
+
+    def apply(self) -> RewriteStats:
+        """Make the collected writes and return the stats."""
+        for obj, name, value in self._writes:
+            setattr(obj, name, value)
+        self._writes = []
+        return self.stats
+
+
+def plan_unit_references(
+    dat: Any,
+    mapping: Dict[int, int],
+    skip_slot: Optional[Callable[[int, int], bool]] = None,
+) -> ReferenceRewrite:
+    """
+    Find all references to renumbered units without changing anything.
+
+    Everything that can fail (reading the fields) happens here, so a caller
+    can plan first, then move the units and apply the plan.
+
+    Args:
+        dat: DatFile to read
+        mapping: Old unit ID -> new unit ID
+        skip_slot: Called as skip_slot(civ_id, unit_id); slots for which it
+                   returns True are not visited (e.g. slots sharing one Unit
+                   object with a slot already visited)
+
+    Returns:
+        ReferenceRewrite whose stats list units by their current slot
+    """
+    rewrite = ReferenceRewrite(RewriteStats())
+    if not mapping:
+        return rewrite
+    stats, writes = rewrite.stats, rewrite._writes
+
+    rewrite_unit = _PathRewriter(unit_reference_paths("units"), mapping)
+    for civ_id, civ in enumerate(dat.civilizations):
+        if civ is None:
+            continue
+        for unit_id, unit in enumerate(civ.units):
+            if unit is None or (skip_slot is not None and skip_slot(civ_id, unit_id)):
+                continue
+            changed = rewrite_unit(unit, writes)
+            if changed:
+                stats.references += changed
+                stats.units.add(unit_id)
+
+    rewrite_tech = _PathRewriter(unit_reference_paths("techs"), mapping)
+    for tech_id, tech in enumerate(dat.techs):
+        if tech is None:
+            continue
+        changed = rewrite_tech(tech, writes)
+        if changed:
+            stats.references += changed
+            stats.techs.add(tech_id)
+
+    for effect_id, effect in enumerate(dat.tech_effects):
+        if effect is None:
+            continue
+        changed = _rewrite_commands(effect.effects, mapping, writes)
+        if changed:
+            stats.references += changed
+            stats.tech_effects.add(effect_id)
+
+    return rewrite
+
+
+def rewrite_unit_references(
+    dat: Any,
+    mapping: Dict[int, int],
+    skip_slot: Optional[Callable[[int, int], bool]] = None,
+) -> RewriteStats:
+    """
+    Rewrite all references to renumbered units in one pass.
+
+    Args:
+        dat: DatFile to rewrite in place
+        mapping: Old unit ID -> new unit ID
+        skip_slot: See plan_unit_references()
+
+    Returns:
+        RewriteStats with the objects that changed
+    """
+    return plan_unit_references(dat, mapping, skip_slot).apply()
@@ -248,6 +248,42 @@ class Registry:
                     return True
         return False
 
+    def remap_ids(self, obj_type: str, mapping: Dict[int, int]) -> int:
+        """
+        Apply many ID changes at once (after a bulk renumber).
+
+        Args:
+            obj_type: Type of object ("units", "graphics", etc.)
+            mapping: Old ID -> new ID
+
+        Returns:
+            Number of registered items updated
+        """
+        if not mapping or obj_type not in self._uuid_map:
+            return 0
+
+        updated = 0
+        for entry in getattr(self, obj_type, []):
+            new_id = mapping.get(entry.get("id"))
+            if new_id is not None:
+                entry["id"] = new_id
+                updated += 1
+        uuid_map = self._uuid_map[obj_type]
+        for item_uuid, old_id in uuid_map.items():
+            if old_id in mapping:
+                uuid_map[item_uuid] = mapping[old_id]
+
+        # Dependencies name objects as "unit:100"
+        prefix = obj_type[:-1] + ":"
+        for dependency in self.dependencies:
+            for key in ("source", "target"):
+                ref = dependency.get(key, "")
+                if ref.startswith(prefix):
+                    old_id = int(ref[len(prefix):])
+                    if old_id in mapping:
+                        dependency[key] = f"{prefix}{mapping[old_id]}"
+        return updated
+
     # -------------------------
     # Export/Import
     # -------------------------
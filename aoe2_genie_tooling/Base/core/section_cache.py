@@ -0,0 +1,347 @@
+"""
+SectionCache - Incremental DAT serialization.
+
+Responsibilities:
+- Serialize and parse each top-level DatFile section on its own
+- Record where each section starts in the inflated payload
+- Compress each section into an independent, byte-aligned deflate chunk
+- Reuse the cached chunk of every section whose bytes did not change since it was cached
+
+Each chunk comes from a fresh deflate compressor and ends on a full flush, so
+the chunks concatenate into one valid raw deflate stream. The inflated result
+is byte-identical to DatFile.to_bytes(); only the compressed form differs
+slightly, because the compressor window restarts at each section boundary.
+
+Every section is serialized on each save and its bytes are compared (by
+digest) with those of the cached chunk, so a chunk is reused only when the
+section is byte-identical; edits that bypass the handles are never lost.
+Sections of a section-indexed LazyDatFile that were never parsed are taken
+from the bytes they were loaded from, without serializing them.
+
+Saving is split in two steps: snapshot() serializes the sections while the
+caller still owns the data, compress() does the CPU-heavy part and can run on
+a worker thread.
+
+Usage:
+    cache = SectionCache()
+    compressed = cache.build(dat, level=9)
+"""
+from __future__ import annotations
+
+import hashlib
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from zlib_ng import zlib_ng as zlib
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from bfp_rs import ByteStream, Version
+from sections.civilization import Civilization
+from sections.color_data import ColorData
+from sections.map_data import MapData
+from sections.sounds import Sound
+from sections.sprite_data import Sprite
+from sections.tech import Tech
+from sections.tech_effect import TechEffect
+from sections.tech_tree import TechTree
+from sections.terrain_data import TerrainData
+from sections.terrain_table_data import TerrainTableData
+from sections.unit_data import UnitData
+
+from aoe2_genie_tooling.Base.core.lazy_dat import LazyDatFile
+from aoe2_genie_tooling.Base.core.struct_schema import struct_from_bytes
+
+__all__ = [
+    "SectionCache",
+    "SectionSnapshot",
+    "SECTION_LAYOUT",
+    "index_payload",
+    "parse_section",
+    "serialize_section",
+]
+
+# (section name, encoding) in file order for every version except SWGB
+SECTION_LAYOUT: Tuple[Tuple[str, str], ...] = (
+    ("file_version", "bytes"),
+    ("terrain_table_data", "struct"),
+    ("color_data", "struct"),
+    ("sounds", "array16"),
+    ("sprites", "option_array16"),
+    ("terrain_data", "struct"),
+    ("map_data", "struct"),
+    ("tech_effects", "array32"),
+    ("unit_data", "struct"),
+    ("civilizations", "array16"),
+    ("techs", "array16"),
+    ("tech_tree", "struct"),
+)
+_ENCODINGS = dict(SECTION_LAYOUT)
+
+# Section -> struct class (or list item class)
+_SECTION_TYPES = {
+    "terrain_table_data": TerrainTableData,
+    "color_data": ColorData,
+    "sounds": Sound,
+    "sprites": Sprite,
+    "terrain_data": TerrainData,
+    "map_data": MapData,
+    "tech_effects": TechEffect,
+    "unit_data": UnitData,
+    "civilizations": Civilization,
+    "techs": Tech,
+    "tech_tree": TechTree,
+}
+
+# SWGB interleaves extra sections, it always takes the full serialization path
+_UNSUPPORTED_VERSIONS = (Version(5, 9),)
+
+
+def serialize_section(value: Any, encoding: str) -> bytes:
+    """
+    Serialize one top-level section exactly as DatFile writes it.
+
+    Args:
+        value: The section value read from the DatFile
+        encoding: Encoding from SECTION_LAYOUT
+
+    Returns:
+        The uncompressed section bytes
+    """
+    if encoding == "bytes":
+        return bytes(value)
+    if encoding == "struct":
+        return value.to_bytes()
+    if encoding == "array16":
+        return struct.pack("<H", len(value)) + b"".join(item.to_bytes() for item in value)
+    if encoding == "array32":
+        return struct.pack("<I", len(value)) + b"".join(item.to_bytes() for item in value)
+    if encoding == "option_array16":
+        # StackedAttrArray16[Option32[T]]: count, all existence flags, then the present items
+        flags = struct.pack(f"<{len(value)}I", *(item is not None for item in value))
+        items = b"".join(item.to_bytes() for item in value if item is not None)
+        return struct.pack("<H", len(value)) + flags + items
+    raise ValueError(f"Unknown section encoding: {encoding}")
+
+
+def parse_section(name: str, data: bytes, ver: Version) -> Any:
+    """
+    Parse one top-level section from its bytes, the inverse of serialize_section().
+
+    Sections do not depend on each other while parsing (the terrain count key
+    is set and read within terrain_table_data), so any section can be parsed
+    on its own.
+
+    Args:
+        name: Section name from SECTION_LAYOUT
+        data: The uncompressed section bytes
+        ver: Struct version of the DAT
+
+    Returns:
+        The section value, as DatFile would hold it
+    """
+    encoding = _ENCODINGS[name]
+    if encoding == "bytes":
+        return bytes(data)
+    cls = _SECTION_TYPES[name]
+    if encoding == "struct":
+        return struct_from_bytes(cls, bytes(data), ver)
+    if encoding in ("array16", "array32"):
+        fmt = "<H" if encoding == "array16" else "<I"
+        (count,) = struct.unpack_from(fmt, data)
+        stream = ByteStream.from_bytes(bytes(data[struct.calcsize(fmt):]))
+        return [cls.from_stream(stream, ver=ver) for _ in range(count)]
+    if encoding == "option_array16":
+        (count,) = struct.unpack_from("<H", data)
+        flags = struct.unpack_from(f"<{count}I", data, 2)
+        stream = ByteStream.from_bytes(bytes(data[2 + 4 * count:]))
+        return [cls.from_stream(stream, ver=ver) if flag else None for flag in flags]
+    raise ValueError(f"Unknown section encoding: {encoding}")
+
+
+def index_payload(dat: Any, payload: bytes) -> Dict[str, Tuple[int, int]]:
+    """
+    Find where each top-level section lies in an inflated payload.
+
+    bfp_rs does not report stream positions, so the offsets are taken from the
+    serialized length of each section, and every section is checked to
+    serialize back to exactly the bytes at its offset.
+
+    Args:
+        dat: DatFile parsed from payload
+        payload: The inflated DAT bytes
+
+    Returns:
+        Section name -> (start, end) in payload, in file order
+
+    Raises:
+        ValueError: If the sections do not reproduce the payload
+    """
+    offsets: Dict[str, Tuple[int, int]] = {}
+    view = memoryview(payload)
+    pos = 0
+    try:
+        for name, encoding in SECTION_LAYOUT:
+            data = serialize_section(getattr(dat, name), encoding)
+            end = pos + len(data)
+            if view[pos:end] != data:
+                raise ValueError(f"Section {name} does not serialize back to its loaded bytes")
+            offsets[name] = (pos, end)
+            pos = end
+    finally:
+        view.release()
+    if pos != len(payload):
+        raise ValueError(f"{len(payload) - pos} bytes after the last section")
+    return offsets
+
+
+@dataclass(frozen=True)
+class SectionSnapshot:
+    """
+    Serialized state of a DAT at one point in time, ready to be compressed.
+
+    Attributes:
+        level: zlib compression level
+        digests: Section name -> digest of its uncompressed bytes
+        parts: (section name, is_compressed_chunk, bytes) in file order
+    """
+    level: int
+    digests: Dict[str, bytes]
+    parts: List[Tuple[str, bool, bytes]]
+
+
+class SectionCache:
+    """
+    Per-workspace cache of compressed section chunks.
+
+    A chunk is reused when its section serializes to the same bytes as when
+    the chunk was built and it was built with the same compression level.
+    Changed sections are compressed again, and their new chunk is cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # section name -> (compression level, digest of the uncompressed bytes, compressed chunk)
+        self._chunks: Dict[str, Tuple[int, bytes, bytes]] = {}
+        self.last_reused: List[str] = []
+
+    @staticmethod
+    def supports(dat: Any) -> bool:
+        """True if dat can be written section by section."""
+        if isinstance(dat, LazyDatFile) and not dat.parsed_sections:
+            # Never accessed: FileIO copies the source file instead
+            return False
+        return dat.ver not in _UNSUPPORTED_VERSIONS
+
+    @staticmethod
+    def _section_bytes(dat: Any, name: str, encoding: str) -> bytes:
+        """Uncompressed bytes of a section, copied from the loaded payload if it was never parsed."""
+        if isinstance(dat, LazyDatFile) and name not in dat.parsed_sections:
+            raw = dat.raw_section(name)
+            if raw is not None:
+                return raw
+        return serialize_section(getattr(dat, name), encoding)
+
+    def payload(self, dat: Any) -> bytes:
+        """
+        Serialize the whole DAT section by section, without compression.
+
+        Args:
+            dat: DatFile or LazyDatFile
+
+        Returns:
+            The inflated DAT payload
+        """
+        return b"".join(self._section_bytes(dat, name, enc) for name, enc in SECTION_LAYOUT)
+
+    def build(self, dat: Any, level: int) -> bytes:
+        """
+        Produce the compressed DAT, reusing chunks of unchanged sections.
+
+        Args:
+            dat: DatFile or LazyDatFile
+            level: zlib compression level
+
+        Returns:
+            A raw deflate stream of the full DAT payload
+        """
+        return self.compress(self.snapshot(dat, level))
+
+    def snapshot(self, dat: Any, level: int) -> SectionSnapshot:
+        """
+        Capture everything a save needs, without compressing.
+
+        Every section is serialized now, so the result no longer depends on
+        the live DatFile and can be compressed on another thread. Sections
+        with the same bytes as their cached chunk are replaced by the chunk.
+
+        Args:
+            dat: DatFile or LazyDatFile
+            level: zlib compression level
+
+        Returns:
+            Snapshot to pass to compress()
+        """
+        digests: Dict[str, bytes] = {}
+        parts: List[Tuple[str, bool, bytes]] = []
+        self.last_reused = []
+
+        for name, encoding in SECTION_LAYOUT:
+            data = self._section_bytes(dat, name, encoding)
+            digest = digests[name] = hashlib.blake2b(data, digest_size=16).digest()
+            cached = self._chunks.get(name)
+            if cached is not None and cached[0] == level and cached[1] == digest:
+                parts.append((name, True, cached[2]))
+                self.last_reused.append(name)
+            else:
+                parts.append((name, False, data))
+
+        return SectionSnapshot(level, digests, parts)
+
+    def compress(self, snapshot: SectionSnapshot) -> bytes:
+        """
+        Compress a snapshot into a raw deflate stream.
+
+        Newly compressed chunks are kept for later saves, tagged with the
+        digest of the bytes they were compressed from.
+
+        Args:
+            snapshot: Result of snapshot()
+
+        Returns:
+            A raw deflate stream of the full DAT payload
+        """
+        last = len(snapshot.parts) - 1
+        chunks: List[bytes] = []
+
+        for i, (name, is_chunk, data) in enumerate(snapshot.parts):
+            if is_chunk:
+                chunks.append(data)
+                continue
+
+            chunk = self._compress_chunk(data, snapshot.level, final=(i == last))
+            self._chunks[name] = (snapshot.level, snapshot.digests[name], chunk)
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    @staticmethod
+    def _compress_chunk(data: bytes, level: int, final: bool) -> bytes:
+        """Compress one section into a standalone deflate chunk."""
+        deflate_obj = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        body = deflate_obj.compress(data)
+        # a full flush ends on a byte boundary without the final-block bit, so the next chunk can follow directly
+        return body + (deflate_obj.flush() if final else deflate_obj.flush(zlib.Z_FULL_FLUSH))
+
+    def invalidate(self, names: Optional[List[str]] = None) -> None:
+        """
+        Drop cached chunks.
+
+        Args:
+            names: Sections to drop (default: all)
+        """
+        if names is None:
+            self._chunks.clear()
+        else:
+            for name in names:
+                self._chunks.pop(name, None)
@@ -0,0 +1,317 @@
+"""
+SnapshotCache - On-disk cache of DAT payloads keyed by file content.
+
+Responsibilities:
+- Key snapshots by a content hash of the DAT, the package version and DE_LATEST
+- Restore a DatFile from the cached snapshot instead of the compressed source
+- Store the section offsets of a snapshot for section-indexed lazy loads
+- Keep the cache directory under a size limit (least recently used first)
+
+Snapshots hold the inflated DAT payload. bfp_rs structs cannot be pickled, so
+the payload is the fastest form a DatFile can be rebuilt from. Next to a
+snapshot, a small ``.idx`` file records where every top-level section starts
+in the payload. load_lazy() uses it to return a LazyDatFile that parses only
+the sections that are accessed, so a hit parses nothing up front; this is
+what ``GenieWorkspace.load(cache_dir=...)`` uses. load() returns a complete
+DatFile and only skips the inflate pass: it still parses the whole payload.
+
+Usage:
+    cache = SnapshotCache("~/.cache/genie_snapshots")
+    dat = cache.load("empires2_x2_p1.dat")
+    lazy = cache.load_lazy("empires2_x2_p1.dat")
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from sections.dat_versions import DE_LATEST
+from sections.datfile_sections import DatFile
+
+from aoe2_genie_tooling.Base.core.lazy_dat import LazyDatFile
+from aoe2_genie_tooling.Base.core.logger import Logger
+from aoe2_genie_tooling.Base.core.section_cache import SectionCache, index_payload
+
+PathLike = Union[str, Path]
+
+__all__ = ["SnapshotCache"]
+
+
+class SnapshotCache:
+    """
+    Content-addressed snapshot cache for parsed DAT files.
+
+    A snapshot is reused only if the DAT bytes, the installed package version
+    and the DE_LATEST struct version all match, so upgrading the package or the
+    vendored parser never restores a stale layout.
+
+    Attributes:
+        cache_dir: Directory holding the ``*.snap`` files
+        max_bytes: Size limit for the directory; oldest snapshots are evicted first
+        hits: Number of loads served from a snapshot
+        misses: Number of loads that had to inflate the source file
+    """
+
+    SUFFIX = ".snap"
+    INDEX_SUFFIX = ".idx"
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB, roughly 10 DE snapshots
+
+    def __init__(
+        self,
+        cache_dir: PathLike,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize the cache, creating the directory if needed.
+
+        Args:
+            cache_dir: Directory to store snapshots in
+            max_bytes: Maximum total size of all snapshots
+            logger: Logger for hit/miss reporting (default: new Logger)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.logger = logger or Logger()
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------
+    # Keys
+    # -------------------------
+
+    @staticmethod
+    def key_for_bytes(data: bytes) -> str:
+        """
+        Compute the cache key for raw DAT file contents.
+
+        Args:
+            data: Bytes of the DAT file as stored on disk
+
+        Returns:
+            Hex digest combining content hash, package version and DE_LATEST
+        """
+        from aoe2_genie_tooling import __version__
+
+        digest = hashlib.blake2b(data, digest_size=20)
+        digest.update(f"|{__version__}|{DE_LATEST}".encode("ascii"))
+        return digest.hexdigest()
+
+    def key_for(self, path: PathLike) -> str:
+        """
+        Compute the cache key for a DAT file on disk.
+
+        Args:
+            path: Path to the .dat file
+
+        Returns:
+            Cache key (hex digest)
+        """
+        return self.key_for_bytes(Path(path).read_bytes())
+
+    def snapshot_path(self, key: str) -> Path:
+        """Path of the snapshot file for a cache key."""
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def index_path(self, key: str) -> Path:
+        """Path of the section offset file for a cache key."""
+        return self.cache_dir / f"{key}{self.INDEX_SUFFIX}"
+
+    # -------------------------
+    # Load / Store
+    # -------------------------
+
+    def load(self, path: PathLike) -> DatFile:
+        """
+        Load a complete DatFile, restoring it from a snapshot when one exists.
+
+        A hit skips inflating the source file; the payload is still parsed in
+        full. On a miss the source file is inflated once, parsed, and the
+        inflated payload is stored as a new snapshot. Use load_lazy() to
+        skip the parse on hits as well.
+
+        Args:
+            path: Path to the .dat file
+
+        Returns:
+            Loaded DatFile instance
+        """
+        p = Path(path)
+        start = time.perf_counter()
+
+        data = p.read_bytes()
+        key = self.key_for_bytes(data)
+        snap = self.snapshot_path(key)
+
+        if snap.exists():
+            try:
+                dat = DatFile.from_bytes(snap.read_bytes())
+            except Exception as e:
+                self.logger.warning(f"Discarding unreadable snapshot {snap.name}: {e}")
+                snap.unlink(missing_ok=True)
+            else:
+                self._touch(snap)
+                self.hits += 1
+                self.logger.info(
+                    f"Snapshot hit for {p.name} [{key[:12]}] in {time.perf_counter() - start:.2f}s"
+                )
+                return dat
+
+        self.misses += 1
+        payload = DatFile._decompress(data)
+        del data
+        dat = DatFile.from_bytes(payload)
+        self._store(snap, payload)
+        self.logger.info(
+            f"Snapshot miss for {p.name} [{key[:12]}], parsed and cached in {time.perf_counter() - start:.2f}s"
+        )
+        return dat
+
+    def load_lazy(self, path: PathLike) -> LazyDatFile:
+        """
+        Load a DAT as a section-indexed LazyDatFile.
+
+        With a snapshot and its section offsets in the cache nothing is
+        parsed here; each section is parsed when it is first accessed.
+        Otherwise the payload is parsed once to find the offsets, which are
+        stored for the next load, and the parsed sections are kept.
+
+        SWGB files cannot be indexed and come back as a whole-file proxy.
+
+        Args:
+            path: Path to the .dat file
+
+        Returns:
+            LazyDatFile over the inflated payload
+        """
+        p = Path(path)
+        start = time.perf_counter()
+
+        data = p.read_bytes()
+        key = self.key_for_bytes(data)
+        snap = self.snapshot_path(key)
+        idx = self.index_path(key)
+
+        if snap.exists() and idx.exists():
+            try:
+                offsets = self._read_index(idx)
+                dat = LazyDatFile.indexed(p, snap.read_bytes(), offsets)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self.logger.warning(f"Discarding unreadable snapshot index {idx.name}: {e}")
+                idx.unlink(missing_ok=True)
+            else:
+                self._touch(snap)
+                self.hits += 1
+                self.logger.info(
+                    f"Snapshot hit for {p.name} [{key[:12]}] in {time.perf_counter() - start:.2f}s (lazy)"
+                )
+                return dat
+
+        # No offsets yet: parse once to find them
+        self.misses += 1
+        stored = snap.exists()
+        payload = snap.read_bytes() if stored else DatFile._decompress(data)
+        del data
+        parsed = DatFile.from_bytes(payload)
+        if not stored:
+            self._store(snap, payload)
+        if not SectionCache.supports(parsed):
+            return LazyDatFile(p, loader=lambda _path: parsed)
+
+        offsets = index_payload(parsed, payload)
+        self._store_index(idx, offsets)
+        self.logger.info(
+            f"Snapshot miss for {p.name} [{key[:12]}], parsed and indexed in {time.perf_counter() - start:.2f}s"
+        )
+        return LazyDatFile.indexed(p, payload, offsets, parsed=parsed)
+
+    @staticmethod
+    def _read_index(idx: Path) -> Dict[str, Tuple[int, int]]:
+        """Section offsets stored by _store_index()."""
+        return {name: (int(start), int(end)) for name, (start, end) in json.loads(idx.read_text()).items()}
+
+    def _store_index(self, idx: Path, offsets: Dict[str, Tuple[int, int]]) -> None:
+        """Write the section offsets of a snapshot atomically."""
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(offsets, f)
+            os.replace(tmp, idx)
+        except OSError as e:
+            Path(tmp).unlink(missing_ok=True)
+            self.logger.warning(f"Could not write snapshot index {idx.name}: {e}")
+
+    def _store(self, snap: Path, payload: bytes) -> None:
+        """Write a snapshot atomically, then evict down to the size limit."""
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, snap)
+        except OSError as e:
+            Path(tmp).unlink(missing_ok=True)
+            self.logger.warning(f"Could not write snapshot {snap.name}: {e}")
+            return
+        self.evict(keep=snap)
+
+    @staticmethod
+    def _touch(snap: Path) -> None:
+        """Mark a snapshot as recently used (LRU order is by mtime)."""
+        try:
+            os.utime(snap)
+        except OSError:
+            pass
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+
+    def entries(self) -> List[Path]:
+        """All snapshot files, least recently used first."""
+        files = [f for f in self.cache_dir.glob(f"*{self.SUFFIX}") if f.is_file()]
+        return sorted(files, key=lambda f: f.stat().st_mtime)
+
+    def size(self) -> int:
+        """Total size in bytes of all snapshots."""
+        return sum(f.stat().st_size for f in self.entries())
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """
+        Remove least recently used snapshots until the cache fits max_bytes.
+
+        Args:
+            keep: Snapshot that must not be evicted (the one just written)
+
+        Returns:
+            Number of snapshots removed
+        """
+        entries = self.entries()
+        total = sum(f.stat().st_size for f in entries)
+        removed = 0
+        for f in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and f == keep:
+                continue
+            total -= f.stat().st_size
+            f.unlink(missing_ok=True)
+            f.with_suffix(self.INDEX_SUFFIX).unlink(missing_ok=True)
+            removed += 1
+        if removed:
+            self.logger.info(f"Evicted {removed} snapshot(s), cache is {total / 1024 ** 2:.1f} MiB")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every snapshot (and its section offsets) from the cache directory."""
+        for f in self.entries():
+            f.unlink(missing_ok=True)
+            f.with_suffix(self.INDEX_SUFFIX).unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
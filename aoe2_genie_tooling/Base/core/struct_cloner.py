@@ -0,0 +1,285 @@
+"""
+Struct cloner - Deep copies of bfp_rs structs from a compiled field plan.
+
+Responsibilities:
+- Classify the Retriever fields of a struct class per version (scalar, list of
+  scalars, nested struct, list of structs)
+- Generate one specialized copy function per (class, version)
+- Clone structs and copy them into existing instances with those functions
+
+The kind of each field is read from the class annotations once, so a copy is a
+straight sequence of assignments instead of a dir() walk with getattr/callable
+checks on every attribute.
+
+bfp_rs copy semantics are respected: lists are always assigned as new lists
+(assigning copies into the struct's own storage), and nested structs are copied
+into the target's existing nested instance, which is replaced first only if it
+is missing or shared with the source.
+
+deep_clone() is the fast path used by the managers: the struct is serialized
+with bfp_rs and parsed back, which runs entirely in Rust. If a struct class
+cannot round-trip on its own, deep_clone() falls back to the compiled copy and
+remembers that for the class and version.
+
+Usage:
+    new_unit = deep_clone(unit)
+    new_unit = clone_struct(unit)  # attribute-by-attribute copy
+    copy_struct_into(unit.combat_info, other.combat_info)
+"""
+from __future__ import annotations
+
+import sys
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple, Type
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from bfp_rs import BaseStruct, Version, errors
+
+from aoe2_genie_tooling.Base.core.struct_schema import (
+    _ver_key,
+    is_list,
+    is_struct,
+    retriever_fields,
+    struct_from_bytes,
+)
+
+__all__ = ["clone_many", "clone_struct", "clone_value", "copy_struct_into", "deep_clone", "field_plan"]
+
+# Field kinds
+SCALAR = "scalar"
+SCALAR_LIST = "scalar_list"
+STRUCT = "struct"
+STRUCT_LIST = "struct_list"
+VALUE = "value"  # unknown annotation, classified per value at copy time
+
+_SCALAR_TYPES = frozenset({"int", "float", "str", "bytes", "bool"})
+
+Copier = Callable[[Any, Any], None]
+
+_PLANS: Dict[Tuple[type, Hashable], Tuple[Tuple[str, str], ...]] = {}
+_COPIERS: Dict[Tuple[type, Hashable], Copier] = {}
+# Fields whose assignment raised once; left out of recompiled copiers
+_SKIPPED: Dict[Tuple[type, Hashable], Set[str]] = {}
+# (class, version) pairs that failed to round-trip through bytes
+_NO_ROUND_TRIP: Set[Tuple[type, Hashable]] = set()
+
+# What bfp_rs raises for a value a field cannot take: a field missing from the
+# struct's version, a wrong type, an out-of-range number, a fixed-size list of
+# another length. Anything else is a real error and propagates.
+_ASSIGN_ERRORS = (errors.ParsingError, TypeError, ValueError, OverflowError)
+
+
+def _annotations(cls: type) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """Field name -> (annotation string, defining module namespace)."""
+    result: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for klass in reversed(cls.__mro__):
+        namespace = vars(sys.modules[klass.__module__]) if klass.__module__ in sys.modules else {}
+        for name, annotation in vars(klass).get("__annotations__", {}).items():
+            if not isinstance(annotation, str):
+                annotation = annotation.__name__ if isinstance(annotation, type) else str(annotation)
+            result[name] = (annotation, namespace)
+    return result
+
+
+def _strip_optional(text: str) -> str:
+    parts = [p.strip() for p in text.split("|")]
+    parts = [p for p in parts if p != "None"]
+    return parts[0] if len(parts) == 1 else text
+
+
+def _is_struct_name(text: str, namespace: Dict[str, Any]) -> bool:
+    target = namespace.get(text)
+    return isinstance(target, type) and issubclass(target, BaseStruct)
+
+
+def _classify(text: str, namespace: Dict[str, Any]) -> str:
+    text = _strip_optional(text.strip())
+    if text.startswith("list[") and text.endswith("]"):
+        inner = _strip_optional(text[5:-1])
+        if inner in _SCALAR_TYPES:
+            return SCALAR_LIST
+        if _is_struct_name(inner, namespace):
+            return STRUCT_LIST
+        return VALUE
+    if text in _SCALAR_TYPES:
+        return SCALAR
+    if _is_struct_name(text, namespace):
+        return STRUCT
+    return VALUE
+
+
+def field_plan(cls: Type[BaseStruct], ver: Version) -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the (field name, kind) pairs copied for a struct class and version.
+
+    Args:
+        cls: bfp_rs struct class
+        ver: Struct version
+
+    Returns:
+        Pairs in declaration order
+    """
+    key = (cls, _ver_key(ver))
+    plan = _PLANS.get(key)
+    if plan is None:
+        annotations = _annotations(cls)
+        plan = tuple(
+            (name, _classify(*annotations[name]) if name in annotations else VALUE)
+            for name in retriever_fields(cls, ver)
+        )
+        _PLANS[key] = plan
+    return plan
+
+
+def _compile(cls: type, plan: Tuple[Tuple[str, str], ...], skipped: FrozenSet[str]) -> Copier:
+    """Generate the copy function for one plan."""
+    lines = ["def copy_into(src, dst):"]
+    for name, kind in plan:
+        if name in skipped:
+            continue
+        if kind == SCALAR:
+            lines.append(f"    dst.{name} = src.{name}")
+        elif kind == SCALAR_LIST:
+            lines.append(f"    dst.{name} = list(src.{name})")
+        elif kind == STRUCT_LIST:
+            lines.append(f"    dst.{name} = [None if x is None else clone(x) for x in src.{name}]")
+        elif kind == STRUCT:
+            lines.append(f"    copy_nested(src.{name}, dst, {name!r})")
+        else:
+            lines.append(f"    dst.{name} = clone_value(src.{name})")
+    lines.append("    return None")
+
+    namespace: Dict[str, Any] = {"clone": clone_struct, "clone_value": clone_value, "copy_nested": _copy_nested}
+    exec(compile("\n".join(lines), f"<struct_cloner {cls.__name__}>", "exec"), namespace)
+    return namespace["copy_into"]
+
+
+def _copier(cls: type, ver: Version) -> Copier:
+    key = (cls, _ver_key(ver))
+    copier = _COPIERS.get(key)
+    if copier is None:
+        copier = _COPIERS[key] = _compile(cls, field_plan(cls, ver), frozenset(_SKIPPED.get(key, ())))
+    return copier
+
+
+def _copy_field(source: Any, target: Any, name: str, kind: str) -> None:
+    """Copy one field the way the compiled copier does."""
+    value = getattr(source, name)
+    if kind == SCALAR:
+        setattr(target, name, value)
+    elif kind == SCALAR_LIST:
+        setattr(target, name, list(value))
+    elif kind == STRUCT_LIST:
+        setattr(target, name, [None if x is None else clone_struct(x) for x in value])
+    elif kind == STRUCT:
+        _copy_nested(value, target, name)
+    else:
+        setattr(target, name, clone_value(value))
+
+
+def _copy_tolerant(source: Any, target: Any) -> None:
+    """Copy field by field, remembering fields that cannot be assigned."""
+    cls = type(source)
+    key = (cls, _ver_key(source.ver))
+    skipped = _SKIPPED.setdefault(key, set())
+    for name, kind in field_plan(cls, source.ver):
+        if name in skipped:
+            continue
+        try:
+            _copy_field(source, target, name, kind)
+        except _ASSIGN_ERRORS:
+            skipped.add(name)
+    # Recompile without the failing fields
+    _COPIERS.pop(key, None)
+
+
+def _copy_nested(value: Any, target: Any, name: str) -> None:
+    """Copy a nested struct field into the target's own instance."""
+    if value is None:
+        return
+    nested = getattr(target, name)
+    if nested is None or nested is value:
+        setattr(target, name, type(value)(ver=value.ver))
+        nested = getattr(target, name)
+    copy_struct_into(value, nested)
+
+
+def copy_struct_into(source: Any, target: Any) -> None:
+    """
+    Copy all fields of a struct into another instance of the same class.
+
+    Args:
+        source: Struct to copy from
+        target: Struct to copy into (modified in place)
+    """
+    try:
+        _copier(type(source), source.ver)(source, target)
+    except _ASSIGN_ERRORS:
+        _copy_tolerant(source, target)
+
+
+def clone_struct(source: Any) -> Any:
+    """
+    Create an independent deep copy of a struct.
+
+    Args:
+        source: Struct to clone (None is returned as-is)
+
+    Returns:
+        New struct instance of the same class and version
+    """
+    if source is None:
+        return None
+    new = type(source)(ver=source.ver)
+    copy_struct_into(source, new)
+    return new
+
+
+def clone_value(value: Any) -> Any:
+    """Deep copy a field value of unknown kind (struct, list or scalar)."""
+    if is_struct(value):
+        return clone_struct(value)
+    if is_list(value):
+        return [clone_value(item) for item in value]
+    return value
+
+
+def deep_clone(source: Any, fallback: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    Create an independent deep copy of a struct by serializing and parsing it.
+
+    Args:
+        source: Struct to clone (None is returned as-is)
+        fallback: Clone function used if the struct cannot round-trip through
+                  bytes (default: clone_struct)
+
+    Returns:
+        New struct instance of the same class and version
+    """
+    if source is None:
+        return None
+    return clone_many(source, 1, fallback)[0]
+
+
+def clone_many(source: Any, count: int, fallback: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    Create several independent deep copies of a struct, serializing it once.
+
+    Args:
+        source: Struct to clone
+        count: Number of copies
+        fallback: Clone function used if the struct cannot round-trip through
+                  bytes (default: clone_struct)
+
+    Returns:
+        List of new struct instances
+    """
+    fallback = fallback or clone_struct
+    cls = type(source)
+    key = (cls, _ver_key(source.ver))
+    if key not in _NO_ROUND_TRIP:
+        try:
+            data = source.to_bytes()
+            return [struct_from_bytes(cls, data, source.ver) for _ in range(count)]
+        except Exception:
+            _NO_ROUND_TRIP.add(key)
+    return [fallback(source) for _ in range(count)]
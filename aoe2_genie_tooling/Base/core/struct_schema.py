@@ -0,0 +1,185 @@
+"""
+Struct schema - Retriever field listings for bfp_rs structs.
+
+Responsibilities:
+- List the Retriever fields of a struct class in declaration order
+- Filter them to the fields that exist for a given struct version
+- Serialize and rebuild single structs
+- Compare field values and find the fields that differ between two structs
+
+Results are cached per (class, version), so walking many structs of the same
+type costs one lookup per struct instead of a scan of the class every time.
+
+Usage:
+    for name in retriever_fields(type(unit), unit.ver):
+        value = getattr(unit, name)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterator, Tuple, Type
+
+import aoe2_genie_tooling._vendor  # Initialize vendored path
+from bfp_rs import BaseStruct, ByteStream, Retriever, Version
+
+__all__ = [
+    "retriever_fields",
+    "has_field",
+    "is_struct",
+    "is_list",
+    "struct_from_bytes",
+    "values_equal",
+    "diff_structs",
+    "FieldPath",
+]
+
+# Field names and list indices leading to a value: ("combat_info", "attacks", 1, "amount")
+FieldPath = Tuple[Any, ...]
+
+_FIELD_CACHE: Dict[Tuple[type, Hashable], Tuple[str, ...]] = {}
+_HAS_FIELD_CACHE: Dict[Tuple[type, Hashable, str], bool] = {}
+
+
+def _ver_key(ver: Version) -> Hashable:
+    """Hashable cache key for a Version."""
+    try:
+        hash(ver)
+        return ver
+    except TypeError:
+        return repr(ver)
+
+
+def is_struct(value: Any) -> bool:
+    """True if value is a bfp_rs struct instance."""
+    return isinstance(value, BaseStruct)
+
+
+def is_list(value: Any) -> bool:
+    """True if value is a list, including the BfpList bfp_rs returns for list fields."""
+    # BfpList is not a list subclass and bfp_rs does not export it
+    return isinstance(value, list) or type(value).__name__ == "BfpList"
+
+
+def retriever_fields(cls: Type[BaseStruct], ver: Version) -> Tuple[str, ...]:
+    """
+    Get the Retriever fields of a struct class that exist in a version.
+
+    Only real storage is listed: RetrieverCombiner aliases (like Unit.name)
+    are skipped, while underscore-private version-specific fields are kept.
+
+    Args:
+        cls: bfp_rs struct class
+        ver: Struct version
+
+    Returns:
+        Field names in declaration order
+    """
+    key = (cls, _ver_key(ver))
+    cached = _FIELD_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    names = []
+    seen = set()
+    for klass in reversed(cls.__mro__):
+        for name, descriptor in vars(klass).items():
+            if name in seen or not isinstance(descriptor, Retriever):
+                continue
+            if not descriptor.supported(ver):
+                continue
+            seen.add(name)
+            names.append(name)
+
+    fields = tuple(names)
+    _FIELD_CACHE[key] = fields
+    return fields
+
+
+def has_field(cls: Type[BaseStruct], ver: Version, name: str) -> bool:
+    """
+    Check whether a struct class has a field in a version.
+
+    Retriever fields are asked with supported(ver); other attributes, such as
+    RetrieverCombiner aliases, count as present when the class defines them.
+
+    Args:
+        cls: bfp_rs struct class
+        ver: Struct version
+        name: Attribute name
+
+    Returns:
+        True if the field can be read in that version
+    """
+    key = (cls, _ver_key(ver), name)
+    cached = _HAS_FIELD_CACHE.get(key)
+    if cached is None:
+        descriptor = getattr(cls, name, None)
+        cached = descriptor.supported(ver) if isinstance(descriptor, Retriever) else descriptor is not None
+        _HAS_FIELD_CACHE[key] = cached
+    return cached
+
+
+def struct_from_bytes(cls: Type[BaseStruct], data: bytes, ver: Version) -> BaseStruct:
+    """
+    Parse a single struct from its serialized bytes.
+
+    Args:
+        cls: bfp_rs struct class
+        data: Bytes produced by to_bytes()
+        ver: Version to parse with
+
+    Returns:
+        New struct instance
+    """
+    return cls.from_stream(ByteStream.from_bytes(data), ver=ver)
+
+
+def values_equal(a: Any, b: Any) -> bool:
+    """Compare two field values the way they would be serialized."""
+    if is_struct(a) or is_struct(b):
+        return type(a) is type(b) and a.to_bytes() == b.to_bytes()
+    if is_list(a) and is_list(b):
+        return len(a) == len(b) and all(values_equal(x, y) for x, y in zip(a, b))
+    if a == b:
+        return True
+    # NaN floats compare unequal to themselves but serialize identically
+    return isinstance(a, float) and isinstance(b, float) and a != a and b != b
+
+
+def diff_structs(a: BaseStruct, b: BaseStruct, skip: Tuple[str, ...] = ()) -> Iterator[Tuple[FieldPath, Any, Any]]:
+    """
+    Find the fields that differ between two structs of the same type.
+
+    Nested structs and equally long lists of structs are compared field by
+    field. Anything else that differs is reported whole, at the deepest level
+    where it differs: a list that changed length, a nested struct switched on
+    or off, or a list element that is not a struct of the same type on both
+    sides.
+
+    Args:
+        a: First struct
+        b: Second struct, whose version decides the fields compared
+        skip: Top-level fields to leave out
+
+    Yields:
+        (path, value in a, value in b), in field order
+    """
+    for name in retriever_fields(type(b), b.ver):
+        if name in skip:
+            continue
+        va, vb = getattr(a, name), getattr(b, name)
+        if values_equal(va, vb):
+            continue
+        if is_struct(va) and is_struct(vb) and type(va) is type(vb):
+            for path, da, db in diff_structs(va, vb):
+                yield (name,) + path, da, db
+        elif is_list(va) and is_list(vb) and len(va) == len(vb) and any(is_struct(v) for v in vb):
+            for i, (ea, eb) in enumerate(zip(va, vb)):
+                if values_equal(ea, eb):
+                    continue
+                if is_struct(ea) and is_struct(eb) and type(ea) is type(eb):
+                    for path, da, db in diff_structs(ea, eb):
+                        yield (name, i) + path, da, db
+                else:
+                    yield (name, i), ea, eb
+        else:
+            yield (name,), va, vb
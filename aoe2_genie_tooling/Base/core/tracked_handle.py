@@ -0,0 +1,80 @@
+"""
+TrackedHandle - Write reporting shared by the single-entry handles.
+
+Responsibilities:
+- Let an open workspace batch and the journal remember the wrapped struct (or
+  one field of it) before a write
+- Report a finished write to the workspace change tracker
+- Skip both for attribute writes that would not change the stored value
+
+Handles call _before_write() once they know a write will happen (after
+validating their arguments) and _changed() only after it succeeded, so a
+rejected or failed edit reports nothing.
+
+Usage:
+    class SoundHandle(TrackedHandle):
+        _KIND = "sounds"
+        _STRUCT = "_sound"
+
+        def __setattr__(self, name, value):
+            self._write_field(name, value)
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+__all__ = ["TrackedHandle", "same_value"]
+
+# Values whose equality means the stored bytes would not change
+_SCALARS = (bool, int, float, str)
+
+
+def same_value(current: Any, value: Any) -> bool:
+    """True if writing value over current would store the same scalar."""
+    return type(current) is type(value) and isinstance(value, _SCALARS) and current == value
+
+
+class TrackedHandle:
+    """
+    Mixin for handles wrapping one entry of a top-level collection.
+
+    Subclasses set _KIND and _STRUCT and store _workspace and _id.
+
+    Attributes:
+        _KIND: Change tracker kind of the collection ("sprites", "techs", ...)
+        _STRUCT: Name of the attribute holding the wrapped struct
+    """
+
+    _KIND: str = ""
+    _STRUCT: str = ""
+
+    def _changed(self) -> None:
+        """Report a write to this entry to the workspace change tracker."""
+        self._workspace.changes.mark(self._KIND, self._id)
+
+    def _before_write(self, field: Optional[str] = None) -> None:
+        """Let an open workspace batch and the journal remember the entry (or one field) before a write."""
+        batch = self._workspace._batch
+        if batch is not None and batch.rollback_enabled:
+            struct = getattr(self, self._STRUCT)
+            if field is None:
+                batch.save(self._KIND, self._id, struct)
+            else:
+                batch.record(self._KIND, self._id, struct, field)
+        journal = self._workspace._journal
+        if journal is not None:
+            journal.touch(self._KIND, self._id)
+
+    def _write_field(self, name: str, value: Any) -> None:
+        """Set a field of the wrapped struct, reporting it unless the value is unchanged."""
+        struct = getattr(self, self._STRUCT)
+        try:
+            current = getattr(struct, name)
+        except Exception:
+            # Let setattr raise the real error
+            current = None
+        if same_value(current, value):
+            return
+        self._before_write(name)
+        setattr(struct, name, value)
+        self._changed()
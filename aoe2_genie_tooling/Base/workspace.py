@@ -13,14 +13,15 @@ Example:
 """
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
 
 # Core data access - GenieDatParser is vendored
 import aoe2_genie_tooling._vendor  # Initialize vendored path
 from sections.datfile_sections import DatFile
-from aoe2_genie_tooling.Base.config import Config, ValidationLevel
+from aoe2_genie_tooling.Base.config import CompressionProfile, Config, ValidationLevel
 from bfp_rs import Version
 
 # Support systems
@@ -29,6 +30,13 @@ from aoe2_genie_tooling.Base.core.registry import Registry
 from aoe2_genie_tooling.Base.core.logger import Logger
 from aoe2_genie_tooling.Base.core.validator import Validator
 from aoe2_genie_tooling.Base.core.id_tracker import IDTracker
+from aoe2_genie_tooling.Base.core.snapshot_cache import SnapshotCache
+from aoe2_genie_tooling.Base.core.lazy_dat import LazyDatFile
+from aoe2_genie_tooling.Base.core.change_tracker import ChangeTracker
+from aoe2_genie_tooling.Base.core.batch import EditBatch
+from aoe2_genie_tooling.Base.core.journal import ChangeJournal
+from aoe2_genie_tooling.Base.core.batch_loader import LoadResult, load_many
+from aoe2_genie_tooling.Base.core.fingerprint import DatFingerprint, Fingerprinter
 from aoe2_genie_tooling.Base.core.exceptions import ValidationError
 
 # Managers (TEMPORARILY COMMENTED - need to be rebuilt)
@@ -56,13 +64,15 @@ class GenieWorkspace:
     - Provides property-based access to managers
     
     Attributes:
-        dat: The underlying DatFile object (from GenieDatParser)
+        dat: The underlying DatFile object (from GenieDatParser), or a
+             LazyDatFile proxy for it when loaded with lazy=True or cache_dir
         source_path: Path from which the DAT was loaded (if any)
         file_io: Handles read/write operations
         registry: Tracks created items for ASP integration
         logger: Colored console output
         validator: Validates attributes and references
         id_tracker: Tracks ID movements and ensures uniqueness
+        changes: Receives write notifications from handles and managers
     """
     dat: DatFile
     source_path: Optional[Path] = None
@@ -83,6 +93,12 @@ class GenieWorkspace:
         self.logger = Logger()
         self.validator = Validator()
         self.id_tracker = IDTracker()
+        self.changes = ChangeTracker()
+        self._fingerprinter: Optional[Fingerprinter] = None
+        # Open workspace.batch(), if any
+        self._batch: Optional[EditBatch] = None
+        # Undo/redo history, if enabled
+        self._journal: Optional[ChangeJournal] = None
         
         # Dirty tracking for unit type changes
         self._type_changed_units = set()  # Unit IDs that need structure sync
@@ -147,6 +163,9 @@ class GenieWorkspace:
         cls,
         path: PathLike,
         validation: ValidationLevel = ValidationLevel.VALIDATE_NEW,
+        cache_dir: Union[PathLike, SnapshotCache, None] = None,
+        lazy: bool = False,
+        memory_map: bool = False,
     ) -> "GenieWorkspace":
         """
         Load a DatFile from disk and return a workspace.
@@ -154,14 +173,31 @@ class GenieWorkspace:
         Args:
             path: Path to the .dat file
             validation: Validation level (default: VALIDATE_NEW)
+            cache_dir: Snapshot cache directory (or SnapshotCache instance).
+                       Repeated loads of the same file restore the inflated
+                       payload and its section offsets from the cache and
+                       parse nothing up front: each top-level section is
+                       parsed when it is first accessed, and unchanged
+                       sections are saved from their loaded bytes.
+            lazy: Defer parsing until the data is first accessed. A workspace
+                  that never touches the data saves the source file verbatim.
+                  Without cache_dir, the first access parses the whole file;
+                  loads through cache_dir are always deferred per section.
+            memory_map: Read the file through a memory map and inflate it into a
+                        single buffer, lowering peak memory during load.
         
         Returns:
             A new GenieWorkspace with the loaded data
         """
         p = Path(path)
         
-        # Load DAT file via FileIO
-        dat = FileIO.load_dat_file(p)
+        # Load DAT file via FileIO, or through the snapshot cache if requested
+        if cache_dir is None:
+            loader = FileIO.load_dat_file_mapped if memory_map else FileIO.load_dat_file
+            dat = LazyDatFile(p, loader) if lazy else loader(p)
+        else:
+            cache = cache_dir if isinstance(cache_dir, SnapshotCache) else SnapshotCache(cache_dir)
+            dat = cache.load_lazy(p)
         workspace = cls(dat=dat, source_path=p, validation_level=validation)
         
         # If validate_all, register all existing objects
@@ -173,10 +209,62 @@ class GenieWorkspace:
         
         return workspace
 
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[PathLike],
+        workers: Optional[int] = None,
+        task: Optional[Callable[["GenieWorkspace"], Any]] = None,
+        max_in_flight: Optional[int] = None,
+        validation: ValidationLevel = ValidationLevel.NO_VALIDATION,
+        cache_dir: Optional[PathLike] = None,
+        memory_map: bool = False,
+    ) -> Iterator[LoadResult]:
+        """
+        Load many DAT files in parallel, yielding one LoadResult per file.
+
+        Without a task, files are loaded on threads and each result carries
+        its workspace. With a task, every file is loaded in a worker process,
+        ``task(workspace)`` runs there and only its return value comes back,
+        which spreads parsing over all cores. A failing file is reported in
+        its own result and does not stop the batch.
+
+        Args:
+            paths: Files to load
+            workers: Pool size (default: os.cpu_count())
+            task: Module-level function run on every workspace in a worker process
+            max_in_flight: Maximum number of files loaded but not yet yielded
+                           (default: workers). Bounds peak memory.
+            validation: Validation level (default: NO_VALIDATION)
+            cache_dir: Snapshot cache directory shared by all workers
+            memory_map: Load through a memory map (see load())
+
+        Returns:
+            Iterator of LoadResult in completion order
+
+        Example:
+            def unit_count(workspace):
+                return len(workspace.dat.civilizations[0].units)
+
+            for result in GenieWorkspace.load_many(paths, workers=8, task=unit_count):
+                print(result.path.name, result.value if result.ok else result.error)
+        """
+        return load_many(
+            paths,
+            workers=workers,
+            task=task,
+            max_in_flight=max_in_flight,
+            validation=validation,
+            cache_dir=cache_dir,
+            memory_map=memory_map,
+        )
+
     def save(
         self,
         target_path: PathLike,
         validate: Union[ValidationLevel, bool] = None,
+        compression: Union[CompressionProfile, str, None] = None,
+        compressed: bool = True,
     ) -> None:
         """
         Save the current DAT state to disk.
@@ -186,16 +274,94 @@ class GenieWorkspace:
         - VALIDATE_NEW: Check session-created objects only
         - VALIDATE_ALL: Full validation of all references
         
+        Sections whose bytes did not change since the previous save reuse
+        its compressed bytes; every other section is compressed again,
+        whether it was edited through a handle or directly on
+        ``workspace.dat``.
+
         Args:
             target_path: Path to save the .dat file to
             validate: Override validation level. If None, uses workspace default.
                       True = VALIDATE_NEW, False = NO_VALIDATION for backward compat.
+            compression: Compression profile ("fast", "balanced", "max").
+                         If None, uses Config.DEFAULT_COMPRESSION.
+            compressed: False writes the raw, uncompressed payload. Raw files
+                        load normally and work with binary diff tools.
         
         Raises:
             ValidationError: If validation fails
         """
         out = Path(target_path)
+        self._prepare_save(validate)
         
+        # Save via FileIO
+        self.file_io.save(str(out), compression=compression, compressed=compressed)
+        self.logger.info(f"Saved to {out.name}")
+
+    def save_async(
+        self,
+        target_path: PathLike,
+        validate: Union[ValidationLevel, bool] = None,
+        compression: Union[CompressionProfile, str, None] = None,
+        compressed: bool = True,
+    ) -> Future:
+        """
+        Save the current DAT state to disk without blocking.
+
+        Validation and the unit type sync run before this returns, followed by
+        a snapshot of the data. Compression and writing then happen on a
+        background thread, so edits made after the call are not included. The
+        file is written to a temporary path and atomically renamed over the
+        target.
+
+        Args:
+            target_path: Path to save the .dat file to
+            validate: Override validation level (same as save())
+            compression: Compression profile (same as save())
+            compressed: False writes the raw payload (same as save())
+
+        Returns:
+            Future resolving to the output Path once the file is on disk
+
+        Raises:
+            ValidationError: If validation fails (raised immediately)
+
+        Example:
+            future = workspace.save_async("output.dat")
+            # ... keep editing ...
+            future.result()  # wait for the write, re-raises any error
+        """
+        out = Path(target_path)
+        self._prepare_save(validate)
+
+        future = self.file_io.save_async(out, compression=compression, compressed=compressed)
+        future.add_done_callback(
+            lambda f: self.logger.info(f"Saved to {out.name}") if f.exception() is None
+            else self.logger.error(f"Background save to {out.name} failed: {f.exception()}")
+        )
+        return future
+
+    def close(self) -> None:
+        """
+        Finish any pending background save and release the save thread.
+
+        The workspace stays usable; a later save_async() starts a new thread.
+
+        Example:
+            with GenieWorkspace.load("empires2_x2_p1.dat") as workspace:
+                workspace.save_async("output.dat")
+            # the file is on disk here
+        """
+        self.file_io.close()
+
+    def __enter__(self) -> "GenieWorkspace":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _prepare_save(self, validate: Union[ValidationLevel, bool] = None) -> None:
+        """Validate and sync unit structures so the DAT is consistent for writing."""
         # Determine validation level
         if validate is None:
             level = self.validation_level
@@ -206,8 +372,9 @@ class GenieWorkspace:
         else:
             level = validate
         
-        # Perform validation based on level
-        if level != ValidationLevel.NO_VALIDATION:
+        # Perform validation based on level (a lazy DAT that was never touched has nothing to check)
+        untouched = isinstance(self.dat, LazyDatFile) and not self.dat.parsed_sections
+        if level != ValidationLevel.NO_VALIDATION and not untouched:
             validate_existing = (level == ValidationLevel.VALIDATE_ALL)
             issues = self.validator.validate_all_references(self, validate_existing)
             if issues:
@@ -224,14 +391,119 @@ class GenieWorkspace:
                         unit = civ.units[unit_id]
                         if unit:
                             sync_structures_to_type(unit, civilizations=self.dat.civilizations)
+                self.changes.mark("units", unit_id)
             
             # Clear dirty set after validation
             self._type_changed_units.clear()
-        
-        # Save via FileIO
-        self.file_io.save(str(out))
-        self.logger.info(f"Saved to {out.name}")
     
+    def fingerprint(self) -> DatFingerprint:
+        """
+        Compute content hashes of the DAT, per top-level section and per object.
+
+        The first call hashes everything; later calls only hash objects that
+        were written through handles or managers since the previous call, so
+        checking "did anything change?" after a few edits is cheap.
+
+        Edits made directly on ``workspace.dat`` are not seen by the handles.
+        Report them with ``workspace.changes.mark(kind, obj_id)``.
+
+        Returns:
+            DatFingerprint with the file hash, section hashes and object hashes
+
+        Example:
+            before = workspace.fingerprint()
+            workspace.unit_manager.get(4).hit_points = 40
+            if workspace.fingerprint().digest != before.digest:
+                rebuild()
+        """
+        self.changes.flush()
+        return self._get_fingerprinter().compute()
+
+    def _get_fingerprinter(self) -> Fingerprinter:
+        """The workspace's hash cache, created (and subscribed) on first use."""
+        if self._fingerprinter is None:
+            self._fingerprinter = Fingerprinter(self)
+        return self._fingerprinter
+
+    def batch(self, rollback: bool = True) -> EditBatch:
+        """
+        Group writes so change bookkeeping runs once per object, not per write.
+
+        Inside the ``with`` block, writes go to the DAT as usual but their
+        change notifications are coalesced and delivered on exit. If the block
+        raises, the handle writes made in it are rolled back. A batch opened
+        inside another one joins it.
+
+        Args:
+            rollback: Record old values for rollback. False makes writes
+                      cheaper when the script does not need to undo them.
+
+        Returns:
+            EditBatch to use as a context manager
+
+        Example:
+            with workspace.batch():
+                for unit_id in unit_ids:
+                    unit = workspace.unit_manager.get(unit_id)
+                    unit.hit_points += 10
+        """
+        if self._batch is not None:
+            return self._batch
+        return EditBatch(self, rollback)
+
+    @property
+    def journal(self) -> Optional[ChangeJournal]:
+        """Undo/redo history (None until enable_journal())."""
+        return self._journal
+
+    def enable_journal(self, limit: Optional[int] = None) -> ChangeJournal:
+        """
+        Start recording edits for undo()/redo().
+
+        Handle writes and manager operations from now on are recorded as
+        compact field-level changes (see ChangeJournal). Calling it again
+        keeps the existing history.
+
+        Args:
+            limit: Maximum number of undo steps kept (None = unlimited)
+
+        Returns:
+            The ChangeJournal
+
+        Example:
+            workspace.enable_journal()
+            workspace.unit_manager.get(4).hit_points = 1
+            workspace.undo()
+        """
+        if self._journal is None:
+            self._journal = ChangeJournal(self, limit)
+            self.changes.subscribe(self._journal._on_change)
+        return self._journal
+
+    def disable_journal(self) -> None:
+        """Stop recording edits and drop the undo/redo history."""
+        if self._journal is not None:
+            self.changes.unsubscribe(self._journal._on_change)
+            self._journal = None
+
+    def undo(self) -> bool:
+        """
+        Revert the newest journaled edit (see enable_journal()).
+
+        Returns:
+            True if an edit was reverted, False if there was nothing to undo
+        """
+        return self._journal is not None and self._journal.undo()
+
+    def redo(self) -> bool:
+        """
+        Reapply the newest edit reverted by undo().
+
+        Returns:
+            True if an edit was reapplied, False if there was nothing to redo
+        """
+        return self._journal is not None and self._journal.redo()
+
     def save_registry(self, path: PathLike) -> None:
         """
         Save the registry of created items to a JSON file.
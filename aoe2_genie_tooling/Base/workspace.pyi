@@ -1,16 +1,23 @@
 """Type stubs for GenieWorkspace - enables IDE autocomplete"""
+from concurrent.futures import Future
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
 
 from bfp_rs import Version
 from sections.datfile_sections import DatFile
 
-from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.config import CompressionProfile, ValidationLevel
 from aoe2_genie_tooling.Base.core.fileio import FileIO
 from aoe2_genie_tooling.Base.core.registry import Registry
 from aoe2_genie_tooling.Base.core.logger import Logger
 from aoe2_genie_tooling.Base.core.validator import Validator
 from aoe2_genie_tooling.Base.core.id_tracker import IDTracker
+from aoe2_genie_tooling.Base.core.snapshot_cache import SnapshotCache
+from aoe2_genie_tooling.Base.core.change_tracker import ChangeTracker
+from aoe2_genie_tooling.Base.core.batch import EditBatch
+from aoe2_genie_tooling.Base.core.journal import ChangeJournal
+from aoe2_genie_tooling.Base.core.batch_loader import LoadResult
+from aoe2_genie_tooling.Base.core.fingerprint import DatFingerprint
 
 from aoe2_genie_tooling.Units.unit_manager import UnitManager
 from aoe2_genie_tooling.Graphics.graphic_manager import GraphicManager
@@ -45,6 +52,7 @@ class GenieWorkspace:
     logger: Logger
     validator: Validator
     id_tracker: IDTracker
+    changes: ChangeTracker
     
     # Manager properties
     @property
@@ -88,6 +96,9 @@ class GenieWorkspace:
         cls,
         path: PathLike,
         validation: ValidationLevel = ValidationLevel.VALIDATE_NEW,
+        cache_dir: Union[PathLike, SnapshotCache, None] = None,
+        lazy: bool = False,
+        memory_map: bool = False,
     ) -> "GenieWorkspace":
         """
         Load a DatFile from disk and return a workspace.
@@ -95,16 +106,72 @@ class GenieWorkspace:
         Args:
             path: Path to the .dat file
             validation: Validation level (default: VALIDATE_NEW)
+            cache_dir: Snapshot cache directory (or SnapshotCache instance).
+                       Repeated loads of the same file restore the inflated
+                       payload and its section offsets from the cache and
+                       parse nothing up front: each top-level section is
+                       parsed when it is first accessed, and unchanged
+                       sections are saved from their loaded bytes.
+            lazy: Defer parsing until the data is first accessed. A workspace
+                  that never touches the data saves the source file verbatim.
+                  Without cache_dir, the first access parses the whole file;
+                  loads through cache_dir are always deferred per section.
+            memory_map: Read the file through a memory map and inflate it into a
+                        single buffer, lowering peak memory during load.
         
         Returns:
             A new GenieWorkspace with the loaded data
         """
         ...
     
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[PathLike],
+        workers: Optional[int] = None,
+        task: Optional[Callable[["GenieWorkspace"], Any]] = None,
+        max_in_flight: Optional[int] = None,
+        validation: ValidationLevel = ValidationLevel.NO_VALIDATION,
+        cache_dir: Optional[PathLike] = None,
+        memory_map: bool = False,
+    ) -> Iterator[LoadResult]:
+        """
+        Load many DAT files in parallel, yielding one LoadResult per file.
+
+        Without a task, files are loaded on threads and each result carries
+        its workspace. With a task, every file is loaded in a worker process,
+        ``task(workspace)`` runs there and only its return value comes back,
+        which spreads parsing over all cores. A failing file is reported in
+        its own result and does not stop the batch.
+
+        Args:
+            paths: Files to load
+            workers: Pool size (default: os.cpu_count())
+            task: Module-level function run on every workspace in a worker process
+            max_in_flight: Maximum number of files loaded but not yet yielded
+                           (default: workers). Bounds peak memory.
+            validation: Validation level (default: NO_VALIDATION)
+            cache_dir: Snapshot cache directory shared by all workers
+            memory_map: Load through a memory map (see load())
+
+        Returns:
+            Iterator of LoadResult in completion order
+
+        Example:
+            def unit_count(workspace):
+                return len(workspace.dat.civilizations[0].units)
+
+            for result in GenieWorkspace.load_many(paths, workers=8, task=unit_count):
+                print(result.path.name, result.value if result.ok else result.error)
+        """
+        ...
+
     def save(
         self,
         target_path: PathLike,
         validate: Union[ValidationLevel, bool] = None,
+        compression: Union[CompressionProfile, str, None] = None,
+        compressed: bool = True,
     ) -> None:
         """
         Save the current DAT state to disk.
@@ -113,12 +180,98 @@ class GenieWorkspace:
             target_path: Path to save the .dat file to
             validate: Override validation level. If None, uses workspace default.
                       True = VALIDATE_NEW, False = NO_VALIDATION for backward compat.
+            compression: Compression profile ("fast", "balanced", "max").
+                         If None, uses Config.DEFAULT_COMPRESSION.
+            compressed: False writes the raw, uncompressed payload. Raw files
+                        load normally and work with binary diff tools.
         
         Raises:
             ValidationError: If validation fails
         """
         ...
+
+    def save_async(
+        self,
+        target_path: PathLike,
+        validate: Union[ValidationLevel, bool] = None,
+        compression: Union[CompressionProfile, str, None] = None,
+        compressed: bool = True,
+    ) -> Future:
+        """
+        Save the current DAT state to disk without blocking.
+
+        Validation and the unit type sync run before this returns; compression
+        and the atomic write happen on a background thread.
+
+        Args:
+            target_path: Path to save the .dat file to
+            validate: Override validation level (same as save())
+            compression: Compression profile (same as save())
+            compressed: False writes the raw payload (same as save())
+
+        Returns:
+            Future resolving to the output Path once the file is on disk
+
+        Raises:
+            ValidationError: If validation fails (raised immediately)
+        """
+        ...
+
+    def close(self) -> None:
+        """Finish any pending background save and release the save thread."""
+        ...
+
+    def __enter__(self) -> "GenieWorkspace": ...
+
+    def __exit__(self, *exc_info: object) -> None: ...
+
+    def fingerprint(self) -> DatFingerprint:
+        """
+        Compute content hashes of the DAT, per top-level section and per object.
+
+        Only objects written through handles or managers since the previous
+        call are hashed again.
+
+        Returns:
+            DatFingerprint with the file hash, section hashes and object hashes
+        """
+        ...
+
+    def batch(self, rollback: bool = True) -> EditBatch:
+        """
+        Group writes so change bookkeeping runs once per object, not per write.
+
+        Use as ``with workspace.batch():``. Handle writes in the block are
+        rolled back if it raises.
+        """
+        ...
     
+    @property
+    def journal(self) -> Optional[ChangeJournal]:
+        """Undo/redo history (None until enable_journal())."""
+        ...
+
+    def enable_journal(self, limit: Optional[int] = None) -> ChangeJournal:
+        """
+        Start recording edits for undo()/redo().
+
+        Args:
+            limit: Maximum number of undo steps kept (None = unlimited)
+        """
+        ...
+
+    def disable_journal(self) -> None:
+        """Stop recording edits and drop the undo/redo history."""
+        ...
+
+    def undo(self) -> bool:
+        """Revert the newest journaled edit. False if there was nothing to undo."""
+        ...
+
+    def redo(self) -> bool:
+        """Reapply the newest edit reverted by undo(). False if there was nothing to redo."""
+        ...
+
     def save_registry(self, path: PathLike) -> None:
         """
         Save the registry of created items to a JSON file.
@@ -138,6 +138,11 @@ class CivHandle:
             object.__setattr__(self, name, value)
         else:
             setattr(self._civ, name, value)
+            self._changed()
+
+    def _changed(self) -> None:
+        """Report a write to this civilization to the workspace change tracker."""
+        self._workspace.changes.mark("civilizations", self._id)
     
     def __repr__(self) -> str:
         if not self.exists():
@@ -5,12 +5,15 @@ Civilizations contain units, resources, and effect links.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, List, Optional, Any
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Civilizations.civ_handle import CivHandle
 
+from aoe2_genie_tooling.Base.core.handle_cache import HandleCache
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.struct_cloner import deep_clone
 from aoe2_genie_tooling.Civilizations.civ_handle import CivHandle
 
 __all__ = ["CivManager"]
@@ -24,6 +27,16 @@ class CivManager:
     def __init__(self, workspace: GenieWorkspace) -> None:
         """Initialize CivManager with workspace reference."""
         self.workspace = workspace
+        # Lazily built lookup for find_by_name/find_by_prefix
+        self.names = NameIndex("civilizations", lambda: len(self.workspace.dat.civilizations), self._civ_name)
+        workspace.changes.subscribe(self.names.on_change)
+        # Handles returned by get(), reused until a change is reported for their ID
+        self._handles = HandleCache("civilizations", lambda civ_id: CivHandle(self.workspace, civ_id))
+        workspace.changes.subscribe(self._handles.on_change)
+
+    def _civ_name(self, civ_id: int) -> List[str]:
+        civ = self.workspace.dat.civilizations[civ_id]
+        return [] if civ is None else [civ.name]
     
     def get(self, civ_id: int) -> CivHandle:
         """
@@ -45,7 +58,7 @@ class CivManager:
                 f"Civ ID {civ_id} out of range (0-{len(self.workspace.dat.civilizations)-1})"
             )
         
-        return CivHandle(self.workspace, civ_id)
+        return self._handles.get(civ_id)
     
     def count(self) -> int:
         """Get total number of civilizations."""
@@ -55,18 +68,14 @@ class CivManager:
         """Check if civilization exists."""
         return 0 <= civ_id < len(self.workspace.dat.civilizations)
 
-    def find_by_name(self, name: str) -> Optional[CivHandle]:
-        """Find first civilization matching name."""
-        for i, civ in enumerate(self.workspace.dat.civilizations):
-            if civ is not None:
-                civ_name = ""
-                try:
-                    civ_name = civ.name
-                except Exception:
-                    pass
-                if civ_name == name:
-                    return CivHandle(self.workspace, i)
-        return None
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[CivHandle]:
+        """Find first civilization matching name (set case_sensitive=False to ignore case)."""
+        civ_id = self.names.find(name, case_sensitive)
+        return None if civ_id is None else CivHandle(self.workspace, civ_id)
+
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[CivHandle]:
+        """Find all civilizations whose name starts with prefix, in ID order."""
+        return [CivHandle(self.workspace, i) for i in self.names.find_prefix(prefix, case_sensitive)]
 
     def _create_blank_civ(self, ver: Any) -> Any:
         """Create a blank Civilization object."""
@@ -124,6 +133,9 @@ class CivManager:
             self.workspace.dat.civilizations.append(self._create_blank_civ(template_ver))
             
         self.workspace.dat.civilizations[target_idx] = new_civ
+        self.workspace.unit_manager.sharing.detach_civ(target_idx)
+        # A replaced civilization brings its own unit table
+        self.workspace.changes.mark("civilizations")
         return CivHandle(self.workspace, target_idx)
 
     # Alias
@@ -154,37 +166,14 @@ class CivManager:
             self.workspace.dat.civilizations.append(self._create_blank_civ(source.ver))
             
         self.workspace.dat.civilizations[target_id] = new_obj
+        self.workspace.unit_manager.sharing.detach_civ(target_id)
+        # A replaced civilization brings its own unit table
+        self.workspace.changes.mark("civilizations")
         return CivHandle(self.workspace, target_id)
 
     def _copy_civ(self, source: Any) -> Any:
-        """Manual copy of Civilization object."""
-        from sections.civilization.civilization import Civilization
-        new_civ = Civilization(ver=source.ver)
-        
-        # Copy simple attrs
-        simple_attrs = [
-            'name', 'player_type', 'num_resources', 'tech_tree_effect_id',
-            'team_bonus_effect_id', 'icon_set'
-        ]
-        for attr in simple_attrs:
-            try:
-                setattr(new_civ, attr, getattr(source, attr))
-            except Exception:
-                pass
-        
-        # Copy resources list
-        try:
-            new_civ.resources = list(source.resources)
-        except Exception:
-            new_civ.resources = []
-            
-        # Copy units list (reference copy, not deep copy of units)
-        try:
-            new_civ.units = list(source.units)
-        except Exception:
-            new_civ.units = []
-            
-        return new_civ
+        """Deep copy of a Civilization object, including its units."""
+        return deep_clone(source)
 
     # Clipboard Implementation
     _clipboard: Optional[Any] = None
@@ -209,6 +198,9 @@ class CivManager:
             self.workspace.dat.civilizations.append(self._create_blank_civ(pasted.ver))
             
         self.workspace.dat.civilizations[target_id] = pasted
+        self.workspace.unit_manager.sharing.detach_civ(target_id)
+        # A replaced civilization brings its own unit table
+        self.workspace.changes.mark("civilizations")
         return CivHandle(self.workspace, target_id)
 
     def clear_clipboard(self) -> None:
@@ -234,11 +226,12 @@ class CivManager:
             Index of the new resource
         """
         new_index = -1
-        for civ in self.workspace.dat.civilizations:
+        for civ_id, civ in enumerate(self.workspace.dat.civilizations):
             if civ is not None:
                 civ.resources.append(default_value)
                 civ.num_resources = len(civ.resources)
                 new_index = len(civ.resources) - 1
+                self.workspace.changes.mark("civilizations", civ_id)
         return new_index
 
     def remove_resource(self, index: int) -> bool:
@@ -265,11 +258,12 @@ class CivManager:
             return False
         
         # Remove from all civs
-        for civ in self.workspace.dat.civilizations:
+        for civ_id, civ in enumerate(self.workspace.dat.civilizations):
             if civ is not None:
                 if 0 <= index < len(civ.resources):
                     del civ.resources[index]
                     civ.num_resources = len(civ.resources)
+                    self.workspace.changes.mark("civilizations", civ_id)
         return True
 
     def resource_count(self) -> int:
@@ -286,7 +280,8 @@ class CivManager:
 
     def clear_resources(self) -> None:
         """Remove all resources from ALL civilizations."""
-        for civ in self.workspace.dat.civilizations:
+        for civ_id, civ in enumerate(self.workspace.dat.civilizations):
             if civ is not None:
                 civ.resources = []
                 civ.num_resources = 0
+                self.workspace.changes.mark("civilizations", civ_id)
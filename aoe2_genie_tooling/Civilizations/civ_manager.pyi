@@ -1,9 +1,12 @@
 """Type stubs for CivManager - enables IDE autocomplete"""
-from typing import Optional, Any
+from typing import List, Optional, Any
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
 from aoe2_genie_tooling.Civilizations.civ_handle import CivHandle
 
 class CivManager:
     """Manager for civilization operations."""
+
+    names: NameIndex
     
     def get(self, civ_id: int) -> CivHandle:
         """Get a civilization by ID."""
@@ -17,10 +20,14 @@ class CivManager:
         """Check if civilization exists."""
         ...
 
-    def find_by_name(self, name: str) -> Optional[CivHandle]:
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[CivHandle]:
         """Find first civilization matching name."""
         ...
 
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[CivHandle]:
+        """Find all civilizations whose name starts with prefix, in ID order."""
+        ...
+
     def add_new(
         self,
         name: str = "",
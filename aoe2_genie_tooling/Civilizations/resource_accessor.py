@@ -47,6 +47,7 @@ class ResourceAccessor:
     def __setitem__(self, index: int, value: float) -> None:
         """Set resource by index."""
         self._civ.resources[index] = value
+        self._civ_handle._changed()
 
     def get(self, index: int) -> Optional[float]:
         """Get a resource value by index."""
@@ -67,5 +68,6 @@ class ResourceAccessor:
         """
         if 0 <= index < len(self._civ.resources):
             self._civ.resources[index] = value
+            self._civ_handle._changed()
             return True
         return False
@@ -85,7 +85,9 @@ class CommandHandle:
         if name.startswith('_'):
             object.__setattr__(self, name, value)
         else:
+            self._parent._before_write()
             setattr(self._cmd, name, value)
+            self._parent._changed()
 
     def __repr__(self) -> str:
         return f"CommandHandle(index={self._id}, type={self.type}, a={self.a}, b={self.b}, c={self.c}, d={self.d})"
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
+from aoe2_genie_tooling.Base.core.tracked_handle import TrackedHandle
+
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Effects.command_handle import CommandHandle
@@ -14,12 +16,15 @@ if TYPE_CHECKING:
 __all__ = ["EffectHandle"]
 
 
-class EffectHandle:
+class EffectHandle(TrackedHandle):
     """
     Handle for a single effect holder.
     
     Provides direct attribute access and command management.
     """
+
+    _KIND = "tech_effects"
+    _STRUCT = "_effect"
     
     def __init__(self, workspace: GenieWorkspace, effect_id: int) -> None:
         """
@@ -99,7 +104,9 @@ class EffectHandle:
         new_cmd.c = c
         new_cmd.d = d
         
+        self._before_write()
         self._effect.effects.append(new_cmd)
+        self._changed()
         return CommandHandle(self, len(self._effect.effects) - 1)
 
     @property
@@ -150,12 +157,14 @@ class EffectHandle:
             except Exception:
                 pass
         
+        self._before_write()
         if target_index is None:
             self._effect.effects.append(new_cmd)
             target_index = len(self._effect.effects) - 1
         else:
             target_index = max(0, min(target_index, len(self._effect.effects)))
             self._effect.effects.insert(target_index, new_cmd)
+        self._changed()
             
         from aoe2_genie_tooling.Effects.command_handle import CommandHandle
         return CommandHandle(self, target_index)
@@ -179,20 +188,28 @@ class EffectHandle:
         if source_index == target_index:
             return True
             
+        self._before_write()
         obj = self._effect.effects.pop(source_index)
         self._effect.effects.insert(target_index, obj)
+        self._changed()
         return True
 
     def remove_command(self, index: int) -> bool:
         """Remove a command by index."""
         if 0 <= index < len(self._effect.effects):
+            self._before_write()
             del self._effect.effects[index]
+            self._changed()
             return True
         return False
 
     def clear_commands(self) -> None:
         """Remove all commands."""
+        if not self._effect.effects:
+            return
+        self._before_write()
         self._effect.effects = []
+        self._changed()
 
     def exists(self) -> bool:
         """Check if this effect entry exists."""
@@ -207,7 +224,7 @@ class EffectHandle:
         if name.startswith('_'):
             object.__setattr__(self, name, value)
         else:
-            setattr(self._effect, name, value)
+            self._write_field(name, value)
 
     def __repr__(self) -> str:
         if not self.exists():
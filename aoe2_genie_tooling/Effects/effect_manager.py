@@ -7,12 +7,16 @@ Effects follow a two-tier structure:
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Any, Union
+from typing import TYPE_CHECKING, List, Optional, Any, Union
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Effects.effect_handle import EffectHandle
 
+from aoe2_genie_tooling.Base.core.handle_cache import HandleCache
+from aoe2_genie_tooling.Base.core.journal import journal_touch
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.struct_cloner import deep_clone
 from aoe2_genie_tooling.Effects.effect_handle import EffectHandle
 
 __all__ = ["EffectManager"]
@@ -29,6 +33,16 @@ class EffectManager:
     def __init__(self, workspace: GenieWorkspace) -> None:
         """Initialize EffectManager with workspace reference."""
         self.workspace = workspace
+        # Lazily built lookup for find_by_name/find_by_prefix
+        self.names = NameIndex("tech_effects", lambda: len(self.workspace.dat.tech_effects), self._effect_name)
+        workspace.changes.subscribe(self.names.on_change)
+        # Handles returned by get(), reused until a change is reported for their ID
+        self._handles = HandleCache("tech_effects", lambda effect_id: EffectHandle(self.workspace, effect_id))
+        workspace.changes.subscribe(self._handles.on_change)
+
+    def _effect_name(self, effect_id: int) -> List[str]:
+        effect = self.workspace.dat.tech_effects[effect_id]
+        return [] if effect is None else [effect.name]
     
     def get(self, effect_id: int) -> EffectHandle:
         """
@@ -50,7 +64,7 @@ class EffectManager:
                 f"Effect ID {effect_id} out of range (0-{len(self.workspace.dat.tech_effects)-1})"
             )
         
-        return EffectHandle(self.workspace, effect_id)
+        return self._handles.get(effect_id)
     
     def count(self) -> int:
         """Get total number of effect slots."""
@@ -78,22 +92,20 @@ class EffectManager:
         """
         if self.exists(effect_id):
             template = self.workspace.dat.tech_effects[effect_id]
+            journal_touch(self.workspace, "tech_effects", effect_id)
             self.workspace.dat.tech_effects[effect_id] = self._create_blank_effect(template.ver)
+            self.workspace.changes.mark("tech_effects", effect_id)
             return True
         return False
 
-    def find_by_name(self, name: str) -> Optional[EffectHandle]:
-        """Find first effect matching name."""
-        for i, effect in enumerate(self.workspace.dat.tech_effects):
-            if effect is not None:
-                effect_name = ""
-                try:
-                    effect_name = effect.name
-                except Exception:
-                    pass
-                if effect_name == name:
-                    return EffectHandle(self.workspace, i)
-        return None
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[EffectHandle]:
+        """Find first effect matching name (set case_sensitive=False to ignore case)."""
+        effect_id = self.names.find(name, case_sensitive)
+        return None if effect_id is None else self._handles.get(effect_id)
+
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[EffectHandle]:
+        """Find all effects whose name starts with prefix, in ID order."""
+        return [self._handles.get(i) for i in self.names.find_prefix(prefix, case_sensitive)]
 
     def _create_blank_effect(self, ver: Any) -> Any:
         """Create a blank TechEffect object."""
@@ -145,11 +157,13 @@ class EffectManager:
         new_effect.effects = []
         
         # Ensure capacity by filling with blank effects
+        journal_touch(self.workspace, "tech_effects", target_idx)
         while len(self.workspace.dat.tech_effects) <= target_idx:
             self.workspace.dat.tech_effects.append(self._create_blank_effect(template_ver))
             
         self.workspace.dat.tech_effects[target_idx] = new_effect
-        return EffectHandle(self.workspace, target_idx)
+        self.workspace.changes.mark("tech_effects", target_idx)
+        return self._handles.get(target_idx)
 
     # Alias
     create = add_new
@@ -175,34 +189,17 @@ class EffectManager:
         if target_id is None:
             target_id = len(self.workspace.dat.tech_effects)
         
+        journal_touch(self.workspace, "tech_effects", target_id)
         while len(self.workspace.dat.tech_effects) <= target_id:
             self.workspace.dat.tech_effects.append(self._create_blank_effect(source.ver))
             
         self.workspace.dat.tech_effects[target_id] = new_obj
-        return EffectHandle(self.workspace, target_id)
+        self.workspace.changes.mark("tech_effects", target_id)
+        return self._handles.get(target_id)
 
     def _copy_effect(self, source: Any) -> Any:
-        """Manual copy of TechEffect object."""
-        from sections.tech_effect.tech_effect import TechEffect
-        new_effect = TechEffect(ver=source.ver)
-        try:
-            new_effect.name = source.name
-        except Exception:
-            pass
-        new_effect.effects = [self._copy_command(cmd) for cmd in source.effects]
-        return new_effect
-
-    def _copy_command(self, source: Any) -> Any:
-        """Manual copy of EffectCommand object."""
-        from sections.tech_effect.effect_command import EffectCommand
-        new_cmd = EffectCommand(ver=source.ver)
-        attrs = ['type', 'a', 'b', 'c', 'd']
-        for attr in attrs:
-            try:
-                setattr(new_cmd, attr, getattr(source, attr))
-            except Exception:
-                pass
-        return new_cmd
+        """Deep copy of a TechEffect object."""
+        return deep_clone(source)
 
     # Clipboard Implementation
     _clipboard: Optional[Any] = None
@@ -223,11 +220,13 @@ class EffectManager:
         if target_id is None:
             target_id = len(self.workspace.dat.tech_effects)
         
+        journal_touch(self.workspace, "tech_effects", target_id)
         while len(self.workspace.dat.tech_effects) <= target_id:
             self.workspace.dat.tech_effects.append(self._create_blank_effect(pasted.ver))
             
         self.workspace.dat.tech_effects[target_id] = pasted
-        return EffectHandle(self.workspace, target_id)
+        self.workspace.changes.mark("tech_effects", target_id)
+        return self._handles.get(target_id)
 
     def clear_clipboard(self) -> None:
         """Clear clipboard."""
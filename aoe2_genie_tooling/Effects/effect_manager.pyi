@@ -1,9 +1,12 @@
 """Type stubs for EffectManager - enables IDE autocomplete"""
-from typing import Optional, Any
+from typing import List, Optional, Any
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
 from aoe2_genie_tooling.Effects.effect_handle import EffectHandle
 
 class EffectManager:
     """Manager for effect operations."""
+
+    names: NameIndex
     
     def get(self, effect_id: int) -> EffectHandle:
         """Get an effect by ID."""
@@ -25,10 +28,14 @@ class EffectManager:
         """Delete an effect (sets slot to None)."""
         ...
 
-    def find_by_name(self, name: str) -> Optional[EffectHandle]:
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[EffectHandle]:
         """Find first effect matching name."""
         ...
 
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[EffectHandle]:
+        """Find all effects whose name starts with prefix, in ID order."""
+        ...
+
     def add_new(
         self,
         name: str = "",
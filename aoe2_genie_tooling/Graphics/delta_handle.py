@@ -49,7 +49,9 @@ class DeltaHandle:
     @graphic_id.setter
     def graphic_id(self, value: Union[GraphicId, int]) -> None:
         """Set the referenced graphic ID."""
+        self.parent._before_write()
         self.parent._sprite.deltas[self.index].sprite_id = int(value)
+        self.parent._changed()
     
     @property
     def offset_x(self) -> int:
@@ -59,7 +61,9 @@ class DeltaHandle:
     @offset_x.setter
     def offset_x(self, value: int) -> None:
         """Set X offset from parent."""
+        self.parent._before_write()
         self.parent._sprite.deltas[self.index].offset_x = value
+        self.parent._changed()
     
     @property
     def offset_y(self) -> int:
@@ -69,7 +73,9 @@ class DeltaHandle:
     @offset_y.setter
     def offset_y(self, value: int) -> None:
         """Set Y offset from parent."""
+        self.parent._before_write()
         self.parent._sprite.deltas[self.index].offset_y = value
+        self.parent._changed()
     
     @property
     def display_angle(self) -> int:
@@ -79,4 +85,6 @@ class DeltaHandle:
     @display_angle.setter
     def display_angle(self, value: int) -> None:
         """Set display angle filter (-1 = all angles)."""
+        self.parent._before_write()
         self.parent._sprite.deltas[self.index].display_angle = value
+        self.parent._changed()
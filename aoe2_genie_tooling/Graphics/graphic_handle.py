@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
+from aoe2_genie_tooling.Base.core.tracked_handle import TrackedHandle, same_value
 from aoe2_genie_tooling.Base.core.typed_ids import GraphicId, DeltaIndex
 
 if TYPE_CHECKING:
@@ -16,12 +17,15 @@ if TYPE_CHECKING:
 __all__ = ["GraphicHandle"]
 
 
-class GraphicHandle:
+class GraphicHandle(TrackedHandle):
     """
     Handle for a single sprite/graphic.
     
     Provides direct attribute access to the underlying Sprite object.
     """
+
+    _KIND = "sprites"
+    _STRUCT = "_sprite"
     
     def __init__(self, workspace: GenieWorkspace, graphic_id: int) -> None:
         """
@@ -67,15 +71,19 @@ class GraphicHandle:
         """
         if name.startswith('_'):
             object.__setattr__(self, name, value)
+            return
         # Check if this class has a property descriptor for the name
-        elif hasattr(type(self), name) and isinstance(getattr(type(self), name), property):
+        if hasattr(type(self), name) and isinstance(getattr(type(self), name), property):
             prop = getattr(type(self), name)
-            if prop.fset is not None:
-                prop.fset(self, value)
-            else:
+            if prop.fset is None:
                 raise AttributeError(f"property '{name}' has no setter")
+            if prop.fget is not None and same_value(prop.fget(self), value):
+                return
+            self._before_write()
+            prop.fset(self, value)
+            self._changed()
         else:
-            setattr(self._sprite, name, value)
+            self._write_field(name, value)
     
     def __repr__(self) -> str:
         return f"GraphicHandle(id={self._id})"
@@ -225,6 +233,8 @@ class GraphicHandle:
         new_delta.offset_y = offset_y
         new_delta.display_angle = display_angle
         
+        self._before_write()
+
         # CRITICAL: Don't use append()! bfp_rs lists share internal storage.
         current_deltas = list(self._sprite.deltas)
         current_deltas.append(new_delta)
@@ -232,6 +242,7 @@ class GraphicHandle:
         
         # Update count
         self._sprite.num_deltas = len(self._sprite.deltas)
+        self._changed()
         
         # Return handle for new delta
         return DeltaHandle(self, len(self._sprite.deltas) - 1)
@@ -263,8 +274,10 @@ class GraphicHandle:
             True if removed, False if index invalid
         """
         if 0 <= delta_id < len(self._sprite.deltas):
+            self._before_write()
             del self._sprite.deltas[delta_id]
             self._sprite.num_deltas = len(self._sprite.deltas)
+            self._changed()
             return True
         return False
     
@@ -375,7 +388,7 @@ class GraphicHandle:
         # Get source delta
         source_delta = source_gfx.deltas[resolved_delta_id]
         
-        # Create new delta with same properties
+        # Create new delta with same properties (add_delta reports the write)
         return self.add_delta(
             graphic_id=source_delta.graphic_id,
             offset_x=source_delta.offset_x,
@@ -385,8 +398,12 @@ class GraphicHandle:
     
     def clear_deltas(self) -> None:
         """Remove all deltas from this graphic."""
+        if not self._sprite.deltas and self._sprite.num_deltas == 0:
+            return
+        self._before_write()
         self._sprite.deltas.clear()
         self._sprite.num_deltas = 0
+        self._changed()
 
     def exists(self) -> bool:
         """
@@ -436,6 +453,8 @@ class GraphicHandle:
         angle_sound.sound_id3 = sound_id_3
         angle_sound.wwise_sound_id3 = wwise_sound_id_3
         
+        self._before_write()
+
         # CRITICAL: bfp_rs validation is strict on list assignment vs num_facets.
         # Strategy: Use Reset-Append to bypass assignment check and break storage sharing.
         
@@ -453,6 +472,7 @@ class GraphicHandle:
         # 4. Sync metadata
         self._sprite.facets_have_attack_sounds = True
         self._sprite.num_facets = len(self._sprite.facet_attack_sounds)
+        self._changed()
     
     @property
     def deltas(self) -> list[DeltaHandle]:
@@ -475,16 +495,20 @@ class GraphicHandle:
         Returns:
             Number of deltas removed
         """
-        initial_count = len(self._sprite.deltas)
-        self._sprite.deltas = [
-            d for d in self._sprite.deltas if d.sprite_id != graphic_id
-        ]
-        removed = initial_count - len(self._sprite.deltas)
+        kept = [d for d in self._sprite.deltas if d.sprite_id != graphic_id]
+        removed = len(self._sprite.deltas) - len(kept)
         if removed > 0:
-            self._sprite.num_deltas = len(self._sprite.deltas)
+            self._before_write()
+            self._sprite.deltas = kept
+            self._sprite.num_deltas = len(kept)
+            self._changed()
         return removed
     
     def clear_angle_sounds(self) -> None:
         """Remove all angle sounds."""
+        if not self._sprite.facet_attack_sounds and not self._sprite.facets_have_attack_sounds:
+            return
+        self._before_write()
         self._sprite.facet_attack_sounds.clear()
         self._sprite.facets_have_attack_sounds = False
+        self._changed()
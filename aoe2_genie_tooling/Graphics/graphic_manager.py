@@ -9,12 +9,16 @@ Responsibilities:
 from __future__ import annotations
 
 import copy as copy_module
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Graphics.delta_handle import DeltaHandle
 
+from aoe2_genie_tooling.Base.core.handle_cache import HandleCache
+from aoe2_genie_tooling.Base.core.journal import journal_touch, journaled
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.struct_cloner import deep_clone
 from aoe2_genie_tooling.Graphics.graphic_handle import GraphicHandle
 
 __all__ = ["GraphicManager"]
@@ -36,6 +40,21 @@ class GraphicManager:
         """
         self.workspace = workspace
         self._clipboard: Optional[Any] = None
+        # Lazily built lookups for find_by_name/find_by_file_name/find_by_prefix
+        self.names = NameIndex("sprites", self._count, lambda i: self._sprite_field(i, "name"))
+        self.file_names = NameIndex("sprites", self._count, lambda i: self._sprite_field(i, "file_name"))
+        workspace.changes.subscribe(self.names.on_change)
+        workspace.changes.subscribe(self.file_names.on_change)
+        # Handles returned by get(), reused until a change is reported for their ID
+        self._handles = HandleCache("sprites", lambda graphic_id: GraphicHandle(self.workspace, graphic_id))
+        workspace.changes.subscribe(self._handles.on_change)
+
+    def _count(self) -> int:
+        return len(self.workspace.dat.sprites)
+
+    def _sprite_field(self, graphic_id: int, field: str) -> List[str]:
+        sprite = self.workspace.dat.sprites[graphic_id]
+        return [] if sprite is None else [getattr(sprite, field)]
 
     def set_valid_attributes(self, obj: Any, attributes: dict[str, Any]) -> None:
         """
@@ -105,7 +124,7 @@ class GraphicManager:
         if sprite is None:
             raise InvalidIdError(f"Graphic ID {graphic_id} is None (deleted/unused)")
         
-        return GraphicHandle(self.workspace, graphic_id)
+        return self._handles.get(graphic_id)
     
     def count(self) -> int:
         """Get total number of graphics (including None slots)."""
@@ -141,39 +160,52 @@ class GraphicManager:
             True if deleted, False if didn't exist
         """
         if self.exists(graphic_id):
+            journal_touch(self.workspace, "sprites", graphic_id)
             self.workspace.dat.sprites[graphic_id] = None
+            self.workspace.changes.mark("sprites", graphic_id)
             return True
         return False
     
-    def find_by_name(self, name: str) -> Optional[GraphicHandle]:
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[GraphicHandle]:
         """
         Find first graphic matching name.
         
         Args:
             name: Internal name to search for
+            case_sensitive: Set False to ignore case
             
         Returns:
             GraphicHandle if found, None otherwise
         """
-        for i, sprite in enumerate(self.workspace.dat.sprites):
-            if sprite is not None and sprite.name == name:
-                return GraphicHandle(self.workspace, i)
-        return None
+        graphic_id = self.names.find(name, case_sensitive)
+        return None if graphic_id is None else self._handles.get(graphic_id)
     
-    def find_by_file_name(self, file_name: str) -> Optional[GraphicHandle]:
+    def find_by_file_name(self, file_name: str, case_sensitive: bool = True) -> Optional[GraphicHandle]:
         """
         Find first graphic matching file name.
         
         Args:
             file_name: SLP/SMX file name to search for
+            case_sensitive: Set False to ignore case
             
         Returns:
             GraphicHandle if found, None otherwise
         """
-        for i, sprite in enumerate(self.workspace.dat.sprites):
-            if sprite is not None and sprite.file_name == file_name:
-                return GraphicHandle(self.workspace, i)
-        return None
+        graphic_id = self.file_names.find(file_name, case_sensitive)
+        return None if graphic_id is None else self._handles.get(graphic_id)
+
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[GraphicHandle]:
+        """
+        Find all graphics whose name starts with prefix.
+
+        Args:
+            prefix: Start of the internal name
+            case_sensitive: Set True to match case
+
+        Returns:
+            GraphicHandles in ID order
+        """
+        return [self._handles.get(i) for i in self.names.find_prefix(prefix, case_sensitive)]
     
     def add_graphic(
         self,
@@ -294,11 +326,13 @@ class GraphicManager:
         # Extend the sprites list if needed (append to end only)
         # Direct indexed assignment at existing indices is safe
         sprites = self.workspace.dat.sprites
+        journal_touch(self.workspace, "sprites", graphic_id)
         while len(sprites) <= graphic_id:
             sprites.append(None)
         
         # Direct assignment at index
         sprites[graphic_id] = new_sprite
+        self.workspace.changes.mark("sprites", graphic_id)
         
         # Register in workspace registry
         self.workspace.registry.register_graphic(
@@ -307,7 +341,7 @@ class GraphicManager:
             file_name=file_name
         )
         
-        return GraphicHandle(self.workspace, graphic_id)
+        return self._handles.get(graphic_id)
     
     def copy(self, source_id: int, target_id: Optional[int] = None) -> GraphicHandle:
         """
@@ -341,11 +375,13 @@ class GraphicManager:
         # Extend the sprites list if needed (append to end only)
         # Direct indexed assignment at existing indices is safe
         sprites = self.workspace.dat.sprites
+        journal_touch(self.workspace, "sprites", target_id)
         while len(sprites) <= target_id:
             sprites.append(None)
         
         # Direct assignment at index (this triggers bfp_rs copy for the element)
         sprites[target_id] = copied
+        self.workspace.changes.mark("sprites", target_id)
         
         # Register in workspace registry
         self.workspace.registry.register_graphic(
@@ -354,9 +390,13 @@ class GraphicManager:
             file_name=copied.file_name if hasattr(copied, 'file_name') else ""
         )
         
-        return GraphicHandle(self.workspace, target_id)
+        return self._handles.get(target_id)
     
     def _copy_sprite(self, source: Any) -> Any:
+        """Deep copy of a Sprite object."""
+        return deep_clone(source, fallback=self._copy_sprite_fields)
+
+    def _copy_sprite_fields(self, source: Any) -> Any:
         """
         Manual deep copy of a Sprite object (bypass pickle blocker).
         """
@@ -465,12 +505,14 @@ class GraphicManager:
         pasted.id = target_id
         
         # Ensure capacity
+        journal_touch(self.workspace, "sprites", target_id)
         while len(self.workspace.dat.sprites) <= target_id:
             self.workspace.dat.sprites.append(None)
         
         self.workspace.dat.sprites[target_id] = pasted
+        self.workspace.changes.mark("sprites", target_id)
         
-        return GraphicHandle(self.workspace, target_id)
+        return self._handles.get(target_id)
     
     def clear_clipboard(self) -> None:
         """Clear the internal clipboard."""
@@ -517,6 +559,7 @@ class GraphicManager:
         """
         return self.get(graphic_id).remove_delta(delta_id)
     
+    @journaled
     def remove_delta_by_graphic(self, graphic_id: int) -> int:
         """
         Remove all deltas that reference a specific graphic (from ALL graphics).
@@ -532,14 +575,15 @@ class GraphicManager:
             >>> gm.remove_delta_by_graphic(graphic_id=200)
         """
         total_removed = 0
-        for sprite in self.workspace.dat.sprites:
+        for sprite_id, sprite in enumerate(self.workspace.dat.sprites):
             if sprite is not None and len(sprite.deltas) > 0:
                 initial_count = len(sprite.deltas)
-                sprite.deltas = [
-                    d for d in sprite.deltas if d.sprite_id != graphic_id
-                ]
-                removed = initial_count - len(sprite.deltas)
+                kept = [d for d in sprite.deltas if d.sprite_id != graphic_id]
+                removed = initial_count - len(kept)
                 if removed > 0:
+                    journal_touch(self.workspace, "sprites", sprite_id)
+                    sprite.deltas = kept
                     sprite.num_deltas = len(sprite.deltas)
+                    self.workspace.changes.mark("sprites", sprite_id)
                     total_removed += removed
         return total_removed
@@ -1,11 +1,15 @@
 """Type stubs for GraphicManager - enables IDE autocomplete"""
-from typing import Optional, Any
+from typing import List, Optional, Any
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
 from aoe2_genie_tooling.Graphics.graphic_handle import GraphicHandle
 from aoe2_genie_tooling.Graphics.delta_handle import DeltaHandle
 
 class GraphicManager:
     """Manager for sprite/graphic operations."""
 
+    names: NameIndex
+    file_names: NameIndex
+
     def set_valid_attributes(self, obj: Any, attributes: dict[str, Any]) -> None:
         """Set attributes safely with version filtering."""
         ...
@@ -30,14 +34,18 @@ class GraphicManager:
         """Delete a graphic (sets slot to None)."""
         ...
     
-    def find_by_name(self, name: str) -> Optional[GraphicHandle]:
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[GraphicHandle]:
         """Find first graphic matching name."""
         ...
     
-    def find_by_file_name(self, file_name: str) -> Optional[GraphicHandle]:
+    def find_by_file_name(self, file_name: str, case_sensitive: bool = True) -> Optional[GraphicHandle]:
         """Find first graphic matching file name."""
         ...
     
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[GraphicHandle]:
+        """Find all graphics whose name starts with prefix, in ID order."""
+        ...
+
     def add_graphic(
         self,
         file_name: str,
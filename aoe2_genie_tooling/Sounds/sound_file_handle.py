@@ -85,7 +85,9 @@ class SoundFileHandle:
         if name.startswith('_'):
             object.__setattr__(self, name, value)
         else:
+            self._parent._before_write()
             setattr(self._file, name, value)
+            self._parent._changed()
 
     def __repr__(self) -> str:
         return f"SoundFileHandle(index={self._id}, filename='{getattr(self, 'filename', 'Unknown')}')"
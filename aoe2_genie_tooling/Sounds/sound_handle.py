@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
+from aoe2_genie_tooling.Base.core.tracked_handle import TrackedHandle
+
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Sounds.sound_file_handle import SoundFileHandle
@@ -14,12 +16,15 @@ if TYPE_CHECKING:
 __all__ = ["SoundHandle"]
 
 
-class SoundHandle:
+class SoundHandle(TrackedHandle):
     """
     Handle for a single sound.
     
     Provides direct attribute access to the underlying Sound object.
     """
+
+    _KIND = "sounds"
+    _STRUCT = "_sound"
     
     def __init__(self, workspace: GenieWorkspace, sound_id: int) -> None:
         """
@@ -66,7 +71,7 @@ class SoundHandle:
         if name.startswith('_'):
             object.__setattr__(self, name, value)
         else:
-            setattr(self._sound, name, value)
+            self._write_field(name, value)
     
     @property
     def sounds(self) -> list[SoundFileHandle]:
@@ -126,8 +131,10 @@ class SoundHandle:
         new_file.civilization_id = civilization_id
         new_file.icon_set = icon_set
         
+        self._before_write()
         self._sound.sound_files.append(new_file)
         self._sound.num_sound_files = len(self._sound.sound_files)
+        self._changed()
         
         return SoundFileHandle(self, len(self._sound.sound_files) - 1)
 
@@ -164,6 +171,7 @@ class SoundHandle:
             except Exception:
                 pass
         
+        self._before_write()
         if target_index is None:
             self._sound.sound_files.append(new_sf)
             target_index = len(self._sound.sound_files) - 1
@@ -173,6 +181,7 @@ class SoundHandle:
             self._sound.sound_files.insert(target_index, new_sf)
             
         self._sound.num_sound_files = len(self._sound.sound_files)
+        self._changed()
         from aoe2_genie_tooling.Sounds.sound_file_handle import SoundFileHandle
         return SoundFileHandle(self, target_index)
 
@@ -196,15 +205,19 @@ class SoundHandle:
         if source_index == target_index:
             return True
             
+        self._before_write()
         obj = self._sound.sound_files.pop(source_index)
         self._sound.sound_files.insert(target_index, obj)
+        self._changed()
         return True
 
     def remove_file(self, index: int) -> bool:
         """Remove a sound file by index."""
         if 0 <= index < len(self._sound.sound_files):
+            self._before_write()
             del self._sound.sound_files[index]
             self._sound.num_sound_files = len(self._sound.sound_files)
+            self._changed()
             return True
         return False
 
@@ -215,8 +228,12 @@ class SoundHandle:
 
     def clear_files(self) -> None:
         """Remove all sound file entries."""
+        if not self._sound.sound_files and self._sound.num_sound_files == 0:
+            return
+        self._before_write()
         self._sound.sound_files = []
         self._sound.num_sound_files = 0
+        self._changed()
 
     def exists(self) -> bool:
         """Check if this sound entry exists and is not None."""
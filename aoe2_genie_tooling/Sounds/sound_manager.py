@@ -8,11 +8,15 @@ Responsibilities:
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Any, Union
+from typing import TYPE_CHECKING, List, Optional, Any, Union
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
 
+from aoe2_genie_tooling.Base.core.handle_cache import HandleCache
+from aoe2_genie_tooling.Base.core.journal import journal_touch
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.struct_cloner import deep_clone
 from aoe2_genie_tooling.Sounds.sound_handle import SoundHandle
 
 __all__ = ["SoundManager"]
@@ -33,6 +37,37 @@ class SoundManager:
             workspace: The GenieWorkspace instance
         """
         self.workspace = workspace
+        # Lazily built lookups for find_by_name/find_by_file_name/find_by_prefix
+        self.names = NameIndex("sounds", self._count, self._sound_name)
+        self.file_names = NameIndex("sounds", self._count, self._sound_file_names)
+        workspace.changes.subscribe(self.names.on_change)
+        workspace.changes.subscribe(self.file_names.on_change)
+        # Handles returned by get(), reused until a change is reported for their ID
+        self._handles = HandleCache("sounds", lambda sound_id: SoundHandle(self.workspace, sound_id))
+        workspace.changes.subscribe(self._handles.on_change)
+
+    def _count(self) -> int:
+        return len(self.workspace.dat.sounds)
+
+    def _sound_name(self, sound_id: int) -> List[str]:
+        sound = self.workspace.dat.sounds[sound_id]
+        return [] if sound is None else [str(sound.id)]
+
+    def _sound_file_names(self, sound_id: int) -> List[str]:
+        sound = self.workspace.dat.sounds[sound_id]
+        if sound is None:
+            return []
+        names = []
+        for sf in sound.sound_files:
+            # Version-safe filename check
+            try:
+                names.append(sf.filename)
+            except Exception:
+                try:
+                    names.append(sf.sound_name)
+                except Exception:
+                    pass
+        return names
     
     def get(self, sound_id: int) -> SoundHandle:
         """
@@ -54,7 +89,7 @@ class SoundManager:
                 f"Sound ID {sound_id} out of range (0-{len(self.workspace.dat.sounds)-1})"
             )
         
-        return SoundHandle(self.workspace, sound_id)
+        return self._handles.get(sound_id)
     
     def count(self) -> int:
         """Get total number of sounds (including None)."""
@@ -85,7 +120,9 @@ class SoundManager:
         """
         if self.exists(sound_id):
             template = self.workspace.dat.sounds[sound_id]
+            journal_touch(self.workspace, "sounds", sound_id)
             self.workspace.dat.sounds[sound_id] = self._create_blank_sound(template.ver, sound_id)
+            self.workspace.changes.mark("sounds", sound_id)
             return True
         return False
 
@@ -93,32 +130,22 @@ class SoundManager:
         """
         Find first sound matching name (the 'id' property inside the sound object).
         """
-        name_str = str(name)
-        for i, sound in enumerate(self.workspace.dat.sounds):
-            if str(sound.id) == name_str:
-                return SoundHandle(self.workspace, i)
-        return None
+        sound_id = self.names.find(str(name))
+        return None if sound_id is None else self._handles.get(sound_id)
 
-    def find_by_file_name(self, file_name: str) -> Optional[SoundHandle]:
+    def find_by_file_name(self, file_name: str, case_sensitive: bool = False) -> Optional[SoundHandle]:
         """
         Find first sound that contains a sound file with matching filename.
+        Case is ignored unless case_sensitive is True.
         """
-        fn_lower = file_name.lower()
-        for i, sound in enumerate(self.workspace.dat.sounds):
-            for sf in sound.sound_files:
-                # Version-safe filename check
-                current_fn = ""
-                try:
-                    current_fn = sf.filename
-                except Exception:
-                    try:
-                        current_fn = sf.sound_name
-                    except Exception:
-                        pass
-                
-                if current_fn.lower() == fn_lower:
-                    return SoundHandle(self.workspace, i)
-        return None
+        sound_id = self.file_names.find(file_name, case_sensitive)
+        return None if sound_id is None else self._handles.get(sound_id)
+
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[SoundHandle]:
+        """
+        Find all sounds with a sound file whose filename starts with prefix, in ID order.
+        """
+        return [self._handles.get(i) for i in self.file_names.find_prefix(prefix, case_sensitive)]
 
     def _create_blank_sound(self, ver: Any, sound_id: int) -> Any:
         """Create a blank Sound object."""
@@ -175,12 +202,14 @@ class SoundManager:
         new_sound.sound_files = []
         
         # Ensure capacity by filling with blank sounds
+        journal_touch(self.workspace, "sounds", target_idx)
         while len(self.workspace.dat.sounds) <= target_idx:
             idx = len(self.workspace.dat.sounds)
             self.workspace.dat.sounds.append(self._create_blank_sound(template_ver, idx))
             
         self.workspace.dat.sounds[target_idx] = new_sound
-        return SoundHandle(self.workspace, target_idx)
+        self.workspace.changes.mark("sounds", target_idx)
+        return self._handles.get(target_idx)
 
     # Alias for add_new
     add_sound = add_new
@@ -208,36 +237,18 @@ class SoundManager:
         
         new_obj.id = target_id
         
+        journal_touch(self.workspace, "sounds", target_id)
         while len(self.workspace.dat.sounds) <= target_id:
             idx = len(self.workspace.dat.sounds)
             self.workspace.dat.sounds.append(self._create_blank_sound(source.ver, idx))
             
         self.workspace.dat.sounds[target_id] = new_obj
-        return SoundHandle(self.workspace, target_id)
+        self.workspace.changes.mark("sounds", target_id)
+        return self._handles.get(target_id)
 
     def _copy_sound(self, source: Any) -> Any:
-        """Manual copy of Sound object."""
-        from sections.sounds.sound import Sound
-        new_sound = Sound(ver=source.ver)
-        attrs = ['id', 'play_delay', 'cache_time', 'total_probability']
-        for attr in attrs:
-            setattr(new_sound, attr, getattr(source, attr))
-        
-        new_sound.num_sound_files = source.num_sound_files
-        new_sound.sound_files = [self._copy_sound_file(sf) for sf in source.sound_files]
-        return new_sound
-
-    def _copy_sound_file(self, source: Any) -> Any:
-        """Manual copy of SoundFile object."""
-        from sections.sounds.sound_file import SoundFile
-        new_sf = SoundFile(ver=source.ver)
-        attrs = ['resource_id', 'probability', 'civilization_id', 'icon_set', 'sound_name', 'filename']
-        for attr in attrs:
-            try:
-                setattr(new_sf, attr, getattr(source, attr))
-            except Exception:
-                pass # Not supported in this version
-        return new_sf
+        """Deep copy of a Sound object."""
+        return deep_clone(source)
 
     # Clipboard Implementation
     _clipboard: Optional[Any] = None
@@ -260,12 +271,14 @@ class SoundManager:
         
         pasted.id = target_id
         
+        journal_touch(self.workspace, "sounds", target_id)
         while len(self.workspace.dat.sounds) <= target_id:
             idx = len(self.workspace.dat.sounds)
             self.workspace.dat.sounds.append(self._create_blank_sound(pasted.ver, idx))
             
         self.workspace.dat.sounds[target_id] = pasted
-        return SoundHandle(self.workspace, target_id)
+        self.workspace.changes.mark("sounds", target_id)
+        return self._handles.get(target_id)
 
     def clear_clipboard(self) -> None:
         """Clear clipboard."""
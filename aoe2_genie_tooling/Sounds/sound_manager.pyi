@@ -1,9 +1,13 @@
 """Type stubs for SoundManager - enables IDE autocomplete"""
-from typing import Optional, Any, Union
+from typing import List, Optional, Any, Union
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
 from aoe2_genie_tooling.Sounds.sound_handle import SoundHandle
 
 class SoundManager:
     """Manager for sound operations."""
+
+    names: NameIndex
+    file_names: NameIndex
     
     def get(self, sound_id: int) -> SoundHandle:
         """Get a sound by ID."""
@@ -29,10 +33,14 @@ class SoundManager:
         """Find a sound by its internal ID property."""
         ...
 
-    def find_by_file_name(self, file_name: str) -> Optional[SoundHandle]:
+    def find_by_file_name(self, file_name: str, case_sensitive: bool = False) -> Optional[SoundHandle]:
         """Find first sound that contains a sound file with matching filename."""
         ...
 
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[SoundHandle]:
+        """Find all sounds with a filename starting with prefix, in ID order."""
+        ...
+
     def add_new(
         self,
         sound_id: Optional[int] = None,
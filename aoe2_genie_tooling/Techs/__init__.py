@@ -2,5 +2,6 @@
 
 from aoe2_genie_tooling.Techs.tech_manager import TechManager
 from aoe2_genie_tooling.Techs.tech_handle import TechHandle
+from aoe2_genie_tooling.Techs.research_location_handle import ResearchLocationHandle
 
-__all__ = ["TechManager", "TechHandle"]
+__all__ = ["TechManager", "TechHandle", "ResearchLocationHandle"]
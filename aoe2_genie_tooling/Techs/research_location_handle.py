@@ -0,0 +1,96 @@
+"""
+ResearchLocationHandle - Wrapper for individual ResearchLocation objects.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aoe2_genie_tooling.Base.core.tracked_handle import same_value
+
+if TYPE_CHECKING:
+    from aoe2_genie_tooling.Techs.tech_handle import TechHandle
+
+__all__ = ["ResearchLocationHandle"]
+
+
+class ResearchLocationHandle:
+    """
+    Handle for a single research location of a tech (DE v8.8+).
+
+    Writes are reported through the owning TechHandle.
+    """
+
+    def __init__(self, parent_handle: TechHandle, location_id: int) -> None:
+        """
+        Initialize ResearchLocationHandle.
+
+        Args:
+            parent_handle: The TechHandle owning this location
+            location_id: Index in the research_locations list
+        """
+        object.__setattr__(self, '_parent', parent_handle)
+        object.__setattr__(self, '_id', location_id)
+        object.__setattr__(self, '_loc', parent_handle._tech.research_locations[location_id])
+
+    @property
+    def index(self) -> int:
+        """Get the index of this location in the tech's list."""
+        return self._id
+
+    @property
+    def location_unit_id(self) -> int:
+        """Building unit ID where the tech can be researched."""
+        return self._loc.location_unit_id
+
+    @location_unit_id.setter
+    def location_unit_id(self, value: int) -> None:
+        self._set('location_unit_id', value)
+
+    @property
+    def research_time(self) -> int:
+        """Time to research at this location."""
+        return self._loc.research_time
+
+    @research_time.setter
+    def research_time(self, value: int) -> None:
+        self._set('research_time', value)
+
+    @property
+    def button_id(self) -> int:
+        """UI button position."""
+        return self._loc.button_id
+
+    @button_id.setter
+    def button_id(self, value: int) -> None:
+        self._set('button_id', value)
+
+    @property
+    def hotkey_str_id(self) -> int:
+        """Hotkey string ID."""
+        return self._loc.hotkey_str_id
+
+    @hotkey_str_id.setter
+    def hotkey_str_id(self, value: int) -> None:
+        self._set('hotkey_str_id', value)
+
+    def _set(self, name: str, value: Any) -> None:
+        if same_value(getattr(self._loc, name), value):
+            return
+        self._parent._before_write()
+        setattr(self._loc, name, value)
+        self._parent._changed()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loc, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            self._set(name, value)
+
+    def __repr__(self) -> str:
+        return (
+            f"ResearchLocationHandle(index={self._id}, location_unit_id={self.location_unit_id}, "
+            f"research_time={self.research_time})"
+        )
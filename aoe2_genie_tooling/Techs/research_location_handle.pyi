@@ -0,0 +1,45 @@
+"""Type stubs for ResearchLocationHandle - enables IDE autocomplete"""
+
+class ResearchLocationHandle:
+    """Handle for a single research location of a tech (DE v8.8+)."""
+
+    @property
+    def index(self) -> int:
+        """Get the index of this location in the tech's list."""
+        ...
+
+    @property
+    def location_unit_id(self) -> int:
+        """Building unit ID where the tech can be researched."""
+        ...
+
+    @location_unit_id.setter
+    def location_unit_id(self, value: int) -> None:
+        ...
+
+    @property
+    def research_time(self) -> int:
+        """Time to research at this location."""
+        ...
+
+    @research_time.setter
+    def research_time(self, value: int) -> None:
+        ...
+
+    @property
+    def button_id(self) -> int:
+        """UI button position."""
+        ...
+
+    @button_id.setter
+    def button_id(self, value: int) -> None:
+        ...
+
+    @property
+    def hotkey_str_id(self) -> int:
+        """Hotkey string ID."""
+        ...
+
+    @hotkey_str_id.setter
+    def hotkey_str_id(self, value: int) -> None:
+        ...
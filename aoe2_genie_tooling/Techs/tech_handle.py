@@ -7,6 +7,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
+from aoe2_genie_tooling.Base.core.tracked_handle import TrackedHandle
+from aoe2_genie_tooling.Techs.research_location_handle import ResearchLocationHandle
+
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
 
@@ -39,18 +42,23 @@ class CostBuilder:
         self._set(2, resource_type, amount, deduct)
     
     def _set(self, slot: int, resource_type: int, amount: int, deduct: bool) -> None:
+        self._tech_handle._before_write()
         costs = self._tech_handle._tech.costs
         costs[slot].resource_id = resource_type
         costs[slot].quantity = amount
         costs[slot].deduct_flag = 1 if deduct else 0
+        self._tech_handle._changed()
 
 
-class TechHandle:
+class TechHandle(TrackedHandle):
     """
     Handle for a single tech.
     
     Provides direct attribute access to the underlying Tech object.
     """
+
+    _KIND = "techs"
+    _STRUCT = "_tech"
     
     def __init__(self, workspace: GenieWorkspace, tech_id: int) -> None:
         """Initialize TechHandle."""
@@ -150,9 +158,14 @@ class TechHandle:
         """
         if not (0 <= slot <= 2):
             raise ValueError(f"slot must be 0-2, got {slot}")
-        self._tech.costs[slot].resource_id = 0
-        self._tech.costs[slot].quantity = 0
-        self._tech.costs[slot].deduct_flag = 0
+        cost = self._tech.costs[slot]
+        if (cost.resource_id, cost.quantity, cost.deduct_flag) == (0, 0, 0):
+            return
+        self._before_write()
+        cost.resource_id = 0
+        cost.quantity = 0
+        cost.deduct_flag = 0
+        self._changed()
 
     def clear_all_costs(self) -> None:
         """Clear all cost slots."""
@@ -193,12 +206,20 @@ class TechHandle:
         max_slot = len(self._tech.required_tech_ids) - 1
         if not (0 <= slot <= max_slot):
             raise ValueError(f"slot must be 0-{max_slot}, got {slot}")
+        if self._tech.required_tech_ids[slot] == tech_id:
+            return
+        self._before_write()
         self._tech.required_tech_ids[slot] = tech_id
+        self._changed()
 
     def clear_required_techs(self) -> None:
         """Clear all required tech slots (set to -1)."""
+        if all(tech_id == -1 for tech_id in self._tech.required_tech_ids):
+            return
+        self._before_write()
         for i in range(len(self._tech.required_tech_ids)):
             self._tech.required_tech_ids[i] = -1
+        self._changed()
 
     @property
     def icon_id(self) -> int:
@@ -368,7 +389,7 @@ class TechHandle:
         except Exception:
             return []
 
-    def get_research_location(self, location_id: int) -> Optional[Any]:
+    def get_research_location(self, location_id: int) -> Optional[ResearchLocationHandle]:
         """
         Get a specific research location by index.
         
@@ -376,11 +397,11 @@ class TechHandle:
             location_id: Index of the research location (0-based)
             
         Returns:
-            ResearchLocation object or None if not found
+            ResearchLocationHandle or None if not found
         """
         try:
             if 0 <= location_id < len(self._tech.research_locations):
-                return self._tech.research_locations[location_id]
+                return ResearchLocationHandle(self, location_id)
         except Exception:
             pass
         return None
@@ -391,7 +412,7 @@ class TechHandle:
         research_time: int = 0,
         button_id: int = 0,
         hotkey_str_id: int = -1,
-    ) -> Optional[Any]:
+    ) -> Optional[ResearchLocationHandle]:
         """
         Add a new research location.
         
@@ -402,7 +423,7 @@ class TechHandle:
             hotkey_str_id: Hotkey string ID
             
         Returns:
-            The new ResearchLocation object, or None if failed
+            Handle of the new research location, or None if failed
         """
         try:
             from sections.tech.tech import ResearchLocation
@@ -413,10 +434,13 @@ class TechHandle:
             new_loc.button_id = button_id
             new_loc.hotkey_str_id = hotkey_str_id
             
-            self._tech.research_locations.append(new_loc)
-            return new_loc
+            locations = self._tech.research_locations
+            self._before_write()
+            locations.append(new_loc)
         except Exception:
             return None
+        self._changed()
+        return ResearchLocationHandle(self, len(locations) - 1)
 
     def remove_research_location(self, location_id: int) -> bool:
         """
@@ -429,14 +453,18 @@ class TechHandle:
             True if removed, False if failed or out of range
         """
         try:
-            if 0 <= location_id < len(self._tech.research_locations):
-                del self._tech.research_locations[location_id]
-                return True
+            if not (0 <= location_id < len(self._tech.research_locations)):
+                return False
+            self._before_write()
+            del self._tech.research_locations[location_id]
         except Exception:
-            pass
-        return False
+            return False
+        self._changed()
+        return True
 
-    def copy_research_location(self, location_id: int, target_index: Optional[int] = None) -> Optional[Any]:
+    def copy_research_location(
+        self, location_id: int, target_index: Optional[int] = None
+    ) -> Optional[ResearchLocationHandle]:
         """
         Copy a research location.
         
@@ -445,7 +473,7 @@ class TechHandle:
             target_index: Destination index. If None, appends to end.
             
         Returns:
-            The new ResearchLocation object, or None if failed
+            Handle of the new research location, or None if failed
         """
         try:
             if not (0 <= location_id < len(self._tech.research_locations)):
@@ -460,15 +488,17 @@ class TechHandle:
             new_loc.button_id = source.button_id
             new_loc.hotkey_str_id = source.hotkey_str_id
             
+            self._before_write()
             if target_index is None:
+                target_index = len(self._tech.research_locations)
                 self._tech.research_locations.append(new_loc)
             else:
                 target_index = max(0, min(target_index, len(self._tech.research_locations)))
                 self._tech.research_locations.insert(target_index, new_loc)
-                
-            return new_loc
         except Exception:
             return None
+        self._changed()
+        return ResearchLocationHandle(self, target_index)
 
     def move_research_location(self, source_index: int, target_index: int) -> bool:
         """
@@ -490,18 +520,24 @@ class TechHandle:
             if source_index == target_index:
                 return True
                 
+            self._before_write()
             obj = self._tech.research_locations.pop(source_index)
             self._tech.research_locations.insert(target_index, obj)
-            return True
         except Exception:
             return False
+        self._changed()
+        return True
 
     def clear_research_locations(self) -> None:
         """Remove all research locations."""
         try:
+            if not self._tech.research_locations:
+                return
+            self._before_write()
             self._tech.research_locations = []
         except Exception:
-            pass
+            return
+        self._changed()
 
     def exists(self) -> bool:
         """Check if this tech entry exists."""
@@ -516,7 +552,7 @@ class TechHandle:
         if name.startswith('_'):
             object.__setattr__(self, name, value)
         else:
-            setattr(self._tech, name, value)
+            self._write_field(name, value)
     
     def __repr__(self) -> str:
         if not self.exists():
@@ -1,6 +1,8 @@
 """Type stubs for TechHandle - enables IDE autocomplete"""
 from typing import Any, Optional, Tuple
 
+from aoe2_genie_tooling.Techs.research_location_handle import ResearchLocationHandle
+
 
 class CostBuilder:
     """Builder for setting tech costs."""
@@ -256,7 +258,7 @@ class TechHandle:
         """Get research locations list (DE v8.8+ only)."""
         ...
 
-    def get_research_location(self, location_id: int) -> Optional[Any]:
+    def get_research_location(self, location_id: int) -> Optional[ResearchLocationHandle]:
         """
         Get a specific research location by index.
         
@@ -264,7 +266,7 @@ class TechHandle:
             location_id: Index of the research location (0-based)
             
         Returns:
-            ResearchLocation object or None if not found
+            ResearchLocationHandle or None if not found
         """
         ...
 
@@ -274,7 +276,7 @@ class TechHandle:
         research_time: int = 0,
         button_id: int = 0,
         hotkey_str_id: int = -1,
-    ) -> Optional[Any]:
+    ) -> Optional[ResearchLocationHandle]:
         """
         Add a new research location.
         
@@ -285,7 +287,7 @@ class TechHandle:
             hotkey_str_id: Hotkey string ID
             
         Returns:
-            The new ResearchLocation object, or None if failed
+            Handle of the new research location, or None if failed
         """
         ...
 
@@ -301,7 +303,9 @@ class TechHandle:
         """
         ...
 
-    def copy_research_location(self, location_id: int, target_index: Optional[int] = None) -> Optional[Any]:
+    def copy_research_location(
+        self, location_id: int, target_index: Optional[int] = None
+    ) -> Optional[ResearchLocationHandle]:
         """
         Copy a research location.
         
@@ -310,7 +314,7 @@ class TechHandle:
             target_index: Destination index. If None, appends to end.
             
         Returns:
-            The new ResearchLocation object, or None if failed
+            Handle of the new research location, or None if failed
         """
         ...
 
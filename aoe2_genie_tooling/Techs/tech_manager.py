@@ -6,12 +6,16 @@ Each Tech has properties like name, effect_id, costs, etc.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, List, Optional, Any
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Techs.tech_handle import TechHandle
 
+from aoe2_genie_tooling.Base.core.handle_cache import HandleCache
+from aoe2_genie_tooling.Base.core.journal import journal_touch
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.struct_cloner import deep_clone
 from aoe2_genie_tooling.Techs.tech_handle import TechHandle
 
 __all__ = ["TechManager"]
@@ -27,6 +31,16 @@ class TechManager:
     def __init__(self, workspace: GenieWorkspace) -> None:
         """Initialize TechManager with workspace reference."""
         self.workspace = workspace
+        # Lazily built lookup for find_by_name/find_by_prefix
+        self.names = NameIndex("techs", lambda: len(self.workspace.dat.techs), self._tech_name)
+        workspace.changes.subscribe(self.names.on_change)
+        # Handles returned by get(), reused until a change is reported for their ID
+        self._handles = HandleCache("techs", lambda tech_id: TechHandle(self.workspace, tech_id))
+        workspace.changes.subscribe(self._handles.on_change)
+
+    def _tech_name(self, tech_id: int) -> List[str]:
+        tech = self.workspace.dat.techs[tech_id]
+        return [] if tech is None else [tech.name]
     
     def get(self, tech_id: int) -> TechHandle:
         """
@@ -48,7 +62,7 @@ class TechManager:
                 f"Tech ID {tech_id} out of range (0-{len(self.workspace.dat.techs)-1})"
             )
         
-        return TechHandle(self.workspace, tech_id)
+        return self._handles.get(tech_id)
     
     def count(self) -> int:
         """Get total number of tech slots."""
@@ -87,22 +101,20 @@ class TechManager:
         """
         if self.exists(tech_id):
             template = self.workspace.dat.techs[tech_id]
+            journal_touch(self.workspace, "techs", tech_id)
             self.workspace.dat.techs[tech_id] = self._create_blank_tech(template.ver)
+            self.workspace.changes.mark("techs", tech_id)
             return True
         return False
 
-    def find_by_name(self, name: str) -> Optional[TechHandle]:
-        """Find first tech matching name."""
-        for i, tech in enumerate(self.workspace.dat.techs):
-            if tech is not None:
-                tech_name = ""
-                try:
-                    tech_name = tech.name
-                except Exception:
-                    pass
-                if tech_name == name:
-                    return TechHandle(self.workspace, i)
-        return None
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[TechHandle]:
+        """Find first tech matching name (set case_sensitive=False to ignore case)."""
+        tech_id = self.names.find(name, case_sensitive)
+        return None if tech_id is None else self._handles.get(tech_id)
+
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[TechHandle]:
+        """Find all techs whose name starts with prefix, in ID order."""
+        return [self._handles.get(i) for i in self.names.find_prefix(prefix, case_sensitive)]
 
     def add_new(
         self,
@@ -145,11 +157,13 @@ class TechManager:
         new_tech.effect_id = effect_id
         
         # Ensure capacity by filling with blank techs
+        journal_touch(self.workspace, "techs", target_idx)
         while len(self.workspace.dat.techs) <= target_idx:
             self.workspace.dat.techs.append(self._create_blank_tech(template_ver))
             
         self.workspace.dat.techs[target_idx] = new_tech
-        return TechHandle(self.workspace, target_idx)
+        self.workspace.changes.mark("techs", target_idx)
+        return self._handles.get(target_idx)
 
     # Alias
     create = add_new
@@ -175,55 +189,17 @@ class TechManager:
         if target_id is None:
             target_id = len(self.workspace.dat.techs)
         
+        journal_touch(self.workspace, "techs", target_id)
         while len(self.workspace.dat.techs) <= target_id:
             self.workspace.dat.techs.append(self._create_blank_tech(source.ver))
             
         self.workspace.dat.techs[target_id] = new_obj
-        return TechHandle(self.workspace, target_id)
+        self.workspace.changes.mark("techs", target_id)
+        return self._handles.get(target_id)
 
     def _copy_tech(self, source: Any) -> Any:
-        """Manual copy of Tech object."""
-        from sections.tech.tech import Tech
-        new_tech = Tech(ver=source.ver)
-        
-        # Copy simple attrs
-        simple_attrs = [
-            'name', 'min_required_techs', 'civilization_id', 'full_tech_tree_mode',
-            'location_unit_id', 'research_time', 'effect_id', 'type', 'icon_id',
-            'button_id', 'help_str_id', 'tech_tree_str_id', 'hotkey_str_id',
-            'name_str_id', 'description_str_id', 'repeatable'
-        ]
-        for attr in simple_attrs:
-            try:
-                setattr(new_tech, attr, getattr(source, attr))
-            except Exception:
-                pass
-        
-        # Copy lists
-        try:
-            new_tech.required_tech_ids = list(source.required_tech_ids)
-        except Exception:
-            pass
-            
-        # Copy costs
-        try:
-            new_tech.costs = [self._copy_cost(c) for c in source.costs]
-        except Exception:
-            pass
-            
-        return new_tech
-
-    def _copy_cost(self, source: Any) -> Any:
-        """Manual copy of TechCost object."""
-        from sections.tech.tech_cost import TechCost
-        new_cost = TechCost(ver=source.ver)
-        attrs = ['resource_id', 'quantity', 'deduct_flag']
-        for attr in attrs:
-            try:
-                setattr(new_cost, attr, getattr(source, attr))
-            except Exception:
-                pass
-        return new_cost
+        """Deep copy of a Tech object."""
+        return deep_clone(source)
 
     # Clipboard Implementation
     _clipboard: Optional[Any] = None
@@ -244,11 +220,13 @@ class TechManager:
         if target_id is None:
             target_id = len(self.workspace.dat.techs)
         
+        journal_touch(self.workspace, "techs", target_id)
         while len(self.workspace.dat.techs) <= target_id:
             self.workspace.dat.techs.append(self._create_blank_tech(pasted.ver))
             
         self.workspace.dat.techs[target_id] = pasted
-        return TechHandle(self.workspace, target_id)
+        self.workspace.changes.mark("techs", target_id)
+        return self._handles.get(target_id)
 
     def clear_clipboard(self) -> None:
         """Clear clipboard."""
@@ -1,9 +1,12 @@
 """Type stubs for TechManager - enables IDE autocomplete"""
-from typing import Optional, Any
+from typing import List, Optional, Any
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
 from aoe2_genie_tooling.Techs.tech_handle import TechHandle
 
 class TechManager:
     """Manager for tech operations."""
+
+    names: NameIndex
     
     def get(self, tech_id: int) -> TechHandle:
         """Get a tech by ID."""
@@ -25,10 +28,14 @@ class TechManager:
         """Reset a tech to blank values."""
         ...
 
-    def find_by_name(self, name: str) -> Optional[TechHandle]:
+    def find_by_name(self, name: str, case_sensitive: bool = True) -> Optional[TechHandle]:
         """Find first tech matching name."""
         ...
 
+    def find_by_prefix(self, prefix: str, case_sensitive: bool = False) -> List[TechHandle]:
+        """Find all techs whose name starts with prefix, in ID order."""
+        ...
+
     def add_new(
         self,
         name: str = "",
@@ -3,11 +3,17 @@ Units module - Unit editing functionality.
 
 Provides:
 - UnitManager: Create, clone, move, and query units
+- UnitSpec: Description of one unit for UnitManager.create_many()
+- UnitSharing: Copy-on-write bookkeeping for units shared between civs
+- UnitColumns: Unit fields as NumPy arrays, from UnitManager.to_columns()
 - UnitHandle: High-level wrapper for Genie Unit objects with multi-civ support
 - TaskBuilder: Fluent API for adding typed tasks
 - Handles: TaskHandle, AttackHandle, ArmourHandle, DamageGraphicHandle, TrainLocationHandle, DropSiteHandle
 """
 from .unit_manager import UnitManager
+from .unit_spec import UnitSpec
+from .unit_sharing import UnitSharing
+from .unit_columns import UnitColumns
 from .unit_handle import UnitHandle
 from .task_builder import TaskBuilder
 from .handles import (
@@ -21,6 +27,9 @@ from .handles import (
 
 __all__ = [
     "UnitManager",
+    "UnitSpec",
+    "UnitSharing",
+    "UnitColumns",
     "UnitHandle",
     "TaskBuilder",
     "TaskHandle",
@@ -13,7 +13,7 @@ Provides index-aware wrappers:
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 if TYPE_CHECKING:
     from sections.unit_data.unit_task import UnitTask
@@ -47,18 +47,28 @@ class TaskHandle:
         All Task properties are accessible directly.
     """
 
-    __slots__ = ("_tasks", "_task_id")
+    __slots__ = ("_tasks", "_task_id", "_on_change", "_before_change")
 
-    def __init__(self, tasks: List["UnitTask"], task_id: int) -> None:
+    def __init__(
+        self,
+        tasks: List["UnitTask"],
+        task_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with a list of tasks (one per civ).
         
         Args:
             tasks: List of UnitTask objects, one per civilization.
             task_id: Index of this task in the task list.
+            on_change: Called after every attribute write.
+            before_change: Called before every attribute write.
         """
         object.__setattr__(self, "_tasks", tasks if isinstance(tasks, list) else [tasks])
         object.__setattr__(self, "_task_id", task_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     @property
     def _task(self) -> "UnitTask":
@@ -438,6 +448,8 @@ class TaskHandle:
         raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self.__slots__ and self._before_change is not None:
+            self._before_change()
         if name in self.__slots__:
             object.__setattr__(self, name, value)
         # Check if this class has a property descriptor for the name
@@ -453,6 +465,8 @@ class TaskHandle:
                 setattr(t, name, value)
         else:
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
+        if name not in self.__slots__ and self._on_change is not None:
+            self._on_change()
 
 
 class AttackHandle:
@@ -460,11 +474,26 @@ class AttackHandle:
     Wrapper for a DamageClass (attack) with its index.
     """
 
-    __slots__ = ("_attack", "_attack_id")
+    __slots__ = ("_attack", "_attack_id", "_on_change", "_before_change")
 
-    def __init__(self, attack: "DamageClass", attack_id: int) -> None:
+    def __init__(
+        self,
+        attack: "DamageClass",
+        attack_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_attack", attack)
         object.__setattr__(self, "_attack_id", attack_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         cls = getattr(self._attack, 'id', -1)
@@ -509,11 +538,26 @@ class ArmourHandle:
     Wrapper for a DamageClass (armour) with its index.
     """
 
-    __slots__ = ("_armour", "_armour_id")
+    __slots__ = ("_armour", "_armour_id", "_on_change", "_before_change")
 
-    def __init__(self, armour: "DamageClass", armour_id: int) -> None:
+    def __init__(
+        self,
+        armour: "DamageClass",
+        armour_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_armour", armour)
         object.__setattr__(self, "_armour_id", armour_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         cls = getattr(self._armour, 'id', -1)
@@ -558,11 +602,26 @@ class DamageGraphicHandle:
     Wrapper for a UnitDamageSprite with its index.
     """
 
-    __slots__ = ("_damage_graphic", "_damage_graphic_id")
+    __slots__ = ("_damage_graphic", "_damage_graphic_id", "_on_change", "_before_change")
 
-    def __init__(self, damage_graphic: "UnitDamageSprite", damage_graphic_id: int) -> None:
+    def __init__(
+        self,
+        damage_graphic: "UnitDamageSprite",
+        damage_graphic_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_damage_graphic", damage_graphic)
         object.__setattr__(self, "_damage_graphic_id", damage_graphic_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         gfx_id = getattr(self._damage_graphic, 'sprite_id', -1)
@@ -615,11 +674,26 @@ class TrainLocationHandle:
     Wrapper for a TrainLocation with its index.
     """
 
-    __slots__ = ("_train_location", "_train_location_id")
+    __slots__ = ("_train_location", "_train_location_id", "_on_change", "_before_change")
 
-    def __init__(self, train_location: "TrainLocation", train_location_id: int) -> None:
+    def __init__(
+        self,
+        train_location: "TrainLocation",
+        train_location_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_train_location", train_location)
         object.__setattr__(self, "_train_location_id", train_location_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         uid = getattr(self._train_location, 'unit_id', -1)
@@ -672,11 +746,26 @@ class DropSiteHandle:
     Wrapper for a drop site (just an int) with its index.
     """
 
-    __slots__ = ("_drop_sites_list", "_drop_site_id")
+    __slots__ = ("_drop_sites_list", "_drop_site_id", "_on_change", "_before_change")
 
-    def __init__(self, drop_sites_list: list, drop_site_id: int) -> None:
+    def __init__(
+        self,
+        drop_sites_list: list,
+        drop_site_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_drop_sites_list", drop_sites_list)
         object.__setattr__(self, "_drop_site_id", drop_site_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         return f"DropSiteHandle(id={self._drop_site_id}, unit_id={self.unit_id})"
@@ -704,11 +793,26 @@ class BuildingAnnexHandle:
     Wrapper for a BuildingAnnex with its index.
     """
 
-    __slots__ = ("_annex", "_annex_id")
+    __slots__ = ("_annex", "_annex_id", "_on_change", "_before_change")
 
-    def __init__(self, annex: Any, annex_id: int) -> None:
+    def __init__(
+        self,
+        annex: Any,
+        annex_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_annex", annex)
         object.__setattr__(self, "_annex_id", annex_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         uid = getattr(self._annex, 'unit_id', -1)
@@ -770,11 +874,26 @@ class CostHandle:
     Wrapper for a UnitCost with its index.
     """
 
-    __slots__ = ("_cost", "_cost_id")
+    __slots__ = ("_cost", "_cost_id", "_on_change", "_before_change")
 
-    def __init__(self, cost: Any, cost_id: int) -> None:
+    def __init__(
+        self,
+        cost: Any,
+        cost_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_cost", cost)
         object.__setattr__(self, "_cost_id", cost_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         rid = getattr(self._cost, 'resource_id', -1)
@@ -815,11 +934,26 @@ class ResourceHandle:
     Wrapper for a UnitResource with its index.
     """
 
-    __slots__ = ("_resource", "_resource_id")
+    __slots__ = ("_resource", "_resource_id", "_on_change", "_before_change")
 
-    def __init__(self, resource: Any, resource_id: int) -> None:
+    def __init__(
+        self,
+        resource: Any,
+        resource_id: int,
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_resource", resource)
         object.__setattr__(self, "_resource_id", resource_id)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def __repr__(self) -> str:
         rtype = getattr(self._resource, 'type', -1)
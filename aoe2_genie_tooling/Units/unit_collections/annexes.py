@@ -5,9 +5,10 @@ Manages the `building_info.building_annex` collection (fixed size of 4).
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import BuildingAnnexHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -21,10 +22,17 @@ class AnnexesManager:
     """
 
     MAX_ANNEXES = 4
-    __slots__ = ("_units",)
-
-    def __init__(self, units: List[Unit]) -> None:
+    __slots__ = ("_units", "_on_change", "_before_change")
+
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def _get_building_info(self) -> Optional[Any]:
         if self._units and hasattr(self._units[0], "building_info"):
@@ -44,13 +52,14 @@ class AnnexesManager:
         
         bi = self._get_building_info()
         if bi and bi.building_annex:
-            return BuildingAnnexHandle(bi.building_annex[index], index)
+            return BuildingAnnexHandle(bi.building_annex[index], index, self._on_change, self._before_change)
         raise RuntimeError("Unit does not have BuildingInfo")
 
     def __iter__(self) -> Iterator[BuildingAnnexHandle]:
         for i in range(self.MAX_ANNEXES):
             yield self[i]
 
+    @notifies
     def set(self, index: int, unit_id: int, x: float = 0.0, y: float = 0.0) -> BuildingAnnexHandle:
         """Set an annex at specified index for all units."""
         if index < 0 or index >= self.MAX_ANNEXES:
@@ -80,7 +89,7 @@ class AnnexesManager:
         
         bi = self._get_building_info()
         if bi and bi.building_annex:
-            return BuildingAnnexHandle(bi.building_annex[index], index)
+            return BuildingAnnexHandle(bi.building_annex[index], index, self._on_change, self._before_change)
         return None
 
     def get_unit(self, index: int) -> Optional[Any]:
@@ -5,9 +5,17 @@ Manages the `combat_info.attacks` collection across multiple units.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Mapping, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import AttackHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
+from aoe2_genie_tooling.Units.unit_collections.bulk import (
+    ClassAmounts,
+    class_amounts,
+    extend_classes,
+    remove_matching,
+    set_amounts,
+)
 from sections.civilization.type_info.damage_class import DamageClass
 
 if TYPE_CHECKING:
@@ -21,10 +29,17 @@ class AttacksManager:
     Manager for the attack collection (combat_info.attacks) of a unit bundle.
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List[Unit]) -> None:
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def _get_combat_info(self) -> Optional[Any]:
         if self._units and hasattr(self._units[0], "combat_info"):
@@ -38,13 +53,14 @@ class AttacksManager:
     def __getitem__(self, index: int) -> AttackHandle:
         ci = self._get_combat_info()
         if ci and 0 <= index < len(ci.attacks):
-            return AttackHandle(ci.attacks[index], index)
+            return AttackHandle(ci.attacks[index], index, self._on_change, self._before_change)
         raise IndexError(f"Attack index {index} out of range (0-{len(self)-1})")
 
     def __iter__(self) -> Iterator[AttackHandle]:
         for i in range(len(self)):
             yield self[i]
 
+    @notifies
     def add(self, class_id: int, amount: int) -> AttackHandle:
         """Add an attack entry to all units.
         
@@ -72,6 +88,7 @@ class AttacksManager:
         
         return self[attack_idx]
 
+    @notifies
     def remove(self, index: int) -> bool:
         """Remove attack at index from all units.
         
@@ -88,6 +105,7 @@ class AttacksManager:
                     removed = True
         return removed
 
+    @notifies
     def clear(self) -> None:
         """Clear all attacks from all units.
         
@@ -105,6 +123,7 @@ class AttacksManager:
                 return handle
         return None
 
+    @notifies
     def set(self, class_id: int, amount: int) -> AttackHandle:
         """Update existing attack if it exists, otherwise add it."""
         existing = self.get_by_class(class_id)
@@ -119,3 +138,54 @@ class AttacksManager:
                             break
             return existing
         return self.add(class_id, amount)
+
+    # -------------------------
+    # Bulk edits (each unit's list is rebuilt once)
+    # -------------------------
+
+    def _combat_infos(self) -> List[Any]:
+        return [u.combat_info for u in self._units if hasattr(u, "combat_info") and u.combat_info]
+
+    @notifies
+    def set_many(self, amounts: Mapping[int, int]) -> None:
+        """
+        Set several attacks in all units: update the classes a unit has,
+        add the others.
+
+        Args:
+            amounts: Damage class ID -> amount
+        """
+        set_amounts(self._combat_infos(), "attacks", amounts)
+
+    @notifies
+    def extend(self, entries: ClassAmounts) -> None:
+        """
+        Add several attacks to all units.
+
+        Args:
+            entries: {class ID: amount} or (class ID, amount) pairs
+        """
+        extend_classes(self._combat_infos(), "attacks", class_amounts(entries))
+
+    @notifies
+    def replace_all(self, entries: ClassAmounts) -> None:
+        """
+        Make the given attacks the only ones of all units.
+
+        Args:
+            entries: {class ID: amount} or (class ID, amount) pairs
+        """
+        extend_classes(self._combat_infos(), "attacks", class_amounts(entries), replace=True)
+
+    @notifies
+    def remove_where(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove the attacks matching a predicate from all units.
+
+        Args:
+            predicate: Called with each raw DamageClass (fields id, amount)
+
+        Returns:
+            Number of attacks removed from the primary unit
+        """
+        return remove_matching(self._combat_infos(), "attacks", predicate)
@@ -0,0 +1,125 @@
+"""
+Bulk list edits shared by the unit collection managers.
+
+The single-entry methods (add, remove, set) copy and reassign a unit's list
+once per entry, and build each new entry field by field in every unit. The
+bulk methods (set_many, extend, replace_all, remove_where) use these helpers
+instead: every unit's list is copied and reassigned exactly once, and every
+new entry is built once and cloned for the other units.
+
+Lists are always reassigned, never mutated in place: bfp_rs Retriever lists
+share internal storage across clones.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, Union
+
+from sections.civilization.type_info.damage_class import DamageClass
+
+from aoe2_genie_tooling.Base.core.struct_cloner import clone_many
+
+__all__ = [
+    "ClassAmounts",
+    "class_amounts",
+    "copies",
+    "extend_classes",
+    "remove_matching",
+    "set_amounts",
+]
+
+# {class ID: amount} or (class ID, amount) pairs
+ClassAmounts = Union[Mapping[int, int], Iterable[Tuple[int, int]]]
+
+
+def class_amounts(entries: ClassAmounts) -> List[Tuple[int, int]]:
+    """Normalize a mapping or pairs to a list of (class ID, amount)."""
+    if isinstance(entries, Mapping):
+        return list(entries.items())
+    return [(class_id, amount) for class_id, amount in entries]
+
+
+def copies(template: Any, count: int) -> List[Any]:
+    """The template followed by count - 1 independent clones of it."""
+    if count <= 0:
+        return []
+    return [template] + clone_many(template, count - 1)
+
+
+def _damage_classes(class_id: int, amount: int, count: int) -> List[DamageClass]:
+    entry = DamageClass()
+    entry.id = class_id
+    entry.amount = amount
+    return copies(entry, count)
+
+
+def set_amounts(infos: List[Any], field: str, amounts: Mapping[int, int]) -> None:
+    """
+    Set the amount of each damage class in every list, appending the classes
+    a list does not have yet.
+
+    Args:
+        infos: Structs holding the lists (one combat_info per unit)
+        field: Name of the list ("attacks", "armors")
+        amounts: Damage class ID -> amount
+    """
+    lists = [list(getattr(info, field)) for info in infos]
+    # Class ID -> positions of the lists that lack it
+    missing: Dict[int, List[int]] = {}
+    for pos, entries in enumerate(lists):
+        found = set()
+        for entry in entries:
+            if entry.id in amounts and entry.id not in found:
+                entry.amount = amounts[entry.id]
+                found.add(entry.id)
+        for class_id in amounts:
+            if class_id not in found:
+                missing.setdefault(class_id, []).append(pos)
+
+    for class_id, positions in missing.items():
+        for pos, entry in zip(positions, _damage_classes(class_id, amounts[class_id], len(positions))):
+            lists[pos].append(entry)
+    for info, entries in zip(infos, lists):
+        setattr(info, field, entries)
+
+
+def extend_classes(infos: List[Any], field: str, entries: List[Tuple[int, int]], replace: bool = False) -> None:
+    """
+    Append damage classes to every list, or make them its only content.
+
+    Args:
+        infos: Structs holding the lists (one combat_info per unit)
+        field: Name of the list ("attacks", "armors")
+        entries: (class ID, amount) pairs, in order
+        replace: Drop the current entries first
+    """
+    lists = [[] if replace else list(getattr(info, field)) for info in infos]
+    for class_id, amount in entries:
+        for target, entry in zip(lists, _damage_classes(class_id, amount, len(infos))):
+            target.append(entry)
+    for info, target in zip(infos, lists):
+        setattr(info, field, target)
+
+
+def remove_matching(infos: List[Any], field: str, predicate: Callable[[Any], bool]) -> int:
+    """
+    Remove the entries matching a predicate from every list.
+
+    Lists without a match are left untouched.
+
+    Args:
+        infos: Structs holding the lists
+        field: Name of the list
+        predicate: Called with each raw entry; True removes it
+
+    Returns:
+        Number of entries removed from the first list
+    """
+    removed = 0
+    for pos, info in enumerate(infos):
+        current = list(getattr(info, field))
+        kept = [entry for entry in current if not predicate(entry)]
+        if len(kept) != len(current):
+            setattr(info, field, kept)
+        if pos == 0:
+            removed = len(current) - len(kept)
+    return removed
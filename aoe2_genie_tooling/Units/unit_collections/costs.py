@@ -5,9 +5,10 @@ Manages the `creation_info.costs` collection (fixed size of 3).
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import CostHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -21,10 +22,17 @@ class CostsManager:
     """
 
     MAX_COSTS = 3
-    __slots__ = ("_units",)
-
-    def __init__(self, units: List[Unit]) -> None:
+    __slots__ = ("_units", "_on_change", "_before_change")
+
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def _get_creation_info(self) -> Optional[Any]:
         if self._units and hasattr(self._units[0], "creation_info"):
@@ -44,13 +52,14 @@ class CostsManager:
         
         ci = self._get_creation_info()
         if ci and ci.costs:
-            return CostHandle(ci.costs[index], index)
+            return CostHandle(ci.costs[index], index, self._on_change, self._before_change)
         raise RuntimeError("Unit does not have CreationInfo")
 
     def __iter__(self) -> Iterator[CostHandle]:
         for i in range(self.MAX_COSTS):
             yield self[i]
 
+    @notifies
     def set(self, index: int, resource_id: int, quantity: int, deduct_flag: int = 1) -> CostHandle:
         """Set a resource cost at specified index for all units."""
         if index < 0 or index >= self.MAX_COSTS:
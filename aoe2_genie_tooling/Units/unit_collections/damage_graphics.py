@@ -5,9 +5,10 @@ Manages the `unit.damage_sprites` collection across multiple units.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import DamageGraphicHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
 from sections.civilization.unit_damage_sprite import UnitDamageSprite
 
 if TYPE_CHECKING:
@@ -21,10 +22,17 @@ class DamageGraphicsManager:
     Manager for the damage graphics collection (unit.damage_sprites) of a unit bundle.
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List[Unit]) -> None:
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def __len__(self) -> int:
         return len(self._units[0].damage_sprites) if self._units and self._units[0].damage_sprites else 0
@@ -32,13 +40,14 @@ class DamageGraphicsManager:
     def __getitem__(self, index: int) -> DamageGraphicHandle:
         u = self._units[0]
         if u and 0 <= index < len(u.damage_sprites):
-            return DamageGraphicHandle(u.damage_sprites[index], index)
+            return DamageGraphicHandle(u.damage_sprites[index], index, self._on_change, self._before_change)
         raise IndexError(f"Damage graphic index {index} out of range (0-{len(self)-1})")
 
     def __iter__(self) -> Iterator[DamageGraphicHandle]:
         for i in range(len(self)):
             yield self[i]
 
+    @notifies
     def add(self, graphic_id: int, damage_percent: int, apply_mode: int = 0) -> DamageGraphicHandle:
         """Add a damage graphic to all units.
         
@@ -62,6 +71,7 @@ class DamageGraphicsManager:
         
         return self[dg_idx]
 
+    @notifies
     def remove(self, index: int) -> bool:
         """Remove damage graphic at index from all units.
         
@@ -77,6 +87,7 @@ class DamageGraphicsManager:
                 removed = True
         return removed
 
+    @notifies
     def clear(self) -> None:
         """Clear all damage graphics from all units.
         
@@ -6,9 +6,10 @@ Since drop sites are just unit IDs (integers), this wraps the integer list.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import DropSiteHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -21,10 +22,17 @@ class DropSitesManager:
     Manager for the drop sites collection (task_info.drop_site_unit_ids) of a unit bundle.
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List[Unit]) -> None:
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def _get_task_info(self) -> Optional[Any]:
         if self._units and hasattr(self._units[0], "task_info"):
@@ -38,13 +46,14 @@ class DropSitesManager:
     def __getitem__(self, index: int) -> DropSiteHandle:
         ti = self._get_task_info()
         if ti and 0 <= index < len(ti.drop_site_unit_ids):
-            return DropSiteHandle(ti.drop_site_unit_ids, index)
+            return DropSiteHandle(ti.drop_site_unit_ids, index, self._on_change, self._before_change)
         raise IndexError(f"Drop site index {index} out of range (0-{len(self)-1})")
 
     def __iter__(self) -> Iterator[DropSiteHandle]:
         for i in range(len(self)):
             yield self[i]
 
+    @notifies
     def add(self, unit_id: int) -> DropSiteHandle:
         """Add a drop site unit ID to all units.
         
@@ -64,6 +73,7 @@ class DropSitesManager:
         
         return self[site_idx]
 
+    @notifies
     def remove(self, index: int) -> bool:
         """Remove drop site at index from all units.
         
@@ -80,6 +90,7 @@ class DropSitesManager:
                     removed = True
         return removed
 
+    @notifies
     def clear(self) -> None:
         """Clear all drop sites from all units.
         
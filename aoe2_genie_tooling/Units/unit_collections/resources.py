@@ -5,9 +5,10 @@ Manages the `unit.resources` collection (fixed size of 3).
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import ResourceHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -21,10 +22,17 @@ class ResourcesManager:
     """
 
     MAX_RESOURCES = 3
-    __slots__ = ("_units",)
-
-    def __init__(self, units: List[Unit]) -> None:
+    __slots__ = ("_units", "_on_change", "_before_change")
+
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def __len__(self) -> int:
         """Counts how many resources have a valid type."""
@@ -39,13 +47,14 @@ class ResourcesManager:
         
         u = self._units[0]
         if u and u.resources:
-            return ResourceHandle(u.resources[index], index)
+            return ResourceHandle(u.resources[index], index, self._on_change, self._before_change)
         raise RuntimeError("No units in bundle")
 
     def __iter__(self) -> Iterator[ResourceHandle]:
         for i in range(self.MAX_RESOURCES):
             yield self[i]
 
+    @notifies
     def set(self, index: int, type_id: int, quantity: float, store_mode: int = 0) -> ResourceHandle:
         """Set a resource entry at specified index for all units."""
         if index < 0 or index >= self.MAX_RESOURCES:
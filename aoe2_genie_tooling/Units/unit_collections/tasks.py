@@ -6,9 +6,11 @@ Manages the `task_info.tasks` collection across multiple units.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import TaskHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
+from aoe2_genie_tooling.Units.unit_collections.bulk import copies, remove_matching
 from sections.unit_data.unit_task import UnitTask
 
 if TYPE_CHECKING:
@@ -16,6 +18,57 @@ if TYPE_CHECKING:
 
 __all__ = ["TasksManager"]
 
+# add() parameters with their defaults (UnitTask field names)
+_TASK_DEFAULTS: Dict[str, Any] = {
+    "task_type": 1,
+    "id": -1,
+    "is_default": False,
+    "action_type": 0,
+    "unit_class_id": -1,
+    "unit_type": -1,
+    "terrain_type": -1,
+    "resource_in": -1,
+    "resource_out": -1,
+    "work_value1": 0.0,
+    "work_value2": 0.0,
+    "work_range": 0.0,
+}
+
+# Alternative keyword names accepted by add() -> UnitTask field names
+_TASK_ALIASES = {
+    "class_id": "unit_class_id",
+    "unit_id": "unit_type",
+    "terrain_id": "terrain_type",
+    "work_value_1": "work_value1",
+    "work_value_2": "work_value2",
+    "work_flag_2": "work_mode",
+    "building_pick": "build_task_flag",
+}
+
+
+def _new_task(ver: Any, fields: Mapping[str, Any]) -> UnitTask:
+    """
+    Build a UnitTask from add() keyword arguments.
+
+    An id of -1 is kept as is; callers assign the task's index. Aliases
+    win over the field names they stand for. Unknown keywords that are not
+    UnitTask attributes are ignored.
+    """
+    values = dict(_TASK_DEFAULTS)
+    for key, value in fields.items():
+        if key not in _TASK_ALIASES:
+            values[key] = value
+    for key, value in fields.items():
+        if key in _TASK_ALIASES:
+            values[_TASK_ALIASES[key]] = value
+    values["is_default"] = bool(values["is_default"])
+
+    task = UnitTask(ver=ver)
+    for key, value in values.items():
+        if key in _TASK_DEFAULTS or hasattr(task, key):
+            setattr(task, key, value)
+    return task
+
 
 class TasksManager:
     """
@@ -25,16 +78,25 @@ class TasksManager:
     modification methods (add, remove, clear).
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List[Unit]) -> None:
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with a list of units to manage.
         
         Args:
             units: List of Unit objects.
+            on_change: Called after every modification.
+            before_change: Called before every modification.
         """
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def _get_task_info(self) -> Optional[Any]:
         """Get task_info from the primary unit."""
@@ -59,7 +121,7 @@ class TasksManager:
             if hasattr(u, "task_info") and u.task_info and index < len(u.task_info.tasks):
                 all_tasks.append(u.task_info.tasks[index])
         
-        return TaskHandle(all_tasks, index)
+        return TaskHandle(all_tasks, index, self._on_change, self._before_change)
 
     def __iter__(self) -> Iterator[TaskHandle]:
         """Iterate over TaskHandles for all tasks."""
@@ -69,6 +131,7 @@ class TasksManager:
     def __repr__(self) -> str:
         return f"TasksManager(tasks={len(self)}, units={len(self._units)})"
 
+    @notifies
     def add(
         self,
         task_type: int = 1,
@@ -106,72 +169,63 @@ class TasksManager:
         Returns:
             TaskHandle for the new task in the primary unit.
         """
-        # Alias handling for backward compatibility in kwargs
-        if 'class_id' in kwargs:
-            unit_class_id = kwargs.pop('class_id')
-        if 'unit_id' in kwargs:
-            unit_type = kwargs.pop('unit_id')
-        if 'terrain_id' in kwargs:
-            terrain_type = kwargs.pop('terrain_id')
-        if 'work_value_1' in kwargs:
-            work_value1 = kwargs.pop('work_value_1')
-        if 'work_value_2' in kwargs:
-            work_value2 = kwargs.pop('work_value_2')
-        # Map aliased names to underlying UnitTask field names
-        if 'work_flag_2' in kwargs:
-            kwargs['work_mode'] = kwargs.pop('work_flag_2')
-        if 'building_pick' in kwargs:
-            kwargs['build_task_flag'] = kwargs.pop('building_pick')
-
-        task_idx = -1
-        # DEBUG: Trace tasks add
-        processed_count = 0
-        shared_ptrs = set()
-        
-        for i, u in enumerate(self._units):
-            if hasattr(u, "task_info") and u.task_info:
-                processed_count += 1
-                # Check pointer if possible, or just ID
-                # ptr = id(u.task_info) # Python ID of wrapper, not struct
-                
-                # Check duplicate prevention?
-                # If we already modified this struct via another unit?
-                
-                # Create with version from unit
-                new_task = UnitTask(ver=u.ver)
-                new_task.task_type = task_type
-                new_task.id = id if id != -1 else len(u.task_info.tasks)
-                new_task.is_default = bool(is_default)
-                new_task.action_type = action_type
-                new_task.unit_class_id = unit_class_id
-                new_task.unit_type = unit_type
-                new_task.terrain_type = terrain_type
-                new_task.resource_in = resource_in
-                new_task.resource_out = resource_out
-                new_task.work_value1 = work_value1
-                new_task.work_value2 = work_value2
-                new_task.work_range = work_range
-                
-                # Apply extra attributes
-                for key, val in kwargs.items():
-                    if hasattr(new_task, key):
-                        setattr(new_task, key, val)
-                
-                # CRITICAL: Don't use append()! bfp_rs lists share internal storage.
-                current_tasks = list(u.task_info.tasks)
-                
-                # OPTIMIZATION: Check if we just added this exact task (pointers shared)?
-                # If current_tasks already has this task at end? 
-                # No, new_task is new object.
-                
-                current_tasks.append(new_task)
-                u.task_info.tasks = current_tasks  # setattr triggers bfp_rs copy
-                
-                if task_idx == -1:
-                    task_idx = len(u.task_info.tasks) - 1
-        
-        return self[task_idx]
+        self._append([dict(
+            kwargs,
+            task_type=task_type,
+            id=id,
+            is_default=is_default,
+            action_type=action_type,
+            unit_class_id=unit_class_id,
+            unit_type=unit_type,
+            terrain_type=terrain_type,
+            resource_in=resource_in,
+            resource_out=resource_out,
+            work_value1=work_value1,
+            work_value2=work_value2,
+            work_range=work_range,
+        )])
+        return self[len(self) - 1]
+
+    @notifies
+    def extend(self, tasks: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Add several tasks to all units in the bundle.
+
+        Each task is built once and cloned per unit, and each unit's list
+        is rebuilt once.
+
+        Args:
+            tasks: One dict of add() keyword arguments per task.
+        """
+        self._append(tasks)
 
+    @notifies
+    def replace_all(self, tasks: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Make the given tasks the only tasks of all units in the bundle.
+
+        Args:
+            tasks: One dict of add() keyword arguments per task.
+        """
+        self._append(tasks, replace=True)
+
+    def _append(self, tasks: Iterable[Mapping[str, Any]], replace: bool = False) -> None:
+        """Append tasks to every unit, rebuilding each unit's list once."""
+        units = [u for u in self._units if hasattr(u, "task_info") and u.task_info]
+        if not units:
+            return
+        lists = [[] if replace else list(u.task_info.tasks) for u in units]
+        for fields in tasks:
+            template = _new_task(units[0].ver, fields)
+            auto_id = template.id == -1
+            for target, task in zip(lists, copies(template, len(units))):
+                if auto_id:
+                    task.id = len(target)
+                target.append(task)
+        for u, target in zip(units, lists):
+            u.task_info.tasks = target  # setattr triggers bfp_rs copy
+
+    @notifies
     def remove(self, index: int) -> bool:
         """
         Remove task at specified index from all units.
@@ -195,6 +249,7 @@ class TasksManager:
                     removed = True
         return removed
 
+    @notifies
     def clear(self) -> None:
         """Remove all tasks from all units.
         
@@ -212,6 +267,23 @@ class TasksManager:
                 return handle
         return None
 
+    @notifies
+    def remove_where(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove the tasks matching a predicate from all units.
+
+        Each unit's list is rebuilt once (units without a match are left
+        untouched).
+
+        Args:
+            predicate: Called with each raw UnitTask; True removes it.
+
+        Returns:
+            Number of tasks removed from the primary unit.
+        """
+        infos = [u.task_info for u in self._units if hasattr(u, "task_info") and u.task_info]
+        return remove_matching(infos, "tasks", predicate)
+
     def remove_by_action_type(self, action_type: int) -> int:
         """
         Remove all tasks with the specified action_type from all units.
@@ -222,21 +294,4 @@ class TasksManager:
         Returns:
             Number of tasks removed (from the primary unit's perspective).
         """
-        # Find indices of tasks to remove (from primary unit)
-        ti = self._get_task_info()
-        if not ti or not ti.tasks:
-            return 0
-        
-        # Collect indices to remove (in reverse order to avoid index shifting)
-        indices_to_remove = [
-            i for i, task in enumerate(ti.tasks) 
-            if task.action_type == action_type
-        ]
-        
-        # Remove from all units, highest index first
-        count = 0
-        for idx in reversed(indices_to_remove):
-            if self.remove(idx):
-                count += 1
-        
-        return count
+        return self.remove_where(lambda task: task.action_type == action_type)
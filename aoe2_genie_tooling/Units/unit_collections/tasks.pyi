@@ -1,14 +1,19 @@
 """
 Type stubs for TasksManager - Provides IDE autocomplete.
 """
-from typing import Iterator, Optional, List, Any
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
 from aoe2_genie_tooling.Units.handles import TaskHandle
 
 
 class TasksManager:
     """Manager for unit tasks across all civilizations."""
     
-    def __init__(self, units: List[Any]) -> None: ...
+    def __init__(
+        self,
+        units: List[Any],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None: ...
     
     def __len__(self) -> int:
         """Number of tasks in the primary unit."""
@@ -41,6 +46,14 @@ class TasksManager:
         """Add a new task to all units in the bundle."""
         ...
     
+    def extend(self, tasks: Iterable[Mapping[str, Any]]) -> None:
+        """Add several tasks (dicts of add() keyword arguments) to all units."""
+        ...
+
+    def replace_all(self, tasks: Iterable[Mapping[str, Any]]) -> None:
+        """Make the given tasks the only tasks of all units."""
+        ...
+
     def remove(self, index: int) -> bool:
         """Remove task at specified index from all units."""
         ...
@@ -53,6 +66,10 @@ class TasksManager:
         """Find the first task with the specified type in the primary unit."""
         ...
     
+    def remove_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove the tasks matching a predicate (called with each UnitTask) from all units."""
+        ...
+
     def remove_by_action_type(self, action_type: int) -> int:
         """
         Remove all tasks with the specified action_type from all units.
@@ -5,9 +5,10 @@ Manages the `creation_info.train_locations_new` collection across multiple units
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Iterator
 
 from aoe2_genie_tooling.Units.handles import TrainLocationHandle
+from aoe2_genie_tooling.Base.core.change_tracker import notifies
 from sections.civilization.type_info.creation_info import TrainLocation
 
 if TYPE_CHECKING:
@@ -22,10 +23,17 @@ class TrainLocationsManager:
     of a unit bundle.
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List[Unit]) -> None:
+    def __init__(
+        self,
+        units: List[Unit],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
 
     def _get_creation_info(self) -> Optional[Any]:
         if self._units and hasattr(self._units[0], "creation_info"):
@@ -39,13 +47,14 @@ class TrainLocationsManager:
     def __getitem__(self, index: int) -> TrainLocationHandle:
         ci = self._get_creation_info()
         if ci and 0 <= index < len(ci.train_locations_new):
-            return TrainLocationHandle(ci.train_locations_new[index], index)
+            return TrainLocationHandle(ci.train_locations_new[index], index, self._on_change, self._before_change)
         raise IndexError(f"Train location index {index} out of range (0-{len(self)-1})")
 
     def __iter__(self) -> Iterator[TrainLocationHandle]:
         for i in range(len(self)):
             yield self[i]
 
+    @notifies
     def add(
         self,
         unit_id: int,
@@ -82,6 +91,7 @@ class TrainLocationsManager:
         
         return self[loc_idx]
 
+    @notifies
     def remove(self, index: int) -> bool:
         """Remove train location at index from all units.
         
@@ -98,6 +108,7 @@ class TrainLocationsManager:
                     removed = True
         return removed
 
+    @notifies
     def clear(self) -> None:
         """Clear all train locations from all units.
         
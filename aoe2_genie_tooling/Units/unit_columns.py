@@ -0,0 +1,299 @@
+"""
+UnitColumns - Columnar NumPy projection of unit attributes.
+
+Reads chosen fields of every unit in every (selected) civ into 2-D arrays
+indexed by (civ row, unit ID), in one pass over the raw structs, and writes
+changed cells back in bulk. Used through UnitManager.to_columns() and
+UnitManager.from_columns().
+
+Field names:
+- Flattened UnitHandle names: "hit_points", "max_range", "walking_graphic_id"
+- Dotted raw paths: "combat_info.max_range", "animation_info.speed"
+- Cost columns: "food_cost", "wood_cost", "stone_cost", "gold_cost"
+  (quantity of that resource in creation_info.costs)
+
+Each field has a mask that is True where a value was read. It is False for
+placeholders, empty slots, and units without the field's component (e.g. no
+combat_info) or whose struct version lacks the field.
+
+NumPy is optional; it is imported on first use.
+
+Usage:
+    cols = workspace.unit_manager.to_columns(["hit_points", "max_range"])
+    cols["hit_points"][cols.mask("hit_points")] *= 2
+    workspace.unit_manager.from_columns(cols)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from aoe2_genie_tooling.Units.wrappers.dispatch import dispatch_table
+
+__all__ = ["UnitColumns", "resolve_field", "write_cells"]
+
+# UnitHandle properties that read a sub-struct under a different path
+_HANDLE_PATHS = {"speed": "animation_info.speed"}
+
+# Cost columns -> resource ID in creation_info.costs
+_COST_RESOURCES = {"food_cost": 0, "wood_cost": 1, "stone_cost": 2, "gold_cost": 3}
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Unit columns need NumPy. Install it with: pip install aoe2-genie-tooling[numpy]"
+        ) from e
+    return numpy
+
+
+def resolve_field(name: str) -> str:
+    """
+    Raw dotted path of a column field ("max_range" -> "combat_info.max_range").
+
+    Cost columns resolve to "creation_info.costs".
+    """
+    if "." in name:
+        return name
+    if name in _COST_RESOURCES:
+        return "creation_info.costs"
+    if name in _HANDLE_PATHS:
+        return _HANDLE_PATHS[name]
+    for accessors in dispatch_table().values():
+        accessor = accessors.get(name)
+        if accessor is not None:
+            return f"{accessor.info}.{accessor.field}"
+    return name
+
+
+# -------------------------
+# Per-field read/write
+# -------------------------
+
+_MISSING = object()
+
+
+def _reader(name: str) -> Callable[[Any], Any]:
+    """Return a function unit -> value (or _MISSING)."""
+    resource = _COST_RESOURCES.get(name)
+    if resource is not None:
+        def read_cost(unit: Any) -> Any:
+            info = getattr(unit, "creation_info", None)
+            if not info:
+                return _MISSING
+            return sum(c.quantity for c in info.costs if c.resource_id == resource)
+        return read_cost
+
+    chain = attrgetter(resolve_field(name))
+
+    def read(unit: Any) -> Any:
+        try:
+            return chain(unit)
+        except AttributeError:
+            return _MISSING
+
+    return read
+
+
+def _writer(name: str) -> Callable[[Any, Any], bool]:
+    """Return a function (unit, value) -> written (False if the unit has no room for it)."""
+    resource = _COST_RESOURCES.get(name)
+    if resource is not None:
+        def write_cost(unit: Any, value: Any) -> bool:
+            info = getattr(unit, "creation_info", None)
+            if not info:
+                return False
+            costs = info.costs
+            slot = next((c for c in costs if c.resource_id == resource), None)
+            if slot is None:
+                if not value:
+                    return True
+                # Use the first free cost slot
+                slot = next((c for c in costs if c.resource_id < 0), None)
+                if slot is None:
+                    return False
+                slot.resource_id = resource
+                slot.deduct_flag = 1
+            slot.quantity = value
+            return True
+        return write_cost
+
+    *parents, last = resolve_field(name).split(".")
+    parent = attrgetter(".".join(parents)) if parents else None
+
+    def write(unit: Any, value: Any) -> bool:
+        try:
+            target = parent(unit) if parent is not None else unit
+            if target is None:
+                return False
+            setattr(target, last, value)
+        except AttributeError:
+            return False
+        return True
+
+    return write
+
+
+@dataclass
+class UnitColumns:
+    """
+    Unit fields as 2-D arrays, rows = civs, columns = unit IDs.
+
+    Attributes:
+        civ_ids: Civ ID of each row
+        fields: Projected field names
+        data: Field -> array of shape (len(civ_ids), unit count)
+        masks: Field -> bool array, True where data holds a read value
+        present: Bool array, True where the slot holds a real unit
+    """
+    civ_ids: List[int]
+    fields: Tuple[str, ...]
+    data: Dict[str, Any]
+    masks: Dict[str, Any]
+    present: Any
+    # Values as read, to find the cells changed before from_columns()
+    _original: Dict[str, Any] = dataclass_field(default_factory=dict, repr=False)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.data[name]
+
+    def __setitem__(self, name: str, values: Any) -> None:
+        self.data[name][...] = values
+
+    def mask(self, name: str) -> Any:
+        """Bool array, True where the field was read."""
+        return self.masks[name]
+
+    @property
+    def unit_ids(self) -> Any:
+        """Unit ID of each column."""
+        return _numpy().arange(self.present.shape[1])
+
+    def row(self, civ_id: int) -> int:
+        """Row index of a civ."""
+        return self.civ_ids.index(civ_id)
+
+    def masked(self, name: str) -> Any:
+        """The field as a numpy.ma masked array (missing cells masked)."""
+        return _numpy().ma.array(self.data[name], mask=~self.masks[name])
+
+    def structured(self) -> Any:
+        """All fields as one structured array of shape (civs, units)."""
+        np = _numpy()
+        dtype = [(name, self.data[name].dtype) for name in self.fields]
+        result = np.zeros(self.present.shape, dtype=dtype)
+        for name in self.fields:
+            result[name] = self.data[name]
+        return result
+
+    # -------------------------
+    # Building and writing back
+    # -------------------------
+
+    @classmethod
+    def read(cls, civs: Sequence[Any], civ_ids: List[int], fields: Sequence[str],
+             is_placeholder: Callable[[Any], bool]) -> UnitColumns:
+        """Project fields of the units of civs[civ_ids] (see module docstring)."""
+        np = _numpy()
+        fields = tuple(dict.fromkeys(fields))
+        width = max((len(civs[c].units) for c in civ_ids), default=0)
+        readers = [_reader(name) for name in fields]
+        values: List[List[List[Any]]] = [[] for _ in fields]
+        present = np.zeros((len(civ_ids), width), dtype=bool)
+
+        for row, civ_id in enumerate(civ_ids):
+            units = civs[civ_id].units
+            rows = [[_MISSING] * width for _ in fields]
+            for unit_id, unit in enumerate(units):
+                if unit is None or is_placeholder(unit):
+                    continue
+                present[row, unit_id] = True
+                for i, read in enumerate(readers):
+                    rows[i][unit_id] = read(unit)
+            for i in range(len(fields)):
+                values[i].append(rows[i])
+
+        data: Dict[str, Any] = {}
+        masks: Dict[str, Any] = {}
+        for name, grid in zip(fields, values):
+            data[name], masks[name] = _to_array(np, grid, (len(civ_ids), width))
+        original = {name: array.copy() for name, array in data.items()}
+        return cls(list(civ_ids), fields, data, masks, present, original)
+
+    def changed(self, name: str) -> Any:
+        """Bool array of the readable cells whose value differs from what was read."""
+        np = _numpy()
+        new, old = self.data[name], self._original[name]
+        if new.dtype == object:
+            diff = np.array([[a != b for a, b in zip(r1, r2)] for r1, r2 in zip(new.tolist(), old.tolist())],
+                            dtype=bool).reshape(new.shape)
+        else:
+            diff = new != old
+            if new.dtype.kind == "f":
+                diff &= ~(np.isnan(new) & np.isnan(old))
+        return diff & self.masks[name]
+
+    def writes(self, fields: Optional[Sequence[str]] = None) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        """
+        Changed cells as {(civ_id, unit_id): {field: new value}}.
+
+        Values are plain Python numbers (not NumPy scalars).
+        """
+        np = _numpy()
+        result: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for name in fields or self.fields:
+            rows, cols = np.nonzero(self.changed(name))
+            array = self.data[name]
+            for row, unit_id in zip(rows.tolist(), cols.tolist()):
+                value = array[row, unit_id]
+                result.setdefault((self.civ_ids[row], unit_id), {})[name] = (
+                    value.item() if hasattr(value, "item") else value
+                )
+        return result
+
+    def commit(self, fields: Optional[Sequence[str]] = None) -> None:
+        """Treat the current values as read (after they were written back)."""
+        for name in fields or self.fields:
+            self._original[name] = self.data[name].copy()
+
+
+def _to_array(np: Any, grid: List[List[Any]], shape: Tuple[int, int]) -> Tuple[Any, Any]:
+    """Turn rows of values/_MISSING into (data array, mask)."""
+    mask = np.array([[v is not _MISSING for v in row] for row in grid], dtype=bool).reshape(shape)
+    kinds = {type(v) for row in grid for v in row if v is not _MISSING}
+    if kinds <= {int, bool}:
+        dtype, fill = np.int64, 0
+    elif kinds <= {int, bool, float}:
+        dtype, fill = np.float64, np.nan
+    else:
+        dtype, fill = object, None
+    data = np.array([[fill if v is _MISSING else v for v in row] for row in grid], dtype=dtype).reshape(shape)
+    return data, mask
+
+
+def write_cells(civs: Sequence[Any], writes: Dict[Tuple[int, int], Dict[str, Any]]) -> List[Tuple[int, int]]:
+    """
+    Apply {(civ_id, unit_id): {field: value}} to the raw units.
+
+    Returns:
+        The (civ_id, unit_id) cells that were written
+    """
+    writers: Dict[str, Callable[[Any, Any], bool]] = {}
+    written = []
+    for (civ_id, unit_id), values in writes.items():
+        unit = civs[civ_id].units[unit_id]
+        if unit is None:
+            continue
+        done = False
+        for name, value in values.items():
+            writer = writers.get(name)
+            if writer is None:
+                writer = writers[name] = _writer(name)
+            done = writer(unit, value) or done
+        if done:
+            written.append((civ_id, unit_id))
+    return written
@@ -0,0 +1,110 @@
+"""
+Unit divergence - Which fields of a unit differ between civilizations.
+
+Used through UnitManager.divergence(). Civs are first grouped by the content
+hash of their copy of the unit (the fingerprint cache, kept up to date by the
+workspace change notifications), so a unit that is identical everywhere
+costs a dict lookup per civ. For the others, one civ of every distinct
+hash is compared field by field with the most common version; the values
+found are reported for every civ of its group.
+
+Field names are dotted raw paths with list indices:
+"hit_points", "combat_info.max_range", "combat_info.attacks[1].amount".
+Nested structs and equally long lists of structs are compared field by field;
+a list that differs in length (or a component present in only some civs) is
+reported whole ("combat_info.attacks").
+
+Civs without the unit (empty slot or placeholder) are left out.
+
+Usage:
+    for unit_id, field, values in workspace.unit_manager.divergence([4, 5]):
+        print(unit_id, field, values)   # 4 hit_points {0: 30, 1: 35, ...}
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from aoe2_genie_tooling.Base.core.struct_schema import FieldPath, diff_structs, is_list
+
+__all__ = ["Divergence", "unit_divergence"]
+
+# (unit ID, field, civ ID -> value)
+Divergence = Tuple[int, str, Dict[int, Any]]
+
+def _read(obj: Any, path: FieldPath) -> Any:
+    """Value at a path, None where the path does not exist in obj."""
+    for part in path:
+        if isinstance(part, int):
+            if not is_list(obj) or part >= len(obj):
+                return None
+            obj = obj[part]
+        else:
+            obj = getattr(obj, part, None)
+        if obj is None:
+            return None
+    return list(obj) if is_list(obj) else obj
+
+
+def _path_name(path: FieldPath) -> str:
+    name = ""
+    for part in path:
+        name += f"[{part}]" if isinstance(part, int) else (f".{part}" if name else part)
+    return name
+
+
+def unit_divergence(
+    civs: Sequence[Any],
+    digests: Dict[int, Dict[int, Optional[str]]],
+    unit_ids: Iterable[int],
+    is_placeholder: Callable[[Any], bool],
+) -> List[Divergence]:
+    """
+    Report the fields of units that differ between civs.
+
+    Args:
+        civs: ``workspace.dat.civilizations``
+        digests: Civ ID -> unit ID -> content hash (None for empty slots),
+                 as kept by the Fingerprinter
+        unit_ids: Units to check
+        is_placeholder: Tells placeholder units from real ones
+
+    Returns:
+        (unit ID, field, civ ID -> value) per differing field, ordered by
+        unit ID and then field order. Values of list fields are copies;
+        struct values are the DAT's own objects.
+    """
+    report: List[Divergence] = []
+    for unit_id in unit_ids:
+        # Content hash -> civs holding that version of the unit
+        groups: Dict[str, List[int]] = {}
+        for civ_id, civ_digests in digests.items():
+            digest = civ_digests.get(unit_id)
+            if digest is not None:
+                groups.setdefault(digest, []).append(civ_id)
+        if len(groups) < 2:
+            continue
+
+        versions = []
+        for civ_ids in groups.values():
+            unit = civs[civ_ids[0]].units[unit_id]
+            if not is_placeholder(unit):
+                versions.append((civ_ids, unit))
+        if len(versions) < 2:
+            continue
+
+        # Most common version first; every other one is compared with it
+        versions.sort(key=lambda v: (-len(v[0]), v[0][0]))
+        reference = versions[0][1]
+        paths: Dict[FieldPath, None] = {}
+        for _, unit in versions[1:]:
+            for path, _, _ in diff_structs(reference, unit):
+                paths[path] = None
+
+        for path in paths:
+            values: Dict[int, Any] = {}
+            for civ_ids, unit in versions:
+                value = _read(unit, path)
+                for civ_id in civ_ids:
+                    values[civ_id] = value
+            report.append((unit_id, _path_name(path), dict(sorted(values.items()))))
+    return report
@@ -28,6 +28,7 @@ from aoe2_genie_tooling.Units.wrappers import (
     ProjectileWrapper, 
     BuildingWrapper
 )
+from aoe2_genie_tooling.Units.wrappers.dispatch import FieldAccessor, install as install_flattened
 
 # Collection Manager imports
 from aoe2_genie_tooling.Units.unit_collections import (
@@ -45,6 +46,7 @@ from aoe2_genie_tooling.Units.unit_collections import (
 # Validation moved to workspace.py (centralized)
 
 if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.core.batch import EditBatch
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
 
 __all__ = ["UnitHandle"]
@@ -78,7 +80,9 @@ class UnitHandle:
     """
 
     __slots__ = (
-        "_workspace", "_unit_id", "_civ_ids", "_units_cache", 
+        "_workspace", "_unit_id", "_civ_ids", "_units_cache", "_sharing", "_sharing_version",
+        # Held weakly by UnitManager.get() (see HandleCache)
+        "__weakref__",
         # removed "_validator" (using workspace.validator)
         
         # Wrapper caches
@@ -106,6 +110,8 @@ class UnitHandle:
             civ_ids = list(range(len(workspace.dat.civilizations)))
         object.__setattr__(self, "_civ_ids", civ_ids)
         object.__setattr__(self, "_units_cache", None)
+        object.__setattr__(self, "_sharing", workspace.unit_manager.sharing)
+        object.__setattr__(self, "_sharing_version", self._sharing.version)
         # _validator init removed
         # Initialize wrapper caches to None
         object.__setattr__(self, "_combat_cache", None)
@@ -135,23 +141,58 @@ class UnitHandle:
     # =========================================================================
 
     def _get_units(self) -> List[Any]:
-        """Get all Unit objects for enabled civs. Cached for performance."""
+        """
+        Get all Unit objects for enabled civs. Cached for performance.
+
+        A Unit object shared by several of these civs is listed once. Nothing
+        is copied here; _prepare_write() splits sharing groups before writes.
+        """
+        self._check_sharing()
         if self._units_cache is not None:
             return self._units_cache
 
+        units = self._collect_units()
+        object.__setattr__(self, "_units_cache", units)
+        return units
+
+    def _collect_units(self) -> List[Any]:
+        """Look up the Unit objects of this handle's civs (uncached)."""
+        sharing = self._sharing
+        civ_ids = sharing.distinct_civs(self._unit_id, self._civ_ids)
+        object.__setattr__(self, "_sharing_version", sharing.version)
+
         civs = self._workspace.dat.civilizations
         units = []
-        for civ_id in self._civ_ids:
+        for civ_id in civ_ids:
             if 0 <= civ_id < len(civs):
                 civ = civs[civ_id]
                 if 0 <= self._unit_id < len(civ.units):
                     unit = civ.units[self._unit_id]
                     if unit is not None:
                         units.append(unit)
-
-        object.__setattr__(self, "_units_cache", units)
         return units
 
+    def _prepare_write(self) -> None:
+        """
+        Give civs outside this handle their own copy of the units it shares
+        with them, before a write.
+
+        The handle's civs keep their Unit objects. The cached unit list is
+        refilled in place, since wrappers hold it.
+        """
+        sharing = self._sharing
+        sharing.unique_civs(self._unit_id, self._civ_ids)
+        cached = self._units_cache
+        if cached is not None and sharing.version != self._sharing_version:
+            cached[:] = self._collect_units()
+
+    def _check_sharing(self) -> None:
+        """Drop cached units if unit sharing changed since they were collected."""
+        version = self._sharing.version
+        if version != self._sharing_version:
+            self.invalidate_cache()
+            object.__setattr__(self, "_sharing_version", version)
+
     def invalidate_cache(self) -> None:
         """Clear cached units and wrapper caches. Call after changing civ_ids."""
         object.__setattr__(self, "_units_cache", None)
@@ -174,6 +215,55 @@ class UnitHandle:
         object.__setattr__(self, "_costs_cache", None)
         object.__setattr__(self, "_resources_cache", None)
 
+    def _changed(self) -> None:
+        """Report a write to this unit to the workspace change tracker."""
+        self._workspace.changes.mark("units", self._unit_id)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        self._prepare_write()
+        batch = self._workspace._batch
+        if batch is not None and batch.rollback_enabled:
+            self._record_write(batch, name)
+        journal = self._workspace._journal
+        if journal is not None:
+            journal.touch("units", self._unit_id, self._civ_ids)
+        object.__setattr__(self, name, value)
+        self._changed()
+
+    def _record_write(self, batch: EditBatch, name: str) -> None:
+        """Let an open workspace batch remember what setting name overwrites."""
+        accessor = _FLATTENED.get(name)
+        for unit in self._get_units():
+            if accessor is None:
+                batch.record("units", self._unit_id, unit, name)
+            else:
+                struct = getattr(unit, accessor.info, None)
+                if struct:
+                    batch.record("units", self._unit_id, struct, accessor.field)
+
+    def _before_write(self) -> None:
+        """
+        Called by wrappers, collections and their items before they write.
+
+        They write to the units directly, so an open workspace batch saves
+        the units and the journal captures them here.
+        """
+        self._prepare_write()
+        batch = self._workspace._batch
+        if batch is not None and batch.rollback_enabled:
+            for unit in self._get_units():
+                batch.save("units", self._unit_id, unit)
+        journal = self._workspace._journal
+        if journal is not None:
+            journal.touch("units", self._unit_id, self._civ_ids)
+
+    def _wrap(self, wrapper_cls: type) -> Any:
+        """Build a wrapper or collection over the units that reports its writes."""
+        return wrapper_cls(self._get_units(), self._changed, self._before_write)
+
     @property
     def _primary_unit(self) -> Optional[Any]:
         """First unit (used for reading values)."""
@@ -238,8 +328,15 @@ class UnitHandle:
             workspace.save("output.dat")  # Structures sync here
         """
         # Update type field
+        batch = self._workspace._batch
+        if batch is not None and batch.rollback_enabled:
+            self._record_write(batch, "type_")
+        journal = self._workspace._journal
+        if journal is not None:
+            journal.touch("units", self._unit_id, self._civ_ids)
         for u in self._get_units():
             u.type_ = new_type
+        self._changed()
         
         # Mark for later validation
         self._workspace._type_changed_units.add(self._unit_id)
@@ -1039,8 +1136,9 @@ class UnitHandle:
     @property
     def combat(self) -> Type50Wrapper:
         """Type50 (combat) wrapper. Cached."""
+        self._check_sharing()
         if self._combat_cache is None:
-            object.__setattr__(self, "_combat_cache", Type50Wrapper(self._get_units()))
+            object.__setattr__(self, "_combat_cache", self._wrap(Type50Wrapper))
         return self._combat_cache
 
 
@@ -1048,15 +1146,17 @@ class UnitHandle:
     @property
     def creation(self) -> CreationWrapper:
         """Creation wrapper. Cached."""
+        self._check_sharing()
         if self._creation_cache is None:
-            object.__setattr__(self, "_creation_cache", CreationWrapper(self._get_units()))
+            object.__setattr__(self, "_creation_cache", self._wrap(CreationWrapper))
         return self._creation_cache
 
     @property
     def cost(self) -> CostWrapper:
         """Cost wrapper. Cached."""
+        self._check_sharing()
         if self._cost_cache is None:
-            object.__setattr__(self, "_cost_cache", CostWrapper(self._get_units()))
+            object.__setattr__(self, "_cost_cache", self._wrap(CostWrapper))
         return self._cost_cache
 
 
@@ -1066,15 +1166,17 @@ class UnitHandle:
     @property
     def projectile(self) -> ProjectileWrapper:
         """Projectile wrapper. Cached."""
+        self._check_sharing()
         if self._projectile_cache is None:
-            object.__setattr__(self, "_projectile_cache", ProjectileWrapper(self._get_units()))
+            object.__setattr__(self, "_projectile_cache", self._wrap(ProjectileWrapper))
         return self._projectile_cache
 
     @property
     def building(self) -> BuildingWrapper:
         """Building wrapper. Cached."""
+        self._check_sharing()
         if self._building_cache is None:
-            object.__setattr__(self, "_building_cache", BuildingWrapper(self._get_units()))
+            object.__setattr__(self, "_building_cache", self._wrap(BuildingWrapper))
         return self._building_cache
 
     @property
@@ -1085,8 +1187,9 @@ class UnitHandle:
     @property
     def damage_graphics(self) -> DamageGraphicsWrapper:
         """Damage graphics wrapper. Cached."""
+        self._check_sharing()
         if self._damage_graphics_cache is None:
-            object.__setattr__(self, "_damage_graphics_cache", DamageGraphicsWrapper(self._get_units()))
+            object.__setattr__(self, "_damage_graphics_cache", self._wrap(DamageGraphicsWrapper))
         return self._damage_graphics_cache
 
     @property
@@ -1097,15 +1200,17 @@ class UnitHandle:
     @property
     def tasks(self) -> TasksWrapper:
         """Tasks wrapper. Cached."""
+        self._check_sharing()
         if self._tasks_cache is None:
-            object.__setattr__(self, "_tasks_cache", TasksWrapper(self._get_units()))
+            object.__setattr__(self, "_tasks_cache", self._wrap(TasksWrapper))
         return self._tasks_cache
 
     @property
     def train_locations_wrapper(self) -> TrainLocationsWrapper:
         """Train locations wrapper for managing where unit can be trained."""
+        self._check_sharing()
         if self._train_locations_cache is None:
-            object.__setattr__(self, "_train_locations_cache", TrainLocationsWrapper(self._get_units()))
+            object.__setattr__(self, "_train_locations_cache", self._wrap(TrainLocationsWrapper))
         return self._train_locations_cache
 
     # =========================================================================
@@ -1115,8 +1220,9 @@ class UnitHandle:
     @property
     def attacks(self) -> AttacksManager:
         """Combat attacks manager."""
+        self._check_sharing()
         if self._attacks_cache is None:
-            object.__setattr__(self, "_attacks_cache", AttacksManager(self._get_units()))
+            object.__setattr__(self, "_attacks_cache", self._wrap(AttacksManager))
         return self._attacks_cache
 
     @attacks.setter
@@ -1129,8 +1235,9 @@ class UnitHandle:
     @property
     def armours(self) -> ArmoursManager:
         """Combat armours manager."""
+        self._check_sharing()
         if self._armours_cache is None:
-            object.__setattr__(self, "_armours_cache", ArmoursManager(self._get_units()))
+            object.__setattr__(self, "_armours_cache", self._wrap(ArmoursManager))
         return self._armours_cache
 
     @armours.setter
@@ -1153,8 +1260,9 @@ class UnitHandle:
     @property
     def costs(self) -> CostWrapper:
         """Creatable resource_costs manager."""
+        self._check_sharing()
         if self._costs_cache is None:
-            object.__setattr__(self, "_costs_cache", CostWrapper(self._get_units()))
+            object.__setattr__(self, "_costs_cache", self._wrap(CostWrapper))
         return self._costs_cache
 
     @costs.setter
@@ -1167,8 +1275,9 @@ class UnitHandle:
     @property
     def resources(self) -> ResourceStoragesWrapper:
         """Resources manager."""
+        self._check_sharing()
         if self._resources_cache is None:
-            object.__setattr__(self, "_resources_cache", ResourceStoragesWrapper(self._get_units()))
+            object.__setattr__(self, "_resources_cache", self._wrap(ResourceStoragesWrapper))
         return self._resources_cache
 
     @resources.setter
@@ -1180,8 +1289,9 @@ class UnitHandle:
     @property
     def train_locations(self) -> TrainLocationsWrapper:
         """Train locations manager."""
+        self._check_sharing()
         if self._train_locations_cache is None:
-            object.__setattr__(self, "_train_locations_cache", TrainLocationsWrapper(self._get_units()))
+            object.__setattr__(self, "_train_locations_cache", self._wrap(TrainLocationsWrapper))
         return self._train_locations_cache
 
     @train_locations.setter
@@ -1194,8 +1304,9 @@ class UnitHandle:
     @property
     def annexes(self) -> AnnexesManager:
         """Building annexes manager."""
+        self._check_sharing()
         if self._annexes_cache is None:
-            object.__setattr__(self, "_annexes_cache", AnnexesManager(self._get_units()))
+            object.__setattr__(self, "_annexes_cache", self._wrap(AnnexesManager))
         return self._annexes_cache
 
     @annexes.setter
@@ -1223,8 +1334,9 @@ class UnitHandle:
     @property
     def drop_sites(self) -> DropSitesManager:
         """Drop sites manager."""
+        self._check_sharing()
         if self._drop_sites_cache is None:
-            object.__setattr__(self, "_drop_sites_cache", DropSitesManager(self._get_units()))
+            object.__setattr__(self, "_drop_sites_cache", self._wrap(DropSitesManager))
         return self._drop_sites_cache
 
     @drop_sites.setter
@@ -1456,6 +1568,9 @@ class UnitHandle:
 
     def _find_component(self, name: str) -> Optional[str]:
         """Find which component has the given attribute."""
+        accessor = _FLATTENED.get(name)
+        if accessor is not None:
+            return accessor.component
         # Use wrappers instead of raw unit struct
         for comp in _COMPONENTS:
             # Get wrapper instance (e.g. self.bird)
@@ -1475,39 +1590,45 @@ class UnitHandle:
 
     @property
     def behavior(self) -> BehaviorWrapper:
+        self._check_sharing()
         if self._behavior_cache is None:
-            self._behavior_cache = BehaviorWrapper(self._get_units())
+            self._behavior_cache = self._wrap(BehaviorWrapper)
         return self._behavior_cache
 
     @property
     def movement(self) -> MovementWrapper:
+        self._check_sharing()
         if self._movement_cache is None:
-            self._movement_cache = MovementWrapper(self._get_units())
+            self._movement_cache = self._wrap(MovementWrapper)
         return self._movement_cache
 
     @property
     def projectile(self) -> ProjectileWrapper:
+        self._check_sharing()
         if self._projectile_cache is None:
-            self._projectile_cache = ProjectileWrapper(self._get_units())
+            self._projectile_cache = self._wrap(ProjectileWrapper)
         return self._projectile_cache
 
     @property
     def creation(self) -> CreationWrapper:
+        self._check_sharing()
         if self._creation_cache is None:
-            self._creation_cache = CreationWrapper(self._get_units())
+            self._creation_cache = self._wrap(CreationWrapper)
         return self._creation_cache
 
     @property
     def building(self) -> BuildingWrapper:
+        self._check_sharing()
         if self._building_cache is None:
-            self._building_cache = BuildingWrapper(self._get_units())
+            self._building_cache = self._wrap(BuildingWrapper)
         return self._building_cache
     
     # Combat accessor appears to exist, but ensured here if needed
     @property
     def combat(self) -> CombatWrapper:
+        self._check_sharing()
         if self._combat_cache is None:
-            self._combat_cache = CombatWrapper(self._get_units())
+            self._combat_cache = self._wrap(CombatWrapper)
         return self._combat_cache
 
 
@@ -2183,20 +2304,20 @@ class UnitHandle:
     @property
     def attack_priority(self) -> Any:
         """Flattens creatable.attack_priority."""
-        return self.creatable.attack_priority
+        return self.creation.attack_priority
 
     @attack_priority.setter
     def attack_priority(self, value: Any) -> None:
-        self.creatable.attack_priority = value
+        self.creation.attack_priority = value
 
     @property
     def button_extended_tooltip_id(self) -> Any:
         """Flattens creatable.button_extended_tooltip_id."""
-        return self.creatable.button_extended_tooltip_id
+        return self.creation.button_extended_tooltip_id
 
     @button_extended_tooltip_id.setter
     def button_extended_tooltip_id(self, value: Any) -> None:
-        self.creatable.button_extended_tooltip_id = value
+        self.creation.button_extended_tooltip_id = value
 
     @property
     def button_hotkey_action(self) -> Any:
@@ -2813,5 +2934,8 @@ class UnitHandle:
         self.building.wwise_transform_sound_id = value
 
 
-
 # =========================================================================
+
+# Route the flattened properties found by wrappers/dispatch.py straight to
+# the unit structs instead of through their wrappers
+_FLATTENED: dict[str, FieldAccessor] = install_flattened(UnitHandle)
@@ -35,7 +35,8 @@ from aoe2_genie_tooling.Units.unit_collections import (
 
 class UnitHandle:
     __slots__ = (
-        "_workspace", "_unit_id", "_civ_ids", "_units_cache",
+        "_workspace", "_unit_id", "_civ_ids", "_units_cache", "_sharing", "_sharing_version",
+        "__weakref__",
         "_combat_cache", "_creation_cache", "_cost_cache", "_movement_cache",
         "_behavior_cache", "_projectile_cache", "_building_cache",
         "_tasks_cache", "_attacks_cache", "_armours_cache", 
@@ -3,7 +3,7 @@ UnitManager - Production-quality unit management for AoE2 DAT files.
 
 Ported from GenieUnitManager (genieutils-py) to work with GenieDatParser.
 
-This module provides create(), clone_into(), and move() methods that return
+This module provides create(), create_many(), clone_into(), move(), renumber() and delete() methods that return
 UnitHandle objects for intuitive, multi-civ unit editing.
 
 Example:
@@ -16,14 +16,40 @@ Example:
 
     # Move unit to new ID
     manager.move(src_unit_id=100, dst_unit_id=1501)
+
+    # Delete a unit (its slot becomes a placeholder)
+    manager.delete(1501)
+
+    # Renumber many units at once, rewriting every reference to them
+    manager.renumber({100: 1500, 101: 1501})
+
+    # Read a field of every unit in every civ as a NumPy array, edit, write back
+    columns = manager.to_columns(["hit_points", "max_range"])
+    columns["hit_points"][columns.mask("hit_points")] += 10
+    manager.from_columns(columns)
+
+    # Create many units at once
+    handles = manager.create_many([UnitSpec("Hero 1", base_unit_id=4), UnitSpec("Hero 2", base_unit_id=5)])
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Optional, Set
+
+from aoe2_genie_tooling.Base.core.handle_cache import HandleCache
+from aoe2_genie_tooling.Base.core.id_allocator import EMPTY, PLACEHOLDER, USED, IdAllocator
+from aoe2_genie_tooling.Base.core.journal import journaled
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.reference_rewriter import RewriteStats, plan_unit_references
+from aoe2_genie_tooling.Base.core.struct_cloner import clone_many, clone_value, copy_struct_into, deep_clone
+from aoe2_genie_tooling.Base.core.struct_schema import _ver_key
+from aoe2_genie_tooling.Units.unit_columns import UnitColumns, write_cells
+from aoe2_genie_tooling.Units.unit_divergence import Divergence, unit_divergence
+from aoe2_genie_tooling.Units.unit_sharing import UnitSharing
 
 if TYPE_CHECKING:
     from aoe2_genie_tooling.Base.workspace import GenieWorkspace
     from aoe2_genie_tooling.Units.unit_handle import UnitHandle
+    from aoe2_genie_tooling.Units.unit_spec import UnitSpec
 
 __all__ = ['UnitManager']
 
@@ -39,16 +65,38 @@ class UnitManager:
     - No explicit apply()/commit step - changes are immediate
     - Placeholder-based capacity extension (no None gaps)
     - Multi-civ support with per-civ override capability
+    - Indexed ID lookups and allocation policies (see IdAllocator)
     """
 
     def __init__(self, workspace: GenieWorkspace) -> None:
         """Initialize UnitManager with workspace reference."""
         self.workspace = workspace
+        self.sharing = UnitSharing(workspace)
+        # Which unit IDs are taken, built on first use
+        self.ids = IdAllocator("units", self._slot_states, self._slot_state)
+        # Placeholder prototype per (Unit class, version)
+        self._placeholders: Dict[Any, Any] = {}
+        # Name lookup per civ, created on first find_by_name() for that civ
+        self._name_indexes: Dict[int, NameIndex] = {}
+        # Handles returned by get(), keyed by (unit ID, civ IDs or None). The
+        # caches of a handle whose unit was reported changed are dropped
+        # before it is reused.
+        self._handles = HandleCache(
+            "units",
+            self._make_handle,
+            key_id=lambda key: key[0],
+            refresh=lambda handle: handle.invalidate_cache(),
+            reset_kinds=("civilizations",),
+        )
+        workspace.changes.subscribe(self.ids.on_change)
+        workspace.changes.subscribe(self._handles.on_change)
+        workspace.id_tracker.attach("units", self.ids)
 
     # -------------------------
     # Core CRUD Operations
     # -------------------------
 
+    @journaled
     def create(
         self,
         name: str,
@@ -57,6 +105,7 @@ class UnitManager:
         enable_for_civs: Optional[List[int]] = None,
         on_conflict: Literal["error", "overwrite"] = "error",
         fill_gaps: Literal["error", "placeholder"] = "placeholder",
+        share: bool = False,
     ) -> UnitHandle:
         """
         Create a new unit.
@@ -64,10 +113,13 @@ class UnitManager:
         Args:
             name: Name for the new unit
             base_unit_id: Unit ID to clone from. If None, uses first valid unit.
-            unit_id: Target unit ID. If None, appends to end.
+            unit_id: Target unit ID. If None, allocated by ids.policy
+                     (appends to end by default).
             enable_for_civs: List of civ IDs to enable for. If None, all civs.
             on_conflict: "error" to raise if ID exists, "overwrite" to replace
             fill_gaps: "error" to raise if gaps needed, "placeholder" to fill gaps
+            share: Put one Unit object into all enabled civs instead of a copy
+                   per civ (copy-on-write, see UnitSharing)
 
         Returns:
             UnitHandle for editing the created unit across all enabled civs
@@ -84,7 +136,6 @@ class UnitManager:
             TemplateNotFoundError,
             UnitIdConflictError,
         )
-        from aoe2_genie_tooling.Units.unit_handle import UnitHandle
 
         civs = self.workspace.dat.civilizations
 
@@ -98,6 +149,8 @@ class UnitManager:
         if enable_for_civs is None:
             enable_for_civs = list(range(len(civs)))
 
+        self._journal_touch([unit_id])
+
         # Check capacity for all civs
         self._ensure_capacity_all_civs(unit_id, fill_gaps)
 
@@ -121,17 +174,19 @@ class UnitManager:
             pass
         new_unit.enabled = True
 
-        # Insert into civs
-        for civ_id, civ in enumerate(civs):
-            if civ_id in enable_for_civs:
-                civs[civ_id].units[unit_id] = self._clone_unit(new_unit)
-            # Note: For civs not in enable_for_civs, we keep existing value or placeholder
+        # Insert into civs (shared, or one serialization and one parse per civ);
+        # civs not in enable_for_civs keep their existing unit or placeholder
+        enabled = [civ_id for civ_id in range(len(civs)) if civ_id in enable_for_civs]
+        self._place(new_unit, unit_id, enabled, share)
+        self.workspace.changes.mark("units", unit_id)
+        self.ids.mark_used(unit_id)
 
         # Track and register
         self._track_unit(name, unit_id, base_unit_id)
 
-        return UnitHandle(self.workspace, unit_id, enable_for_civs)
+        return self._handles.get((unit_id, tuple(enable_for_civs)))
 
+    @journaled
     def clone_into(
         self,
         dest_unit_id: int,
@@ -140,6 +195,7 @@ class UnitManager:
         enable_for_civs: Optional[List[int]] = None,
         on_conflict: Literal["error", "overwrite"] = "error",
         fill_gaps: Literal["error", "placeholder"] = "placeholder",
+        share: bool = False,
     ) -> UnitHandle:
         """
         Clone an existing unit into a specific destination ID.
@@ -154,6 +210,8 @@ class UnitManager:
             enable_for_civs: List of civ IDs. If None, all civs.
             on_conflict: "error" to raise if dest exists, "overwrite" to replace
             fill_gaps: "error" to raise if gaps needed, "placeholder" to fill gaps
+            share: Civs whose source units are identical share one Unit
+                   object instead of a copy each (copy-on-write)
 
         Returns:
             UnitHandle for editing the cloned unit
@@ -162,7 +220,6 @@ class UnitManager:
             InvalidIdError,
             UnitIdConflictError,
         )
-        from aoe2_genie_tooling.Units.unit_handle import UnitHandle
 
         self._validate_id_positive(dest_unit_id, "dest_unit_id")
         self._validate_id_positive(base_unit_id, "base_unit_id")
@@ -173,6 +230,8 @@ class UnitManager:
         if enable_for_civs is None:
             enable_for_civs = list(range(len(civs)))
 
+        self._journal_touch([dest_unit_id])
+
         # Ensure capacity
         self._ensure_capacity_all_civs(dest_unit_id, fill_gaps)
 
@@ -188,31 +247,159 @@ class UnitManager:
         if source is None:
             raise InvalidIdError(f"Base unit ID {base_unit_id} not found.")
 
-        # Clone into each civ
+        # Group civs by source content; each group gets one clone when sharing
+        groups = {}
         for civ_id, civ in enumerate(civs):
             if civ_id in enable_for_civs:
                 # Get civ-specific source if available
                 civ_source = civ.units[base_unit_id] if base_unit_id < len(civ.units) else None
                 if civ_source is None:
                     civ_source = source
+                key = civ_source.to_bytes() if share else civ_id
+                groups.setdefault(key, (civ_source, []))[1].append(civ_id)
 
-                new_unit = self._clone_unit(civ_source)
-                new_unit.id = dest_unit_id
-                if name is not None:
-                    try:
-                        new_unit.name = name
-                    except Exception:
-                        pass
-                new_unit.enabled = True
-
-                civ.units[dest_unit_id] = new_unit
+        for civ_source, civ_ids in groups.values():
+            new_unit = self._clone_unit(civ_source)
+            new_unit.id = dest_unit_id
+            if name is not None:
+                try:
+                    new_unit.name = name
+                except Exception:
+                    pass
+            new_unit.enabled = True
+            self._place(new_unit, dest_unit_id, civ_ids, share)
+        self.workspace.changes.mark("units", dest_unit_id)
+        self.ids.mark_used(dest_unit_id)
 
         # Track and register
         final_name = name if name else source.name
         self._track_unit_clone(final_name, dest_unit_id, base_unit_id)
 
-        return UnitHandle(self.workspace, dest_unit_id, enable_for_civs)
+        return self._handles.get((dest_unit_id, tuple(enable_for_civs)))
 
+    @journaled
+    def create_many(
+        self,
+        specs: Iterable[UnitSpec],
+        on_conflict: Literal["error", "overwrite"] = "error",
+        fill_gaps: Literal["error", "placeholder"] = "placeholder",
+        share: bool = False,
+    ) -> List[UnitHandle]:
+        """
+        Create many units in one pass.
+
+        Equivalent to calling create() once per spec, but every civ's unit
+        list is grown once, each template is looked up once, and every unit is
+        serialized once and parsed once per civ. Overrides on unit fields are
+        applied before that clone, so they cost nothing per civ.
+
+        IDs and templates are all checked before anything is written, so an
+        unknown base unit leaves the DAT unchanged. Templates are the base
+        units as they were before the call.
+
+        Args:
+            specs: UnitSpec per unit to create
+            on_conflict: "error" to raise if an ID exists, "overwrite" to replace
+            fill_gaps: "error" to raise if slots between the current end and the
+                       new IDs would be left without a unit, "placeholder" to
+                       fill them
+            share: Put one Unit object per spec into all its civs (copy-on-write)
+
+        Returns:
+            UnitHandle per spec, in input order
+
+        Raises:
+            UnitIdConflictError: If an ID exists (on_conflict="error") or two
+                                 specs target the same ID
+            GapNotAllowedError: If fill_gaps="error" and gaps would be created
+            TemplateNotFoundError: If no template unit can be found
+            InvalidIdError: If an ID is negative or a base unit does not exist
+        """
+        from aoe2_genie_tooling.Base.core.exceptions import (
+            GapNotAllowedError,
+            UnitIdConflictError,
+        )
+
+        specs = list(specs)
+        if not specs:
+            return []
+
+        civs = self.workspace.dat.civilizations
+        all_civs = list(range(len(civs)))
+
+        # Assign target IDs: explicit IDs first, then free IDs by ids.policy
+        explicit = set()
+        for spec in specs:
+            if spec.unit_id is not None:
+                self._validate_id_positive(spec.unit_id, "unit_id")
+                if spec.unit_id in explicit:
+                    raise UnitIdConflictError(f"Unit ID {spec.unit_id} is targeted by more than one spec.")
+                explicit.add(spec.unit_id)
+
+        free_ids = iter(self.ids.allocate_many(sum(spec.unit_id is None for spec in specs), exclude=explicit))
+        unit_ids = [spec.unit_id if spec.unit_id is not None else next(free_ids) for spec in specs]
+
+        # Conflicts against existing units
+        if on_conflict == "error":
+            for unit_id in unit_ids:
+                if self.exists(unit_id):
+                    raise UnitIdConflictError(
+                        f"Unit ID {unit_id} already exists. Use on_conflict='overwrite' to replace."
+                    )
+
+        # One template lookup per base unit, before anything is written
+        templates = {base: self._get_template(base) for base in dict.fromkeys(spec.base_unit_id for spec in specs)}
+
+        self._journal_touch(unit_ids)
+
+        # Grow every civ once; slots the batch fills are reserved as None
+        targets = set(unit_ids)
+        current = min(len(civ.units) for civ in civs) if civs else 0
+        gaps = [i for i in range(current, max(unit_ids) + 1) if i not in targets]
+        if gaps and fill_gaps == "error":
+            raise GapNotAllowedError(
+                f"Unit ID {max(unit_ids)} would leave {len(gaps)} empty slots starting at {gaps[0]}. "
+                "Use fill_gaps='placeholder' to extend with placeholders."
+            )
+        self._extend_all_civs(max(unit_ids), reserved=targets)
+
+        handle_overrides = []
+        try:
+            for spec, unit_id in zip(specs, unit_ids):
+                prototype = self._clone_unit(templates[spec.base_unit_id])
+                prototype.id = unit_id
+                try:
+                    prototype.name = spec.name
+                except Exception:
+                    pass
+                prototype.enabled = True
+                handle_overrides.append(self._apply_overrides(prototype, spec.overrides))
+
+                enabled = all_civs
+                if spec.enable_for_civs is not None:
+                    enabled = [c for c in all_civs if c in spec.enable_for_civs]
+                self._place(prototype, unit_id, enabled, share)
+        finally:
+            # Reserved slots not filled (civs a spec did not enable, or specs
+            # after a failing override) get placeholders
+            self._fill_reserved(targets)
+            for unit_id in targets:
+                self.workspace.changes.mark("units", unit_id)
+
+        handles = []
+        for spec, unit_id, overrides in zip(specs, unit_ids, handle_overrides):
+            self.ids.mark_used(unit_id)
+            self._track_unit(spec.name, unit_id, spec.base_unit_id, log=False)
+            civ_ids = all_civs if spec.enable_for_civs is None else list(spec.enable_for_civs)
+            handle = self._handles.get((unit_id, tuple(civ_ids)))
+            for name, value in overrides.items():
+                setattr(handle, name, value)
+            handles.append(handle)
+
+        self.workspace.logger.success(f"Created {len(handles)} units ({min(unit_ids)}-{max(unit_ids)})", "units")
+        return handles
+
+    @journaled
     def move(
         self,
         src_unit_id: int,
@@ -252,6 +439,8 @@ class UnitManager:
 
         civs = self.workspace.dat.civilizations
 
+        self._journal_touch([src_unit_id, dst_unit_id])
+
         # Ensure capacity at destination
         self._ensure_capacity_all_civs(dst_unit_id, fill_gaps)
 
@@ -296,10 +485,197 @@ class UnitManager:
                         placeholder = placeholder_factory()
                         placeholder.id = dst_unit_id
                         civ.units[dst_unit_id] = placeholder
+        self.sharing.move(src_unit_id, dst_unit_id, swap=(on_conflict == "swap"))
+        self.workspace.changes.mark("units", src_unit_id)
+        self.workspace.changes.mark("units", dst_unit_id)
+        self._invalidate_handles({src_unit_id, dst_unit_id})
 
         # Track
         self._track_unit_move(src_unit_id, dst_unit_id)
 
+    @journaled
+    def renumber(
+        self,
+        mapping: Dict[int, int],
+        fill_gaps: Literal["error", "placeholder"] = "placeholder",
+    ) -> RewriteStats:
+        """
+        Move many units to new IDs at once and rewrite all references to them.
+
+        The whole mapping is applied together, so swaps and chains
+        ({1: 2, 2: 1} or {1: 2, 2: 3}) work. Vacated slots get placeholders.
+        References are rewritten in one pass over the DAT: every unit
+        reference field in field_discovery.json (dead units, projectiles,
+        train locations, annexes, drop sites, tech research locations, ...),
+        unit copy/base IDs and the unit parameters of effect commands.
+
+        Args:
+            mapping: Old unit ID -> new unit ID
+            fill_gaps: "error" to raise if a new ID is past the end,
+                       "placeholder" to extend with placeholders
+
+        Returns:
+            RewriteStats describing the rewritten references
+
+        Raises:
+            InvalidIdError: If an ID is negative or a source unit doesn't exist
+            UnitIdConflictError: If two units get the same ID, or a new ID is
+                                 taken by a unit that is not renumbered itself
+            GapNotAllowedError: If fill_gaps="error" and gaps would be created
+        """
+        from aoe2_genie_tooling.Base.core.exceptions import (
+            InvalidIdError,
+            UnitIdConflictError,
+        )
+
+        mapping = {old: new for old, new in mapping.items() if old != new}
+        if not mapping:
+            return RewriteStats()
+
+        for old, new in mapping.items():
+            self._validate_id_positive(old, "src_unit_id")
+            self._validate_id_positive(new, "dst_unit_id")
+            if not self.exists(old):
+                raise InvalidIdError(f"Source unit ID {old} does not exist.")
+        if len(set(mapping.values())) != len(mapping):
+            raise UnitIdConflictError("Two units cannot be renumbered to the same ID.")
+        for new in mapping.values():
+            if new not in mapping and self.exists(new):
+                raise UnitIdConflictError(
+                    f"Destination unit ID {new} already exists and is not renumbered itself."
+                )
+
+        # Everything that can fail runs before the first unit moves: finding
+        # the references and building the placeholder for vacated slots
+        rewrite = plan_unit_references(self.workspace.dat, mapping, skip_slot=self.sharing.is_duplicate_slot)
+        vacated = set(mapping) - set(mapping.values())
+        if vacated:
+            self._placeholder_prototype()
+
+        journal = self.workspace._journal
+        if journal is not None:
+            # References to the moved units may be anywhere
+            for kind in ("units", "techs", "tech_effects"):
+                journal.touch_all(kind)
+
+        self._ensure_capacity_all_civs(max(mapping.values()), fill_gaps)
+
+        # Move the units: read every source slot of a civ before writing any
+        civs = self.workspace.dat.civilizations
+        needs_placeholder: Dict[int, List[int]] = {}
+        for civ_id, civ in enumerate(civs):
+            units = civ.units
+            moved = [(new, units[old]) for old, new in mapping.items()]
+            for new, unit in moved:
+                if unit is None:
+                    needs_placeholder.setdefault(new, []).append(civ_id)
+                    continue
+                unit.id = new
+                units[new] = unit
+            for old in vacated:
+                needs_placeholder.setdefault(old, []).append(civ_id)
+        self.sharing.renumber(mapping)
+        self._put_placeholders(needs_placeholder)
+
+        stats = rewrite.apply()
+        # The plan lists units by the slot they were read from
+        stats.units = {mapping.get(unit_id, unit_id) for unit_id in stats.units}
+
+        for unit_id in set(mapping) | set(mapping.values()) | stats.units:
+            self.workspace.changes.mark("units", unit_id)
+        self._invalidate_handles(set(mapping) | set(mapping.values()))
+        for tech_id in stats.techs:
+            self.workspace.changes.mark("techs", tech_id)
+        for effect_id in stats.tech_effects:
+            self.workspace.changes.mark("tech_effects", effect_id)
+        for old in vacated:
+            self.ids.mark_free(old)
+        for new in mapping.values():
+            self.ids.mark_used(new)
+
+        self.workspace.registry.remap_ids("units", mapping)
+        self.workspace.id_tracker.track_moves("units", mapping)
+        self.workspace.logger.info(
+            f"Renumbered {len(mapping)} units ({stats.references} references rewritten)", "units"
+        )
+        return stats
+
+    def compact(self, start: int = 0, stop: Optional[int] = None) -> Dict[int, int]:
+        """
+        Close the gaps between units in an ID range, keeping their order.
+
+        The units in [start, stop) are renumbered to consecutive IDs from
+        start (see renumber()); the freed slots at the end of the range are
+        left as placeholders.
+
+        Args:
+            start: First ID of the range
+            stop: End of the range (exclusive). If None, the end of the list.
+
+        Returns:
+            The mapping that was applied (old unit ID -> new unit ID)
+        """
+        self._validate_id_positive(start, "start")
+        stop = self.ids.size if stop is None else min(stop, self.ids.size)
+        used = [unit_id for unit_id in range(start, stop) if self.ids.is_used(unit_id)]
+        mapping = {old: new for new, old in enumerate(used, start) if old != new}
+        self.renumber(mapping)
+        return mapping
+
+    @journaled
+    def delete(self, unit_id: int, civ_ids: Optional[List[int]] = None) -> None:
+        """
+        Delete a unit.
+
+        The slot keeps a placeholder (not None), so later IDs do not shift.
+
+        Args:
+            unit_id: Unit ID to delete
+            civ_ids: Civs to delete it from. If None, all civs.
+
+        Raises:
+            InvalidIdError: If the unit doesn't exist
+        """
+        from aoe2_genie_tooling.Base.core.exceptions import InvalidIdError
+
+        if not self.exists(unit_id):
+            raise InvalidIdError(f"Unit ID {unit_id} does not exist.")
+
+        civs = self.workspace.dat.civilizations
+        targets = range(len(civs)) if civ_ids is None else civ_ids
+        placeholder_factory = self._create_unit_placeholder_factory()
+
+        self._journal_touch([unit_id], civ_ids)
+        self.sharing.detach(unit_id, civ_ids)
+        for civ_id in targets:
+            units = civs[civ_id].units
+            if unit_id < len(units) and units[unit_id] is not None:
+                placeholder = placeholder_factory()
+                placeholder.id = unit_id
+                units[unit_id] = placeholder
+        self.workspace.changes.mark("units", unit_id)
+        self._invalidate_handles({unit_id})
+        if civ_ids is None:
+            self.ids.mark_free(unit_id)
+
+        self.workspace.logger.info(f"Deleted unit {unit_id}", "units")
+
+    def unshare(self, unit_id: Optional[int] = None, civ_ids: Optional[List[int]] = None) -> None:
+        """
+        Give civs their own copy of units created with share=True.
+
+        Needed before editing a shared unit directly through workspace.dat;
+        UnitHandles take care of this themselves.
+
+        Args:
+            unit_id: Unit to unshare. If None, all shared units.
+            civ_ids: Civs to give copies. If None, all civs sharing the unit.
+        """
+        if unit_id is None:
+            self.sharing.materialize_all()
+        else:
+            self.sharing.materialize(unit_id, civ_ids)
+
     # -------------------------
     # Query Operations
     # -------------------------
@@ -319,15 +695,11 @@ class UnitManager:
             InvalidIdError: If unit doesn't exist
         """
         from aoe2_genie_tooling.Base.core.exceptions import InvalidIdError
-        from aoe2_genie_tooling.Units.unit_handle import UnitHandle
 
         if not self.exists(unit_id):
             raise InvalidIdError(f"Unit ID {unit_id} does not exist.")
 
-        if civ_ids is None:
-            civ_ids = list(range(len(self.workspace.dat.civilizations)))
-
-        return UnitHandle(self.workspace, unit_id, civ_ids)
+        return self._handles.get((unit_id, None if civ_ids is None else tuple(civ_ids)))
 
     def get_unit(self, unit_id: int, civ_id: int = 0) -> Optional[Any]:
         """
@@ -355,15 +727,9 @@ class UnitManager:
 
         A "placeholder" unit is detected by: enabled=0 AND name="" AND hit_points=1
         This allows distinguishing real units from capacity placeholders.
+        Answered from the ID index (see IdAllocator).
         """
-        for civ in self.workspace.dat.civilizations:
-            if 0 <= unit_id < len(civ.units):
-                unit = civ.units[unit_id]
-                if unit is not None:
-                    # Check if it's a placeholder
-                    if not self._is_placeholder(unit):
-                        return True
-        return False
+        return self.ids.is_used(unit_id)
 
     def exists_raw(self, unit_id: int) -> bool:
         """
@@ -371,11 +737,7 @@ class UnitManager:
 
         Unlike exists(), this returns True for placeholders too.
         """
-        for civ in self.workspace.dat.civilizations:
-            if 0 <= unit_id < len(civ.units):
-                if civ.units[unit_id] is not None:
-                    return True
-        return False
+        return self.ids.state(unit_id) != EMPTY
 
     def count(self) -> int:
         """Return the total number of unit slots in civ 0."""
@@ -384,44 +746,229 @@ class UnitManager:
             return 0
         return len(civs[0].units)
 
-    def find_by_name(self, name: str, civ_id: int = 0) -> Optional[UnitHandle]:
+    def find_by_name(self, name: str, civ_id: int = 0, case_sensitive: bool = True) -> Optional[UnitHandle]:
         """
         Find first unit matching name in the specified civ.
 
         Args:
             name: Unit name to search for
             civ_id: Civilization ID to search in (default 0)
+            case_sensitive: Set False to ignore case
 
         Returns:
             UnitHandle for the unit, or None if not found
         """
-        from aoe2_genie_tooling.Units.unit_handle import UnitHandle
+        if not 0 <= civ_id < len(self.workspace.dat.civilizations):
+            return None
+        unit_id = self.name_index(civ_id).find(name, case_sensitive)
+        return None if unit_id is None else self._handles.get((unit_id, None))
+
+    def find_by_prefix(self, prefix: str, civ_id: int = 0, case_sensitive: bool = False) -> List[UnitHandle]:
+        """
+        Find all units whose name starts with prefix in the specified civ.
+
+        Args:
+            prefix: Start of the unit name
+            civ_id: Civilization ID to search in (default 0)
+            case_sensitive: Set True to match case
+
+        Returns:
+            UnitHandles in ID order
+        """
+        if not 0 <= civ_id < len(self.workspace.dat.civilizations):
+            return []
+        return [self._handles.get((i, None)) for i in self.name_index(civ_id).find_prefix(prefix, case_sensitive)]
+
+    def name_index(self, civ_id: int = 0) -> NameIndex:
+        """
+        Name lookup over the units of one civ (placeholders excluded).
+
+        Built on the first lookup; kept in sync through the change tracker.
+        """
+        index = self._name_indexes.get(civ_id)
+        if index is None:
+            index = NameIndex(
+                "units",
+                lambda: self._civ_unit_count(civ_id),
+                lambda unit_id: self._unit_name(civ_id, unit_id),
+                reset_kinds=("civilizations",),
+            )
+            self._name_indexes[civ_id] = index
+            self.workspace.changes.subscribe(index.on_change)
+        return index
+
+    # -------------------------
+    # Columnar Operations
+    # -------------------------
+
+    def to_columns(self, fields: Iterable[str], civ_ids: Optional[List[int]] = None) -> UnitColumns:
+        """
+        Read fields of every unit into NumPy arrays indexed by (civ row, unit ID).
 
+        One pass over the raw structs instead of a property call per unit,
+        civ and field. Needs NumPy (pip install aoe2-genie-tooling[numpy]).
+
+        Args:
+            fields: Flattened UnitHandle names ("hit_points", "max_range"),
+                    dotted raw paths ("combat_info.max_range") or cost
+                    columns ("food_cost", "wood_cost", "stone_cost", "gold_cost")
+            civ_ids: Civs to read, one row each. If None, all civs.
+
+        Returns:
+            UnitColumns; cells of placeholders and of units without the
+            field's component are masked out
+        """
         civs = self.workspace.dat.civilizations
-        if civ_id < 0 or civ_id >= len(civs):
-            return None
+        civ_ids = list(range(len(civs))) if civ_ids is None else list(civ_ids)
+        return UnitColumns.read(civs, civ_ids, list(fields), self._is_placeholder)
 
-        for i, unit in enumerate(civs[civ_id].units):
-            if unit is not None and not self._is_placeholder(unit):
-                unit_name = ""
-                try:
-                    unit_name = unit.name
-                except Exception:
-                    pass
-                if unit_name == name:
-                    return UnitHandle(self.workspace, i)
-        return None
+    @journaled
+    def from_columns(self, columns: UnitColumns, fields: Optional[Iterable[str]] = None) -> int:
+        """
+        Write the cells changed since to_columns() back to the units.
+
+        Only readable cells (mask True) whose value differs from what was
+        read are written. Shared units are written once when every civ
+        sharing them gets the same values, otherwise the civs are given
+        their own copies first.
+
+        Args:
+            columns: Result of to_columns(), with modified arrays
+            fields: Fields to write. If None, all fields of columns.
+
+        Returns:
+            Number of (civ, unit) cells written
+        """
+        fields = None if fields is None else list(fields)
+        writes = columns.writes(fields)
+        if not writes:
+            return 0
+
+        by_unit: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        for (civ_id, unit_id), values in writes.items():
+            by_unit.setdefault(unit_id, {})[civ_id] = values
+
+        read_civs = set(columns.civ_ids)
+        for unit_id, civ_writes in by_unit.items():
+            for group in self.sharing.groups(unit_id):
+                writers = [civ_id for civ_id in group if civ_id in civ_writes]
+                if not writers:
+                    continue
+                first = civ_writes[writers[0]]
+                if group <= read_civs and all(civ_writes.get(civ_id) == first for civ_id in group):
+                    # The shared object takes the same values for everyone
+                    for civ_id in writers[1:]:
+                        del writes[(civ_id, unit_id)]
+                else:
+                    self.sharing.materialize(unit_id, writers)
+
+        civs = self.workspace.dat.civilizations
+        batch = self.workspace._batch
+        if batch is not None and batch.rollback_enabled:
+            for civ_id, unit_id in writes:
+                batch.save("units", unit_id, civs[civ_id].units[unit_id])
+        for unit_id, civ_writes in by_unit.items():
+            self._journal_touch([unit_id], list(civ_writes))
+        written = write_cells(civs, writes)
+        for unit_id in by_unit:
+            self.workspace.changes.mark("units", unit_id)
+        columns.commit(fields)
+        return len(written)
+
+    # -------------------------
+    # Per-Civ Comparison
+    # -------------------------
+
+    def divergence(self, unit_ids: Optional[Iterable[int]] = None) -> List[Divergence]:
+        """
+        Report the fields of units that differ between civs.
+
+        Civs are grouped by a content hash of their copy of the unit, cached
+        with the workspace fingerprint and rehashed only after writes, so
+        units that are identical in every civ are skipped without reading
+        their fields. Only one civ per distinct version is compared field by
+        field. Civs without the unit (empty slot or placeholder) are left out.
+
+        Args:
+            unit_ids: Units to check. If None, all units.
+
+        Returns:
+            (unit ID, field, civ ID -> value) per differing field. Fields are
+            dotted raw paths ("hit_points", "combat_info.attacks[1].amount");
+            a list whose length differs is reported whole.
+
+        Example:
+            for unit_id, field, values in unit_manager.divergence([4]):
+                print(field, values)   # hit_points {0: 30, 1: 30, 2: 35, ...}
+        """
+        workspace = self.workspace
+        workspace.changes.flush()
+        digests = workspace._get_fingerprinter().unit_digests()
+        civs = workspace.dat.civilizations
+        if unit_ids is None:
+            unit_ids = range(max((len(civ.units) for civ in civs if civ is not None), default=0))
+        return unit_divergence(civs, digests, unit_ids, self._is_placeholder)
+
+    def _civ_unit_count(self, civ_id: int) -> int:
+        civs = self.workspace.dat.civilizations
+        return len(civs[civ_id].units) if civ_id < len(civs) else 0
+
+    def _unit_name(self, civ_id: int, unit_id: int) -> List[str]:
+        unit = self.workspace.dat.civilizations[civ_id].units[unit_id]
+        if unit is None or self._is_placeholder(unit):
+            return []
+        return [unit.name]
 
     # -------------------------
     # Internal Helpers
     # -------------------------
 
+    def _make_handle(self, key: Any) -> UnitHandle:
+        from aoe2_genie_tooling.Units.unit_handle import UnitHandle
+
+        unit_id, civ_ids = key
+        return UnitHandle(self.workspace, unit_id, None if civ_ids is None else list(civ_ids))
+
+    def _journal_touch(self, unit_ids: Iterable[int], civ_ids: Optional[List[int]] = None) -> None:
+        """Let the workspace journal (if enabled) capture unit slots before an operation writes them."""
+        journal = self.workspace._journal
+        if journal is not None:
+            for unit_id in unit_ids:
+                journal.touch("units", unit_id, civ_ids)
+
+    def _invalidate_handles(self, unit_ids: Set[int]) -> None:
+        """Clear the caches of live handles to units whose slots were replaced."""
+        for handle in self._handles.handles():
+            if handle._unit_id in unit_ids:
+                handle.invalidate_cache()
+
     def _allocate_next_unit_id(self) -> int:
-        """Allocates the next unit ID based on civ[0]'s unit list length."""
-        civs = self.workspace.dat.civilizations
-        if not civs:
-            return 0
-        return len(civs[0].units)
+        """Allocates the next unit ID by ids.policy (default: end of the unit list)."""
+        return self.ids.allocate()
+
+    def _slot_states(self) -> bytearray:
+        """Scan every civ once for the state of each unit slot (IdAllocator scan)."""
+        civs = [civ for civ in self.workspace.dat.civilizations if civ is not None]
+        states = bytearray(max((len(civ.units) for civ in civs), default=0))
+        is_placeholder = self._is_placeholder
+        for civ in civs:
+            for index, unit in enumerate(civ.units):
+                if unit is None or states[index] == USED:
+                    continue
+                states[index] = PLACEHOLDER if is_placeholder(unit) else USED
+        return states
+
+    def _slot_state(self, unit_id: int) -> int:
+        """State of one unit slot across all civs (IdAllocator check)."""
+        state = EMPTY
+        for civ in self.workspace.dat.civilizations:
+            if civ is not None and 0 <= unit_id < len(civ.units):
+                unit = civ.units[unit_id]
+                if unit is not None:
+                    if not self._is_placeholder(unit):
+                        return USED
+                    state = PLACEHOLDER
+        return state
 
     def _validate_id_positive(self, id_value: int, name: str = "ID") -> None:
         """Validates that an ID is non-negative."""
@@ -456,14 +1003,95 @@ class UnitManager:
                 "Use fill_gaps='placeholder' to extend with placeholders."
             )
 
-        # Create placeholder factory
-        placeholder_factory = self._create_unit_placeholder_factory()
+        if needs_extension:
+            self._extend_all_civs(required_index, reserved=set())
 
-        for civ in civs:
-            while len(civ.units) <= required_index:
-                placeholder = placeholder_factory()
-                placeholder.id = len(civ.units)
-                civ.units.append(placeholder)
+    def _place(self, unit: Any, unit_id: int, civ_ids: List[int], share: bool) -> None:
+        """Put a finished unit into the unit_id slot of civs, shared or as copies."""
+        if share:
+            self.sharing.place(unit, unit_id, civ_ids)
+            return
+        self.sharing.detach(unit_id, civ_ids)
+        civs = self.workspace.dat.civilizations
+        clones = [unit] + clone_many(unit, len(civ_ids) - 1) if civ_ids else []
+        for civ_id, clone in zip(civ_ids, clones):
+            civs[civ_id].units[unit_id] = clone
+
+    def _put_placeholders(self, slots: Dict[int, List[int]]) -> None:
+        """
+        Put a placeholder into the given civs of each slot.
+
+        Each slot gets one placeholder, placed through UnitSharing so the
+        civs holding it form a copy-on-write group (or get copies where
+        bfp_rs cannot share structs).
+        """
+        for (index, civ_ids), placeholder in zip(sorted(slots.items()), self._new_placeholders(len(slots))):
+            placeholder.id = index
+            self.sharing.place(placeholder, index, civ_ids)
+
+    def _extend_all_civs(self, required_index: int, reserved: Set[int]) -> None:
+        """
+        Grow every civ's unit list up to required_index in one pass.
+
+        Indexes in reserved are appended as None for the caller to fill;
+        all other new slots get placeholders. One placeholder is parsed per
+        slot and appended to every civ with a single extend() per civ; the
+        slot is then shared (copy-on-write) by the civs that got it, unless
+        bfp_rs already stored a copy per civ.
+        """
+        civs = self.workspace.dat.civilizations
+        lengths = [len(civ.units) for civ in civs]
+        if all(length > required_index for length in lengths):
+            return
+
+        first = min(lengths)
+        indexes = [i for i in range(first, required_index + 1) if i not in reserved]
+        placeholders = dict(zip(indexes, self._new_placeholders(len(indexes))))
+        for index, placeholder in placeholders.items():
+            placeholder.id = index
+        new_slots = [placeholders.get(i) for i in range(first, required_index + 1)]
+
+        for civ, length in zip(civs, lengths):
+            if length <= required_index:
+                civ.units.extend(new_slots[length - first:])
+
+        for index in indexes:
+            civ_ids = [civ_id for civ_id, length in enumerate(lengths) if length <= index]
+            # Groups left over from a slot that was removed do not apply to the new one
+            self.sharing.detach(index, civ_ids)
+            self.sharing.adopt(index, civ_ids)
+        self.ids.grow(required_index + 1)
+
+    def _fill_reserved(self, reserved: Set[int]) -> None:
+        """Replace reserved slots that are still None with placeholders."""
+        placeholder_factory = None
+        for civ in self.workspace.dat.civilizations:
+            for index in reserved:
+                if index < len(civ.units) and civ.units[index] is None:
+                    if placeholder_factory is None:
+                        placeholder_factory = self._create_unit_placeholder_factory()
+                    placeholder = placeholder_factory()
+                    placeholder.id = index
+                    civ.units[index] = placeholder
+
+    def _apply_overrides(self, unit: Any, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Set overrides that name unit fields (or dotted paths) on a raw unit.
+
+        Returns:
+            The overrides that are not unit fields, to be set through a UnitHandle
+        """
+        remaining = {}
+        for name, value in overrides.items():
+            *path, attr = name.split(".")
+            target = unit
+            for part in path:
+                target = getattr(target, part)
+            if path or hasattr(type(unit), attr):
+                setattr(target, attr, value)
+            else:
+                remaining[name] = value
+        return remaining
 
     def _get_template(self, base_unit_id: Optional[int]) -> Any:
         """
@@ -519,314 +1147,79 @@ class UnitManager:
 
         Returns -1 if no real units exist.
         """
-        max_id = -1
-        for civ in self.workspace.dat.civilizations:
-            for i in range(len(civ.units) - 1, -1, -1):
-                unit = civ.units[i]
-                if unit is not None and not self._is_placeholder(unit):
-                    if i > max_id:
-                        max_id = i
-                    break
-        return max_id
+        return self.ids.highest_used()
 
     def _create_unit_placeholder_factory(self) -> Callable[[], Any]:
         """Returns a factory function that creates placeholder units."""
+        prototype = self._placeholder_prototype()
+
+        def factory() -> Any:
+            return self._clone_unit(prototype)
+
+        return factory
+
+    def _new_placeholders(self, count: int) -> List[Any]:
+        """Create count placeholder units, serializing the prototype once."""
+        if count <= 0:
+            return []
+        return clone_many(self._placeholder_prototype(), count)
+
+    def _placeholder_prototype(self) -> Any:
+        """
+        Get the placeholder unit for the DAT's unit version, built once.
+
+        The first valid unit is cloned and turned into a placeholder
+        (disabled, empty name, 1 HP); every placeholder is a copy of it.
+        """
         from aoe2_genie_tooling.Base.core.exceptions import TemplateNotFoundError
 
         template = self._find_first_valid_unit()
+        key = (type(template), _ver_key(template.ver)) if template is not None else None
+        prototype = self._placeholders.get(key)
+        if prototype is not None:
+            return prototype
         if template is None:
             raise TemplateNotFoundError(
                 "Cannot create placeholder factory: no valid template unit found."
             )
 
-        def factory() -> Any:
-            placeholder = self._clone_unit(template)
-            try:
-                placeholder.name = ""
-            except Exception:
-                pass
-            placeholder.enabled = False
-            placeholder.hit_points = 1
-            return placeholder
-
-        return factory
-
-    def _clone_base_struct(self, source: Any, depth: int = 0, debug: bool = False) -> Any:
-        """
-        Recursively clone a bfp_rs.BaseStruct object.
-        
-        Creates a new instance of the same class and copies all attributes.
-        Handles nested BaseStruct objects and lists recursively.
-        
-        NOTE: bfp_rs.Retriever list fields (like attacks, armors, tasks) use
-        copy semantics - setattr copies items into internal storage. We must
-        use getattr(new_obj, name).extend(cloned_items) to populate lists.
-        """
-        indent = "  " * depth
-        if source is None:
-            return None
-            
-        # Get the class to instantiate
-        cls = source.__class__
-        
-        # Create new instance (bfp_rs.BaseStruct types need ver argument)
+        prototype = self._clone_unit(template)
         try:
-            if hasattr(source, 'ver'):
-                new_obj = cls(ver=source.ver)
-            else:
-                new_obj = cls()
-            if debug:
-                print(f"{indent}Created new {cls.__name__}: id {id(source)} -> {id(new_obj)}")
-        except Exception as e:
-            # If we can't create a new instance, return the original (last resort)
-            if debug:
-                print(f"{indent}FAILED to create {cls.__name__}: {e}")
-            return source
-        
-        # Copy all public attributes
-        for name in dir(source):
-            if name.startswith("_"):
-                continue
-            if name == "ver":  # Already set in constructor
-                continue
-            try:
-                attr = getattr(source, name)
-                if callable(attr):
-                    continue
-                
-                # Special handling for lists: bfp_rs.Retriever uses copy semantics
-                # We need to extend the new object's list with cloned items
-                if isinstance(attr, list):
-                    try:
-                        target_list = getattr(new_obj, name)
-                        if isinstance(target_list, list):
-                            # Clone each item and extend the target list
-                            cloned_items = [self._clone_value(item, depth + 1, debug) for item in attr]
-                            target_list.extend(cloned_items)
-                            if debug:
-                                print(f"{indent}  Extended {name} with {len(cloned_items)} items")
-                            continue
-                    except Exception:
-                        pass
-                
-                # For non-list attributes, recursively clone and setattr
-                val = self._clone_value(attr, depth + 1, debug)
-                
-                try:
-                    setattr(new_obj, name, val)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-        
-        return new_obj
-    
-    def _clone_value(self, value: Any, depth: int = 0, debug: bool = False) -> Any:
-        """
-        Clone a single value, handling lists and BaseStruct objects recursively.
-        """
-        indent = "  " * depth
-        if value is None:
-            return None
-        
-        # Handle lists - create new list with cloned items
-        if isinstance(value, list):
-            if debug:
-                print(f"{indent}Cloning list of {len(value)} items")
-            new_list = [self._clone_value(item, depth + 1, debug) for item in value]
-            if debug:
-                print(f"{indent}  Original list id: {id(value)}, New list id: {id(new_list)}")
-            return new_list
-        
-        # Handle bfp_rs.BaseStruct objects (have 'ver' attribute and are not primitives)
-        if hasattr(value, 'ver') and hasattr(value, '__class__'):
-            # Additional check: make sure it's not a primitive type masquerading
-            if not isinstance(value, (int, float, str, bool)):
-                if debug:
-                    print(f"{indent}Cloning BaseStruct: {type(value).__name__}")
-                return self._clone_base_struct(value, depth, debug)
-        
-        # For primitives (int, float, str, bool, etc.), return as-is
-        return value
+            prototype.name = ""
+        except Exception:
+            pass
+        prototype.enabled = False
+        prototype.hit_points = 1
+        self._placeholders[key] = prototype
+        return prototype
 
     def _clone_unit(self, source: Any) -> Any:
         """
-        Clone a Unit object manually to avoid shared references.
+        Clone a Unit object without shared references.
         
-        Due to bfp_rs.Retriever behavior:
-        - Nested BaseStruct fields (combat_info, task_info) have separate internal storage
-        - Assigning cloned objects doesn't update their nested list storage
-        - We must modify the new Unit's existing nested fields IN-PLACE
-        - List fields use clear() + extend() with cloned items
-        - type_ MUST be set first to trigger proper struct initialization
+        The unit is serialized and parsed back. If that fails, the compiled
+        cloner copies it field by field instead: fields in declaration order
+        (so type_ is set first), lists as new lists of cloned items and nested
+        info structs into the new unit's own instances.
         """
-        from sections.civilization.unit import Unit
-
-        new_unit = Unit(ver=source.ver)
-        
-        # CRITICAL: Set type_ FIRST to trigger proper nested struct initialization
-        # The disable_types() callback in bfp_rs sets structs to None based on type
-        # If we set type_ after creation, the correct structs will be initialized
-        try:
-            new_unit.type_ = source.type_
-        except Exception:
-            pass
-        
-        # Nested struct fields that need special in-place handling
-        NESTED_STRUCT_FIELDS = {
-            'combat_info', 'task_info', 'animation_info', 'movement_info',
-            'creation_info', 'projectile_info', 'building_info'
-        }
-
-        # Copy all public attributes
-        for name in dir(source):
-            if name.startswith("_"):
-                continue
-            if name == "ver":  # Already set in constructor
-                continue
-            if name == "type_":  # Already set above
-                continue
-            try:
-                attr = getattr(source, name)
-                if callable(attr):
-                    continue
-                
-                # Handle nested struct fields with in-place modification
-                if name in NESTED_STRUCT_FIELDS:
-                    if attr is not None:
-                        target = getattr(new_unit, name)
-                        
-                        # CRITICAL: Check if target IS the same object as source
-                        # This can happen due to bfp_rs internal storage behavior
-                        # If so, we MUST create a new struct instance
-                        if target is attr or target is None:
-                            try:
-                                cls = attr.__class__
-                                new_struct = cls(ver=source.ver)
-                                setattr(new_unit, name, new_struct)
-                                target = getattr(new_unit, name)
-                                # If still the same (setattr didn't work), warn
-                                if target is attr:
-                                    # Last resort: can't create independent struct
-                                    pass
-                            except Exception:
-                                target = None
-                        
-                        if target is not None and target is not attr:
-                            self._copy_struct_inplace(attr, target)
-                    continue
-                
-                # Handle lists at Unit level (resources, damage_sprites)
-                if isinstance(attr, list):
-                    target_list = getattr(new_unit, name)
-                    if isinstance(target_list, list):
-                        cloned_items = [self._clone_item(item) for item in attr]
-                        # CRITICAL: Always use setattr to trigger bfp_rs copy semantics!
-                        # Using clear()+extend() does NOT work because bfp_rs lists
-                        # share internal storage even when Python wrapper IDs differ.
-                        try:
-                            setattr(new_unit, name, cloned_items)
-                        except Exception:
-                            # Fallback: clear and extend (may still cause issues)
-                            target_list.clear()
-                            target_list.extend(cloned_items)
-                    continue
-                
-                # Scalar values - use setattr
-                try:
-                    setattr(new_unit, name, attr)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-        return new_unit
+        return deep_clone(source)
     
     def _copy_struct_inplace(self, source: Any, target: Any) -> None:
-        """
-        Copy attributes from source struct into target struct IN-PLACE.
-        
-        Lists are handled carefully to ensure no shared references:
-        - If target_list IS source_list (same object), use setattr to force new list
-        - Otherwise, use clear() + extend() for in-place update
-        """
-        for name in dir(source):
-            if name.startswith("_"):
-                continue
-            if name == "ver":
-                continue
-            try:
-                attr = getattr(source, name)
-                if callable(attr):
-                    continue
-                
-                # Handle lists - ensure no shared references
-                if isinstance(attr, list):
-                    source_list = attr
-                    target_list = getattr(target, name)
-                    if isinstance(target_list, list):
-                        cloned_items = [self._clone_item(item) for item in source_list]
-                        # CRITICAL: Always use setattr to trigger bfp_rs copy semantics!
-                        # Using clear()+extend() does NOT work because bfp_rs lists
-                        # share internal storage even when Python wrapper IDs differ.
-                        # setattr with a new list forces bfp_rs to copy into independent storage.
-                        try:
-                            setattr(target, name, cloned_items)
-                        except Exception:
-                            # Last resort: clear and extend (may still cause issues)
-                            target_list.clear()
-                            target_list.extend(cloned_items)
-                    continue
-                
-                # Handle nested structs recursively
-                if hasattr(attr, 'ver') and not isinstance(attr, (int, float, str, bool)):
-                    target_nested = getattr(target, name)
-                    if target_nested is not None:
-                        self._copy_struct_inplace(attr, target_nested)
-                    continue
-                
-                # Scalar values
-                try:
-                    setattr(target, name, attr)
-                except Exception:
-                    pass
-            except Exception:
-                pass
+        """Copy attributes from source struct into target struct IN-PLACE."""
+        copy_struct_into(source, target)
     
     def _clone_item(self, item: Any) -> Any:
         """Clone a single item (for list contents like DamageClass, UnitTask)."""
-        if item is None:
-            return None
-        
-        # For BaseStruct items, create new instance and copy attributes
-        if hasattr(item, 'ver') and not isinstance(item, (int, float, str, bool)):
-            cls = item.__class__
-            try:
-                new_item = cls(ver=item.ver) if hasattr(item, 'ver') else cls()
-                # Copy all public attributes
-                for name in dir(item):
-                    if name.startswith("_") or name == "ver":
-                        continue
-                    try:
-                        attr = getattr(item, name)
-                        if not callable(attr):
-                            setattr(new_item, name, attr)
-                    except Exception:
-                        pass
-                return new_item
-            except Exception:
-                return item
-        
-        # Primitives returned as-is
-        return item
+        return clone_value(item)
 
     # -------------------------
     # Tracking Helpers
     # -------------------------
 
-    def _track_unit(self, name: str, unit_id: int, base_unit_id: Optional[int] = None) -> None:
-        """Log and register a unit creation."""
-        self.workspace.logger.success(f"Created unit '{name}' at ID {unit_id}", "units")
+    def _track_unit(self, name: str, unit_id: int, base_unit_id: Optional[int] = None, log: bool = True) -> None:
+        """Log and register a unit creation (log=False for batches that log a summary)."""
+        if log:
+            self.workspace.logger.success(f"Created unit '{name}' at ID {unit_id}", "units")
         self.workspace.registry.register_unit(name, unit_id, base_unit_id=base_unit_id)
 
     def _track_unit_clone(self, name: str, unit_id: int, source_id: int) -> None:
@@ -1,12 +1,21 @@
 """Type stubs for UnitManager - enables IDE autocomplete"""
-from typing import Any, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
+from aoe2_genie_tooling.Base.core.id_allocator import IdAllocator
+from aoe2_genie_tooling.Base.core.name_index import NameIndex
+from aoe2_genie_tooling.Base.core.reference_rewriter import RewriteStats
+from aoe2_genie_tooling.Units.unit_columns import UnitColumns
 from aoe2_genie_tooling.Units.unit_handle import UnitHandle
+from aoe2_genie_tooling.Units.unit_spec import UnitSpec
+from aoe2_genie_tooling.Units.unit_sharing import UnitSharing
 
 
 class UnitManager:
     """Manager for creating, cloning, and moving units in a DAT file."""
     
+    sharing: UnitSharing
+    ids: IdAllocator
+
     def create(
         self,
         name: str,
@@ -15,6 +24,7 @@ class UnitManager:
         enable_for_civs: Optional[List[int]] = None,
         on_conflict: Literal["error", "overwrite"] = "error",
         fill_gaps: Literal["error", "placeholder"] = "placeholder",
+        share: bool = False,
     ) -> UnitHandle:
         """
         Create a new unit.
@@ -22,13 +32,36 @@ class UnitManager:
         Args:
             name: Name for the new unit
             base_unit_id: Unit ID to clone from. If None, uses first valid unit.
-            unit_id: Target unit ID. If None, appends to end.
+            unit_id: Target unit ID. If None, allocated by ids.policy
+                     (appends to end by default).
             enable_for_civs: List of civ IDs to enable for. None = all civs.
             on_conflict: "error" or "overwrite"
             fill_gaps: "error" or "placeholder"
+            share: One Unit object for all enabled civs (copy-on-write)
         """
         ...
     
+    def create_many(
+        self,
+        specs: Iterable[UnitSpec],
+        on_conflict: Literal["error", "overwrite"] = "error",
+        fill_gaps: Literal["error", "placeholder"] = "placeholder",
+        share: bool = False,
+    ) -> List[UnitHandle]:
+        """
+        Create many units in one pass (one list growth, one clone per civ).
+
+        Args:
+            specs: UnitSpec per unit (name, base unit, target ID, civs, overrides)
+            on_conflict: "error" or "overwrite"
+            fill_gaps: "error" or "placeholder"
+            share: One Unit object per spec for all its civs (copy-on-write)
+
+        Returns:
+            UnitHandle per spec, in input order
+        """
+        ...
+
     def clone_into(
         self,
         dest_unit_id: int,
@@ -37,6 +70,7 @@ class UnitManager:
         enable_for_civs: Optional[List[int]] = None,
         on_conflict: Literal["error", "overwrite"] = "error",
         fill_gaps: Literal["error", "placeholder"] = "placeholder",
+        share: bool = False,
     ) -> UnitHandle:
         """Clone an existing unit into a specific destination ID."""
         ...
@@ -51,8 +85,28 @@ class UnitManager:
         """Move a unit from source ID to destination ID."""
         ...
     
+    def renumber(
+        self,
+        mapping: Dict[int, int],
+        fill_gaps: Literal["error", "placeholder"] = "placeholder",
+    ) -> RewriteStats:
+        """Move many units to new IDs at once and rewrite all references to them."""
+        ...
+
+    def compact(self, start: int = 0, stop: Optional[int] = None) -> Dict[int, int]:
+        """Close the gaps between units in an ID range, keeping their order."""
+        ...
+
+    def delete(self, unit_id: int, civ_ids: Optional[List[int]] = None) -> None:
+        """Delete a unit, leaving a placeholder in its slot."""
+        ...
+
+    def unshare(self, unit_id: Optional[int] = None, civ_ids: Optional[List[int]] = None) -> None:
+        """Give civs their own copy of units created with share=True."""
+        ...
+
     def get(self, unit_id: int, civ_ids: Optional[List[int]] = None) -> UnitHandle:
-        """Get a handle for an existing unit."""
+        """Get a handle for an existing unit (the same handle while one is held)."""
         ...
     
     def get_unit(self, unit_id: int, civ_id: int = 0) -> Optional[Any]:
@@ -71,6 +125,26 @@ class UnitManager:
         """Return the total number of unit slots in civ 0."""
         ...
     
-    def find_by_name(self, name: str, civ_id: int = 0) -> Optional[UnitHandle]:
+    def find_by_name(self, name: str, civ_id: int = 0, case_sensitive: bool = True) -> Optional[UnitHandle]:
         """Find first unit matching name in the specified civ."""
         ...
+
+    def find_by_prefix(self, prefix: str, civ_id: int = 0, case_sensitive: bool = False) -> List[UnitHandle]:
+        """Find all units whose name starts with prefix in the specified civ, in ID order."""
+        ...
+
+    def name_index(self, civ_id: int = 0) -> NameIndex:
+        """Name lookup over the units of one civ (placeholders excluded)."""
+        ...
+
+    def to_columns(self, fields: Iterable[str], civ_ids: Optional[List[int]] = None) -> UnitColumns:
+        """Read fields of every unit into NumPy arrays indexed by (civ row, unit ID). Needs NumPy."""
+        ...
+
+    def from_columns(self, columns: UnitColumns, fields: Optional[Iterable[str]] = None) -> int:
+        """Write the cells changed since to_columns() back to the units; returns the number written."""
+        ...
+
+    def divergence(self, unit_ids: Optional[Iterable[int]] = None) -> List[Tuple[int, str, Dict[int, Any]]]:
+        """Fields of units that differ between civs, as (unit ID, field, civ ID -> value)."""
+        ...
@@ -0,0 +1,312 @@
+"""
+UnitSharing - Copy-on-write unit sharing across civilizations.
+
+Most units are identical in every civilization. With ``share=True``,
+UnitManager.create(), create_many() and clone_into() put one Unit object into
+the slots of all civs that would otherwise get identical copies. The civs of
+such a slot form a sharing group.
+
+A group stays shared while it is edited as a whole. When a UnitHandle covers
+only part of a group (``unit_manager.get(4, civ_ids=[1])``) and writes to it,
+the other civs of the group get their own copy first, so the edit does not
+leak into them. Reads never copy. A handle that covers the whole group writes
+to the shared object once.
+
+Placeholders appended when unit lists grow are shared the same way: one
+object per slot, in every civ that got it.
+
+Serialization is unaffected: bfp_rs writes the unit of every civ slot, shared
+or not. Sharing only lasts for the session; a reloaded file has separate units.
+
+Edits made directly on ``workspace.dat`` bypass this; call
+``unit_manager.unshare(unit_id)`` before editing a shared unit by hand.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from aoe2_genie_tooling.Base.core.struct_cloner import clone_many
+
+if TYPE_CHECKING:
+    from aoe2_genie_tooling.Base.workspace import GenieWorkspace
+
+__all__ = ['UnitSharing']
+
+# Whether assigning one struct to several list slots makes them alias the same
+# storage; probed on first use (a property of bfp_rs, fixed per process)
+_SLOTS_ALIAS: Optional[bool] = None
+
+
+class UnitSharing:
+    """
+    Bookkeeping for units shared between civilizations.
+
+    Attributes:
+        version: Incremented whenever a group is created, split or moved, so
+                 UnitHandles know when their cached unit lists are stale
+    """
+
+    def __init__(self, workspace: GenieWorkspace) -> None:
+        """Initialize with no shared units."""
+        self.workspace = workspace
+        self.version = 0
+        # unit ID -> groups of civ IDs holding the same Unit object
+        self._groups: Dict[int, List[FrozenSet[int]]] = {}
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def is_shared(self, unit_id: int) -> bool:
+        """True if any civs share the Unit object of unit_id."""
+        return unit_id in self._groups
+
+    def groups(self, unit_id: int) -> List[FrozenSet[int]]:
+        """Sharing groups of a unit ID (civ ID sets), empty if not shared."""
+        return list(self._groups.get(unit_id, ()))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Summarize sharing.
+
+        Returns:
+            Dict with "units" (shared unit IDs), "slots" (civ slots holding a
+            shared object) and "copies_saved" (Unit objects not allocated)
+        """
+        groups = [g for unit_groups in self._groups.values() for g in unit_groups]
+        return {
+            "units": len(self._groups),
+            "slots": sum(len(g) for g in groups),
+            "copies_saved": sum(len(g) - 1 for g in groups),
+        }
+
+    # -------------------------
+    # Placement
+    # -------------------------
+
+    def place(self, unit: Any, unit_id: int, civ_ids: List[int]) -> None:
+        """
+        Put one Unit object into the unit_id slot of several civs.
+
+        If bfp_rs copies structs on assignment instead of sharing them, every
+        civ gets its own copy instead.
+
+        Args:
+            unit: Unit to place
+            unit_id: Slot index
+            civ_ids: Civs to place it in
+        """
+        global _SLOTS_ALIAS
+
+        civs = self.workspace.dat.civilizations
+        self.detach(unit_id, civ_ids)
+        if len(civ_ids) >= 2 and _SLOTS_ALIAS is None:
+            _SLOTS_ALIAS = self._probe_alias(unit, unit_id, civ_ids)
+            if not _SLOTS_ALIAS:
+                self.workspace.logger.warning(
+                    "Unit sharing is not supported by this bfp_rs build; using copies", "units"
+                )
+        if len(civ_ids) < 2 or not _SLOTS_ALIAS:
+            for civ_id, copy in zip(civ_ids, [unit] + clone_many(unit, len(civ_ids) - 1)):
+                civs[civ_id].units[unit_id] = copy
+            return
+
+        for civ_id in civ_ids:
+            civs[civ_id].units[unit_id] = unit
+        self._groups.setdefault(unit_id, []).append(frozenset(civ_ids))
+        self.version += 1
+
+    def adopt(self, unit_id: int, civ_ids: List[int]) -> bool:
+        """
+        Record civs whose unit_id slot was filled with one object in bulk
+        (e.g. the same placeholder appended to every civ's unit list).
+
+        Args:
+            unit_id: Slot index
+            civ_ids: Civs holding the object
+
+        Returns:
+            True if the slot is shared, False if bfp_rs stored a copy per civ
+        """
+        global _SLOTS_ALIAS
+
+        if len(civ_ids) < 2 or _SLOTS_ALIAS is False:
+            return False
+        if _SLOTS_ALIAS is None:
+            civs = self.workspace.dat.civilizations
+            unit = civs[civ_ids[0]].units[unit_id]
+            _SLOTS_ALIAS = self._probe_alias(unit, unit_id, civ_ids)
+            # Put the object back into the slots the probe used
+            for civ_id in civ_ids[:2]:
+                civs[civ_id].units[unit_id] = unit
+            if not _SLOTS_ALIAS:
+                return False
+
+        self._groups.setdefault(unit_id, []).append(frozenset(civ_ids))
+        self.version += 1
+        return True
+
+    def _probe_alias(self, unit: Any, unit_id: int, civ_ids: List[int]) -> bool:
+        """
+        Check whether two slots assigned the same struct see the same storage.
+
+        The probe writes to a throwaway clone of unit, placed in the unit_id
+        slot of the first two civs; the caller fills those slots afterwards.
+        """
+        civs = self.workspace.dat.civilizations
+        first, second = civs[civ_ids[0]].units, civs[civ_ids[1]].units
+        probe = clone_many(unit, 1)[0]
+        first[unit_id] = probe
+        second[unit_id] = probe
+        written = first[unit_id]
+        written.hit_points = written.hit_points - 1 if written.hit_points > 0 else written.hit_points + 1
+        return second[unit_id].hit_points == written.hit_points
+
+    # -------------------------
+    # Copy-on-write
+    # -------------------------
+
+    def distinct_civs(self, unit_id: int, civ_ids: List[int]) -> List[int]:
+        """
+        Civ IDs to read a unit through, without copying anything.
+
+        Of every sharing group, only the lowest civ in civ_ids is kept, so
+        each shared object is listed once.
+
+        Args:
+            unit_id: Unit ID being read
+            civ_ids: Civs the handle covers
+
+        Returns:
+            civ_ids without the duplicate members of shared groups
+        """
+        groups = self._groups.get(unit_id)
+        if not groups:
+            return civ_ids
+
+        wanted = set(civ_ids)
+        skip: Set[int] = set()
+        for group in groups:
+            skip.update(sorted(group & wanted)[1:])
+        return [civ_id for civ_id in civ_ids if civ_id not in skip]
+
+    def unique_civs(self, unit_id: int, civ_ids: List[int]) -> List[int]:
+        """
+        Prepare civ IDs for a write through a handle.
+
+        Groups only partly in civ_ids are split: the civs outside civ_ids get
+        their own copy, and the civs in civ_ids keep the object they hold, so
+        units and structs already read through them stay the ones written.
+
+        Args:
+            unit_id: Unit ID being edited
+            civ_ids: Civs the handle covers
+
+        Returns:
+            civ_ids without the duplicate members of shared groups (as
+            distinct_civs())
+        """
+        groups = self._groups.get(unit_id)
+        if not groups:
+            return civ_ids
+
+        wanted = set(civ_ids)
+        outside = [g - wanted for g in groups if g & wanted and not g <= wanted]
+        if outside:
+            self.materialize(unit_id, set().union(*outside))
+        return self.distinct_civs(unit_id, civ_ids)
+
+    def materialize(self, unit_id: int, civ_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Give civs their own copy of a shared unit.
+
+        Args:
+            unit_id: Unit ID
+            civ_ids: Civs to give copies (default: all civs sharing the unit)
+        """
+        groups = self._groups.get(unit_id)
+        if not groups:
+            return
+
+        civs = self.workspace.dat.civilizations
+        targets = set(civ_ids) if civ_ids is not None else set().union(*groups)
+        remaining: List[FrozenSet[int]] = []
+        for group in groups:
+            split = group & targets
+            if not split:
+                remaining.append(group)
+                continue
+            rest = group - split
+            # With nobody left in the group, one civ keeps the original object
+            to_copy = sorted(split) if rest else sorted(split)[1:]
+            source = civs[min(group)].units[unit_id]
+            for civ_id, copy in zip(to_copy, clone_many(source, len(to_copy))):
+                civs[civ_id].units[unit_id] = copy
+            if len(rest) > 1:
+                remaining.append(frozenset(rest))
+
+        self._set_groups(unit_id, remaining)
+
+    def materialize_all(self) -> None:
+        """Give every civ its own copy of every shared unit."""
+        for unit_id in list(self._groups):
+            self.materialize(unit_id)
+
+    # -------------------------
+    # Slot changes
+    # -------------------------
+
+    def detach(self, unit_id: int, civ_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Forget sharing for slots that are about to be replaced.
+
+        Args:
+            unit_id: Unit ID
+            civ_ids: Civs whose slot is replaced (default: all)
+        """
+        groups = self._groups.get(unit_id)
+        if not groups:
+            return
+        if civ_ids is None:
+            self._set_groups(unit_id, [])
+            return
+        targets = set(civ_ids)
+        self._set_groups(unit_id, [g - targets for g in groups if len(g - targets) > 1])
+
+    def detach_civ(self, civ_id: int) -> None:
+        """Forget sharing for every slot of a civ that was replaced as a whole."""
+        for unit_id in list(self._groups):
+            self.detach(unit_id, [civ_id])
+
+    def move(self, src_unit_id: int, dst_unit_id: int, swap: bool = False) -> None:
+        """Carry sharing groups along when units change IDs."""
+        src = self._groups.pop(src_unit_id, None)
+        dst = self._groups.pop(dst_unit_id, None)
+        if src:
+            self._groups[dst_unit_id] = src
+        if swap and dst:
+            self._groups[src_unit_id] = dst
+        if src or dst:
+            self.version += 1
+
+    def renumber(self, mapping: Dict[int, int]) -> None:
+        """Carry sharing groups along when many units change IDs at once."""
+        moved = {mapping[unit_id]: self._groups.pop(unit_id) for unit_id in list(self._groups) if unit_id in mapping}
+        for target in mapping.values():
+            self._groups.pop(target, None)
+        self._groups.update(moved)
+        self.version += 1
+
+    def is_duplicate_slot(self, civ_id: int, unit_id: int) -> bool:
+        """True if the slot holds the same Unit object as a lower civ ID."""
+        for group in self._groups.get(unit_id, ()):
+            if civ_id in group:
+                return civ_id != min(group)
+        return False
+
+    def _set_groups(self, unit_id: int, groups: List[FrozenSet[int]]) -> None:
+        if groups:
+            self._groups[unit_id] = groups
+        else:
+            self._groups.pop(unit_id, None)
+        self.version += 1
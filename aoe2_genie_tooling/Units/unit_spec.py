@@ -0,0 +1,39 @@
+"""
+UnitSpec - Description of one unit for UnitManager.create_many().
+
+Example:
+    specs = [
+        UnitSpec("Elite Hero", base_unit_id=4, overrides={"hit_points": 120}),
+        UnitSpec("Siege Hero", base_unit_id=280, unit_id=2100, enable_for_civs=[1, 2]),
+    ]
+    handles = workspace.unit_manager.create_many(specs)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+__all__ = ['UnitSpec']
+
+
+@dataclass
+class UnitSpec:
+    """
+    One unit to create in a batch.
+
+    Attributes:
+        name: Name for the new unit
+        base_unit_id: Unit ID to clone from. If None, uses first valid unit.
+        unit_id: Target unit ID. If None, the next free ID at the end is used.
+        enable_for_civs: List of civ IDs to enable for. If None, all civs.
+        overrides: Attribute name -> value applied to the new unit. Unit fields
+                   and dotted paths into nested structs (for example
+                   "combat_info.base_armor") are set once before the unit is
+                   cloned into the civs; any other name is set through the
+                   returned UnitHandle.
+    """
+    name: str
+    base_unit_id: Optional[int] = None
+    unit_id: Optional[int] = None
+    enable_for_civs: Optional[List[int]] = None
+    overrides: Dict[str, Any] = field(default_factory=dict)
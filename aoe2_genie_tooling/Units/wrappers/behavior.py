@@ -14,7 +14,7 @@ Note: The tasks list itself is managed via collections/tasks.py (TasksManager +
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -40,16 +40,32 @@ class BehaviorWrapper:
         run_mode
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List["Unit"]) -> None:
+    def __init__(
+        self,
+        units: List["Unit"],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with list of units to modify.
 
         Args:
             units: List of Unit objects to proxy
+            on_change: Called after every attribute write
+            before_change: Called before every attribute write
         """
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def _get_task_info(self) -> Optional[Any]:
         """Get TaskInfo from first unit."""
@@ -135,7 +151,7 @@ class BehaviorWrapper:
     def tasks(self) -> "TasksManager":
         """Tasks collection manager."""
         from aoe2_genie_tooling.Units.unit_collections import TasksManager
-        return TasksManager(self._units)
+        return TasksManager(self._units, self._on_change, self._before_change)
 
     @tasks.setter
     def tasks(self, value: List) -> None:
@@ -148,7 +164,7 @@ class BehaviorWrapper:
     def drop_sites(self) -> "DropSitesManager":
         """Drop sites collection manager."""
         from aoe2_genie_tooling.Units.unit_collections import DropSitesManager
-        return DropSitesManager(self._units)
+        return DropSitesManager(self._units, self._on_change, self._before_change)
 
     @drop_sites.setter
     def drop_sites(self, value: List[int]) -> None:
@@ -14,7 +14,7 @@ Maps to GenieDatParser's BuildingInfo structure.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -41,16 +41,32 @@ class BuildingWrapper:
         salvage_unit_id, salvage_attributes
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List["Unit"]) -> None:
+    def __init__(
+        self,
+        units: List["Unit"],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with list of units to modify.
 
         Args:
             units: List of Unit objects to proxy
+            on_change: Called after every attribute write
+            before_change: Called before every attribute write
         """
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def _get_building_info(self) -> Optional[Any]:
         """Get BuildingInfo from first unit."""
@@ -381,4 +397,4 @@ class BuildingWrapper:
             building.annexes_manager[0].unit_id  # Get first annex unit_id
         """
         from aoe2_genie_tooling.Units.unit_collections import AnnexesManager
-        return AnnexesManager(self._units)
+        return AnnexesManager(self._units, self._on_change, self._before_change)
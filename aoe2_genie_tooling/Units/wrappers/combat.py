@@ -12,7 +12,7 @@ Maps to GenieDatParser's CombatInfo structure.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -40,16 +40,32 @@ class CombatWrapper:
         attack_graphic2
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List["Unit"]) -> None:
+    def __init__(
+        self,
+        units: List["Unit"],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with list of units to modify.
 
         Args:
             units: List of Unit objects to proxy
+            on_change: Called after every attribute write
+            before_change: Called before every attribute write
         """
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def _get_combat_info(self) -> Optional[Any]:
         """Get CombatInfo from first unit."""
@@ -372,7 +388,7 @@ class CombatWrapper:
     def attacks(self) -> "AttacksManager":
         """Attacks collection manager."""
         from aoe2_genie_tooling.Units.unit_collections import AttacksManager
-        return AttacksManager(self._units)
+        return AttacksManager(self._units, self._on_change, self._before_change)
 
     @attacks.setter
     def attacks(self, value: List) -> None:
@@ -385,7 +401,7 @@ class CombatWrapper:
     def armours(self) -> "ArmoursManager":
         """Armours collection manager."""
         from aoe2_genie_tooling.Units.unit_collections import ArmoursManager
-        return ArmoursManager(self._units)
+        return ArmoursManager(self._units, self._on_change, self._before_change)
 
     @armours.setter
     def armours(self, value: List) -> None:
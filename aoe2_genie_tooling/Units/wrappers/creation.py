@@ -13,7 +13,7 @@ Maps to GenieDatParser's CreationInfo structure.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -44,16 +44,32 @@ class CreationWrapper:
         special_graphic_id, special_activation, displayed_pierce_armor
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List["Unit"]) -> None:
+    def __init__(
+        self,
+        units: List["Unit"],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with list of units to modify.
 
         Args:
             units: List of Unit objects to proxy
+            on_change: Called after every attribute write
+            before_change: Called before every attribute write
         """
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def _get_creation_info(self) -> Optional[Any]:
         """Get CreationInfo from first unit."""
@@ -135,7 +151,7 @@ class CreationWrapper:
     def train_locations(self) -> "TrainLocationsManager":
         """Train locations collection manager."""
         from aoe2_genie_tooling.Units.unit_collections import TrainLocationsManager
-        return TrainLocationsManager(self._units)
+        return TrainLocationsManager(self._units, self._on_change, self._before_change)
 
     @train_locations.setter
     def train_locations(self, value: List) -> None:
@@ -148,7 +164,7 @@ class CreationWrapper:
     def resource_costs(self) -> "CostsManager":
         """Costs collection manager."""
         from aoe2_genie_tooling.Units.unit_collections import CostsManager
-        return CostsManager(self._units)
+        return CostsManager(self._units, self._on_change, self._before_change)
 
     @resource_costs.setter
     def resource_costs(self, value: List) -> None:
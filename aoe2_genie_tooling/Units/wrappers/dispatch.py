@@ -0,0 +1,224 @@
+"""
+Dispatch - Direct accessors for UnitHandle's flattened wrapper attributes.
+
+UnitHandle flattens wrapper properties (``unit.max_range`` is
+``unit.combat.max_range``). Going through the wrapper costs a wrapper lookup,
+a ``hasattr`` on the unit and a property call per access. Most wrapper
+properties only read one field of one info struct, or return a default if
+the unit has no such struct, and set that field on every unit:
+
+    ci = self._get_combat_info()
+    return ci.max_range if ci else 0.0      # getter
+    self._set_all("max_range", value)       # setter
+
+The table of these properties is built at import time by running every
+wrapper property against stand-in units whose info structs record the
+fields read and written. A property qualifies when its getter returns the one
+field it read, its setter writes the value it was given (or value.id) to that
+same field of every unit that has the struct, and neither touches anything
+else. install() replaces UnitHandle's generated passthrough properties for
+them with accessors that go straight to ``unit.<info>.<field>``. Properties
+that do more (lists, tuples, validation) fail the probe and keep going
+through their wrapper.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bfp_rs import errors
+
+from aoe2_genie_tooling.Units.wrappers.behavior import BehaviorWrapper
+from aoe2_genie_tooling.Units.wrappers.building import BuildingWrapper
+from aoe2_genie_tooling.Units.wrappers.combat import CombatWrapper
+from aoe2_genie_tooling.Units.wrappers.creation import CreationWrapper
+from aoe2_genie_tooling.Units.wrappers.movement import MovementWrapper
+from aoe2_genie_tooling.Units.wrappers.projectile import ProjectileWrapper
+
+__all__ = ["FieldAccessor", "dispatch_table", "install"]
+
+
+@dataclass(frozen=True)
+class FieldAccessor:
+    """
+    Direct route to one flattened attribute.
+
+    Attributes:
+        component: UnitHandle component the attribute belongs to ("combat", ...)
+        info: Unit attribute holding the component struct ("combat_info", ...)
+        field: Field on that struct
+        default: Value read when a unit has no such struct
+        accepts_handles: Setter stores value.id for objects with an id
+    """
+    component: str
+    info: str
+    field: str
+    default: Any
+    accepts_handles: bool = False
+
+    def getter(self) -> Callable[[Any], Any]:
+        info, default = self.info, self.default
+        chain = attrgetter(f"{self.info}.{self.field}")
+
+        def get(handle: Any) -> Any:
+            units = handle._get_units()
+            if units:
+                try:
+                    return chain(units[0])
+                except errors.VersionError:
+                    # Field not in the struct's version
+                    pass
+                except AttributeError:
+                    # No struct for this unit type -> default; a field missing
+                    # from the struct's version is still an error
+                    if getattr(units[0], info, None):
+                        raise
+            return default
+
+        return get
+
+    def setter(self) -> Callable[[Any, Any], None]:
+        info, field, accepts_handles = self.info, self.field, self.accepts_handles
+
+        def set_(handle: Any, value: Any) -> None:
+            if accepts_handles and hasattr(value, "id"):
+                value = value.id
+            for unit in handle._get_units():
+                struct = getattr(unit, info, None)
+                if struct:
+                    setattr(struct, field, value)
+
+        return set_
+
+
+# Component -> wrapper class whose properties are probed
+_WRAPPERS: Dict[str, type] = {
+    "behavior": BehaviorWrapper,
+    "movement": MovementWrapper,
+    "combat": CombatWrapper,
+    "projectile": ProjectileWrapper,
+    "creation": CreationWrapper,
+    "building": BuildingWrapper,
+}
+
+_INFOS = ("task_info", "movement_info", "combat_info", "projectile_info", "creation_info", "building_info")
+
+
+class _Recorder:
+    """Stand-in info struct: every read returns a fresh marker, writes are logged."""
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "reads", {})
+        object.__setattr__(self, "writes", [])
+
+    def __getattr__(self, name: str) -> Any:
+        marker = object()
+        self.reads[name] = marker
+        return marker
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.writes.append((name, value))
+
+
+def _probe_units(count: int, empty: int = -1) -> Tuple[List[Any], List[Dict[str, Optional[_Recorder]]]]:
+    """Stand-in units holding recorders in every info attribute (None for the empty one)."""
+    structs = [{info: None if i == empty else _Recorder() for info in _INFOS} for i in range(count)]
+    return [SimpleNamespace(**s) for s in structs], structs
+
+
+def _probe_write(prop: property, wrapper: type, info: str, value: Any) -> Any:
+    """Value the setter stored in info of each unit that has it, or None if it did anything else."""
+    units, structs = _probe_units(3, empty=1)
+    try:
+        prop.fset(wrapper(units), value)
+    except Exception:
+        return None
+    writes = []
+    for unit_structs in structs[::2]:
+        if any(r.reads for r in unit_structs.values()):
+            return None
+        writes.extend((i, name, stored) for i, r in unit_structs.items() for name, stored in r.writes)
+    if len(writes) != 2 or writes[0][:2] != writes[1][:2] or writes[0][0] != info or writes[0][2] is not writes[1][2]:
+        return None
+    return writes[0][1:]
+
+
+def _probe(wrapper: type, prop: property) -> Optional[Tuple[str, str, Any, bool]]:
+    """(info, field, default, accepts_handles) if prop is a plain field passthrough."""
+    if prop.fget is None or prop.fset is None:
+        return None
+    units, structs = _probe_units(2)
+    try:
+        value = prop.fget(wrapper(units))
+    except Exception:
+        return None
+    reads = [(info, name, marker) for info, r in structs[0].items() for name, marker in r.reads.items()]
+    others = any(r.reads or r.writes for r in structs[1].values())
+    if len(reads) != 1 or reads[0][2] is not value or others or any(r.writes for r in structs[0].values()):
+        return None
+    info, field, _ = reads[0]
+
+    try:
+        default = prop.fget(wrapper(_probe_units(1, empty=0)[0]))
+    except Exception:
+        return None
+
+    marker = object()
+    if _probe_write(prop, wrapper, info, marker) != (field, marker):
+        return None
+    handle = SimpleNamespace(id=object())
+    stored = _probe_write(prop, wrapper, info, handle)
+    if stored == (field, handle):
+        return info, field, default, False
+    if stored == (field, handle.id):
+        return info, field, default, True
+    return None
+
+
+def _build_table() -> Dict[str, Dict[str, FieldAccessor]]:
+    table: Dict[str, Dict[str, FieldAccessor]] = {}
+    for component, wrapper in _WRAPPERS.items():
+        accessors = table[component] = {}
+        for name, prop in vars(wrapper).items():
+            if isinstance(prop, property):
+                found = _probe(wrapper, prop)
+                if found is not None:
+                    accessors[name] = FieldAccessor(component, *found)
+    return table
+
+
+_TABLE: Dict[str, Dict[str, FieldAccessor]] = _build_table()
+
+
+def dispatch_table() -> Dict[str, Dict[str, FieldAccessor]]:
+    """
+    Simple wrapper properties by component.
+
+    Returns:
+        {component: {property name: FieldAccessor}}
+    """
+    return _TABLE
+
+
+def install(handle_cls: type) -> Dict[str, FieldAccessor]:
+    """
+    Replace the flattened properties of handle_cls found by the probe.
+
+    Returns:
+        {flattened name: FieldAccessor} for the replaced properties
+    """
+    installed: Dict[str, FieldAccessor] = {}
+    for accessors in _TABLE.values():
+        for name, accessor in accessors.items():
+            prop = vars(handle_cls).get(name)
+            if not isinstance(prop, property):
+                # Not flattened onto handle_cls
+                continue
+            doc = prop.__doc__
+            getter = accessor.getter()
+            getter.__doc__ = doc
+            setattr(handle_cls, name, property(getter, accessor.setter(), None, doc))
+            installed[name] = accessor
+    return installed
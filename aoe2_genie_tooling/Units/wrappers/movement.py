@@ -14,7 +14,7 @@ Maps to GenieDatParser's MovementInfo structure.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 if TYPE_CHECKING:
     from sections.civilization.unit import Unit
@@ -37,16 +37,32 @@ class MovementWrapper:
         max_yaw_per_sec_standing, min_collision_size_multiplier
     """
 
-    __slots__ = ("_units",)
+    __slots__ = ("_units", "_on_change", "_before_change")
 
-    def __init__(self, units: List["Unit"]) -> None:
+    def __init__(
+        self,
+        units: List["Unit"],
+        on_change: Optional[Callable[[], None]] = None,
+        before_change: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Initialize with list of units to modify.
 
         Args:
             units: List of Unit objects to proxy
+            on_change: Called after every attribute write
+            before_change: Called before every attribute write
         """
         object.__setattr__(self, "_units", units)
+        object.__setattr__(self, "_on_change", on_change)
+        object.__setattr__(self, "_before_change", before_change)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._before_change is not None:
+            self._before_change()
+        object.__setattr__(self, name, value)
+        if self._on_change is not None:
+            self._on_change()
 
     def _get_movement_info(self) -> Optional[Any]:
         """Get MovementInfo from first unit."""
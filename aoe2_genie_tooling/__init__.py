@@ -23,9 +23,11 @@ Quick Start:
 Public API:
     - GenieWorkspace: Root entry point for DAT file editing
     - Managers: UnitManager, TechManager, EffectManager, GraphicManager, SoundManager, CivManager
+    - UnitSpec: Input for UnitManager.create_many()
     - Handles: UnitHandle, TechHandle, EffectHandle, GraphicHandle, SoundHandle, CivHandle
     - logger: Colored console output (can be disabled with logger.disable())
     - registry: JSON export for created items
+    - Patches: create_patch, apply_patch, DatPatch for shipping DAT diffs
 """
 
 from aoe2_genie_tooling.Base.workspace import GenieWorkspace
@@ -34,14 +36,18 @@ from aoe2_genie_tooling.Base.core.registry import Registry
 from aoe2_genie_tooling.Base.core.exceptions import (
     GenieToolsError,
     GapNotAllowedError,
+    IdRangeExhaustedError,
     InvalidIdError,
+    PatchError,
     TemplateNotFoundError,
     UnitIdConflictError,
     ValidationError,
 )
+from aoe2_genie_tooling.Base.core.patch import DatPatch, apply_patch, create_patch
 
 # Managers
 from aoe2_genie_tooling.Units.unit_manager import UnitManager
+from aoe2_genie_tooling.Units.unit_spec import UnitSpec
 from aoe2_genie_tooling.Techs.tech_manager import TechManager
 from aoe2_genie_tooling.Effects.effect_manager import EffectManager
 from aoe2_genie_tooling.Graphics.graphic_manager import GraphicManager
@@ -52,6 +58,7 @@ from aoe2_genie_tooling.Civilizations.civ_manager import CivManager
 from aoe2_genie_tooling.Units.unit_handle import UnitHandle
 from aoe2_genie_tooling.Units.task_builder import TaskBuilder
 from aoe2_genie_tooling.Techs.tech_handle import TechHandle
+from aoe2_genie_tooling.Techs.research_location_handle import ResearchLocationHandle
 from aoe2_genie_tooling.Effects.effect_handle import EffectHandle
 from aoe2_genie_tooling.Effects.command_handle import CommandHandle
 from aoe2_genie_tooling.Effects.effect_command_builder import EffectCommandBuilder
@@ -68,6 +75,7 @@ __all__ = [
     "GenieWorkspace",
     # Managers
     "UnitManager",
+    "UnitSpec",
     "TechManager",
     "EffectManager",
     "GraphicManager",
@@ -77,6 +85,7 @@ __all__ = [
     "UnitHandle",
     "TaskBuilder",
     "TechHandle",
+    "ResearchLocationHandle",
     "EffectHandle",
     "CommandHandle",
     "EffectCommandBuilder",
@@ -86,10 +95,16 @@ __all__ = [
     # Logging/Registry
     "logger",
     "registry",
+    # Patches
+    "DatPatch",
+    "create_patch",
+    "apply_patch",
     # Exceptions
     "GenieToolsError",
     "GapNotAllowedError",
+    "IdRangeExhaustedError",
     "InvalidIdError",
+    "PatchError",
     "TemplateNotFoundError",
     "UnitIdConflictError",
     "ValidationError",
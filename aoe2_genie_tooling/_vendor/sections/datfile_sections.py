@@ -40,6 +40,9 @@ def get_num_terrains(struct_ver: Version, num_used_terrains) -> int:
 class DatFile(BaseStruct):
     __default_ver__ = DE_LATEST
 
+    # deflate level used by _compress (None = no compression), callers may change it temporarily when saving
+    _compression_level = 9
+
     # @formatter:off
     file_version: bytes                      = Retriever(Bytes[8],                                                           default = b"VER 7.8\x00", remaining_compressed = True)
     swgb_data: SwgbData                      = Retriever(SwgbData,         min_ver = Version(5, 9), max_ver = Version(5, 9), default_factory = SwgbData)
@@ -60,12 +63,19 @@ class DatFile(BaseStruct):
 
     @classmethod
     def _decompress(cls, bytes_: bytes) -> bytes:
+        # an already inflated payload starts with the version string. A deflate stream can never start with "V"
+        # (0x56 has the reserved block type 11), so this cannot misfire on a compressed file
+        if bytes_[:4] == b"VER ":
+            return bytes_
         bytes_ = zlib.decompress(bytes_, -zlib.MAX_WBITS)
         return bytes_
 
     @classmethod
     def _compress(cls, bytes_: bytes) -> bytes:
-        deflate_obj = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        # None writes the inflated payload as is (raw DAT)
+        if cls._compression_level is None:
+            return bytes_
+        deflate_obj = zlib.compressobj(cls._compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
         compressed = deflate_obj.compress(bytes_) + deflate_obj.flush()
         return compressed
 
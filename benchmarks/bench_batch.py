@@ -0,0 +1,67 @@
+"""
+Benchmark workspace.batch() for scripts that write the same units many times.
+
+Writes a few flattened attributes of the first N units in every civ, several
+rounds over the same units, without a batch, inside workspace.batch(), and
+inside workspace.batch(rollback=False). The name index and the fingerprint
+are built first, so every write has the usual change subscribers to notify.
+
+Usage:
+    python benchmarks/bench_batch.py path/to/empires2_x2_p1.dat [--units 200] [--rounds 20]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+ATTRIBUTES = ("hit_points", "line_of_sight", "max_range", "reload_time")
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--units", type=int, default=200, help="Units written per round")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the same units")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+    manager.find_by_name("Archer")
+    workspace.fingerprint()
+
+    handles = [manager.get(unit_id) for unit_id in range(manager.count()) if manager.exists(unit_id)][:args.units]
+    values = [[getattr(handle, name) for name in ATTRIBUTES] for handle in handles]
+    count = args.rounds * len(handles) * len(ATTRIBUTES)
+
+    def write() -> None:
+        for _ in range(args.rounds):
+            for handle, row in zip(handles, values):
+                for name, value in zip(ATTRIBUTES, row):
+                    setattr(handle, name, value)
+
+    def write_batch(rollback: bool) -> Callable[[], None]:
+        def run() -> None:
+            with workspace.batch(rollback=rollback):
+                write()
+        return run
+
+    _time(f"writes x{count} (no batch)", count, write)
+    _time(f"writes x{count} (batch)", count, write_batch(True))
+    _time(f"writes x{count} (batch, no rollback)", count, write_batch(False))
+
+
+if __name__ == "__main__":
+    main()
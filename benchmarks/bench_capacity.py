@@ -0,0 +1,62 @@
+"""
+Benchmark extending unit capacity.
+
+Adds placeholder slots to every civilization's unit list, as reserving a high
+unit ID does, with the cached placeholder and one extend() per civ, against
+the per-slot template clone and append() it replaced (kept below for
+reference).
+
+Usage:
+    python benchmarks/bench_capacity.py path/to/empires2_x2_p1.dat [--slots 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.core.struct_cloner import deep_clone
+
+
+def legacy_extend(manager: Any, required_index: int) -> None:
+    """The previous capacity extension: one template clone and append per slot and civ."""
+    template = manager._find_first_valid_unit()
+    for civ in manager.workspace.dat.civilizations:
+        while len(civ.units) <= required_index:
+            placeholder = deep_clone(template)
+            placeholder.name = ""
+            placeholder.enabled = False
+            placeholder.hit_points = 1
+            placeholder.id = len(civ.units)
+            civ.units.append(placeholder)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--slots", type=int, default=2000, help="Slots added per run")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+    civs = len(workspace.dat.civilizations)
+
+    for label, extend in (
+        ("per-slot clone + append", lambda index: legacy_extend(manager, index)),
+        ("cached placeholder + extend", lambda index: manager._ensure_capacity_all_civs(index, "placeholder")),
+    ):
+        required_index = manager.count() + args.slots - 1
+        start = time.perf_counter()
+        extend(required_index)
+        elapsed = time.perf_counter() - start
+        print(f"{label:30s} {elapsed:8.3f}s  {args.slots * civs / elapsed:12.1f} slots/s")
+
+    print(f"{civs} civilizations, {args.slots} slots per run, sharing: {manager.sharing.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark struct cloning.
+
+Times cloning one unit and UnitManager.clone_into() with the serializing
+cloner, the compiled cloner and the reflective dir()-walking cloner they
+replaced (kept below for reference), and create() as shipped. Sprites, techs
+and whole civilizations are cloned with the serializing and compiled cloners.
+
+Usage:
+    python benchmarks/bench_clone.py path/to/empires2_x2_p1.dat [--unit 4] [--count 20]
+        [--sprite 100] [--tech 22] [--civ 1]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.core.struct_cloner import clone_struct, deep_clone
+
+NESTED_STRUCT_FIELDS = {
+    "combat_info", "task_info", "animation_info", "movement_info",
+    "creation_info", "projectile_info", "building_info",
+}
+
+
+def _reflective_item(item: Any) -> Any:
+    if item is None or not hasattr(item, "ver"):
+        return item
+    new_item = item.__class__(ver=item.ver)
+    for name in dir(item):
+        if name.startswith("_") or name == "ver":
+            continue
+        try:
+            attr = getattr(item, name)
+            if not callable(attr):
+                setattr(new_item, name, attr)
+        except Exception:
+            pass
+    return new_item
+
+
+def _reflective_inplace(source: Any, target: Any) -> None:
+    for name in dir(source):
+        if name.startswith("_") or name == "ver":
+            continue
+        try:
+            attr = getattr(source, name)
+            if callable(attr):
+                continue
+            if isinstance(attr, list):
+                setattr(target, name, [_reflective_item(item) for item in attr])
+            elif hasattr(attr, "ver") and not isinstance(attr, (int, float, str, bool)):
+                nested = getattr(target, name)
+                if nested is not None:
+                    _reflective_inplace(attr, nested)
+            else:
+                setattr(target, name, attr)
+        except Exception:
+            pass
+
+
+def reflective_clone_unit(source: Any) -> Any:
+    """The pre-compiled cloner: walks dir(source) on every call."""
+    new_unit = source.__class__(ver=source.ver)
+    new_unit.type_ = source.type_
+    for name in dir(source):
+        if name.startswith("_") or name in ("ver", "type_"):
+            continue
+        try:
+            attr = getattr(source, name)
+            if callable(attr):
+                continue
+            if name in NESTED_STRUCT_FIELDS:
+                if attr is not None:
+                    target = getattr(new_unit, name)
+                    if target is attr or target is None:
+                        setattr(new_unit, name, attr.__class__(ver=source.ver))
+                        target = getattr(new_unit, name)
+                    _reflective_inplace(attr, target)
+                continue
+            if isinstance(attr, list):
+                setattr(new_unit, name, [_reflective_item(item) for item in attr])
+                continue
+            setattr(new_unit, name, attr)
+        except Exception:
+            pass
+    return new_unit
+
+
+def _rate(label: str, count: int, fn: Callable[[int], Any]) -> None:
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:10.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--unit", type=int, default=4, help="Unit to clone")
+    parser.add_argument("--count", type=int, default=20, help="Units created per run")
+    parser.add_argument("--sprite", type=int, default=100, help="Sprite to clone")
+    parser.add_argument("--tech", type=int, default=22, help="Tech to clone")
+    parser.add_argument("--civ", type=int, default=1, help="Civilization to clone")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+    source = manager.get_unit(args.unit)
+    civs = len(workspace.dat.civilizations)
+
+    _rate("clone one unit (reflective)", args.count * civs, lambda _: reflective_clone_unit(source))
+    _rate("clone one unit (compiled)", args.count * civs, lambda _: clone_struct(source))
+    _rate("clone one unit (serialized)", args.count * civs, lambda _: deep_clone(source))
+
+    base = manager.count()
+    _rate("create()", args.count, lambda i: manager.create(f"Bench {i}", base_unit_id=args.unit))
+    cloners = (("reflective", reflective_clone_unit), ("compiled", clone_struct), ("serialized", deep_clone))
+    for label, cloner in cloners:
+        manager._clone_unit = cloner
+        offset = manager.count()
+        _rate(
+            f"clone_into() ({label})",
+            args.count,
+            lambda i: manager.clone_into(offset + i, args.unit, on_conflict="overwrite"),
+        )
+    del manager._clone_unit
+    print(f"{civs} civilizations, {manager.count() - base} units added")
+
+    dat = workspace.dat
+    for label, obj, count in (
+        ("sprite", dat.sprites[args.sprite], args.count * 10),
+        ("tech", dat.techs[args.tech], args.count * 10),
+        ("civilization", dat.civilizations[args.civ], 3),
+    ):
+        _rate(f"clone {label} (compiled)", count, lambda _: clone_struct(obj))
+        _rate(f"clone {label} (serialized)", count, lambda _: deep_clone(obj))
+
+
+if __name__ == "__main__":
+    main()
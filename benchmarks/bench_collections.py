@@ -0,0 +1,76 @@
+"""
+Benchmark bulk attack/task edits against one add() or remove() per entry.
+
+Adds N attacks to a unit in every civ with add() in a loop and with
+attacks.extend(), removes them with remove() and with attacks.remove_where(),
+and does the same for N tasks.
+
+Usage:
+    python benchmarks/bench_collections.py path/to/empires2_x2_p1.dat [--unit 4] [--entries 10]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+# Damage classes / action types not used by the stock data
+FIRST_CLASS = 100
+ACTION_TYPE = 999
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--unit", type=int, default=4, help="Unit to edit (needs combat and task info)")
+    parser.add_argument("--entries", type=int, default=10, help="Entries added per run")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    unit = workspace.unit_manager.get(args.unit)
+    classes = range(FIRST_CLASS, FIRST_CLASS + args.entries)
+    count = args.entries * len(workspace.dat.civilizations)
+
+    def add_attacks() -> None:
+        for class_id in classes:
+            unit.attacks.add(class_id, 1)
+
+    def remove_attacks() -> None:
+        for _ in classes:
+            unit.attacks.remove(len(unit.attacks) - 1)
+
+    def add_tasks() -> None:
+        for _ in classes:
+            unit.tasks.add(action_type=ACTION_TYPE)
+
+    def remove_tasks() -> None:
+        for _ in classes:
+            unit.tasks.remove(len(unit.tasks) - 1)
+
+    _time(f"attacks.add x{count}", count, add_attacks)
+    _time(f"attacks.remove x{count}", count, remove_attacks)
+    _time(f"attacks.extend x{count}", count, lambda: unit.attacks.extend([(c, 1) for c in classes]))
+    _time(f"attacks.set_many x{count}", count, lambda: unit.attacks.set_many({c: 2 for c in classes}))
+    _time(f"attacks.remove_where x{count}", count, lambda: unit.attacks.remove_where(lambda a: a.id in classes))
+    _time(f"tasks.add x{count}", count, add_tasks)
+    _time(f"tasks.remove x{count}", count, remove_tasks)
+    _time(f"tasks.extend x{count}", count, lambda: unit.tasks.extend([{"action_type": ACTION_TYPE}] * args.entries))
+    _time(
+        f"tasks.remove_where x{count}", count, lambda: unit.tasks.remove_where(lambda t: t.action_type == ACTION_TYPE)
+    )
+
+
+if __name__ == "__main__":
+    main()
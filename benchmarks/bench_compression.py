@@ -0,0 +1,46 @@
+"""
+Benchmark save time and output size for each compression profile.
+
+Usage:
+    python benchmarks/bench_compression.py path/to/empires2_x2_p1.dat [--repeat 3] [--verify]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import CompressionProfile, ValidationLevel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--repeat", type=int, default=3, help="Saves per profile (best time is reported)")
+    parser.add_argument("--verify", action="store_true", help="Reload every output to check it parses")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    source_size = args.dat.stat().st_size
+
+    print(f"{'profile':<10} {'level':>5} {'bytes':>12} {'ratio':>7} {'seconds':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in CompressionProfile:
+            out = Path(tmp) / f"{profile.value}.dat"
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                workspace.save(out, validate=False, compression=profile)
+                best = min(best, time.perf_counter() - start)
+
+            size = out.stat().st_size
+            print(f"{profile.value:<10} {profile.level:>5} {size:>12,} {size / source_size:>7.3f} {best:>9.3f}")
+
+            if args.verify:
+                GenieWorkspace.load(out, validation=ValidationLevel.NO_VALIDATION)
+
+
+if __name__ == "__main__":
+    main()
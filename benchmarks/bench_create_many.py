@@ -0,0 +1,58 @@
+"""
+Benchmark UnitManager.create_many() against a loop of create().
+
+Each run starts from a freshly loaded DAT and creates the same units: copies of
+a few base units with a hit point override, appended at the end.
+
+Usage:
+    python benchmarks/bench_create_many.py path/to/empires2_x2_p1.dat [--count 500] [--bases 4 5 7]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+from aoe2_genie_tooling import GenieWorkspace, UnitSpec
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+
+def _load(path: Path) -> GenieWorkspace:
+    workspace = GenieWorkspace.load(path, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    return workspace
+
+
+def _specs(count: int, bases: List[int]) -> List[UnitSpec]:
+    return [
+        UnitSpec(f"Bench {i}", base_unit_id=bases[i % len(bases)], overrides={"hit_points": 100 + i})
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--count", type=int, default=500, help="Units to create")
+    parser.add_argument("--bases", type=int, nargs="+", default=[4, 5, 7], help="Base unit IDs")
+    args = parser.parse_args()
+    specs = _specs(args.count, args.bases)
+
+    workspace = _load(args.dat)
+    start = time.perf_counter()
+    for spec in specs:
+        handle = workspace.unit_manager.create(spec.name, base_unit_id=spec.base_unit_id)
+        handle.hit_points = spec.overrides["hit_points"]
+    loop = time.perf_counter() - start
+    print(f"create() loop: {loop:8.3f}s  {args.count / loop:8.1f} units/s")
+
+    workspace = _load(args.dat)
+    start = time.perf_counter()
+    workspace.unit_manager.create_many(specs)
+    batch = time.perf_counter() - start
+    print(f"create_many(): {batch:8.3f}s  {args.count / batch:8.1f} units/s  ({loop / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
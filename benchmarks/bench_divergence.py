@@ -0,0 +1,66 @@
+"""
+Benchmark unit_manager.divergence() against reading every field through handles.
+
+Runs the divergence report over all units three times: cold (every unit is
+hashed), warm (hashes cached), and after writing one attribute of N units
+(only those are hashed again). For comparison, reads a few flattened
+attributes of every unit in every civ through per-civ handles.
+
+Usage:
+    python benchmarks/bench_divergence.py path/to/empires2_x2_p1.dat [--writes 50]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+ATTRIBUTES = ("hit_points", "line_of_sight", "max_range", "reload_time")
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--writes", type=int, default=50, help="Units written between reports")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+    civ_count = len(workspace.dat.civilizations)
+    unit_ids = [unit_id for unit_id in range(manager.count()) if manager.exists(unit_id)]
+    count = len(unit_ids)
+
+    def handle_reads() -> None:
+        for civ_id in range(civ_count):
+            for unit_id in unit_ids:
+                handle = manager.get(unit_id, civ_ids=[civ_id])
+                for name in ATTRIBUTES:
+                    getattr(handle, name, None)
+
+    def write() -> None:
+        for unit_id in unit_ids[:args.writes]:
+            handle = manager.get(unit_id)
+            handle.hit_points = handle.hit_points
+
+    _time(f"handle reads x{count * civ_count}", count * civ_count, handle_reads)
+    _time(f"divergence x{count} (cold)", count, manager.divergence)
+    _time(f"divergence x{count} (warm)", count, manager.divergence)
+    write()
+    _time(f"divergence x{count} ({args.writes} written)", count, manager.divergence)
+    print(f"differing fields: {len(manager.divergence())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark incremental fingerprints.
+
+Loads a DAT and fingerprints it once (hashes everything), edits a few units and
+a sprite through their handles and fingerprints it again. The incremental result
+is checked against a fingerprint computed from scratch.
+
+Usage:
+    python benchmarks/bench_fingerprint.py path/to/empires2_x2_p1.dat [--units 4 5 6] [--sprite 100]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.core.fingerprint import Fingerprinter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--units", type=int, nargs="+", default=[4, 5, 6], help="Units whose hit points are edited")
+    parser.add_argument("--sprite", type=int, default=100, help="Sprite whose frame rate is edited")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+
+    start = time.perf_counter()
+    before = workspace.fingerprint()
+    print(f"first fingerprint:       {time.perf_counter() - start:8.3f}s")
+
+    for unit_id in args.units:
+        unit = workspace.unit_manager.get(unit_id)
+        unit.hit_points = unit.hit_points + 1
+    sprite = workspace.graphic_manager.get(args.sprite)
+    sprite.frame_rate = sprite.frame_rate + 1
+
+    start = time.perf_counter()
+    after = workspace.fingerprint()
+    print(f"incremental fingerprint: {time.perf_counter() - start:8.3f}s")
+
+    fresh = Fingerprinter(workspace).compute()
+    print(f"matches full rehash: {fresh == after}")
+    for category, keys in after.diff(before).items():
+        print(f"  {category}: {len(keys)} changed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark repeated get() calls.
+
+Times a loop that fetches a handle and reads a few attributes, the way scripts
+usually do, with the handle cache against a new handle per call (what get()
+used to do). The loop runs over units, graphics and techs.
+
+Usage:
+    python benchmarks/bench_handle_cache.py path/to/empires2_x2_p1.dat [--rounds 20] [--units 200]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Graphics.graphic_handle import GraphicHandle
+from aoe2_genie_tooling.Techs.tech_handle import TechHandle
+from aoe2_genie_tooling.Units.unit_handle import UnitHandle
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the IDs")
+    parser.add_argument("--units", type=int, default=200, help="Unit IDs per pass")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    units = workspace.unit_manager
+    unit_ids: List[int] = [i for i in range(units.count()) if units.exists(i)][: args.units]
+    graphic_ids = [i for i in range(workspace.graphic_manager.count()) if workspace.graphic_manager.exists(i)]
+    tech_ids = list(range(workspace.tech_manager.count()))
+    civ_count = len(workspace.dat.civilizations)
+
+    def read_unit(handle: UnitHandle) -> None:
+        handle.hit_points, handle.speed, handle.combat.max_range
+
+    def fresh_units() -> None:
+        for _ in range(args.rounds):
+            for unit_id in unit_ids:
+                read_unit(UnitHandle(workspace, unit_id, list(range(civ_count))))
+
+    def cached_units() -> None:
+        held = []  # keep the handles alive, as a script holding them would
+        for _ in range(args.rounds):
+            for unit_id in unit_ids:
+                handle = units.get(unit_id)
+                read_unit(handle)
+                held.append(handle)
+
+    count = args.rounds * len(unit_ids)
+    _time(f"units x{count} (new handle)", count, fresh_units)
+    _time(f"units x{count} (cached)", count, cached_units)
+
+    for label, ids, make, get in (
+        ("graphics", graphic_ids, lambda i: GraphicHandle(workspace, i), workspace.graphic_manager.get),
+        ("techs", tech_ids, lambda i: TechHandle(workspace, i), workspace.tech_manager.get),
+    ):
+        count = args.rounds * len(ids)
+        _time(f"{label} x{count} (new handle)", count, lambda: [make(i).name for _ in range(args.rounds) for i in ids])
+        held = [get(i) for i in ids]
+        _time(f"{label} x{count} (cached)", count, lambda: [get(i).name for _ in range(args.rounds) for i in ids])
+        del held
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark incremental saves and check them against a full re-serialization.
+
+Loads a DAT, saves it once (which fills the section cache), changes one unit's
+hit points and saves again. The inflated output of every save is compared with
+DatFile.to_bytes(), and the edited file is loaded back to check the new value;
+any mismatch raises, so the script fails instead of printing a bad result.
+
+Usage:
+    python benchmarks/bench_incremental_save.py path/to/empires2_x2_p1.dat [--unit 4]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sections.datfile_sections import DatFile
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+
+def _check(workspace: GenieWorkspace, out: Path) -> None:
+    """Raise if the written file does not inflate to the full serialization of the DAT."""
+    written = DatFile._decompress(out.read_bytes())
+    full = DatFile._decompress(workspace.dat.to_bytes())
+    if written != full:
+        first = next((i for i, (a, b) in enumerate(zip(written, full)) if a != b), min(len(written), len(full)))
+        raise AssertionError(
+            f"{out.name} differs from DatFile.to_bytes() "
+            f"({len(written)} vs {len(full)} bytes, first difference at {first})"
+        )
+
+
+def _timed_save(workspace: GenieWorkspace, out: Path) -> float:
+    start = time.perf_counter()
+    workspace.save(out, validate=False)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--unit", type=int, default=4, help="Unit whose hit points are edited")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    cache = workspace.file_io.section_cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "out.dat"
+
+        full = _timed_save(workspace, out)
+        _check(workspace, out)
+        print(f"first save (fills cache):   {full:8.3f}s")
+
+        unit = workspace.unit_manager.get(args.unit)
+        hit_points = unit.hit_points + 1
+        unit.hit_points = hit_points
+
+        edit = _timed_save(workspace, out)
+        _check(workspace, out)
+        print(f"save after one-field edit:  {edit:8.3f}s")
+        print(f"reused sections:  {cache.last_reused}")
+        if "civilizations" in cache.last_reused:
+            raise AssertionError("the edited civilizations section was not written again")
+
+        reloaded = GenieWorkspace.load(out, validation=ValidationLevel.NO_VALIDATION)
+        reloaded.logger.disable()
+        if reloaded.unit_manager.get(args.unit).hit_points != hit_points:
+            raise AssertionError(f"unit {args.unit} did not keep its edited hit points after reload")
+
+        start = time.perf_counter()
+        workspace.dat.to_file(str(out))
+        print(f"full to_file for reference: {time.perf_counter() - start:8.3f}s")
+        print("round trip OK")
+
+
+if __name__ == "__main__":
+    main()
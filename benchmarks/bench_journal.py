@@ -0,0 +1,73 @@
+"""
+Benchmark the undo journal: the cost it adds to writes, and undo/redo.
+
+Writes a few flattened attributes of the first N units, once without the
+journal and once with it (each write is one undo step), then undoes and redoes
+every step. A last pass writes the same units inside one workspace.batch(),
+which the journal records as a single step.
+
+Usage:
+    python benchmarks/bench_journal.py path/to/empires2_x2_p1.dat [--units 200]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+ATTRIBUTES = ("hit_points", "line_of_sight", "max_range", "reload_time")
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--units", type=int, default=200, help="Units written")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+
+    handles = [manager.get(unit_id) for unit_id in range(manager.count()) if manager.exists(unit_id)][:args.units]
+    count = len(handles) * len(ATTRIBUTES)
+
+    def write() -> None:
+        for handle in handles:
+            for name in ATTRIBUTES:
+                setattr(handle, name, getattr(handle, name) + 1)
+
+    def undo_all() -> None:
+        while workspace.undo():
+            pass
+
+    def redo_all() -> None:
+        while workspace.redo():
+            pass
+
+    def write_batch() -> None:
+        with workspace.batch():
+            write()
+
+    _time(f"writes x{count} (no journal)", count, write)
+    journal = workspace.enable_journal()
+    _time(f"writes x{count} (journal)", count, write)
+    steps = journal.undo_count
+    _time(f"undo x{steps}", steps, undo_all)
+    _time(f"redo x{steps}", steps, redo_all)
+    _time(f"writes x{count} (journal, batch)", count, write_batch)
+    _time("undo x1 (batch)", 1, workspace.undo)
+
+
+if __name__ == "__main__":
+    main()
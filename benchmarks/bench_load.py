@@ -0,0 +1,115 @@
+"""
+Benchmark cold-load time and peak RSS for each load mode.
+
+Every mode runs in a fresh interpreter so peak RSS is not shared between runs.
+The cache modes are warmed up once first. "cached" then restores the snapshot
+with its section offsets and parses nothing; "cache+access" also parses the
+civilizations, and nothing else.
+
+Usage:
+    python benchmarks/bench_load.py path/to/empires2_x2_p1.dat [--modes eager lazy]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def _peak_rss_mib() -> float:
+    """Peak resident set size of this process in MiB."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _load_eager(path: Path) -> None:
+    from aoe2_genie_tooling import GenieWorkspace
+    GenieWorkspace.load(path)
+
+
+def _load_lazy(path: Path) -> None:
+    from aoe2_genie_tooling import GenieWorkspace
+    GenieWorkspace.load(path, lazy=True)
+
+
+def _load_lazy_touched(path: Path) -> None:
+    from aoe2_genie_tooling import GenieWorkspace
+    workspace = GenieWorkspace.load(path, lazy=True)
+    len(workspace.dat.civilizations)
+
+
+def _load_cached(path: Path) -> None:
+    from aoe2_genie_tooling import GenieWorkspace
+    GenieWorkspace.load(path, cache_dir=_CACHE_DIR)
+
+
+def _load_cached_touched(path: Path) -> None:
+    from aoe2_genie_tooling import GenieWorkspace
+    workspace = GenieWorkspace.load(path, cache_dir=_CACHE_DIR)
+    len(workspace.dat.civilizations)
+
+
+def _load_mapped(path: Path) -> None:
+    from aoe2_genie_tooling import GenieWorkspace
+    GenieWorkspace.load(path, memory_map=True)
+
+
+MODES = {
+    "eager": _load_eager,
+    "mmap": _load_mapped,
+    "cached": _load_cached,
+    "lazy": _load_lazy,
+    "lazy+access": _load_lazy_touched,
+    "cache+access": _load_cached_touched,
+}
+
+# Snapshot cache for the cache modes, filled by a warm-up run in main()
+_CACHE_DIR = Path(tempfile.gettempdir()) / "genie_bench_load_cache"
+
+
+def _child(mode: str, path: Path) -> None:
+    """Run one load in this process and print the measurements as JSON."""
+    import aoe2_genie_tooling  # import cost is not part of the load time
+    aoe2_genie_tooling.logger.disable()
+
+    baseline = _peak_rss_mib()
+    start = time.perf_counter()
+    MODES[mode](path)
+    seconds = time.perf_counter() - start
+    print(json.dumps({"seconds": seconds, "peak_rss_mib": _peak_rss_mib(), "baseline_mib": baseline}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--child", choices=list(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.dat)
+        return
+
+    if "cache+access" in args.modes or "cached" in args.modes:
+        # Store the snapshot and its section offsets, so the timed runs are cache hits
+        subprocess.run([sys.executable, __file__, str(args.dat), "--child", "cached"], check=True, capture_output=True)
+
+    print(f"{'mode':<18} {'seconds':>9} {'peak RSS MiB':>13} {'import MiB':>11}")
+    for mode in args.modes:
+        out = subprocess.run(
+            [sys.executable, __file__, str(args.dat), "--child", mode],
+            check=True, capture_output=True, text=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{mode:<18} {result['seconds']:>9.3f} {result['peak_rss_mib']:>13.1f} {result['baseline_mib']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark loading many DAT files sequentially and with load_many().
+
+Runs the same small task (counting units of the first civilization) three ways:
+a plain loop over GenieWorkspace.load, load_many on threads and load_many on a
+process pool. Per-file failures are printed at the end.
+
+Usage:
+    python benchmarks/bench_load_many.py dats/*.dat [--workers 8]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+
+def unit_count(workspace: GenieWorkspace) -> int:
+    return sum(1 for unit in workspace.dat.civilizations[0].units if unit is not None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dats", type=Path, nargs="+", help="DAT files to load")
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    for path in args.dats:
+        workspace = GenieWorkspace.load(path, validation=ValidationLevel.NO_VALIDATION)
+        unit_count(workspace)
+        del workspace
+    print(f"sequential:          {time.perf_counter() - start:8.3f}s")
+
+    start = time.perf_counter()
+    for result in GenieWorkspace.load_many(args.dats, workers=args.workers):
+        if result.ok:
+            unit_count(result.workspace)
+    print(f"load_many threads:   {time.perf_counter() - start:8.3f}s")
+
+    start = time.perf_counter()
+    failures = []
+    for result in GenieWorkspace.load_many(args.dats, workers=args.workers, task=unit_count):
+        if not result.ok:
+            failures.append(result)
+    print(f"load_many processes: {time.perf_counter() - start:8.3f}s")
+
+    for result in failures:
+        print(f"  {result.path.name}: {result.error!r}")
+
+
+if __name__ == "__main__":
+    main()
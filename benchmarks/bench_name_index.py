@@ -0,0 +1,86 @@
+"""
+Benchmark find_by_name() lookups.
+
+Times a batch of lookups (10,000 by default) on units, graphics and techs
+with the name indexes, against the linear scans they replaced (kept below for
+reference). Names are drawn from the DAT itself, with a few misses mixed in.
+The index build is timed separately.
+
+Usage:
+    python benchmarks/bench_name_index.py path/to/empires2_x2_p1.dat [--lookups 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+
+def scan(items: List[Any], name: str, skip: Callable[[Any], bool] = lambda item: False) -> Optional[int]:
+    """The pre-index find_by_name(): first item with the name."""
+    for i, item in enumerate(items):
+        if item is not None and not skip(item) and item.name == name:
+            return i
+    return None
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+    return result
+
+
+def _queries(items: List[Any], count: int, rng: random.Random) -> List[str]:
+    names = [item.name for item in items if item is not None and item.name]
+    queries = [rng.choice(names) for _ in range(count)]
+    # One in ten is a miss, the worst case for a scan
+    for i in range(0, count, 10):
+        queries[i] = f"missing {i}"
+    return queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--lookups", type=int, default=10_000, help="Lookups per collection")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the query names")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    rng = random.Random(args.seed)
+    units = workspace.unit_manager
+    dat = workspace.dat
+
+    cases = [
+        ("units", dat.civilizations[0].units, units._is_placeholder,
+         units.name_index(0), lambda name: units.find_by_name(name)),
+        ("graphics", dat.sprites, lambda item: False,
+         workspace.graphic_manager.names, workspace.graphic_manager.find_by_name),
+        ("techs", dat.techs, lambda item: False,
+         workspace.tech_manager.names, workspace.tech_manager.find_by_name),
+    ]
+    for label, items, skip, index, find in cases:
+        queries = _queries(items, args.lookups, rng)
+        _time(f"{label}: index build", len(items), lambda: index.find(""))
+        expected = _time(f"{label}: x{args.lookups} (scan)", args.lookups,
+                         lambda: [scan(items, q, skip) for q in queries])
+        found = _time(f"{label}: x{args.lookups} (index)", args.lookups,
+                      lambda: [find(q) for q in queries])
+        assert [h.id if h is not None else None for h in found] == expected, f"{label}: results differ"
+        _time(f"{label}: x{args.lookups} (no case)", args.lookups,
+              lambda: [index.find(q.upper(), case_sensitive=False) for q in queries])
+        prefixes = [q[:3] for q in queries]
+        _time(f"{label}: x{args.lookups} (prefix)", args.lookups,
+              lambda: [index.find_prefix(p) for p in prefixes])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Create a patch between two DATs, apply it, and check the result byte for byte.
+
+Reports patch size, diff time and apply time, then verifies that applying the
+patch to the source reproduces the target's serialized payload exactly, and
+that a civilization whose resource list changed length is refused with a
+PatchError. Both checks raise on failure.
+
+Usage:
+    python benchmarks/bench_patch.py source.dat target.dat [--out balance.genpatch]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from aoe2_genie_tooling import DatPatch, GenieWorkspace, apply_patch, create_patch
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.core.exceptions import PatchError
+
+
+def _payload(workspace: GenieWorkspace) -> bytes:
+    """Inflated payload of a workspace, as a full save would write it."""
+    return workspace.file_io.section_cache.payload(workspace.dat)
+
+
+def _check_layout_change(source: GenieWorkspace, target: GenieWorkspace) -> None:
+    """Raise unless a civ list that changed length outside the units is refused."""
+    civ = target.dat.civilizations[-1]
+    civ.resources = list(civ.resources) + [0.0]
+    target.changes.mark("civilizations", len(target.dat.civilizations) - 1)
+    try:
+        create_patch(source, target)
+    except PatchError as e:
+        print(f"layout change refused: {e}")
+        return
+    raise AssertionError("create_patch() accepted a civilization whose resource list changed length")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, help="DAT the patch applies to")
+    parser.add_argument("target", type=Path, help="DAT the patch should produce")
+    parser.add_argument("--out", type=Path, help="Also keep the patch file here")
+    args = parser.parse_args()
+
+    source = GenieWorkspace.load(args.source, validation=ValidationLevel.NO_VALIDATION)
+    target = GenieWorkspace.load(args.target, validation=ValidationLevel.NO_VALIDATION)
+    source.logger.disable()
+
+    start = time.perf_counter()
+    patch = create_patch(source, target)
+    diff_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        patch_path = args.out or Path(tmp) / "patch.genpatch"
+        patch.save(patch_path)
+        size = patch_path.stat().st_size
+        loaded = DatPatch.load(patch_path)
+
+    start = time.perf_counter()
+    apply_patch(source, loaded)
+    apply_ms = (time.perf_counter() - start) * 1000
+
+    print(f"operations:   {len(patch):,}")
+    for key, count in sorted(patch.summary().items(), key=lambda kv: -kv[1])[:10]:
+        print(f"  {key:<16} {count:,}")
+    print(f"patch size:   {size:,} bytes (target DAT: {args.target.stat().st_size:,} bytes)")
+    print(f"diff time:    {diff_seconds:.2f}s")
+    print(f"apply time:   {apply_ms:.1f}ms")
+    patched, expected = _payload(source), _payload(target)
+    if patched != expected:
+        first = next((i for i, (a, b) in enumerate(zip(patched, expected)) if a != b), min(len(patched), len(expected)))
+        raise AssertionError(
+            f"patched source differs from target ({len(patched):,} vs {len(expected):,} bytes, "
+            f"first difference at {first:,})"
+        )
+    print("byte-identical to target")
+
+    _check_layout_change(source, target)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark bulk unit renumbering.
+
+Moves the last --count units to the end of the list with renumber(), which
+applies the whole mapping and rewrites references in one pass over the DAT,
+and with one move() plus one reference pass per unit (what per-unit moves
+cost once references have to be kept valid).
+
+Usage:
+    python benchmarks/bench_renumber.py path/to/empires2_x2_p1.dat [--count 100]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.core.reference_rewriter import rewrite_unit_references
+
+
+def _mapping(workspace: GenieWorkspace, count: int) -> dict:
+    manager = workspace.unit_manager
+    used = [unit_id for unit_id in range(manager.ids.size) if manager.exists(unit_id)][-count:]
+    end = manager.count()
+    return {old: end + i for i, old in enumerate(used)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--count", type=int, default=100, help="Units to renumber")
+    args = parser.parse_args()
+
+    for label in ("move() + pass per unit", "renumber()"):
+        workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+        workspace.logger.disable()
+        manager = workspace.unit_manager
+        mapping = _mapping(workspace, args.count)
+
+        start = time.perf_counter()
+        if label == "renumber()":
+            references = manager.renumber(mapping).references
+        else:
+            references = 0
+            for old, new in mapping.items():
+                manager.move(old, new)
+                references += rewrite_unit_references(workspace.dat, {old: new}).references
+        elapsed = time.perf_counter() - start
+        print(f"{label:26s} {elapsed:8.3f}s  {len(mapping)} units, {references} references rewritten")
+
+
+if __name__ == "__main__":
+    main()
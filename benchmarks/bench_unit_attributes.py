@@ -0,0 +1,80 @@
+"""
+Benchmark flattened UnitHandle attribute access.
+
+Times reads and writes (1,000,000 each by default) of a few flattened
+attributes (handle.max_range, handle.walking_graphic_id, ...) through the
+dispatch table, against the same access through the component wrappers
+(handle.combat.max_range), which is what the flattened properties did before.
+
+Usage:
+    python benchmarks/bench_unit_attributes.py path/to/empires2_x2_p1.dat [--count 1000000] [--unit 4] [--civs 1]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+# (component, attribute) pairs read and written in turn
+ATTRIBUTES = (
+    ("combat", "max_range"),
+    ("combat", "reload_time"),
+    ("movement", "walking_graphic_id"),
+    ("behavior", "search_radius"),
+)
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Reads and writes per run")
+    parser.add_argument("--unit", type=int, default=4, help="Unit ID (needs combat and movement info)")
+    parser.add_argument("--civs", type=int, default=1, help="Civs the handle writes to")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    handle = workspace.unit_manager.get(args.unit, civ_ids=list(range(args.civs)))
+    rounds = args.count // len(ATTRIBUTES)
+    count = rounds * len(ATTRIBUTES)
+    values = [(component, name, getattr(handle, name)) for component, name in ATTRIBUTES]
+
+    def read_dispatch() -> None:
+        for _ in range(rounds):
+            for _, name, _ in values:
+                getattr(handle, name)
+
+    def read_wrapper() -> None:
+        for _ in range(rounds):
+            for component, name, _ in values:
+                getattr(getattr(handle, component), name)
+
+    def write_dispatch() -> None:
+        for _ in range(rounds):
+            for _, name, value in values:
+                setattr(handle, name, value)
+
+    def write_wrapper() -> None:
+        for _ in range(rounds):
+            for component, name, value in values:
+                setattr(getattr(handle, component), name, value)
+
+    _time(f"read x{count} (dispatch)", count, read_dispatch)
+    _time(f"read x{count} (wrapper)", count, read_wrapper)
+    _time(f"write x{count} (dispatch)", count, write_dispatch)
+    _time(f"write x{count} (wrapper)", count, write_wrapper)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark reading unit fields as columns.
+
+Reads 20 fields of every unit in every civ with unit_manager.to_columns(),
+against a loop over one UnitHandle per (unit, civ) reading the same fields
+as properties. Then writes one changed column back with from_columns().
+
+Usage:
+    python benchmarks/bench_unit_columns.py path/to/empires2_x2_p1.dat [--rounds 3]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+FIELDS = (
+    "hit_points", "line_of_sight", "speed", "garrison_capacity", "class_",
+    "max_range", "min_range", "reload_time", "accuracy_percent", "blast_width",
+    "displayed_attack", "displayed_range", "search_radius", "work_rate",
+    "rotation_speed", "walking_graphic_id", "total_projectiles", "max_total_projectiles",
+    "food_cost", "gold_cost",
+)
+
+# Resource IDs of the cost columns, read through handle.cost in the handle loop
+COSTS = {"food_cost": 0, "gold_cost": 3}
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--rounds", type=int, default=3, help="Full projections per run")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+    civs = workspace.dat.civilizations
+
+    cells = [
+        (civ_id, unit_id)
+        for civ_id, civ in enumerate(civs)
+        for unit_id, unit in enumerate(civ.units)
+        if unit is not None and not manager._is_placeholder(unit)
+    ]
+    count = args.rounds * len(cells) * len(FIELDS)
+    print(f"{len(cells)} units x {len(FIELDS)} fields")
+
+    def read_columns() -> None:
+        for _ in range(args.rounds):
+            manager.to_columns(FIELDS)
+
+    def read_handles() -> None:
+        plain = [name for name in FIELDS if name not in COSTS]
+        for _ in range(args.rounds):
+            for civ_id, unit_id in cells:
+                handle = manager.get(unit_id, civ_ids=[civ_id])
+                for name in plain:
+                    getattr(handle, name)
+                costs = handle.cost
+                if len(costs):
+                    for resource in COSTS.values():
+                        sum(c.quantity for c in costs if c.resource_id == resource)
+
+    _time(f"to_columns x{args.rounds}", count, read_columns)
+    _time(f"handle loop x{args.rounds}", count, read_handles)
+
+    columns = manager.to_columns(["hit_points"])
+    columns["hit_points"][columns.mask("hit_points")] += 1
+    written = len(cells)
+    _time("from_columns (hit_points + 1)", written, lambda: manager.from_columns(columns))
+
+
+if __name__ == "__main__":
+    main()
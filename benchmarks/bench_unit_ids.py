@@ -0,0 +1,80 @@
+"""
+Benchmark unit ID lookups and allocation.
+
+Times exists() over every unit ID and repeated create() calls with the
+occupancy index, against the per-call civ scans it replaced (kept below for
+reference). The index build itself is timed separately.
+
+Usage:
+    python benchmarks/bench_unit_ids.py path/to/empires2_x2_p1.dat [--count 50] [--base 4]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+
+
+def scan_exists(manager: Any, unit_id: int) -> bool:
+    """The pre-index exists(): checks the slot in every civ."""
+    for civ in manager.workspace.dat.civilizations:
+        if 0 <= unit_id < len(civ.units):
+            unit = civ.units[unit_id]
+            if unit is not None and not manager._is_placeholder(unit):
+                return True
+    return False
+
+
+def scan_max_id(manager: Any) -> int:
+    """The pre-index _get_max_id(): walks every civ's units backwards."""
+    max_id = -1
+    for civ in manager.workspace.dat.civilizations:
+        for i in range(len(civ.units) - 1, -1, -1):
+            unit = civ.units[i]
+            if unit is not None and not manager._is_placeholder(unit):
+                max_id = max(max_id, i)
+                break
+    return max_id
+
+
+def _time(label: str, count: int, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:12.1f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--count", type=int, default=50, help="Units created per run")
+    parser.add_argument("--base", type=int, default=4, help="Base unit ID")
+    args = parser.parse_args()
+
+    workspace = GenieWorkspace.load(args.dat, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    manager = workspace.unit_manager
+    slots = manager.count()
+
+    _time("index build", slots, lambda: manager.ids.size)
+    _time("exists() x all IDs (scan)", slots, lambda: [scan_exists(manager, i) for i in range(slots)])
+    _time("exists() x all IDs (index)", slots, lambda: [manager.exists(i) for i in range(slots)])
+    _time("max ID (scan)", 1, lambda: scan_max_id(manager))
+    _time("max ID (index)", 1, lambda: manager._get_max_id())
+
+    for policy in ("append", "lowest"):
+        manager.ids.set_policy(policy)
+        _time(
+            f"create() x{args.count} ({policy})",
+            args.count,
+            lambda: [manager.create(f"Bench {i}", base_unit_id=args.base) for i in range(args.count)],
+        )
+    print(f"{slots} slots before, {manager.count()} after, {manager.ids.used_count()} in use")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark copy-on-write unit sharing.
+
+Creates the same units with and without share=True and reports the time spent
+and the resident memory added. Every mode runs in a fresh interpreter so the
+memory numbers are not shared between runs.
+
+Usage:
+    python benchmarks/bench_unit_sharing.py path/to/empires2_x2_p1.dat [--count 300] [--base 4]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+def _rss_mib() -> float:
+    """Current resident set size in MiB (peak RSS where /proc is unavailable)."""
+    try:
+        import os
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _child(path: Path, count: int, base: int, share: bool) -> None:
+    """Create the units in this process and print the measurements as JSON."""
+    from aoe2_genie_tooling import GenieWorkspace, UnitSpec
+    from aoe2_genie_tooling.Base.config import ValidationLevel
+
+    workspace = GenieWorkspace.load(path, validation=ValidationLevel.NO_VALIDATION)
+    workspace.logger.disable()
+    specs = [UnitSpec(f"Bench {i}", base_unit_id=base) for i in range(count)]
+
+    before = _rss_mib()
+    start = time.perf_counter()
+    workspace.unit_manager.create_many(specs, share=share)
+    seconds = time.perf_counter() - start
+    print(json.dumps({
+        "seconds": seconds,
+        "added_mib": _rss_mib() - before,
+        "copies_saved": workspace.unit_manager.sharing.stats()["copies_saved"],
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dat", type=Path, help="DAT file to load")
+    parser.add_argument("--count", type=int, default=300, help="Units to create")
+    parser.add_argument("--base", type=int, default=4, help="Base unit ID")
+    parser.add_argument("--child", choices=["copies", "shared"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.dat, args.count, args.base, args.child == "shared")
+        return
+
+    print(f"{'mode':<8} {'seconds':>9} {'added MiB':>10} {'copies saved':>13}")
+    for mode in ("copies", "shared"):
+        out = subprocess.run(
+            [sys.executable, __file__, str(args.dat), "--count", str(args.count), "--base", str(args.base),
+             "--child", mode],
+            check=True, capture_output=True, text=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{mode:<8} {result['seconds']:>9.3f} {result['added_mib']:>10.1f} {result['copies_saved']:>13}")
+
+
+if __name__ == "__main__":
+    main()
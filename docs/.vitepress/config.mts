@@ -92,7 +92,8 @@ export default defineConfig({
           { text: 'Technicalities', link: '/technicalities/' },
           { text: 'Error Handling', link: '/technicalities/error-handling' },
           { text: 'Validation', link: '/technicalities/validation' },
-          { text: 'ID Preservation', link: '/technicalities/id-preservation' }
+          { text: 'ID Preservation', link: '/technicalities/id-preservation' },
+          { text: 'Performance', link: '/technicalities/performance' }
         ]
       }
     ],
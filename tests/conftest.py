@@ -0,0 +1,67 @@
+"""
+Shared fixtures: small in-memory workspaces built from DE structs.
+
+No DAT file ships with the repository, so the workspaces stand in for a
+loaded DatFile with a namespace holding the sections the managers use. The
+remaining top-level sections are left empty and compare equal between
+workspaces.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Callable
+
+import pytest
+from sections.civilization.civilization import Civilization
+from sections.civilization.unit import Unit
+from sections.dat_versions import DE_LATEST
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Units.unit_type_validator import sync_structures_to_type
+
+CREATABLE = 70
+
+
+def _dat(num_civs: int, num_units: int, num_resources: int) -> SimpleNamespace:
+    civs = []
+    for _ in range(num_civs):
+        civ = Civilization(ver=DE_LATEST)
+        civ.num_resources = num_resources
+        civ.resources = [0.0] * num_resources
+        units = []
+        for unit_id in range(num_units):
+            unit = Unit(ver=DE_LATEST)
+            unit.type_ = CREATABLE
+            sync_structures_to_type(unit)
+            unit.id = unit_id
+            unit.hit_points = 10 + unit_id
+            units.append(unit)
+        civ.units = units
+        civs.append(civ)
+    return SimpleNamespace(
+        ver=DE_LATEST,
+        civilizations=civs,
+        sprites=[],
+        sounds=[],
+        techs=[],
+        tech_effects=[],
+        file_version="VER 8.8",
+        terrain_table_data=None,
+        color_data=None,
+        terrain_data=None,
+        map_data=None,
+        unit_data=None,
+        tech_tree=None,
+    )
+
+
+@pytest.fixture
+def make_workspace() -> Callable[..., GenieWorkspace]:
+    """Factory for DE_LATEST workspaces with the same creatable units in every civ."""
+    def make(num_civs: int = 3, num_units: int = 4, num_resources: int = 4) -> GenieWorkspace:
+        dat = _dat(num_civs, num_units, num_resources)
+        workspace = GenieWorkspace(dat=dat, validation_level=ValidationLevel.NO_VALIDATION)
+        workspace.logger.disable()
+        return workspace
+    return make
@@ -0,0 +1,28 @@
+"""Direct accessors behave like the wrapper properties they replace."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from bfp_rs import Version
+from sections.civilization.type_info.task_info import TaskInfo
+
+from aoe2_genie_tooling.Units.unit_handle import _FLATTENED
+from aoe2_genie_tooling.Units.wrappers.dispatch import dispatch_table
+
+
+def test_accessors_match_wrappers(make_workspace):
+    workspace = make_workspace()
+    unit = workspace.unit_manager.get(1)
+    assert "vanish_mode" in dispatch_table()["projectile"]
+    assert _FLATTENED["attack_graphic_id"].accepts_handles
+
+    for name, accessor in _FLATTENED.items():
+        wrapper = getattr(unit, accessor.component)
+        assert getattr(unit, name) == getattr(wrapper, name), name
+
+
+def test_getter_defaults_for_fields_missing_from_version():
+    accessor = dispatch_table()["behavior"]["wwise_attack_sound_id"]
+    old = SimpleNamespace(task_info=TaskInfo(ver=Version(5, 7)))
+    handle = SimpleNamespace(_get_units=lambda: [old])
+    assert accessor.getter()(handle) == accessor.default
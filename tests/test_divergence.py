@@ -0,0 +1,36 @@
+"""Divergence of DE_LATEST units between civilizations."""
+from __future__ import annotations
+
+
+def test_divergence_reports_differing_fields(make_workspace):
+    workspace = make_workspace()
+    workspace.unit_manager.get(2).add_attack(4, 6)
+    civs = workspace.dat.civilizations
+    civs[1].units[2].hit_points = 40
+    civs[2].units[2].combat_info.attacks[0].amount = 9
+    workspace.changes.mark("units", 2)
+
+    report = workspace.unit_manager.divergence()
+
+    assert report == [
+        (2, "hit_points", {0: 12, 1: 40, 2: 12}),
+        (2, "combat_info.attacks[0].amount", {0: 6, 1: 6, 2: 9}),
+    ]
+
+
+def test_divergence_reports_list_length_whole(make_workspace):
+    workspace = make_workspace()
+    task_info = workspace.dat.civilizations[0].units[1].task_info
+    task_info.drop_site_unit_ids = [3]
+    workspace.changes.mark("units", 1)
+
+    report = workspace.unit_manager.divergence([0, 1])
+
+    assert report == [(1, "task_info._drop_sites2_de2", {0: [3], 1: [], 2: []})]
+    assert isinstance(report[0][2][0], list)
+
+
+def test_identical_units_do_not_diverge(make_workspace):
+    workspace = make_workspace()
+    workspace.unit_manager.get(3).hit_points = 70
+    assert workspace.unit_manager.divergence() == []
@@ -0,0 +1,34 @@
+"""Memory-mapped loads call the parser once and let its errors propagate."""
+from __future__ import annotations
+
+import zlib
+
+import pytest
+from sections.datfile_sections import DatFile
+
+from aoe2_genie_tooling.Base.core import fileio
+from aoe2_genie_tooling.Base.core.fileio import FileIO
+
+
+def test_mapped_load_parses_once(tmp_path, monkeypatch):
+    deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    path = tmp_path / "empires2_x2_p1.dat"
+    path.write_bytes(deflate.compress(b"VER 8.8" * 100) + deflate.flush())
+    calls = []
+
+    def from_bytes(data):
+        calls.append(type(data))
+        raise TypeError("bad field")
+
+    monkeypatch.setattr(DatFile, "from_bytes", staticmethod(from_bytes))
+
+    with pytest.raises(TypeError, match="bad field"):
+        FileIO.load_dat_file_mapped(path)
+    assert calls == [bytearray if fileio._FROM_BYTES_TAKES_BUFFER else bytes]
+
+
+def test_release_parsing(monkeypatch):
+    monkeypatch.setattr(fileio, "version", lambda name: "0.3.0a24")
+    assert fileio._bfp_release() == (0, 3, 0, 24)
+    monkeypatch.setattr(fileio, "version", lambda name: "0.3.0")
+    assert fileio._bfp_release() > (0, 3, 0, 24)
@@ -0,0 +1,30 @@
+"""Fingerprints of DE_LATEST workspaces."""
+from __future__ import annotations
+
+
+def test_equal_content_gives_equal_fingerprints(make_workspace):
+    first, second = make_workspace().fingerprint(), make_workspace().fingerprint()
+    assert first.digest == second.digest
+    assert first.civilizations == second.civilizations
+    assert len(first.units) == 12
+
+
+def test_fingerprint_tracks_handle_writes(make_workspace):
+    workspace = make_workspace()
+    before = workspace.fingerprint()
+
+    workspace.unit_manager.get(2).hit_points = 40
+    after = workspace.fingerprint()
+
+    assert after.diff(before) == {"sections": ["civilizations"], "units": [(0, 2), (1, 2), (2, 2)]}
+    assert workspace._get_fingerprinter().last_rehashed == 3
+
+
+def test_fingerprint_hashes_civ_fields(make_workspace):
+    workspace = make_workspace()
+    before = workspace.fingerprint()
+
+    workspace.dat.civilizations[1].resources = [0.0, 0.0, 5.0, 0.0]
+    workspace.changes.mark("civilizations", 1)
+
+    assert workspace.fingerprint().diff(before) == {"sections": ["civilizations"], "civilizations": [1]}
@@ -0,0 +1,59 @@
+"""Undo and redo of edits to DE_LATEST units."""
+from __future__ import annotations
+
+
+def _snapshot(workspace):
+    return [civ.to_bytes() for civ in workspace.dat.civilizations]
+
+
+def test_undo_redo_unit_edits(make_workspace):
+    workspace = make_workspace()
+    workspace.enable_journal()
+    original = _snapshot(workspace)
+
+    unit = workspace.unit_manager.get(2)
+    unit.hit_points = 250
+    unit.attacks.add(4, 6)
+    edited = _snapshot(workspace)
+    assert edited != original
+
+    workspace.undo()
+    assert workspace.unit_manager.get(2).hit_points == 250
+    assert len(workspace.dat.civilizations[0].units[2].combat_info.attacks) == 0
+    workspace.undo()
+    assert _snapshot(workspace) == original
+
+    workspace.redo()
+    workspace.redo()
+    assert _snapshot(workspace) == edited
+
+
+def test_undo_renumber(make_workspace):
+    workspace = make_workspace()
+    workspace.enable_journal()
+    workspace.dat.civilizations[1].units[3].dead_unit_id = 1
+    original = _snapshot(workspace)
+
+    workspace.unit_manager.renumber({1: 6})
+    assert workspace.dat.civilizations[1].units[3].dead_unit_id == 6
+
+    workspace.undo()
+    assert _snapshot(workspace) == original
+
+
+def test_redo_in_place_list_edits(make_workspace):
+    workspace = make_workspace()
+    unit = workspace.dat.civilizations[0].units[2]
+    unit.task_info.drop_site_unit_ids = [-1, -1]
+    journal = workspace.enable_journal()
+
+    for unit_id in (5, 7):
+        journal.touch("units", 2, [0])
+        unit.task_info.drop_site_unit_ids[0] = unit_id
+        workspace.changes.mark("units", 2)
+
+    workspace.undo()
+    workspace.undo()
+    assert list(unit.task_info.drop_site_unit_ids) == [-1, -1]
+    workspace.redo()
+    assert list(unit.task_info.drop_site_unit_ids) == [5, -1]
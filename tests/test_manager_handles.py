@@ -0,0 +1,30 @@
+"""Managers hand out the cached handle wherever they return one."""
+from __future__ import annotations
+
+from sections.tech_effect.tech_effect import TechEffect
+
+
+def test_unit_manager_reuses_cached_handles(make_workspace):
+    workspace = make_workspace()
+    units = workspace.unit_manager
+
+    created = units.create("Scout", base_unit_id=1, enable_for_civs=[0, 2])
+    assert units.get(created.id, civ_ids=[0, 2]) is created
+    found = units.find_by_name("Scout")
+    assert found is units.get(created.id)
+    assert units.find_by_prefix("Sco") == [found]
+    assert units.find_by_prefix("Sco")[0] is found
+
+
+def test_effect_manager_reuses_cached_handles(make_workspace):
+    workspace = make_workspace()
+    effect = TechEffect(ver=workspace.dat.ver)
+    effect.name = "Bonus"
+    workspace.dat.tech_effects = [effect]
+    effects = workspace.effect_manager
+
+    handle = effects.get(0)
+    assert effects.find_by_name("Bonus") is handle
+    assert effects.find_by_prefix("Bo")[0] is handle
+    copy = effects.copy(0)
+    assert effects.get(copy.id) is copy
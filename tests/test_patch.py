@@ -0,0 +1,65 @@
+"""Patching DE_LATEST structs, whose classes carry fields of other versions."""
+from __future__ import annotations
+
+import pytest
+from sections.civilization.civilization import Civilization
+from sections.civilization.unit import Unit
+from sections.dat_versions import DE_LATEST
+
+from aoe2_genie_tooling import DatPatch, apply_patch, create_patch
+from aoe2_genie_tooling.Base.core.exceptions import PatchError
+from aoe2_genie_tooling.Base.core.struct_schema import diff_structs, retriever_fields
+
+
+def test_retriever_fields_skips_other_versions():
+    unit_fields = retriever_fields(Unit, DE_LATEST)
+    assert "hit_points" in unit_fields
+    assert "_len_name_aoe1" not in unit_fields
+    civ_fields = retriever_fields(Civilization, DE_LATEST)
+    assert "_str_sign_de2" in civ_fields
+    assert "_str_sign_de1" not in civ_fields
+    assert "name" not in civ_fields
+
+
+def test_diff_structs_reads_only_supported_fields():
+    a, b = Unit(ver=DE_LATEST), Unit(ver=DE_LATEST)
+    b.hit_points = 99
+    b.icon_id = 3
+    assert list(diff_structs(a, b)) == [(("hit_points",), 1, 99), (("icon_id",), -1, 3)]
+
+
+def test_patch_round_trip(make_workspace, tmp_path):
+    source, target = make_workspace(), make_workspace()
+    target.unit_manager.get(1).hit_points = 99
+    target.dat.civilizations[2].units[3].combat_info.base_armor = 5
+    target.dat.civilizations[0].resources = [1.0, 2.0, 3.0, 4.0]
+
+    patch = create_patch(source, target)
+    assert patch.summary() == {"units/0": 1, "units/1": 1, "units/2": 2, "dat": 1}
+
+    patch.save(tmp_path / "balance.genpatch")
+    apply_patch(source, DatPatch.load(tmp_path / "balance.genpatch"))
+    for civ_a, civ_b in zip(source.dat.civilizations, target.dat.civilizations):
+        assert civ_a.to_bytes() == civ_b.to_bytes()
+
+
+def test_patch_stores_added_and_removed_units_whole(make_workspace):
+    source, target = make_workspace(), make_workspace()
+    civ = target.dat.civilizations[0]
+    added = Unit(ver=DE_LATEST)
+    added.id = 4
+    civ.units = list(civ.units[:3]) + [None, added]
+
+    patch = create_patch(source, target)
+    assert [op[:3] for op in patch.ops] == [["resize", "units/0", 5], ["put", "units/0", 3], ["put", "units/0", 4]]
+
+    apply_patch(source, patch)
+    assert source.dat.civilizations[0].to_bytes() == civ.to_bytes()
+
+
+def test_patch_refuses_civ_layout_change(make_workspace):
+    source, target = make_workspace(), make_workspace()
+    civ = target.dat.civilizations[1]
+    civ.resources = list(civ.resources) + [0.0]
+    with pytest.raises(PatchError):
+        create_patch(source, target)
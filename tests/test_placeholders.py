@@ -0,0 +1,34 @@
+"""Placeholders shared between civs are copied before a partial write."""
+from __future__ import annotations
+
+
+def test_extended_slots_are_shared_copy_on_write(make_workspace):
+    workspace = make_workspace()
+    units = workspace.unit_manager
+    civs = workspace.dat.civilizations
+
+    units.create("Scout", base_unit_id=1, unit_id=7, enable_for_civs=[0])
+    assert units.sharing.groups(6) == [frozenset({0, 1, 2})]
+    assert units.sharing.groups(7) == [frozenset({1, 2})]
+
+    units.clone_into(6, 2, enable_for_civs=[1])
+    assert civs[0].units[6] is not civs[1].units[6]
+    assert units.sharing.groups(6) == [frozenset({0, 2})]
+    units.get(6, civ_ids=[1]).hit_points = 80
+    assert [civ.units[6].hit_points for civ in civs] == [1, 80, 1]
+
+
+def test_vacated_slots_are_shared_copy_on_write(make_workspace):
+    workspace = make_workspace()
+    units = workspace.unit_manager
+    civs = workspace.dat.civilizations
+
+    units.renumber({2: 5})
+    assert units.sharing.groups(2) == [frozenset({0, 1, 2})]
+
+    units.clone_into(2, 1, enable_for_civs=[2])
+    units.get(2, civ_ids=[2]).hit_points = 60
+    assert [civ.units[2].hit_points for civ in civs] == [1, 1, 60]
+    units.sharing.materialize(2)
+    civs[0].units[2].hit_points = 5
+    assert civs[1].units[2].hit_points == 1
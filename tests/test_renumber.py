@@ -0,0 +1,51 @@
+"""Renumbering units of a DE_LATEST DAT, whose structs carry fields of other versions."""
+from __future__ import annotations
+
+import pytest
+from sections.civilization.type_info.creation_info import TrainLocation
+from sections.dat_versions import DE_LATEST
+from sections.tech.tech import ResearchLocation, Tech
+
+import aoe2_genie_tooling.Units.unit_manager as unit_manager_module
+
+
+def _location(cls, unit_id):
+    location = cls(ver=DE_LATEST)
+    location.location_unit_id = unit_id
+    return location
+
+
+def test_renumber_rewrites_references(make_workspace):
+    workspace = make_workspace()
+    dat = workspace.dat
+    for civ in dat.civilizations:
+        civ.units[2].creation_info.train_locations_new = [_location(TrainLocation, 1)]
+        civ.units[3].dead_unit_id = 1
+    tech = Tech(ver=DE_LATEST)
+    tech.research_locations = [_location(ResearchLocation, 1)]
+    dat.techs = [tech]
+
+    stats = workspace.unit_manager.renumber({1: 8})
+
+    assert stats.units == {2, 3}
+    assert stats.techs == {0}
+    for civ in dat.civilizations:
+        assert len(civ.units) == 9
+        assert civ.units[8].id == 8 and civ.units[8].hit_points == 11
+        assert civ.units[2].creation_info.train_locations_new[0].location_unit_id == 8
+        assert civ.units[3].dead_unit_id == 8
+    assert dat.techs[0].research_locations[0].location_unit_id == 8
+
+
+def test_failed_renumber_moves_nothing(make_workspace, monkeypatch):
+    workspace = make_workspace()
+    before = [civ.to_bytes() for civ in workspace.dat.civilizations]
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("unreadable reference")
+
+    monkeypatch.setattr(unit_manager_module, "plan_unit_references", fail)
+    with pytest.raises(RuntimeError):
+        workspace.unit_manager.renumber({1: 8})
+
+    assert [civ.to_bytes() for civ in workspace.dat.civilizations] == before
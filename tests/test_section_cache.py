@@ -0,0 +1,54 @@
+"""Incremental saves through the section cache."""
+from __future__ import annotations
+
+from zlib_ng import zlib_ng as zlib
+
+from aoe2_genie_tooling.Base.core.section_cache import SectionCache
+
+LEVEL = 6
+
+
+class _Blob:
+    """Stands in for a struct section that cannot be built from defaults."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def to_bytes(self) -> bytes:
+        return self.data
+
+
+def _dat(make_workspace):
+    dat = make_workspace().dat
+    dat.file_version = b"VER 8.8\0"
+    for name in ("terrain_table_data", "color_data", "terrain_data", "map_data", "unit_data", "tech_tree"):
+        setattr(dat, name, _Blob(name.encode("ascii") * 64))
+    return dat
+
+
+def _inflate(data: bytes) -> bytes:
+    return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
+def test_unchanged_sections_are_reused(make_workspace):
+    dat, cache = _dat(make_workspace), SectionCache()
+    first = cache.build(dat, LEVEL)
+    assert cache.last_reused == []
+
+    assert cache.build(dat, LEVEL) == first
+    assert len(cache.last_reused) == 12
+
+
+def test_direct_edits_are_written(make_workspace):
+    dat, cache = _dat(make_workspace), SectionCache()
+    cache.build(dat, LEVEL)
+
+    # Not reported to any change tracker
+    dat.civilizations[1].units[2].hit_points = 77
+    dat.tech_tree.data = b"changed"
+    data = cache.build(dat, LEVEL)
+
+    assert "civilizations" not in cache.last_reused
+    assert "tech_tree" not in cache.last_reused
+    assert "sprites" in cache.last_reused
+    assert _inflate(data) == cache.payload(dat)
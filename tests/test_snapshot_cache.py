@@ -0,0 +1,36 @@
+"""Loads through the snapshot cache."""
+from __future__ import annotations
+
+from aoe2_genie_tooling import GenieWorkspace
+from aoe2_genie_tooling.Base.config import ValidationLevel
+from aoe2_genie_tooling.Base.core.snapshot_cache import SnapshotCache
+
+
+class _RecordingCache(SnapshotCache):
+    """Serves a prepared DAT and records which load path was taken."""
+
+    def __init__(self, cache_dir, dat):
+        super().__init__(cache_dir)
+        self.dat = dat
+        self.calls = []
+
+    def load(self, path):
+        self.calls.append("load")
+        return self.dat
+
+    def load_lazy(self, path):
+        self.calls.append("load_lazy")
+        return self.dat
+
+
+def test_workspace_loads_through_section_index(make_workspace, tmp_path):
+    cache = _RecordingCache(tmp_path / "cache", make_workspace().dat)
+    cache.logger.disable()
+
+    for lazy in (False, True):
+        workspace = GenieWorkspace.load(
+            tmp_path / "empires2_x2_p1.dat", validation=ValidationLevel.NO_VALIDATION, cache_dir=cache, lazy=lazy
+        )
+        assert workspace.dat is cache.dat
+
+    assert cache.calls == ["load_lazy", "load_lazy"]
@@ -0,0 +1,52 @@
+"""The tolerant struct copy skips only fields bfp_rs refuses to assign."""
+from __future__ import annotations
+
+import pytest
+from sections.tech.tech import Tech
+
+from aoe2_genie_tooling.Base.core import struct_cloner
+
+
+def _failing_copy(monkeypatch, bad_name, error):
+    def copier(source, target):
+        raise TypeError("compiled copy failed")
+
+    def copy_field(source, target, name, kind):
+        if name == bad_name:
+            raise error
+        original(source, target, name, kind)
+
+    original = struct_cloner._copy_field
+    monkeypatch.setattr(struct_cloner, "_copier", lambda cls, ver: copier)
+    monkeypatch.setattr(struct_cloner, "_copy_field", copy_field)
+    monkeypatch.setattr(struct_cloner, "_SKIPPED", {})
+
+
+def test_unassignable_field_is_skipped(make_workspace, monkeypatch):
+    ver = make_workspace().dat.ver
+    source, target = Tech(ver=ver), Tech(ver=ver)
+    source.name = "Loom"
+    source.icon_id = 7
+    _failing_copy(monkeypatch, "icon_id", OverflowError("out of range"))
+
+    struct_cloner.copy_struct_into(source, target)
+
+    assert target.name == "Loom"
+    assert target.icon_id != 7
+    assert "icon_id" in next(iter(struct_cloner._SKIPPED.values()))
+
+
+def test_unexpected_error_propagates(make_workspace, monkeypatch):
+    ver = make_workspace().dat.ver
+    _failing_copy(monkeypatch, "icon_id", RuntimeError("bug"))
+
+    with pytest.raises(RuntimeError):
+        struct_cloner.copy_struct_into(Tech(ver=ver), Tech(ver=ver))
+
+
+def test_bfp_lists_are_cloned(make_workspace):
+    ver = make_workspace().dat.ver
+    source = Tech(ver=ver)
+    clone = struct_cloner.clone_value(source.required_tech_ids)
+
+    assert type(clone) is list and clone == list(source.required_tech_ids)
@@ -0,0 +1,25 @@
+"""Research location handles report their writes."""
+from __future__ import annotations
+
+from sections.tech.tech import Tech
+
+from aoe2_genie_tooling import ResearchLocationHandle
+
+
+def test_research_location_writes_are_tracked(make_workspace):
+    workspace = make_workspace()
+    workspace.dat.techs = [Tech(ver=workspace.dat.ver)]
+    tech = workspace.tech_manager.get(0)
+
+    location = tech.add_research_location(location_unit_id=3, research_time=20)
+    assert isinstance(location, ResearchLocationHandle)
+    assert location.index == 0
+    version = workspace.changes.section_version("techs")
+
+    location.research_time = 45
+    assert workspace.dat.techs[0].research_locations[0].research_time == 45
+    assert workspace.changes.section_version("techs") > version
+
+    copy = tech.copy_research_location(0, target_index=0)
+    assert copy.index == 0
+    assert tech.get_research_location(1).location_unit_id == 3
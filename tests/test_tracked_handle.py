@@ -0,0 +1,44 @@
+"""Entry handles report writes only after they succeed and change something."""
+from __future__ import annotations
+
+import pytest
+from sections.tech.tech import Tech
+from sections.tech_effect.tech_effect import TechEffect
+
+
+def _workspace(make_workspace):
+    workspace = make_workspace()
+    workspace.dat.techs = [Tech(ver=workspace.dat.ver)]
+    workspace.dat.tech_effects = [TechEffect(ver=workspace.dat.ver)]
+    return workspace
+
+
+def test_rejected_and_unchanged_writes_are_not_reported(make_workspace):
+    workspace = _workspace(make_workspace)
+    tech = workspace.tech_manager.get(0)
+    effect = workspace.effect_manager.get(0)
+    versions = workspace.changes.section_version("techs"), workspace.changes.section_version("tech_effects")
+
+    with pytest.raises(ValueError):
+        tech.set_required_tech(99, 5)
+    tech.icon_id = tech.icon_id
+    tech.clear_required_techs()
+    assert not effect.remove_command(3)
+    assert effect.copy_command(0) is None
+    effect.clear_commands()
+
+    assert (workspace.changes.section_version("techs"), workspace.changes.section_version("tech_effects")) == versions
+
+
+def test_successful_writes_are_reported_and_journaled(make_workspace):
+    workspace = _workspace(make_workspace)
+    workspace.enable_journal()
+    tech = workspace.tech_manager.get(0)
+    version = workspace.changes.section_version("techs")
+
+    tech.set_required_tech(1, 7)
+    assert workspace.changes.section_version("techs") > version
+    assert workspace.dat.techs[0].required_tech_ids[1] == 7
+
+    workspace.undo()
+    assert workspace.dat.techs[0].required_tech_ids[1] == -1